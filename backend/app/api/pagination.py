@@ -0,0 +1,43 @@
+"""
+Shared cursor pagination parameters for list endpoints.
+
+List endpoints keep their response bodies and return the cursor of the
+next page in the ``X-Next-Cursor`` header (absent on the last page).
+Passing it back as ``?cursor=`` continues the listing by keyset instead
+of ``skip``.
+"""
+from typing import Any, Optional, Sequence
+
+from fastapi import Depends, Query, Response
+
+from app.i18n.dependencies import get_locale
+from app.i18n.helpers import raise_validation_error
+from app.utils.pagination import (
+    NEXT_CURSOR_HEADER, Keyset, decode_cursor, next_cursor
+)
+
+
+async def get_cursor(
+    cursor: Optional[str] = Query(
+        None, description="Opaque cursor from the X-Next-Cursor header"
+    ),
+    locale: str = Depends(get_locale),
+) -> Optional[Keyset]:
+    """Decode the ``cursor`` query parameter."""
+    if cursor is None:
+        return None
+    try:
+        return decode_cursor(cursor)
+    except ValueError:
+        raise_validation_error(locale, error_type="invalid_cursor")
+
+
+def set_next_cursor(
+    response: Response, items: Sequence[Any], limit: Optional[int],
+    sort_attr: str = "created_at"
+) -> Optional[str]:
+    """Expose the cursor of the page after ``items`` on the response."""
+    cursor = next_cursor(items, limit, sort_attr)
+    if cursor:
+        response.headers[NEXT_CURSOR_HEADER] = cursor
+    return cursor
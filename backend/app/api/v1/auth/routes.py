@@ -19,7 +19,9 @@ from app.domain.schemas.settings import (
     TwoFactorLoginVerifyRequest, TwoFactorBackupVerifyRequest,
     TwoFactorLoginResponse
 )
-from app.core.auth import refresh_tokens, verify_refresh_token
+from app.core.auth import (
+    refresh_tokens, revoke_access_tokens, verify_refresh_token
+)
 from app.core.permissions import apply_access_context
 from app.services.auth_service import auth_service
 from app.services.google_oauth_service import google_oauth
@@ -217,6 +219,7 @@ async def logout(
             status_code=status.HTTP_400_BAD_REQUEST,
             translation_key="errors.invalid_refresh_token"
         )
+    revoke_access_tokens(token_info["user_id"])
 
     # Clear auth cookies if response is available
     if response:
@@ -3,15 +3,14 @@ Comment API routes.
 """
 from fastapi import APIRouter, Depends, Body
 from sqlalchemy.orm import Session
-from sqlalchemy.exc import IntegrityError
 
 from app.core.database import get_db
 from app.core.auth import get_current_user
 from app.core.permissions import can_manage_comment
 from app.domain.schemas.project import Comment, CommentCreate
-from app.domain.models import CommentVote
 from app.repositories.project_repository import CommentRepository
 from app.repositories.comment_vote_repository import CommentVoteRepository
+from app.repositories.vote_counts import VoteResult
 from app.i18n.dependencies import get_locale
 from app.i18n.helpers import (
     raise_not_found,
@@ -75,6 +74,17 @@ async def delete_comment(
     return {"message": "Comment deleted successfully"}
 
 
+def _vote_stats(comment_id: int, result: VoteResult) -> dict:
+    """Comment vote counters as returned by the vote endpoints."""
+    return {
+        "comment_id": comment_id,
+        "upvotes": result.upvotes,
+        "downvotes": result.downvotes,
+        "total_score": result.score,
+        "user_vote": result.user_vote,
+    }
+
+
 @router.post("/{comment_id}/vote")
 async def vote_for_comment(
     comment_id: int,
@@ -98,97 +108,18 @@ async def vote_for_comment(
     if vote_type not in ["upvote", "downvote"]:
         raise_bad_request(locale, "vote_type_invalid")
 
-    # Check if comment exists
-    comment = comment_repository.get(db, comment_id)
-    if not comment:
+    result = comment_vote_repository.cast_vote(
+        db, comment_id, current_user.id, vote_type
+    )
+    if result is None:
         raise_not_found(locale, "comment")
-
-    try:
-        # Check if user already voted
-        existing_vote = comment_vote_repository.get_by_user_and_comment(
-            db, current_user.id, comment_id
-        )
-
-        vote_obj = None
-        message = ""
-
-        if existing_vote:
-            # Update existing vote
-            if existing_vote.vote_type == vote_type:
-                # Same vote type - remove the vote
-                comment_vote_repository.delete_by_user_and_comment(
-                    db, current_user.id, comment_id
-                )
-                message = f"Removed {vote_type}"
-            else:
-                # Change vote type
-                existing_vote.vote_type = vote_type
-                db.commit()
-                db.refresh(existing_vote)
-                message = f"Changed vote to {vote_type}"
-                vote_obj = existing_vote
-        else:
-            # Create new vote with error handling for race conditions
-            try:
-                vote_obj = comment_vote_repository.create_vote(
-                    db, current_user.id, comment_id, vote_type
-                )
-                message = f"Added {vote_type}"
-            except IntegrityError:
-                # Race condition: vote was created by another request
-                db.rollback()
-
-                # Get the current vote state
-                existing_vote = comment_vote_repository.get_by_user_and_comment(
-                    db, current_user.id, comment_id
-                )
-                if existing_vote:
-                    # Another request created a vote, return current state
-                    message = f"Already voted {existing_vote.vote_type}"
-                    vote_type = existing_vote.vote_type
-                    vote_obj = existing_vote
-                else:
-                    # Retry once (should rarely happen)
-                    vote_obj = comment_vote_repository.create_vote(
-                        db, current_user.id, comment_id, vote_type
-                    )
-                    message = f"Added {vote_type}"
-
-    except IntegrityError:
-        db.rollback()
-        raise_bad_request(locale, "vote_conflict")
-
-    # Update comment vote counts
-    # Calculate upvote/downvote counts from database
-    upvotes = db.query(CommentVote).filter(
-        CommentVote.comment_id == comment_id,
-        CommentVote.vote_type == "upvote"
-    ).count()
-    downvotes = db.query(CommentVote).filter(
-        CommentVote.comment_id == comment_id,
-        CommentVote.vote_type == "downvote"
-    ).count()
-
-    comment.upvote_count = upvotes
-    comment.downvote_count = downvotes
-    db.commit()
-    db.refresh(comment)
+    vote_obj = result.vote
 
     response_data = {
-        "message": message,
+        "message": result.message,
         "comment_id": comment_id,
-        "vote_type": vote_type,
-        "comment_stats": {
-            "comment_id": comment_id,
-            "upvotes": comment.upvote_count,
-            "downvotes": comment.downvote_count,
-            "total_score": comment.vote_score,
-            "user_vote": (
-                vote_type
-                if message.startswith("Added") or message.startswith("Changed")
-                else None
-            )
-        }
+        "vote_type": result.vote_type,
+        "comment_stats": _vote_stats(comment_id, result),
     }
 
     # Include vote object if it exists (for frontend state updates)
@@ -216,46 +147,16 @@ async def remove_comment_vote(
     locale: str = Depends(get_locale)
 ):
     """Remove vote from a comment."""
-    # Check if comment exists
-    comment = comment_repository.get(db, comment_id)
-    if not comment:
-        raise_not_found(locale, "comment")
-
-    # Check if user has voted
-    existing_vote = comment_vote_repository.get_by_user_and_comment(
-        db, current_user.id, comment_id
+    result = comment_vote_repository.remove_vote(
+        db, comment_id, current_user.id
     )
-    if not existing_vote:
+    if result is None:
+        if not comment_repository.exists(db, comment_id):
+            raise_not_found(locale, "comment")
         raise_bad_request(locale, "no_vote_to_remove")
 
-    # Delete the vote
-    comment_vote_repository.delete_by_user_and_comment(
-        db, current_user.id, comment_id
-    )
-
-    # Update comment vote counts
-    upvotes = db.query(CommentVote).filter(
-        CommentVote.comment_id == comment_id,
-        CommentVote.vote_type == "upvote"
-    ).count()
-    downvotes = db.query(CommentVote).filter(
-        CommentVote.comment_id == comment_id,
-        CommentVote.vote_type == "downvote"
-    ).count()
-
-    comment.upvote_count = upvotes
-    comment.downvote_count = downvotes
-    db.commit()
-    db.refresh(comment)
-
     return {
         "message": "Vote removed",
         "comment_id": comment_id,
-        "comment_stats": {
-            "comment_id": comment_id,
-            "upvotes": comment.upvote_count,
-            "downvotes": comment.downvote_count,
-            "total_score": comment.vote_score,
-            "user_vote": None
-        }
+        "comment_stats": _vote_stats(comment_id, result),
     }
@@ -1,9 +1,9 @@
 """
 Hackathon API routes.
 """
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
 from app.core.database import get_db
 from app.core.auth import get_current_user
@@ -24,9 +24,13 @@ from app.repositories.hackathon_repository import (
     HackathonRepository,
     HackathonRegistrationRepository
 )
+from app.services.hackathon_service import hackathon_service
 from app.services.team_service import team_service
 from app.services.report_service import report_service
 from app.api.openapi_responses import NOT_FOUND_RESPONSE, UNAUTHORIZED_RESPONSE
+from app.api.pagination import get_cursor, set_next_cursor
+from app.utils.view_counter import view_counter
+from app.utils.pagination import Keyset
 
 router = APIRouter()
 hackathon_repository = HackathonRepository()
@@ -35,14 +39,17 @@ registration_repository = HackathonRegistrationRepository()
 
 @router.get("", response_model=List[Hackathon])
 async def get_hackathons(
+    response: Response,
     skip: int = Query(0, ge=0, le=1000),
     limit: int = Query(100, ge=0, le=1000),
+    after: Optional[Keyset] = Depends(get_cursor),
     db: Session = Depends(get_db)
 ):
-    """Get all hackathons."""
+    """Get all hackathons, latest start date first."""
     hackathons = hackathon_repository.get_active_hackathons(
-        db, skip=skip, limit=limit
+        db, skip=skip, limit=limit, after=after
     )
+    set_next_cursor(response, hackathons, limit, sort_attr="start_date")
     return hackathons
 
 
@@ -60,10 +67,8 @@ async def get_hackathon(
     if not hackathon:
         raise HTTPException(status_code=404, detail="Hackathon not found")
 
-    # Increment view count
-    hackathon.view_count = (hackathon.view_count or 0) + 1
-    db.commit()
-    db.refresh(hackathon)
+    # Counted in batches; the stored count catches up on the next flush
+    view_counter.record("hackathon", hackathon_id)
 
     return hackathon
 
@@ -80,6 +85,7 @@ async def create_hackathon(
     hackathon_data = hackathon.dict()
     hackathon_data["owner_id"] = current_user.id
     new_hackathon = hackathon_repository.create(db, obj_in=hackathon_data)
+    hackathon_service.invalidate_hackathon_cache(new_hackathon.id)
     return new_hackathon
 
 
@@ -105,6 +111,7 @@ async def update_hackathon(
     updated_hackathon = hackathon_repository.update(
         db, db_obj=hackathon, obj_in=hackathon_update.dict(exclude_unset=True)
     )
+    hackathon_service.invalidate_hackathon_cache(hackathon_id)
     return updated_hackathon
 
 
@@ -127,6 +134,7 @@ async def delete_hackathon(
         raise HTTPException(
             status_code=500, detail="Failed to delete hackathon"
         )
+    hackathon_service.invalidate_hackathon_cache(hackathon_id)
 
     return {"message": "Hackathon deleted successfully"}
 
@@ -227,22 +235,9 @@ async def get_hackathon_projects(
     if not hackathon:
         raise HTTPException(status_code=404, detail="Hackathon not found")
 
-    # Import Project model and query projects
-    from app.domain.models.project import Project
-    projects = db.query(Project).filter(
-        Project.hackathon_id == hackathon_id
-    ).all()
-
-    # Convert to simple dict representation
-    project_list = []
-    for project in projects:
-        project_list.append({
-            "id": project.id,
-            "title": project.title,
-            "description": project.description,
-            "team_id": project.team_id,
-            "created_at": project.created_at
-        })
+    project_list = hackathon_service.get_hackathon_projects(
+        db, hackathon_id=hackathon_id
+    )
 
     return {"projects": project_list, "hackathon_id": hackathon_id}
 
@@ -11,6 +11,7 @@ from app.core.permissions import apply_access_context
 from app.domain import schemas, models
 from app.repositories.user_repository import UserRepository
 from app.repositories.team_repository import TeamInvitationRepository
+from app.services.dashboard_service import dashboard_service
 from app.i18n.dependencies import get_locale
 from app.i18n.helpers import raise_not_found
 from app.api.openapi_responses import UNAUTHORIZED_RESPONSE
@@ -34,60 +35,10 @@ async def get_current_user(
 
     # Convert to User schema first (avoids relationship errors)
     user_schema = schemas.User.model_validate(apply_access_context(db, db_user))
-    # Create UserWithDetails from User schema (extra fields will be None)
-    user_with_details = schemas.UserWithDetails(**user_schema.model_dump())
-
-    # Get user's team memberships
-    team_memberships = db.query(models.TeamMember).filter(
-        models.TeamMember.user_id == db_user.id
-    ).all()
-
-    # Convert team memberships to schema
-    user_with_details.teams = []
-    for membership in team_memberships:
-        team_member_schema = schemas.TeamMember.model_validate(membership)
-        # Include team details
-        team = db.query(models.Team).filter(
-            models.Team.id == membership.team_id
-        ).first()
-        if team:
-            team_member_schema.team = schemas.Team.model_validate(team)
-        user_with_details.teams.append(team_member_schema)
-
-    # Get user's projects
-    user_projects = db.query(models.Project).filter(
-        models.Project.owner_id == db_user.id
-    ).all()
-    user_with_details.projects = [
-        schemas.Project.model_validate(project) for project in user_projects
-    ]
-
-    # Get user's votes
-    user_votes = db.query(models.Vote).filter(
-        models.Vote.user_id == db_user.id
-    ).all()
-    user_with_details.votes = [
-        schemas.Vote.model_validate(vote) for vote in user_votes
-    ]
-
-    # Get user's comments
-    user_comments = db.query(models.Comment).filter(
-        models.Comment.user_id == db_user.id
-    ).all()
-    user_with_details.comments = [
-        schemas.Comment.model_validate(comment) for comment in user_comments
-    ]
-
-    # Get user's hackathon registrations
-    user_registrations = db.query(models.HackathonRegistration).filter(
-        models.HackathonRegistration.user_id == db_user.id
-    ).all()
-    user_with_details.hackathon_registrations = [
-        schemas.HackathonRegistration.model_validate(reg)
-        for reg in user_registrations
-    ]
-
-    return user_with_details
+    return schemas.UserWithDetails(
+        **user_schema.model_dump(),
+        **dashboard_service.get_details(db, db_user.id)
+    )
 
 
 @router.get("/me/votes", response_model=List[schemas.Vote])
@@ -1,9 +1,9 @@
 """
 Notification API routes.
 """
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 
 from app.core.auth import get_current_user
@@ -27,6 +27,8 @@ from app.services.notification_settings_service import (
 )
 from app.services.notification_service import notification_service
 from app.api.openapi_responses import UNAUTHORIZED_RESPONSE
+from app.api.pagination import get_cursor, set_next_cursor
+from app.utils.pagination import Keyset, encode_cursor
 
 router = APIRouter(responses=UNAUTHORIZED_RESPONSE)
 notification_repository = NotificationRepository()
@@ -36,19 +38,24 @@ in_app_service = InAppNotificationService()
 
 @router.get("", response_model=List[UserNotification])
 async def get_notifications(
+    response: Response,
     skip: int = Query(0, ge=0, le=1000),
     limit: int = Query(100, ge=0, le=1000),
     unread_only: bool = False,
+    after: Optional[Keyset] = Depends(get_cursor),
     db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
-    return notification_service.get_user_notifications(
+    notifications = notification_service.get_user_notifications(
         db=db,
         user_id=current_user.id,
         skip=skip,
         limit=limit,
         unread_only=unread_only,
+        after=after,
     )
+    set_next_cursor(response, notifications, limit)
+    return notifications
 
 
 @router.post("", response_model=UserNotification)
@@ -271,16 +278,18 @@ async def get_in_app_notifications(
     limit: int = Query(50, ge=0, le=1000),
     unread_only: bool = False,
     include_expired: bool = False,
+    after: Optional[Keyset] = Depends(get_cursor),
     db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
-    notifications = in_app_service.get_user_notifications(
+    notifications, following = in_app_service.get_user_notifications_page(
         db=db,
         user_id=current_user.id,
         offset=skip,
         limit=limit,
         unread_only=unread_only,
         include_expired=include_expired,
+        after=after,
     )
     return {
         "notifications": [
@@ -290,6 +299,7 @@ async def get_in_app_notifications(
         "total": len(notifications),
         "skip": skip,
         "limit": limit,
+        "next_cursor": encode_cursor(*following) if following else None,
     }
 
 
@@ -1,10 +1,9 @@
 """Project API routes."""
-from datetime import datetime, timezone
-
-from fastapi import APIRouter, Depends, Body, Request, HTTPException, Query
+from fastapi import (
+    APIRouter, Depends, Body, Request, Response, HTTPException, Query
+)
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from sqlalchemy.exc import IntegrityError
-from sqlalchemy import func
 from typing import List, Optional
 
 from app.core.database import get_db
@@ -17,7 +16,8 @@ from app.core.permissions import (
     user_has_permission,
 )
 from app.domain.schemas.project import (
-    Project, ProjectCreate, ProjectUpdate, CommentCreate, Comment
+    Project, ProjectCreate, ProjectUpdate, CommentCreate, Comment,
+    TechnologyFacet
 )
 from app.domain.schemas.user import PublicUser
 from app.domain.schemas.report import Report, ReportCreateRequest
@@ -25,7 +25,8 @@ from app.services.project_service import project_service
 from app.repositories.project_repository import ProjectRepository
 from app.repositories.project_repository import VoteRepository
 from app.repositories.project_repository import CommentRepository
-from app.domain.models.project import Vote as VoteModel, Comment as CommentModel
+from app.repositories.vote_counts import VoteResult
+from app.domain.models.project import Project as ProjectModel
 from app.i18n.dependencies import get_locale
 from app.i18n.helpers import (
     raise_not_found, raise_bad_request,
@@ -34,6 +35,12 @@ from app.i18n.helpers import (
 from app.i18n.translations import get_translation
 from app.services.report_service import report_service
 from app.api.openapi_responses import NOT_FOUND_RESPONSE, UNAUTHORIZED_RESPONSE
+from app.api.pagination import get_cursor, set_next_cursor
+from app.utils.pagination import Keyset, next_cursor
+from app.utils.view_counter import view_counter
+from app.utils.project_engagement import (
+    calculate_engagement, engagement_rate
+)
 
 router = APIRouter()
 
@@ -64,9 +71,8 @@ def _serialize_comment(comment) -> Comment:
     )
 
 
-def _build_comment_tree(db: Session, project_id: int) -> list[Comment]:
-    """Build a nested comment tree for a project."""
-    flat_comments = comment_repository.get_project_comments_flat(db, project_id)
+def _build_comment_tree(flat_comments) -> list[Comment]:
+    """Build a nested comment tree from a flat list of comments."""
     comment_map: dict[int, Comment] = {}
     root_comments: list[Comment] = []
 
@@ -80,136 +86,123 @@ def _build_comment_tree(db: Session, project_id: int) -> list[Comment]:
         else:
             root_comments.append(serialized)
 
-    root_comments.sort(key=lambda item: item.created_at, reverse=True)
+    root_comments.sort(
+        key=lambda item: (item.created_at, item.id), reverse=True
+    )
     for root in root_comments:
         root.replies.sort(key=lambda item: item.created_at)
 
     return root_comments
 
 
-def _calculate_project_engagement(
-    total_votes: int,
-    total_comments: int,
-    view_count: int,
-    last_activity_at: datetime | None,
-) -> tuple[int, float, str]:
-    """Calculate project engagement score, rate and level."""
-    score = min(total_votes * 12, 40) + min(total_comments * 15, 35)
-    score += min(view_count * 2, 15)
-
-    if last_activity_at:
-        now = datetime.now(timezone.utc)
-        activity_time = last_activity_at
-        if activity_time.tzinfo is None:
-            activity_time = activity_time.replace(tzinfo=timezone.utc)
-        age_days = max(0, (now - activity_time).days)
-        if age_days <= 7:
-            score += 10
-        elif age_days <= 30:
-            score += 5
-
-    score = min(score, 100)
-
-    interactions = total_votes + total_comments
-    rate = round(min(100.0, (interactions / max(view_count, 1)) * 100), 1)
-
-    if score >= 70 or rate >= 15:
-        return score, rate, "high"
-    if score >= 35 or rate >= 5:
-        return score, rate, "medium"
-    return score, rate, "low"
-
-
-def _attach_project_stats(db: Session, projects: List[Project]) -> None:
-    """Populate aggregated project engagement statistics."""
-    project_ids = [project.id for project in projects]
-    if not project_ids:
-        return
-
-    vote_rows = db.query(
-        VoteModel.project_id,
-        func.max(VoteModel.created_at).label("last_vote_at"),
-    ).filter(
-        VoteModel.project_id.in_(project_ids)
-    ).group_by(VoteModel.project_id).all()
-    vote_activity_map = {
-        row.project_id: row.last_vote_at for row in vote_rows
-    }
-
-    comment_rows = db.query(
-        CommentModel.project_id,
-        func.max(CommentModel.created_at).label("last_comment_at"),
-    ).filter(
-        CommentModel.project_id.in_(project_ids)
-    ).group_by(CommentModel.project_id).all()
-    comment_activity_map = {
-        row.project_id: row.last_comment_at for row in comment_rows
-    }
+def _attach_project_stats(projects: List[Project]) -> None:
+    """
+    Populate derived engagement fields from the stored project columns.
 
+    Rows not yet filled by rebuild_project_activity.py fall back to their
+    own timestamps.
+    """
     for project in projects:
         total_votes = (project.upvote_count or 0) + (project.downvote_count or 0)
         total_comments = project.comment_count or 0
-        last_activity_candidates = [
-            project.updated_at,
-            project.created_at,
-            vote_activity_map.get(project.id),
-            comment_activity_map.get(project.id),
-        ]
-        last_activity_at = max(
-            (candidate for candidate in last_activity_candidates if candidate is not None),
-            default=project.created_at,
-        )
-        engagement_score, engagement_rate, engagement_level = _calculate_project_engagement(
-            total_votes=total_votes,
-            total_comments=total_comments,
-            view_count=project.view_count or 0,
-            last_activity_at=last_activity_at,
-        )
+        view_count = project.view_count or 0
 
         project.total_votes = total_votes
         project.total_comments = total_comments
-        project.last_activity_at = last_activity_at
-        project.engagement_score = engagement_score
-        project.engagement_rate = engagement_rate
-        project.engagement_level = engagement_level
+        project.engagement_rate = engagement_rate(
+            total_votes, total_comments, view_count
+        )
+        if project.last_activity_at is None:
+            project.last_activity_at = max(
+                (moment for moment in (project.updated_at, project.created_at)
+                 if moment is not None),
+                default=None,
+            )
+            (project.engagement_score, _,
+             project.engagement_level) = calculate_engagement(
+                total_votes, total_comments, view_count,
+                project.last_activity_at,
+            )
 
 
 @router.get("", response_model=List[Project])
 async def get_projects(
+    response: Response,
     skip: int = Query(0, ge=0, le=1000),
     limit: int = Query(100, ge=0, le=1000),
     user: Optional[int] = None,
     technology: Optional[str] = None,
     technologies: Optional[str] = None,
+    match: str = Query("all", pattern="^(all|any)$"),
     search: Optional[str] = None,
+    after: Optional[Keyset] = Depends(get_cursor),
     db: Session = Depends(get_db),
     locale: str = Depends(get_locale)
 ):
-    """Get all projects, optionally filtered by user, technology, or search."""
+    """
+    Get all projects, optionally filtered by user, technology, or search.
+
+    ``technologies`` is a comma-separated tag list; ``match=any`` returns
+    projects with any of the tags instead of all of them. Listings other
+    than search (which is ordered by relevance) return the next page's
+    cursor in the X-Next-Cursor header. The cached listings run in the
+    threadpool: a miss may wait for another worker computing the same
+    page, which must not block the event loop.
+    """
     if search:
-        projects = project_service.search_projects(
+        projects = await run_in_threadpool(
+            project_service.search_projects,
             db, search_term=search, skip=skip, limit=limit
         )
-    elif technology:
-        projects = project_service.get_projects_by_technology(
-            db, technology=technology, skip=skip, limit=limit
-        )
-    elif technologies:
-        tech_list = [t.strip() for t in technologies.split(",") if t.strip()]
-        projects = project_service.get_projects_by_technologies(
-            db, technologies=tech_list, skip=skip, limit=limit
-        )
-    elif user is not None:
-        projects = project_service.get_projects(
-            db, skip=skip, limit=limit, user_id=user
-        )
     else:
-        projects = project_service.get_projects(db, skip=skip, limit=limit)
+        if technology:
+            projects = await run_in_threadpool(
+                project_service.get_projects_by_technology,
+                db, technology=technology, skip=skip, limit=limit,
+                after=after
+            )
+        elif technologies:
+            tech_list = [
+                t.strip() for t in technologies.split(",") if t.strip()
+            ]
+            projects = await run_in_threadpool(
+                project_service.get_projects_by_technologies,
+                db, technologies=tech_list, skip=skip, limit=limit,
+                match_all=match == "all", after=after
+            )
+        else:
+            projects = await run_in_threadpool(
+                project_service.get_projects,
+                db, skip=skip, limit=limit, user_id=user, after=after
+            )
+        set_next_cursor(response, projects, limit)
 
-    _attach_project_stats(db, projects)
+    _attach_project_stats(projects)
     return projects
 
 
+@router.get("/technologies", response_model=List[TechnologyFacet])
+async def get_technology_facets(
+    technologies: Optional[str] = None,
+    match: str = Query("all", pattern="^(all|any)$"),
+    limit: int = Query(50, ge=1, le=500),
+    db: Session = Depends(get_db)
+):
+    """
+    Count public projects per technology tag.
+
+    With ``technologies`` the counts are restricted to projects matching
+    that selection, for drill-down filtering.
+    """
+    tech_list = [
+        t.strip() for t in (technologies or "").split(",") if t.strip()
+    ]
+    return await run_in_threadpool(
+        project_service.get_technology_facets,
+        db, technologies=tech_list, match_all=match == "all", limit=limit
+    )
+
+
 @router.get(
     "/{project_id}",
     response_model=Project,
@@ -222,10 +215,12 @@ async def get_project(
     locale: str = Depends(get_locale)
 ):
     """Get a specific project by ID."""
-    project = project_service.get_project(db, project_id)
+    project = await run_in_threadpool(
+        project_service.get_project, db, project_id
+    )
     if not project:
         raise_not_found(locale, "project")
-    _attach_project_stats(db, [project])
+    _attach_project_stats([project])
     return project
 
 
@@ -356,6 +351,17 @@ async def get_project_reports(
     )
 
 
+def _vote_stats(project_id: int, result: VoteResult) -> dict:
+    """Project vote counters as returned by the vote endpoints."""
+    return {
+        "project_id": project_id,
+        "upvotes": result.upvotes,
+        "downvotes": result.downvotes,
+        "total_score": result.score,
+        "user_vote": result.user_vote,
+    }
+
+
 @router.post("/{project_id}/vote", responses=UNAUTHORIZED_RESPONSE)
 async def vote_for_project(
     project_id: int,
@@ -385,88 +391,18 @@ async def vote_for_project(
             option2="downvote"
         )
 
-    # Check if project exists
-    project = project_repository.get(db, project_id)
-    if not project:
+    result = vote_repository.cast_vote(
+        db, project_id, current_user.id, vote_type
+    )
+    if result is None:
         raise_not_found(locale, "project")
-
-    try:
-        # Check if user already voted
-        existing_vote = vote_repository.get_user_vote_for_project(
-            db, current_user.id, project_id
-        )
-
-        vote_obj = None
-
-        if existing_vote:
-            # Update existing vote
-            if existing_vote.vote_type == vote_type:
-                # Same vote type - remove the vote
-                vote_repository.delete(db, id=existing_vote.id)
-                message = f"Removed {vote_type}"
-            else:
-                # Change vote type
-                existing_vote.vote_type = vote_type
-                db.commit()
-                db.refresh(existing_vote)
-                message = f"Changed vote to {vote_type}"
-                vote_obj = existing_vote
-        else:
-            # Create new vote with error handling for race conditions
-            try:
-                vote_obj = vote_repository.create(db, obj_in={
-                    "user_id": current_user.id,
-                    "project_id": project_id,
-                    "vote_type": vote_type
-                })
-                message = f"Added {vote_type}"
-            except IntegrityError:
-                # Race condition: vote was created by another request
-                db.rollback()
-                # Get the current vote state
-                existing_vote = vote_repository.get_user_vote_for_project(
-                    db, current_user.id, project_id
-                )
-                if existing_vote:
-                    # Another request created a vote, return current state
-                    message = f"Already voted {existing_vote.vote_type}"
-                    vote_type = existing_vote.vote_type
-                    vote_obj = existing_vote
-                else:
-                    # Retry once (should rarely happen)
-                    vote_obj = vote_repository.create(db, obj_in={
-                        "user_id": current_user.id,
-                        "project_id": project_id,
-                        "vote_type": vote_type
-                    })
-                    message = f"Added {vote_type}"
-
-    except IntegrityError:
-        db.rollback()
-        raise_bad_request(locale, "vote_conflict")
-
-    # Update vote counts
-    vote_repository.update_vote_counts(db, project_id)
-
-    # Get updated project stats for frontend
-    project = project_repository.get(db, project_id)
-    db.refresh(project)
+    vote_obj = result.vote
 
     response_data = {
-        "message": message,
+        "message": result.message,
         "project_id": project_id,
-        "vote_type": vote_type,
-        "project_stats": {
-            "project_id": project_id,
-            "upvotes": getattr(project, 'upvote_count', 0),
-            "downvotes": getattr(project, 'downvote_count', 0),
-            "total_score": getattr(project, 'vote_score', 0),
-            "user_vote": (
-                vote_type
-                if message.startswith("Added") or message.startswith("Changed")
-                else None
-            )
-        }
+        "vote_type": result.vote_type,
+        "project_stats": _vote_stats(project_id, result),
     }
 
     # Include vote object if it exists (for frontend state updates)
@@ -524,21 +460,26 @@ async def increment_project_view(
     db: Session = Depends(get_db),
     locale: str = Depends(get_locale)
 ):
-    """Increment view count for a project"""
-    # Check if project exists
-    project = project_repository.get(db, project_id)
-    if not project:
+    """
+    Count a view of a project.
+
+    Views are buffered and written in batches; the returned count includes
+    views of this worker that are not stored yet.
+    """
+    stored = db.query(ProjectModel.view_count).filter(
+        ProjectModel.id == project_id
+    ).first()
+    if stored is None:
         raise_not_found(locale, "project")
 
-    # Increment view count
-    project.view_count = (project.view_count or 0) + 1
-    db.commit()
-    db.refresh(project)
+    view_counter.record("project", project_id)
 
     message = get_translation("success.view_count_incremented", locale)
     return {
         "message": message,
-        "view_count": project.view_count
+        "view_count": (stored.view_count or 0) + view_counter.pending(
+            "project", project_id
+        )
     }
 
 
@@ -551,38 +492,16 @@ async def remove_vote(
     locale: str = Depends(get_locale)
 ):
     """Remove user's vote from a project."""
-    # Check if project exists
-    project = project_repository.get(db, project_id)
-    if not project:
-        raise_not_found(locale, "project")
-
-    # Check if user has voted
-    existing_vote = vote_repository.get_user_vote_for_project(
-        db, current_user.id, project_id
-    )
-    if not existing_vote:
+    result = vote_repository.remove_vote(db, project_id, current_user.id)
+    if result is None:
+        if not project_repository.exists(db, project_id):
+            raise_not_found(locale, "project")
         raise_not_found(locale, "vote")
 
-    # Delete the vote
-    vote_repository.delete(db, id=existing_vote.id)
-
-    # Update vote counts
-    vote_repository.update_vote_counts(db, project_id)
-
-    # Get updated project stats
-    project = project_repository.get(db, project_id)
-    db.refresh(project)  # Ensure we have latest values
-
     message = get_translation("success.vote_removed", locale)
     return {
         "message": message,
-        "project_stats": {
-            "project_id": project_id,
-            "upvotes": getattr(project, 'upvote_count', 0),
-            "downvotes": getattr(project, 'downvote_count', 0),
-            "total_score": getattr(project, 'vote_score', 0),
-            "user_vote": None
-        }
+        "project_stats": _vote_stats(project_id, result),
     }
 
 
@@ -592,22 +511,35 @@ async def get_project_comments(
     request: Request,
     skip: int = 0,
     limit: int = 100,
+    after: Optional[Keyset] = Depends(get_cursor),
     db: Session = Depends(get_db),
     locale: str = Depends(get_locale)
 ):
-    """Get comments for a project."""
+    """
+    Get comments for a project.
+
+    Pages over top-level comments, newest first; each comes with all of
+    its nested replies. ``next_cursor`` continues after the last one.
+    """
     # Check if project exists
     project = project_repository.get(db, project_id)
     if not project:
         raise_not_found(locale, "project")
 
-    comment_list = _build_comment_tree(db, project_id)
-    if skip:
-        comment_list = comment_list[skip:]
-    if limit is not None:
-        comment_list = comment_list[:limit]
+    roots = comment_repository.get_project_comments(
+        db, project_id, skip=skip, limit=limit, after=after
+    )
+    comment_list = _build_comment_tree(
+        roots + comment_repository.get_descendants(
+            db, [root.id for root in roots]
+        )
+    )
 
-    return {"comments": comment_list, "project_id": project_id}
+    return {
+        "comments": comment_list,
+        "project_id": project_id,
+        "next_cursor": next_cursor(comment_list, limit),
+    }
 
 
 @router.post(
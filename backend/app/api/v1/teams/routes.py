@@ -1,11 +1,9 @@
 """
 Team API routes.
 """
-from datetime import datetime, timezone
-from fastapi import APIRouter, Depends, Request, Query
-from sqlalchemy import case, func
+from fastapi import APIRouter, Depends, Request, Response, Query
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
 from app.core.database import get_db
 from app.core.auth import get_current_user
@@ -23,7 +21,6 @@ from app.domain.schemas.team import (
 )
 from app.domain.models.team import TeamMember as TeamMemberModel
 from app.domain.schemas.project import Project
-from app.domain.models.project import Project as ProjectModel
 from app.repositories.team_repository import (
     TeamRepository,
     TeamMemberRepository,
@@ -37,6 +34,10 @@ from app.i18n.helpers import (
     raise_internal_server_error
 )
 from app.api.openapi_responses import NOT_FOUND_RESPONSE, UNAUTHORIZED_RESPONSE
+from app.api.pagination import get_cursor, set_next_cursor
+from app.utils.team_stats import attach_team_stats
+from app.utils.view_counter import view_counter
+from app.utils.pagination import Keyset
 
 router = APIRouter()
 team_repository = TeamRepository()
@@ -45,122 +46,29 @@ team_invitation_repository = TeamInvitationRepository()
 project_repository = ProjectRepository()
 
 
-def _calculate_engagement_score(
-    member_count: int,
-    project_count: int,
-    view_count: int,
-    last_activity_at: datetime | None,
-) -> tuple[int, str]:
-    """Calculate a stable team engagement score and level."""
-    score = min(member_count * 12, 30) + min(project_count * 18, 30)
-    score += min(view_count * 2, 25)
-
-    if last_activity_at:
-        now = datetime.now(timezone.utc)
-        activity_time = last_activity_at
-        if activity_time.tzinfo is None:
-            activity_time = activity_time.replace(tzinfo=timezone.utc)
-        age_days = max(0, (now - activity_time).days)
-        if age_days <= 7:
-            score += 15
-        elif age_days <= 30:
-            score += 8
-
-    score = min(score, 100)
-
-    if score >= 70:
-        return score, "high"
-    if score >= 35:
-        return score, "medium"
-    return score, "low"
-
-
-def _attach_team_stats(db: Session, teams: List) -> None:
-    """Populate aggregated team statistics used across team responses."""
-    from app.domain.models.team import TeamMember
-
-    team_ids = [team.id for team in teams]
-    if not team_ids:
-        return
-
-    member_rows = db.query(
-        TeamMember.team_id,
-        func.count(TeamMember.id).label("member_count"),
-    ).filter(
-        TeamMember.team_id.in_(team_ids)
-    ).group_by(TeamMember.team_id).all()
-    member_map = {row.team_id: row.member_count for row in member_rows}
-
-    project_rows = db.query(
-        ProjectModel.team_id.label("team_id"),
-        func.count(ProjectModel.id).label("project_count"),
-        func.sum(
-            case((ProjectModel.status == "active", 1), else_=0)
-        ).label("active_project_count"),
-        func.sum(
-            case((ProjectModel.status == "completed", 1), else_=0)
-        ).label("completed_project_count"),
-        func.sum(ProjectModel.comment_count).label("total_comments"),
-        func.sum(ProjectModel.upvote_count + ProjectModel.downvote_count).label("total_votes"),
-        func.max(func.coalesce(ProjectModel.updated_at, ProjectModel.created_at)).label("last_activity_at"),
-    ).filter(
-        ProjectModel.team_id.in_(team_ids)
-    ).group_by(ProjectModel.team_id).all()
-
-    project_map = {
-        row.team_id: {
-            "project_count": row.project_count or 0,
-            "active_project_count": row.active_project_count or 0,
-            "completed_project_count": row.completed_project_count or 0,
-            "total_comments": row.total_comments or 0,
-            "total_votes": row.total_votes or 0,
-            "last_activity_at": row.last_activity_at,
-        }
-        for row in project_rows
-    }
-
-    for team in teams:
-        project_stats = project_map.get(team.id, {})
-        member_count = member_map.get(team.id, 0)
-        project_count = project_stats.get("project_count", 0)
-        last_activity_at = project_stats.get("last_activity_at") or team.created_at
-        view_count = team.view_count or 0
-        engagement_score, engagement_level = _calculate_engagement_score(
-            member_count=member_count,
-            project_count=project_count,
-            view_count=view_count,
-            last_activity_at=last_activity_at,
-        )
-
-        team._member_count = member_count
-        team.project_count = project_count
-        team.active_project_count = project_stats.get("active_project_count", 0)
-        team.completed_project_count = project_stats.get("completed_project_count", 0)
-        team.total_comments = project_stats.get("total_comments", 0)
-        team.total_votes = project_stats.get("total_votes", 0)
-        team.last_activity_at = last_activity_at
-        team.engagement_score = engagement_score
-        team.engagement_level = engagement_level
-
-
 @router.get("", response_model=List[Team])
 async def get_teams(
+    response: Response,
     skip: int = Query(0, ge=0, le=1000),
     limit: int = Query(100, ge=0, le=1000),
     hackathon_id: int = None,
+    after: Optional[Keyset] = Depends(get_cursor),
     db: Session = Depends(get_db)
 ):
-    """Get all teams."""
+    """Get all teams, newest first."""
     if hackathon_id:
         # Get teams for specific hackathon
         teams = team_repository.get_by_hackathon(
-            db, hackathon_id, skip=skip, limit=limit
+            db, hackathon_id, skip=skip, limit=limit, after=after
         )
     else:
         # Get all teams
-        teams = team_repository.get_multi(db, skip=skip, limit=limit)
+        teams = team_repository.get_page(
+            db, skip=skip, limit=limit, after=after
+        )
 
-    _attach_team_stats(db, teams)
+    attach_team_stats(db, teams)
+    set_next_cursor(response, teams, limit)
     return teams
 
 
@@ -176,11 +84,10 @@ async def get_team(
     if not team:
         raise_not_found(locale, "team")
 
-    team.view_count = (team.view_count or 0) + 1
-    db.commit()
-    db.refresh(team)
+    # Counted in batches; the stored count catches up on the next flush
+    view_counter.record("team", team_id)
 
-    _attach_team_stats(db, [team])
+    attach_team_stats(db, [team])
     return team
 
 
@@ -10,7 +10,8 @@ from app.core.auth import get_current_user
 from app.core.permissions import PERMISSION_CODES, user_has_permission
 from app.domain.schemas.user import User, UserUpdate
 from app.domain.schemas.project import Project
-from app.domain.models.team import Team, TeamMember
+from app.repositories.team_repository import TeamRepository
+from app.services.dashboard_service import dashboard_service
 from app.services.user_service import UserService
 from app.i18n.dependencies import get_locale
 from app.i18n.helpers import (
@@ -23,6 +24,37 @@ from app.api.openapi_responses import (
 )
 
 router = APIRouter(responses=UNAUTHORIZED_RESPONSE)
+team_repository = TeamRepository()
+
+
+def _teams_with_members(teams: List) -> List[dict]:
+    """
+    Serialize teams with their members from eagerly loaded rows.
+
+    Member counts come from the loaded members; no project statistics
+    are needed for these listings.
+    """
+    return [
+        {
+            "id": team.id,
+            "name": team.name,
+            "description": team.description,
+            "hackathon_id": team.hackathon_id,
+            "created_at": team.created_at,
+            "member_count": len(team.members),
+            "members": [
+                {
+                    "id": member.user.id,
+                    "name": member.user.name,
+                    "email": member.user.email,
+                    "role": member.role,
+                    "joined_at": member.joined_at
+                }
+                for member in team.members if member.user
+            ]
+        }
+        for team in teams
+    ]
 
 
 @router.get(
@@ -84,28 +116,11 @@ async def get_user_stats(
     current_user: User = Depends(get_current_user)
 ):
     """Get user statistics"""
-    # Count user's projects
-    from app.domain.models.project import Project
-    projects_count = db.query(Project).filter(
-        Project.owner_id == current_user.id
-    ).count()
-
-    # Count user's hackathons (where user is owner)
-    from app.domain.models.hackathon import Hackathon
-    hackathons_count = db.query(Hackathon).filter(
-        Hackathon.owner_id == current_user.id
-    ).count()
-
-    # Count user's votes
-    from app.domain.models.project import Vote
-    votes_count = db.query(Vote).filter(
-        Vote.user_id == current_user.id
-    ).count()
-
+    counts = dashboard_service.get_counts(db, current_user.id)
     return {
-        "hackathonsCreated": hackathons_count,
-        "projectsSubmitted": projects_count,
-        "totalVotes": votes_count
+        "hackathonsCreated": counts["hackathons_created"],
+        "projectsSubmitted": counts["projects"],
+        "totalVotes": counts["votes"]
     }
 
 
@@ -209,57 +224,10 @@ async def get_user_teams_for_hackathon(
     if not hackathon:
         raise_not_found(locale, "hackathon")
 
-    # Get user's teams for this hackathon
-    # We need to query teams through TeamMember join
-    teams = db.query(Team).join(
-        TeamMember, Team.id == TeamMember.team_id
-    ).filter(
-        TeamMember.user_id == current_user.id,
-        Team.hackathon_id == hackathon_id
-    ).all()
-
-    # Convert to TeamWithMembers schema
-    from app.domain.models.user import User as UserModel
-
-    result = []
-    for team in teams:
-        # Get members count
-        member_count = db.query(TeamMember).filter(
-            TeamMember.team_id == team.id
-        ).count()
-
-        # Create team with members data
-        team_data = {
-            "id": team.id,
-            "name": team.name,
-            "description": team.description,
-            "hackathon_id": team.hackathon_id,
-            "created_at": team.created_at,
-            "member_count": member_count,
-            "members": []
-        }
-
-        # Get team members
-        members = db.query(TeamMember).filter(
-            TeamMember.team_id == team.id
-        ).all()
-
-        for member in members:
-            user = db.query(UserModel).filter(
-                UserModel.id == member.user_id
-            ).first()
-            if user:
-                team_data["members"].append({
-                    "id": user.id,
-                    "name": user.name,
-                    "email": user.email,
-                    "role": member.role,
-                    "joined_at": member.joined_at
-                })
-
-        result.append(team_data)
-
-    return result
+    teams = team_repository.get_member_teams(
+        db, current_user.id, hackathon_id=hackathon_id
+    )
+    return _teams_with_members(teams)
 
 
 @router.get("/{user_id}/teams")
@@ -272,10 +240,8 @@ async def get_user_teams(
     """Get all teams a user belongs to"""
     # Check if user exists
     from app.repositories.user_repository import UserRepository
-    from app.repositories.team_repository import TeamMemberRepository
 
     user_repository = UserRepository()
-    team_member_repository = TeamMemberRepository()
 
     user = user_repository.get(db, user_id)
     if not user:
@@ -284,60 +250,8 @@ async def get_user_teams(
     if current_user.id != user_id and not user_has_permission(db, current_user, PERMISSION_CODES["users_view"]):
         raise_forbidden(locale, "view_teams", entity="user")
 
-    # Get user's team memberships
-    team_memberships = team_member_repository.get_user_teams(
-        db, user_id=user_id
-    )
-
-    # Get the actual teams
-    teams = []
-    for membership in team_memberships:
-        team = db.query(Team).filter(Team.id == membership.team_id).first()
-        if team:
-            teams.append(team)
-
-    # Convert to TeamWithMembers schema
-    from app.domain.models.user import User as UserModel
-
-    result = []
-    for team in teams:
-        # Get members count
-        member_count = db.query(TeamMember).filter(
-            TeamMember.team_id == team.id
-        ).count()
-
-        # Create team with members data
-        team_data = {
-            "id": team.id,
-            "name": team.name,
-            "description": team.description,
-            "hackathon_id": team.hackathon_id,
-            "created_at": team.created_at,
-            "member_count": member_count,
-            "members": []
-        }
-
-        # Get team members
-        members = db.query(TeamMember).filter(
-            TeamMember.team_id == team.id
-        ).all()
-
-        for member in members:
-            user = db.query(UserModel).filter(
-                UserModel.id == member.user_id
-            ).first()
-            if user:
-                team_data["members"].append({
-                    "id": user.id,
-                    "name": user.name,
-                    "email": user.email,
-                    "role": member.role,
-                    "joined_at": member.joined_at
-                })
-
-        result.append(team_data)
-
-    return result
+    teams = team_repository.get_member_teams(db, user_id)
+    return _teams_with_members(teams)
 
 
 @router.get("/{user_id}", response_model=User)
@@ -404,64 +318,4 @@ async def get_user_profile(
     if user is None:
         raise_not_found(locale, "user")
 
-    # Get user's projects
-    from app.domain.models.project import Project
-    projects = db.query(Project).filter(
-        Project.owner_id == user_id
-    ).limit(10).all()
-
-    # Get user's team memberships
-    team_memberships = db.query(TeamMember).filter(
-        TeamMember.user_id == user_id
-    ).all()
-
-    # Get team details
-    teams = []
-    for membership in team_memberships:
-        team = db.query(Team).filter(Team.id == membership.team_id).first()
-        if team:
-            teams.append({
-                "id": team.id,
-                "name": team.name,
-                "role": membership.role,
-                "joined_at": membership.joined_at
-            })
-
-    # Get hackathon registrations
-    from app.domain.models.hackathon import HackathonRegistration
-    registrations = db.query(HackathonRegistration).filter(
-        HackathonRegistration.user_id == user_id
-    ).all()
-
-    hackathons = []
-    for registration in registrations:
-        from app.domain.models.hackathon import Hackathon
-        hackathon = db.query(Hackathon).filter(
-            Hackathon.id == registration.hackathon_id
-        ).first()
-        if hackathon:
-            hackathons.append({
-                "id": hackathon.id,
-                "name": hackathon.name,
-                "registered_at": registration.registered_at,
-                "status": registration.status
-            })
-
-    return {
-        "user": user,
-        "projects": [
-            {
-                "id": p.id,
-                "title": p.title,
-                "description": p.description,
-                "created_at": p.created_at
-            } for p in projects
-        ],
-        "teams": teams,
-        "hackathons": hackathons,
-        "stats": {
-            "project_count": len(projects),
-            "team_count": len(teams),
-            "hackathon_count": len(hackathons)
-        }
-    }
+    return {"user": user, **dashboard_service.get_profile(db, user_id)}
@@ -8,14 +8,17 @@ from sqlalchemy.orm import Session
 from datetime import datetime, timedelta, timezone
 import os
 import uuid
+from types import SimpleNamespace
 from dotenv import load_dotenv
 
+from app.repositories.rbac_repository import ACCESS_MEMO_KEY, USER_ACCESS_TAG
 from app.repositories.user_repository import (
-    UserRepository, RefreshTokenRepository
+    USER_SESSION_TAG, UserRepository, RefreshTokenRepository
 )
 from app.domain.schemas.user import TokenData, User
 from app.core.database import get_db
 from app.i18n.helpers import raise_i18n_http_exception
+from app.utils.cache import cache_manager
 from app.utils.cookies import get_auth_token_from_cookies
 
 load_dotenv()
@@ -30,6 +33,23 @@ REFRESH_TOKEN_EXPIRE_DAYS = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", "7"))
 REFRESH_TOKEN_EXPIRE_DAYS_PERSISTENT = int(
     os.getenv("REFRESH_TOKEN_EXPIRE_DAYS_PERSISTENT", "30")
 )
+# Trust the signed claims of access tokens (user id, roles, permission
+# mask) for their lifetime instead of loading the user on every request.
+# Logout, closing the account and password changes revoke the tokens
+# through the session version tag; role changes make requests fall back
+# to the RBAC cache. Only takes effect with Redis: the tag versions have
+# to be shared, or a revocation would only reach the worker handling it.
+STATELESS_ACCESS_TOKENS = os.getenv(
+    "STATELESS_ACCESS_TOKENS", "false"
+).lower() in ("1", "true", "yes")
+
+if STATELESS_ACCESS_TOKENS and not cache_manager.use_redis:
+    import warnings
+    warnings.warn(
+        "STATELESS_ACCESS_TOKENS is ignored without Redis. "
+        "Set REDIS_URL to verify access tokens from their claims.",
+        UserWarning
+    )
 
 # Security warning for default secret key
 if SECRET_KEY == "your-secret-key-here-change-in-production":
@@ -48,6 +68,122 @@ def _serialize_user_with_access(db: Session, user):
     return apply_access_context(db, user)
 
 
+class TokenUser:
+    """
+    Current user known from the claims of a stateless access token.
+
+    Carries the id, username, roles and permissions; any other attribute
+    loads the user row on first access.
+    """
+
+    is_active = True
+
+    def __init__(self, db: Session, user_id: int, username: str):
+        self.id = user_id
+        self.username = username
+        self.roles = []
+        self.permissions = []
+        self.role = "user"
+        self._db = db
+        self._user = None
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        if self._user is None:
+            self._user = UserRepository().get(self._db, self.id)
+            if self._user is None:
+                raise AttributeError(name)
+        return getattr(self._user, name)
+
+
+def stateless_access_tokens_enabled() -> bool:
+    """Whether access tokens are verified from their claims."""
+    return STATELESS_ACCESS_TOKENS and cache_manager.use_redis
+
+
+def _token_tags(user_id: int):
+    return (
+        USER_SESSION_TAG.format(user_id=user_id),
+        USER_ACCESS_TAG.format(user_id=user_id),
+    )
+
+
+def revoke_access_tokens(user_id: int):
+    """Reject the stateless access tokens issued to a user so far."""
+    cache_manager.invalidate_tags(USER_SESSION_TAG.format(user_id=user_id))
+
+
+def _access_claims(user_id: int, db: Session = None):
+    """Claims that let an access token be verified without the database."""
+    from app.core.permissions import (
+        PERMISSION_BITS, PERMISSION_CATALOGUE, get_user_access_context
+    )
+    # Versions are read before the roles: a concurrent change then makes
+    # the token look outdated rather than the roles look current.
+    tags = _token_tags(user_id)
+    versions = cache_manager.get_tag_versions(tags)
+    claims = {"ver": [versions[tag] for tag in tags]}
+    if db is not None:
+        access = get_user_access_context(db, SimpleNamespace(id=user_id))
+        claims.update(
+            roles=access.roles,
+            perms=access.permission_mask,
+            pcat=PERMISSION_CATALOGUE,
+        )
+        uncatalogued = [
+            code for code in access.permissions if code not in PERMISSION_BITS
+        ]
+        if uncatalogued:
+            claims["perms_x"] = uncatalogued
+    return claims
+
+
+def _user_from_claims(db: Session, payload: dict, locale: str = "en"):
+    """
+    Current user from a stateless access token.
+
+    Returns None when the token has to be checked against the database,
+    which is always the case without Redis.
+    """
+    from app.core.permissions import (
+        PERMISSION_CATALOGUE, AccessContext, permissions_from_mask
+    )
+    if not cache_manager.use_redis:
+        return None
+    user_id = payload.get("user_id")
+    issued = payload.get("ver")
+    if not isinstance(user_id, int) or not isinstance(issued, list) \
+            or len(issued) != 2:
+        return None
+    session_tag, access_tag = _token_tags(user_id)
+    versions = cache_manager.get_tag_versions((session_tag, access_tag))
+    if issued[0] > versions[session_tag]:
+        # The version store was reset; revocations may have been lost.
+        return None
+    if issued[0] < versions[session_tag]:
+        raise_i18n_http_exception(
+            locale=locale,
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            translation_key="errors.could_not_validate_credentials",
+            headers={"WWW-Authenticate": "Bearer"}
+        )
+
+    user = TokenUser(db, user_id, payload["sub"])
+    if issued[1] == versions[access_tag] and "roles" in payload \
+            and payload.get("pcat") == PERMISSION_CATALOGUE:
+        mask = payload["perms"]
+        db.info.setdefault(ACCESS_MEMO_KEY, {})[user_id] = AccessContext(
+            roles=list(payload["roles"]),
+            permissions=permissions_from_mask(mask)
+            + list(payload.get("perms_x", [])),
+            permission_mask=mask,
+        )
+    # Otherwise the roles changed since the token was issued and are
+    # loaded through the RBAC cache.
+    return _serialize_user_with_access(db, user)
+
+
 def create_access_token(data: dict, expires_delta: timedelta = None):
     """Create a JWT token with expiration"""
     to_encode = data.copy()
@@ -74,16 +210,27 @@ def verify_token(token: str, credentials_exception):
         raise credentials_exception
 
 
-def create_tokens(user_id: int, username: str, remember_me: bool = False):
-    """Create access and refresh token pair"""
+def create_tokens(
+    user_id: int, username: str, remember_me: bool = False,
+    db: Session = None
+):
+    """
+    Create access and refresh token pair.
+
+    With stateless access tokens, ``db`` is used to embed the user's roles
+    and permissions; without it they are looked up per request.
+    """
     # Access token
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    claims = {
+        "sub": username,
+        "user_id": user_id,
+        "type": "access"
+    }
+    if stateless_access_tokens_enabled():
+        claims.update(_access_claims(user_id, db))
     access_token = create_access_token(
-        data={
-            "sub": username,
-            "user_id": user_id,
-            "type": "access"
-        },
+        data=claims,
         expires_delta=access_token_expires
     )
 
@@ -215,7 +362,7 @@ def refresh_tokens(refresh_token: str, db: Session, locale: str = "en"):
     refresh_token_repository.revoke_by_token_id(db, token_info["token_id"])
 
     # Create new tokens with same persistence setting
-    new_tokens = create_tokens(user.id, user.username, is_persistent)
+    new_tokens = create_tokens(user.id, user.username, is_persistent, db=db)
 
     # Store new refresh token in database with persistence flag
     now = datetime.now(timezone.utc)
@@ -262,6 +409,11 @@ def get_current_user_from_token(
         )
         token_data = verify_token(token, credentials_exception)
 
+        if stateless_access_tokens_enabled():
+            user = _user_from_claims(db, payload, locale)
+            if user is not None:
+                return user
+
         user_repository = UserRepository()
         user = user_repository.get_by_username(
             db, username=token_data.username
@@ -339,58 +491,7 @@ async def get_current_user_with_cookies(
             headers={"WWW-Authenticate": "Bearer"}
         )
 
-    try:
-        # Decode token to check type
-        payload = jwt.decode(auth_token, SECRET_KEY, algorithms=[ALGORITHM])
-        token_type = payload.get("type")
-
-        # Only accept access tokens
-        if token_type != "access":
-            raise_i18n_http_exception(
-                locale=locale,
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                translation_key="errors.could_not_validate_credentials",
-                headers={"WWW-Authenticate": "Bearer"}
-            )
-
-        # Use existing verify_token for backward compatibility
-        credentials_exception = HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-        token_data = verify_token(auth_token, credentials_exception)
-
-        # Try to find user by username (stored in token sub field)
-        user_repository = UserRepository()
-        user = user_repository.get_by_username(
-            db, username=token_data.username)
-        if user is None:
-            # Fallback: try to find by email (for backward compatibility)
-            user = user_repository.get_by_email(
-                db, email=token_data.username)
-            if user is None:
-                raise_i18n_http_exception(
-                    locale=locale,
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    translation_key="errors.could_not_validate_credentials",
-                    headers={"WWW-Authenticate": "Bearer"}
-                )
-        if getattr(user, "is_active", True) is False:
-            raise_i18n_http_exception(
-                locale=locale,
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                translation_key="errors.could_not_validate_credentials",
-                headers={"WWW-Authenticate": "Bearer"}
-            )
-        return _serialize_user_with_access(db, user)
-    except JWTError:
-        raise_i18n_http_exception(
-            locale=locale,
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            translation_key="errors.could_not_validate_credentials",
-            headers={"WWW-Authenticate": "Bearer"}
-        )
+    return get_current_user_from_token(db, auth_token, locale)
 
 
 async def get_current_active_user(
@@ -17,6 +17,22 @@ class Settings(BaseSettings):
     DATABASE_URL: str = "sqlite:///./hackathon.db"
     DATABASE_POOL_SIZE: int = 5
     DATABASE_MAX_OVERFLOW: int = 10
+    # Async driver URL; derived from DATABASE_URL (asyncpg/aiosqlite) if unset
+    DATABASE_ASYNC_URL: Optional[str] = None
+
+    # Cache
+    REDIS_URL: Optional[str] = None
+    CACHE_LOCAL_MAX_ENTRIES: int = 1024
+    CACHE_LOCAL_MAX_BYTES: Optional[int] = None
+    # Upper bound for L1 entries when Redis is the shared tier
+    CACHE_LOCAL_TTL: int = 30
+    # Longest a request waits for another worker computing the same
+    # cache entry before running the query itself
+    CACHE_SINGLE_FLIGHT_WAIT: float = 0.25
+    # Threads refreshing stale cache entries in the background
+    CACHE_REFRESH_WORKERS: int = 4
+    # Seconds between flushes of buffered page-view counts
+    VIEW_COUNT_FLUSH_INTERVAL: float = 5.0
 
     # Security
     SECRET_KEY: str = "your-secret-key-here-change-in-production"
@@ -45,6 +61,11 @@ class Settings(BaseSettings):
     SMTP_FROM_EMAIL: Optional[str] = None
     SMTP_TLS: bool = True
     SMTP_SSL: bool = False
+    # Bulk email (newsletters, reminders): recipients read per batch,
+    # emails per send_many call, and an optional messages/second cap
+    BULK_EMAIL_BATCH_SIZE: int = 500
+    BULK_EMAIL_CHUNK_SIZE: int = 50
+    BULK_EMAIL_RATE_LIMIT: Optional[float] = None
 
     # OAuth
     GITHUB_CLIENT_ID: Optional[str] = None
@@ -64,6 +85,23 @@ class Settings(BaseSettings):
     # Notification
     VAPID_PUBLIC_KEY: Optional[str] = None
     VAPID_PRIVATE_KEY: Optional[str] = None
+    # Store email and push deliveries as pending for the outbox worker
+    # (python -m app.workers.notifications) instead of sending them in
+    # the request; in-app deliveries are always written inline. Only
+    # enable it where the worker runs, or email and push stay unsent.
+    NOTIFICATION_OUTBOX: bool = False
+    NOTIFICATION_WORKER_BATCH_SIZE: int = 50
+    NOTIFICATION_WORKER_CONCURRENCY: int = 8
+    NOTIFICATION_WORKER_POLL_INTERVAL: float = 2.0
+    # Claimed deliveries not finished within the lease are claimed again
+    NOTIFICATION_WORKER_LEASE_SECONDS: int = 300
+    NOTIFICATION_MAX_ATTEMPTS: int = 5
+    NOTIFICATION_RETRY_BASE_SECONDS: float = 30.0
+    NOTIFICATION_RETRY_MAX_SECONDS: float = 3600.0
+    # Bulk push: users whose subscriptions are loaded per query, and
+    # concurrent FCM/WebPush sends shared by all of them
+    PUSH_BULK_BATCH_SIZE: int = 500
+    PUSH_MAX_CONCURRENCY: int = 16
 
     class Config:
         env_file = ".env"
@@ -1,7 +1,11 @@
 """
 Database configuration and session management.
 """
+from typing import AsyncIterator, Optional
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+)
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import StaticPool
 import os
@@ -80,6 +84,95 @@ def get_db() -> Session:
         db.close()
 
 
+def to_async_database_url(url: str) -> str:
+    """
+    Translate a sync database URL into its async driver equivalent.
+
+    PostgreSQL URLs are mapped to asyncpg (``sslmode`` becomes asyncpg's
+    ``ssl`` parameter) and SQLite URLs to aiosqlite.
+    """
+    if url.startswith("sqlite+aiosqlite:") or "+asyncpg" in url:
+        return url
+    if url.startswith("sqlite:"):
+        return "sqlite+aiosqlite:" + url[len("sqlite:"):]
+    for prefix in ("postgresql+psycopg2:", "postgresql:", "postgres:"):
+        if url.startswith(prefix):
+            url = "postgresql+asyncpg:" + url[len(prefix):]
+            return url.replace("sslmode=", "ssl=")
+    return url
+
+
+_async_engine: Optional[AsyncEngine] = None
+_async_session_factory: Optional[async_sessionmaker] = None
+
+
+def get_async_engine() -> AsyncEngine:
+    """
+    Return the shared async engine, creating it on first use.
+
+    Created lazily so the async drivers are only required by deployments
+    that actually use async sessions.
+    """
+    global _async_engine
+    if _async_engine is None:
+        async_url = settings.DATABASE_ASYNC_URL or to_async_database_url(
+            settings.DATABASE_URL
+        )
+        if async_url.startswith("sqlite"):
+            _async_engine = create_async_engine(
+                async_url,
+                poolclass=StaticPool,
+                echo=settings.DEBUG
+            )
+        else:
+            _async_engine = create_async_engine(
+                async_url,
+                pool_size=settings.DATABASE_POOL_SIZE,
+                max_overflow=settings.DATABASE_MAX_OVERFLOW,
+                pool_pre_ping=True,
+                echo=settings.DEBUG
+            )
+    return _async_engine
+
+
+def get_async_session_factory() -> async_sessionmaker:
+    """Return the async session factory bound to the shared async engine."""
+    global _async_session_factory
+    if _async_session_factory is None:
+        _async_session_factory = async_sessionmaker(
+            bind=get_async_engine(),
+            class_=AsyncSession,
+            autoflush=False,
+            expire_on_commit=False,
+        )
+    return _async_session_factory
+
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """
+    Dependency function to get an async database session.
+
+    Queries are awaited instead of blocking the event loop, so async
+    routes should prefer this over get_db.
+
+    Usage:
+        @app.get("/items")
+        async def read_items(db: AsyncSession = Depends(get_async_db)):
+            ...
+    """
+    async with get_async_session_factory()() as db:
+        yield db
+
+
+async def dispose_async_engine() -> None:
+    """Close all pooled async connections (application shutdown)."""
+    global _async_engine, _async_session_factory
+    if _async_engine is not None:
+        await _async_engine.dispose()
+    _async_engine = None
+    _async_session_factory = None
+
+
 def create_tables():
     """Create all database tables (for development/testing)."""
     Base.metadata.create_all(bind=engine)
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import hashlib
+import logging
+from contextvars import ContextVar
 from dataclasses import dataclass
-from typing import Iterable
+from typing import Iterable, Optional
 
 from fastapi import Depends, HTTPException, status
+from sqlalchemy import and_, event
 from sqlalchemy.orm import Session
 
 from app.core.auth import get_current_user
@@ -15,8 +19,12 @@ from app.domain.models.shared import File
 from app.domain.models.team import Team, TeamMember, TeamReport
 from app.domain.models.user import User
 from app.repositories.rbac_repository import (
-    PermissionRepository, UserRoleRepository
+    ACCESS_MEMO_KEY, USER_ACCESS_TAG, UserRoleRepository
 )
+from app.utils.cache import cached
+from app.utils.notification_mask_utils import enable_all_flags, has_flag
+
+logger = logging.getLogger(__name__)
 
 SYSTEM_ROLE_NAMES = ("user", "moderator", "admin", "superuser")
 PERMISSION_CODES = {
@@ -104,15 +112,66 @@ ROLE_PERMISSION_MAP = {
     "superuser": set(PERMISSION_CODES.values()),
 }
 
+# Bit of each catalogued permission, compiled once at import. Codes only
+# present in the database (not in PERMISSION_CODES) have no bit and are
+# checked against AccessContext.permissions instead.
+PERMISSION_BITS = {
+    code: 1 << position
+    for position, code in enumerate(sorted(set(PERMISSION_CODES.values())))
+}
+ALL_PERMISSIONS_MASK = enable_all_flags(PERMISSION_BITS.values())
+# Fingerprint of the bit layout, so masks compiled by a process with a
+# different catalogue (e.g. in access tokens) are recognised as foreign.
+PERMISSION_CATALOGUE = hashlib.sha256(
+    ",".join(PERMISSION_BITS).encode()
+).hexdigest()[:12]
+
+
+def permission_mask(codes: Iterable[str]) -> int:
+    """Bitmask of the catalogued permissions among ``codes``."""
+    return enable_all_flags(
+        PERMISSION_BITS[code] for code in codes if code in PERMISSION_BITS
+    )
+
+
+def permissions_from_mask(mask: int) -> list[str]:
+    """Catalogued permission codes whose bits are set in ``mask``."""
+    return [
+        code for code, bit in PERMISSION_BITS.items() if has_flag(mask, bit)
+    ]
+
+
+ROLE_PERMISSION_MASKS = {
+    role: permission_mask(codes) for role, codes in ROLE_PERMISSION_MAP.items()
+}
+
 
 user_role_repository = UserRoleRepository()
-permission_repository = PermissionRepository()
 
 
 @dataclass
 class AccessContext:
     roles: list[str]
     permissions: list[str]
+    permission_mask: Optional[int] = None
+
+    def __post_init__(self):
+        if self.permission_mask is None:
+            self.permission_mask = (
+                ALL_PERMISSIONS_MASK if "superuser" in self.roles
+                else permission_mask(self.permissions)
+            )
+
+    def allows(self, code: str) -> bool:
+        """Whether the permissions include ``code``."""
+        bit = PERMISSION_BITS.get(code)
+        if bit is not None:
+            return has_flag(self.permission_mask, bit)
+        return "superuser" in self.roles or code in self.permissions
+
+    def allows_any(self, mask: int) -> bool:
+        """Whether any permission of a compiled ``mask`` is granted."""
+        return bool(self.permission_mask & mask)
 
     @property
     def primary_role(self) -> str:
@@ -122,22 +181,116 @@ class AccessContext:
         return "user"
 
 
+# Shared cache lifetime for access contexts. Role assignments through
+# UserRoleRepository.set_user_roles invalidate immediately; the TTL bounds
+# staleness after direct database edits.
+ACCESS_CACHE_TTL = 60
+RBAC_QUERIES_HEADER = "X-RBAC-Queries"
+
+
+class RBACQueryStats:
+    """Number of RBAC queries run while handling one request."""
+
+    def __init__(self):
+        self.queries = 0
+
+
+_rbac_query_stats: ContextVar[RBACQueryStats | None] = ContextVar(
+    "rbac_query_stats", default=None
+)
+
+
+def start_rbac_query_stats() -> RBACQueryStats:
+    """Start counting RBAC queries for the current request or task."""
+    stats = RBACQueryStats()
+    _rbac_query_stats.set(stats)
+    return stats
+
+
+class RBACQueryCounterMiddleware:
+    """
+    Count RBAC queries per request and report them in X-RBAC-Queries.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = start_rbac_query_stats()
+
+        async def send_with_count(message):
+            if message["type"] == "http.response.start":
+                message.setdefault("headers", []).append((
+                    RBAC_QUERIES_HEADER.lower().encode(),
+                    str(stats.queries).encode(),
+                ))
+                if stats.queries:
+                    logger.debug(
+                        "%s %s ran %d RBAC queries", scope["method"],
+                        scope["path"], stats.queries,
+                    )
+            await send(message)
+
+        await self.app(scope, receive, send_with_count)
+
+
+@cached(
+    ttl=ACCESS_CACHE_TTL,
+    tags=(USER_ACCESS_TAG,),
+    key=("user_id",),
+)
+def _load_access(db: Session, user_id: int) -> dict:
+    """Roles and permission codes of a user, from one joined query."""
+    stats = _rbac_query_stats.get()
+    if stats is not None:
+        stats.queries += 1
+    roles = user_role_repository.get_user_roles(db, user_id)
+    if not roles:
+        return {
+            "roles": ["user"],
+            "permissions": sorted(ROLE_PERMISSION_MAP["user"]),
+        }
+    return {
+        "roles": [role.name for role in roles],
+        "permissions": sorted({
+            permission.code
+            for role in roles for permission in role.permissions
+        }),
+    }
+
+
 def get_user_access_context(db: Session, user: User | None) -> AccessContext:
+    """
+    Roles and permissions of a user.
+
+    Memoized on the session for the rest of the request and cached across
+    requests until the user's roles change.
+    """
     if not user:
         return AccessContext(roles=[], permissions=[])
+    memo = db.info.setdefault(ACCESS_MEMO_KEY, {})
+    access = memo.get(user.id)
+    if access is not None:
+        return access
     try:
-        roles = user_role_repository.get_user_roles(db, user.id)
-        role_names = [role.name for role in roles]
-        permission_codes = sorted(
-            permission_repository.get_codes_for_user(db, user.id))
-        if not role_names:
-            role_names = ["user"]
-            permission_codes = sorted(ROLE_PERMISSION_MAP["user"])
-        return AccessContext(roles=role_names, permissions=permission_codes)
+        loaded = _load_access(db, user.id)
     except Exception:
-        return AccessContext(roles=["user"], permissions=sorted(
-            ROLE_PERMISSION_MAP["user"]
-        ))
+        return AccessContext(
+            roles=["user"],
+            permissions=sorted(ROLE_PERMISSION_MAP["user"]),
+            permission_mask=ROLE_PERMISSION_MASKS["user"],
+        )
+    # Bit positions are process-local, so the mask is compiled here
+    # rather than shared through the cache.
+    access = AccessContext(
+        roles=list(loaded["roles"]), permissions=list(loaded["permissions"])
+    )
+    memo[user.id] = access
+    return access
 
 
 def apply_access_context(db: Session, user):
@@ -154,10 +307,7 @@ def apply_access_context(db: Session, user):
 def user_has_permission(db: Session, user: User | None, code: str) -> bool:
     if not user:
         return False
-    access = get_user_access_context(db, user)
-    if "superuser" in access.roles:
-        return True
-    return code in access.permissions
+    return get_user_access_context(db, user).allows(code)
 
 
 def require_permission(code: str):
@@ -174,13 +324,18 @@ def require_permission(code: str):
 
 def require_any_permission(codes: Iterable[str]):
     required = tuple(codes)
+    required_mask = permission_mask(required)
+    uncatalogued = tuple(
+        code for code in required if code not in PERMISSION_BITS
+    )
 
     def dependency(
         db: Session = Depends(get_db),
         current_user: User = Depends(get_current_user)
     ):
-        if not any(
-            user_has_permission(db, current_user, code) for code in required
+        access = get_user_access_context(db, current_user)
+        if not access.allows_any(required_mask) and not any(
+            access.allows(code) for code in uncatalogued
         ):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -210,6 +365,113 @@ def can_delete_hackathon(
     )
 
 
+TEAM_MANAGER_ROLES = {"owner", "admin"}
+# Session.info key of the ownership contexts resolved in a session
+OWNERSHIP_MEMO_KEY = "ownership"
+
+
+@dataclass(frozen=True)
+class OwnershipContext:
+    """
+    Ownership chain of a project or team as seen by one user.
+
+    Loaded by resolve_ownership in a single joined query; pass it on to
+    further checks of the same resource instead of resolving it again.
+    ``owner_id`` is the project owner, or the creator for a team.
+    """
+    user_id: int
+    exists: bool = False
+    owner_id: Optional[int] = None
+    team_id: Optional[int] = None
+    team_creator_id: Optional[int] = None
+    team_role: Optional[str] = None
+    hackathon_id: Optional[int] = None
+    hackathon_owner_id: Optional[int] = None
+
+    @property
+    def is_owner(self) -> bool:
+        return self.owner_id is not None and self.owner_id == self.user_id
+
+    @property
+    def leads_team(self) -> bool:
+        """Created the team or is one of its owners/admins."""
+        return self.team_id is not None and (
+            self.team_creator_id == self.user_id
+            or self.team_role in TEAM_MANAGER_ROLES
+        )
+
+    @property
+    def owns_hackathon(self) -> bool:
+        return (
+            self.hackathon_owner_id is not None
+            and self.hackathon_owner_id == self.user_id
+        )
+
+
+def resolve_ownership(
+    db: Session, user: User, project_id: int | None = None,
+    team_id: int | None = None
+) -> OwnershipContext:
+    """
+    Load a project's (or team's) owner, team, the user's team membership
+    and the hackathon owner in one query.
+
+    Memoized on the session until it flushes or its transaction ends, so
+    repeated checks of the same resource in a request (route and service)
+    share the query.
+    """
+    key = ("project", project_id) if project_id is not None \
+        else ("team", team_id)
+    memo = db.info.setdefault(OWNERSHIP_MEMO_KEY, {})
+    ownership = memo.get((*key, user.id))
+    if ownership is not None:
+        return ownership
+    if project_id is not None:
+        query = db.query(Project.owner_id).select_from(Project).outerjoin(
+            Team, Team.id == Project.team_id
+        ).filter(Project.id == project_id)
+        hackathon_key = Project.hackathon_id
+    else:
+        query = db.query(Team.created_by).filter(Team.id == team_id)
+        hackathon_key = Team.hackathon_id
+    row = query.add_columns(
+        Team.id, Team.created_by, TeamMember.role,
+        Hackathon.id, Hackathon.owner_id,
+    ).outerjoin(TeamMember, and_(
+        TeamMember.team_id == Team.id, TeamMember.user_id == user.id
+    )).outerjoin(Hackathon, Hackathon.id == hackathon_key).first()
+    ownership = OwnershipContext(user.id, True, *row) if row \
+        else OwnershipContext(user_id=user.id)
+    memo[(*key, user.id)] = ownership
+    return ownership
+
+
+@event.listens_for(Session, "after_flush")
+@event.listens_for(Session, "after_transaction_end")
+def _forget_ownership(session, *args):
+    session.info.pop(OWNERSHIP_MEMO_KEY, None)
+
+
+def _manages_team(
+    db: Session, user: User, ownership: OwnershipContext
+) -> bool:
+    if ownership.team_id is None:
+        return False
+    return ownership.leads_team or user_has_permission(
+        db, user, PERMISSION_CODES["teams_update_any"]
+    )
+
+
+def _manages_hackathon(
+    db: Session, user: User, ownership: OwnershipContext
+) -> bool:
+    if ownership.hackathon_id is None:
+        return False
+    return ownership.owns_hackathon or user_has_permission(
+        db, user, PERMISSION_CODES["hackathons_update_any"]
+    )
+
+
 def can_manage_team(
     db: Session, user: User | None, team: Team | None
 ) -> bool:
@@ -221,7 +483,7 @@ def can_manage_team(
         return True
     team_member = db.query(TeamMember).filter(
         TeamMember.team_id == team.id, TeamMember.user_id == user.id).first()
-    return bool(team_member and team_member.role in {"owner", "admin"})
+    return bool(team_member and team_member.role in TEAM_MANAGER_ROLES)
 
 
 def can_delete_team(
@@ -237,7 +499,8 @@ def can_delete_team(
 
 
 def can_manage_project(
-    db: Session, user: User | None, project: Project | None
+    db: Session, user: User | None, project: Project | None,
+    ownership: OwnershipContext | None = None
 ) -> bool:
     if not user or not project:
         return False
@@ -245,27 +508,23 @@ def can_manage_project(
         return True
     if user_has_permission(db, user, PERMISSION_CODES["projects_update_any"]):
         return True
-    if project.team_id:
-        team = db.query(Team).filter(Team.id == project.team_id).first()
-        if can_manage_team(db, user, team):
-            return True
-    if project.hackathon_id:
-        hackathon = db.query(Hackathon).filter(
-            Hackathon.id == project.hackathon_id
-        ).first()
-        if can_manage_hackathon(db, user, hackathon):
-            return True
-    return False
+    if not project.team_id and not project.hackathon_id:
+        return False
+    ownership = ownership or resolve_ownership(db, user, project_id=project.id)
+    return _manages_team(db, user, ownership) or _manages_hackathon(
+        db, user, ownership
+    )
 
 
 def can_delete_project(
-    db: Session, user: User | None, project: Project | None
+    db: Session, user: User | None, project: Project | None,
+    ownership: OwnershipContext | None = None
 ) -> bool:
     if not user or not project:
         return False
-    return can_manage_project(db, user, project) or user_has_permission(
+    return user_has_permission(
         db, user, PERMISSION_CODES["projects_delete_any"]
-    )
+    ) or can_manage_project(db, user, project, ownership)
 
 
 def can_manage_hackathon_reports(
@@ -286,22 +545,10 @@ def can_manage_project_reports(
         return False
     if user_has_permission(db, user, PERMISSION_CODES["reports_view"]):
         return True
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
-        return False
-    if project.owner_id == user.id:
-        return True
-    if project.team_id:
-        team = db.query(Team).filter(Team.id == project.team_id).first()
-        if can_manage_team(db, user, team):
-            return True
-    if project.hackathon_id:
-        hackathon = db.query(Hackathon).filter(
-            Hackathon.id == project.hackathon_id
-        ).first()
-        if hackathon and hackathon.owner_id == user.id:
-            return True
-    return False
+    ownership = resolve_ownership(db, user, project_id=project_id)
+    return ownership.is_owner or _manages_team(
+        db, user, ownership
+    ) or ownership.owns_hackathon
 
 
 def can_review_report(
@@ -319,8 +566,9 @@ def can_review_report(
     if report.resource_type == "project":
         return can_manage_project_reports(db, user, report.resource_id)
     if report.resource_type == "team":
-        team = db.query(Team).filter(Team.id == report.resource_id).first()
-        return bool(team and can_manage_team(db, user, team))
+        return _manages_team(
+            db, user, resolve_ownership(db, user, team_id=report.resource_id)
+        )
     return False
 
 
@@ -343,13 +591,7 @@ def can_review_team_report(
         return False
     if user_has_permission(db, user, PERMISSION_CODES["team_reports_review"]):
         return True
-    team = db.query(Team).filter(Team.id == report.team_id).first()
-    if not team:
-        return False
-    hackathon = db.query(Hackathon).filter(
-        Hackathon.id == team.hackathon_id
-    ).first()
-    return bool(hackathon and hackathon.owner_id == user.id)
+    return resolve_ownership(db, user, team_id=report.team_id).owns_hackathon
 
 
 def can_view_notification(
@@ -11,7 +11,9 @@ from .user import (
 )
 from .rbac import Role, Permission, RolePermission, UserRole
 from .report import Report
-from .project import Project, Vote, Comment, CommentVote
+from .project import (
+    Project, Vote, Comment, CommentVote, Technology, ProjectTechnology
+)
 from .hackathon import Hackathon, HackathonRegistration
 from .team import Team, TeamMember, TeamInvitation, TeamReport
 from .notification import (
@@ -19,7 +21,7 @@ from .notification import (
     UserNotificationPreference, PushSubscription
 )
 from .shared import (
-    File, NewsletterSubscription, ChatRoom,
+    File, NewsletterSubscription, EmailCampaign, ChatRoom,
     ChatMessage, ChatParticipant
 )
 
@@ -270,6 +272,8 @@ __all__ = [
     "Vote",
     "Comment",
     "CommentVote",
+    "Technology",
+    "ProjectTechnology",
     "Hackathon",
     "HackathonRegistration",
     "Team",
@@ -288,6 +292,7 @@ __all__ = [
     "PushSubscription",
     "File",
     "NewsletterSubscription",
+    "EmailCampaign",
     "ChatRoom",
     "ChatMessage",
     "ChatParticipant",
@@ -3,7 +3,7 @@ Hackathon domain models.
 """
 from sqlalchemy import (
     Column, Integer, String, Text, DateTime,
-    ForeignKey, Boolean, Float, UniqueConstraint
+    ForeignKey, Boolean, Float, Index, UniqueConstraint
 )
 from sqlalchemy.sql import func
 
@@ -37,6 +37,13 @@ class Hackathon(Base):
     owner_id = Column(Integer, ForeignKey("users.id"),
                       nullable=True)  # Creator
 
+    # Keyset pagination of the active listing by (start_date, id)
+    __table_args__ = (
+        Index(
+            "ix_hackathons_active_start_id", "is_active", "start_date", "id"
+        ),
+    )
+
     # Relationships will be defined in __init__.py
     # registrations = relationship(
     #     "HackathonRegistration",
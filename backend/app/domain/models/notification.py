@@ -89,6 +89,10 @@ class UserNotification(Base):
         Index("ix_user_notifications_user_id", "user_id"),
         Index("ix_user_notifications_created_at", "created_at"),
         Index("ix_user_notifications_read_at", "read_at"),
+        Index(
+            "ix_user_notifications_user_created_id",
+            "user_id", "created_at", "id"
+        ),
     )
 
 
@@ -108,8 +112,19 @@ class NotificationDelivery(Base):
     attempt_count = Column(Integer, nullable=False, default=0)
     last_attempt_at = Column(DateTime(timezone=True))
     delivered_at = Column(DateTime(timezone=True))
+    # Outbox: language and template variables of a queued send, and when
+    # the worker may (re)try it; NULL for deliveries sent inline.
+    payload = Column(notification_json_type)
+    next_attempt_at = Column(DateTime(timezone=True))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
+    __table_args__ = (
+        Index(
+            "ix_notification_deliveries_status_next_attempt",
+            "status", "next_attempt_at"
+        ),
+    )
+
 
 class PushSubscription(Base):
     __tablename__ = "push_subscriptions"
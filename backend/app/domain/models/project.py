@@ -1,10 +1,14 @@
 """
 Project domain models including Project, Vote, Comment, and CommentVote.
 """
+from typing import List, Optional
+
 from sqlalchemy import (
-    Column, Integer, String, Text, DateTime,
-    ForeignKey, Boolean, UniqueConstraint
+    DDL, Column, Integer, String, Text, DateTime,
+    ForeignKey, Boolean, Index, UniqueConstraint, delete, event, insert,
+    inspect, select
 )
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.sql import func
 
@@ -31,9 +35,26 @@ class Project(Base):
     vote_score = Column(Integer, default=0)  # upvotes - downvotes
     comment_count = Column(Integer, default=0)
     view_count = Column(Integer, default=0)  # Project view count
+    # Denormalized activity, maintained by ProjectRepository.record_activity
+    last_activity_at = Column(DateTime(timezone=True), nullable=True)
+    engagement_score = Column(Integer, default=0, nullable=False)
+    engagement_level = Column(String(10), default="low", nullable=False)
     hackathon_id = Column(Integer, ForeignKey("hackathons.id"), nullable=True)
     team_id = Column(Integer, ForeignKey("teams.id"), nullable=True)
 
+    # Keyset pagination: listings are ordered by (created_at, id)
+    __table_args__ = (
+        Index(
+            "ix_projects_public_created_id", "is_public", "created_at", "id"
+        ),
+        Index("ix_projects_owner_created_id", "owner_id", "created_at", "id"),
+        Index(
+            "ix_projects_hackathon_created_id",
+            "hackathon_id", "created_at", "id"
+        ),
+        Index("ix_projects_team_created_id", "team_id", "created_at", "id"),
+    )
+
     # Relationships will be defined in __init__.py
     # owner = relationship("User", back_populates="projects")
     # hackathon = relationship("Hackathon", back_populates="projects")
@@ -42,6 +63,169 @@ class Project(Base):
     # comments = relationship("Comment", back_populates="project")
 
 
+# Full-text search index for projects (see ProjectRepository.search_projects).
+# Both indexes are only maintained when the searched columns change, so
+# counter updates (votes, views, activity) do not re-tokenize the text.
+# PostgreSQL: a weighted tsvector column with a GIN index, set by a
+# trigger on insert and on updates of title, description or technologies.
+PROJECT_SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('simple', coalesce({row}title, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce({row}technologies, '')), 'B') "
+    "|| setweight(to_tsvector('simple', coalesce({row}description, '')), 'C')"
+)
+POSTGRES_SEARCH_DDL = [
+    "ALTER TABLE projects ADD COLUMN IF NOT EXISTS search_vector tsvector",
+    "CREATE OR REPLACE FUNCTION projects_search_vector_update() "
+    "RETURNS trigger LANGUAGE plpgsql AS $$ BEGIN "
+    "NEW.search_vector := "
+    f"{PROJECT_SEARCH_VECTOR_SQL.format(row='NEW.')}; "
+    "RETURN NEW; END $$",
+    "CREATE TRIGGER projects_search_vector_trg "
+    "BEFORE INSERT OR UPDATE OF title, description, technologies "
+    "ON projects FOR EACH ROW "
+    "EXECUTE FUNCTION projects_search_vector_update()",
+    "CREATE INDEX IF NOT EXISTS ix_projects_search_vector "
+    "ON projects USING GIN (search_vector)",
+]
+# SQLite (dev/tests): an external-content FTS5 table kept in sync by
+# triggers.
+SQLITE_SEARCH_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS projects_fts USING fts5("
+    "title, description, technologies, "
+    "content='projects', content_rowid='id')",
+    "CREATE TRIGGER IF NOT EXISTS projects_fts_ai AFTER INSERT ON projects "
+    "BEGIN INSERT INTO projects_fts(rowid, title, description, technologies) "
+    "VALUES (new.id, new.title, new.description, new.technologies); END",
+    "CREATE TRIGGER IF NOT EXISTS projects_fts_ad AFTER DELETE ON projects "
+    "BEGIN INSERT INTO projects_fts"
+    "(projects_fts, rowid, title, description, technologies) "
+    "VALUES ('delete', old.id, old.title, old.description, "
+    "old.technologies); END",
+    "CREATE TRIGGER IF NOT EXISTS projects_fts_au "
+    "AFTER UPDATE OF title, description, technologies ON projects "
+    "BEGIN INSERT INTO projects_fts"
+    "(projects_fts, rowid, title, description, technologies) "
+    "VALUES ('delete', old.id, old.title, old.description, "
+    "old.technologies); "
+    "INSERT INTO projects_fts(rowid, title, description, technologies) "
+    "VALUES (new.id, new.title, new.description, new.technologies); END",
+    "INSERT INTO projects_fts(projects_fts) VALUES ('rebuild')",
+]
+
+for _statement in POSTGRES_SEARCH_DDL:
+    event.listen(
+        Project.__table__, "after_create",
+        DDL(_statement).execute_if(dialect="postgresql")
+    )
+for _statement in SQLITE_SEARCH_DDL:
+    event.listen(
+        Project.__table__, "after_create",
+        DDL(_statement).execute_if(dialect="sqlite")
+    )
+event.listen(
+    Project.__table__, "before_drop",
+    DDL("DROP TABLE IF EXISTS projects_fts").execute_if(dialect="sqlite")
+)
+
+
+class Technology(Base):
+    """Normalized technology tag dictionary."""
+    __tablename__ = "technologies"
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String(100), nullable=False, unique=True)
+
+
+class ProjectTechnology(Base):
+    """Inverted index from technology tags to projects."""
+    __tablename__ = "project_technologies"
+
+    project_id = Column(
+        Integer, ForeignKey("projects.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    technology_id = Column(
+        Integer, ForeignKey("technologies.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+
+    __table_args__ = (
+        Index(
+            "ix_project_technologies_technology_project",
+            "technology_id", "project_id"
+        ),
+    )
+
+
+def normalize_technologies(value: Optional[str]) -> List[str]:
+    """Split a comma-separated technologies string into unique tags."""
+    tags = []
+    for tag in (value or "").split(","):
+        tag = " ".join(tag.split()).lower()[:100]
+        if tag and tag not in tags:
+            tags.append(tag)
+    return tags
+
+
+def sync_project_technologies(connection, project_id: int,
+                              technologies: Optional[str]) -> None:
+    """Rewrite the tag index rows of one project from its string column."""
+    connection.execute(delete(ProjectTechnology).where(
+        ProjectTechnology.project_id == project_id
+    ))
+    names = normalize_technologies(technologies)
+    if not names:
+        return
+
+    dialect_insert = {
+        "postgresql": postgresql.insert,
+        "sqlite": sqlite.insert,
+    }.get(connection.dialect.name)
+    if dialect_insert is not None:
+        connection.execute(
+            dialect_insert(Technology).values(
+                [{"name": name} for name in names]
+            ).on_conflict_do_nothing(index_elements=["name"])
+        )
+    else:
+        existing = set(connection.execute(
+            select(Technology.name).where(Technology.name.in_(names))
+        ).scalars())
+        missing = [name for name in names if name not in existing]
+        if missing:
+            connection.execute(
+                insert(Technology), [{"name": name} for name in missing]
+            )
+
+    technology_ids = connection.execute(
+        select(Technology.id).where(Technology.name.in_(names))
+    ).scalars().all()
+    connection.execute(insert(ProjectTechnology), [
+        {"project_id": project_id, "technology_id": technology_id}
+        for technology_id in technology_ids
+    ])
+
+
+@event.listens_for(Project, "after_insert")
+def _index_new_project_technologies(mapper, connection, target):
+    if target.technologies:
+        sync_project_technologies(connection, target.id, target.technologies)
+
+
+@event.listens_for(Project, "after_update")
+def _reindex_project_technologies(mapper, connection, target):
+    if inspect(target).attrs.technologies.history.has_changes():
+        sync_project_technologies(connection, target.id, target.technologies)
+
+
+@event.listens_for(Project, "after_delete")
+def _unindex_project_technologies(mapper, connection, target):
+    # SQLite does not enforce ON DELETE CASCADE unless foreign keys are on.
+    connection.execute(delete(ProjectTechnology).where(
+        ProjectTechnology.project_id == target.id
+    ))
+
+
 class Vote(Base):
     __tablename__ = "votes"
 
@@ -77,6 +261,14 @@ class Comment(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    __table_args__ = (
+        Index(
+            "ix_comments_project_parent_created_id",
+            "project_id", "parent_comment_id", "created_at", "id"
+        ),
+        Index("ix_comments_parent_comment_id", "parent_comment_id"),
+    )
+
     @hybrid_property
     def vote_score(self):
         return self.upvote_count - self.downvote_count
@@ -38,6 +38,25 @@ class NewsletterSubscription(Base):
     source = Column(String, default="website_footer")
 
 
+class EmailCampaign(Base):
+    """Progress of one bulk email send (app.services.bulk_email_service)."""
+    __tablename__ = "email_campaigns"
+
+    id = Column(Integer, primary_key=True, index=True)
+    # e.g. "hackathon_start_reminder:42"; one campaign per key
+    key = Column(String(200), unique=True, nullable=False)
+    template_name = Column(String(200), nullable=False)
+    # 'running', 'completed'
+    status = Column(String(20), nullable=False, default="running")
+    # Recipients are sent in ascending id order; resume after this one
+    last_recipient_id = Column(Integer, nullable=False, default=0)
+    sent_count = Column(Integer, nullable=False, default=0)
+    failed_count = Column(Integer, nullable=False, default=0)
+    started_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    completed_at = Column(DateTime(timezone=True), nullable=True)
+
+
 class ChatRoom(Base):
     __tablename__ = "chat_rooms"
 
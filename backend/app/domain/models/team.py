@@ -3,7 +3,7 @@ Team domain models.
 """
 from sqlalchemy import (
     Column, Integer, String, Text, DateTime,
-    ForeignKey, Boolean, UniqueConstraint
+    ForeignKey, Boolean, Index, UniqueConstraint
 )
 from sqlalchemy.sql import func
 
@@ -23,6 +23,14 @@ class Team(Base):
     is_open = Column(Boolean, default=True)  # Open for new members
     view_count = Column(Integer, default=0, nullable=False)  # Team page views
 
+    # Keyset pagination: listings are ordered by (created_at, id)
+    __table_args__ = (
+        Index("ix_teams_created_id", "created_at", "id"),
+        Index(
+            "ix_teams_hackathon_created_id", "hackathon_id", "created_at", "id"
+        ),
+    )
+
     # Relationships will be defined in __init__.py
     # hackathon = relationship("Hackathon", back_populates="teams")
     # creator = relationship("User", foreign_keys=[created_by])
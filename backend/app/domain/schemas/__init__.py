@@ -7,7 +7,7 @@ from .rbac import Role, Permission, UserRoleAssignmentRequest
 from .report import Report, ReportCreateRequest, ReportUpdateRequest, ReportResourceSummary
 from .project import (
     Project, ProjectCreate, ProjectUpdate,
-    Vote, VoteCreate, Comment, CommentCreate
+    Vote, VoteCreate, Comment, CommentCreate, TechnologyFacet
 )
 from .hackathon import (
     Hackathon, HackathonCreate, HackathonUpdate, HackathonRegistration
@@ -77,6 +77,7 @@ __all__ = [
     "VoteCreate",
     "Comment",
     "CommentCreate",
+    "TechnologyFacet",
     "NewsletterSubscription",
     "NewsletterSubscriptionCreate",
     "NewsletterSubscribeRequest",
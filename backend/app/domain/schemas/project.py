@@ -94,6 +94,11 @@ class Project(ProjectBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+class TechnologyFacet(BaseModel):
+    name: str
+    count: int
+
+
 class VoteBase(BaseModel):
     user_id: int
     project_id: int
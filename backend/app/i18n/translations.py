@@ -188,7 +188,8 @@ TRANSLATIONS: Dict[str, Dict[str, Any]] = {
             "string_too_short": "Too short",
             "string_too_long": "Too long",
             "number_too_small": "Number too small",
-            "number_too_large": "Number too large"
+            "number_too_large": "Number too large",
+            "invalid_cursor": "Invalid pagination cursor"
         },
         "email": {
             "newsletter_welcome_subject": "Welcome to Newsletter",
@@ -562,7 +563,8 @@ TRANSLATIONS: Dict[str, Dict[str, Any]] = {
             "string_too_short": "Zu kurz",
             "string_too_long": "Zu lang",
             "number_too_small": "Zahl zu klein",
-            "number_too_large": "Zahl zu groß"
+            "number_too_large": "Zahl zu groß",
+            "invalid_cursor": "Ungültiger Seiten-Cursor"
         },
         "email": {
             "newsletter_welcome_subject": "Willkommen beim Newsletter",
@@ -8,7 +8,11 @@ from fastapi.staticfiles import StaticFiles
 from pathlib import Path
 
 from app.core.config import settings
+from app.core.permissions import (
+    RBAC_QUERIES_HEADER, RBACQueryCounterMiddleware
+)
 from app.i18n.middleware import LocaleMiddleware
+from app.utils.pagination import NEXT_CURSOR_HEADER
 
 # Import routers
 from app.api.v1.auth.routes import router as auth_router
@@ -54,11 +58,15 @@ if settings.CORS_ORIGINS:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=[NEXT_CURSOR_HEADER, RBAC_QUERIES_HEADER],
     )
 
 # Add i18n middleware for language detection
 app.add_middleware(LocaleMiddleware)
 
+# Report RBAC queries per request (X-RBAC-Queries)
+app.add_middleware(RBACQueryCounterMiddleware)
+
 # Mount static files for uploaded images
 upload_dir = Path(settings.UPLOAD_DIR)
 upload_dir.mkdir(parents=True, exist_ok=True)
@@ -194,3 +202,57 @@ async def initialize_notification_types():
         logger.error(f"Failed to initialize notification types: {e}")
     finally:
         db.close()
+
+
+@app.on_event("startup")
+async def warn_about_notification_outbox():
+    """Remind that queued deliveries need the outbox worker."""
+    if settings.NOTIFICATION_OUTBOX:
+        logger.warning(
+            "NOTIFICATION_OUTBOX is enabled: email and push notifications "
+            "are only sent while the outbox worker "
+            "(python -m app.workers.notifications) is running"
+        )
+
+
+@app.on_event("startup")
+async def start_view_counter():
+    """Start the periodic flush of buffered page-view counts."""
+    from app.core.database import SessionLocal
+    from app.utils.view_counter import view_counter
+
+    view_counter.start(SessionLocal)
+
+
+@app.on_event("shutdown")
+async def flush_view_counter():
+    """Write page views still buffered in this worker."""
+    from app.core.database import SessionLocal
+    from app.utils.view_counter import view_counter
+
+    view_counter.stop(SessionLocal)
+
+
+@app.on_event("shutdown")
+async def close_async_database_pool():
+    """Release pooled async database connections."""
+    from app.core.database import dispose_async_engine
+
+    await dispose_async_engine()
+
+
+@app.on_event("shutdown")
+async def close_smtp_pool():
+    """Quit pooled SMTP sessions."""
+    from app.services.email_service import email_service
+
+    email_service.close()
+
+
+@app.on_event("shutdown")
+async def close_fcm_client():
+    """Close the shared FCM HTTP client."""
+    from app.services.push_notification_service import firebase_provider
+
+    if firebase_provider is not None:
+        firebase_provider.close()
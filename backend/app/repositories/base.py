@@ -2,14 +2,38 @@
 Base repository class providing common CRUD operations.
 """
 from typing import TypeVar, Type, Generic, List, Optional, Dict, Any
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import asc, desc
+from sqlalchemy import asc, desc, func, select
 
 from app.domain.models.base import Base
+from app.utils.pagination import Keyset, keyset_paginate
 
 ModelType = TypeVar("ModelType", bound=Base)
 
 
+def filter_model_fields(
+    model: Type[ModelType], obj_in: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Drop keys that are not mapped columns and normalize their names."""
+    # Filter out fields that don't exist in the model.
+    # Use mapper column attributes as source of truth so ORM attribute keys
+    # like Comment.parent_id are preserved even when the DB column name
+    # differs (e.g. parent_comment_id).
+    model_field_map: Dict[str, str] = {}
+    for attr in model.__mapper__.column_attrs:
+        model_field_map[attr.key] = attr.key
+        for column in attr.columns:
+            model_field_map[column.name] = attr.key
+            model_field_map[column.key] = attr.key
+
+    return {
+        model_field_map[k]: v
+        for k, v in obj_in.items()
+        if k in model_field_map
+    }
+
+
 class BaseRepository(Generic[ModelType]):
     """Base repository class with common CRUD operations."""
 
@@ -48,25 +72,26 @@ class BaseRepository(Generic[ModelType]):
             query = query.limit(limit)
         return query.all()
 
+    def get_page(
+        self,
+        db: Session,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        after: Optional[Keyset] = None,
+        filters: Optional[List[Any]] = None,
+    ) -> List[ModelType]:
+        """Get records newest first, continuing after a keyset cursor."""
+        query = db.query(self.model)
+        for condition in filters or []:
+            query = query.filter(condition)
+        return keyset_paginate(
+            query, self.model, after
+        ).offset(skip).limit(limit).all()
+
     def create(self, db: Session, *, obj_in: Dict[str, Any]) -> ModelType:
         """Create a new record."""
-        # Filter out fields that don't exist in the model.
-        # Use mapper column attributes as source of truth so ORM attribute keys
-        # like Comment.parent_id are preserved even when the DB column name
-        # differs (e.g. parent_comment_id).
-        model_field_map: Dict[str, str] = {}
-        for attr in self.model.__mapper__.column_attrs:
-            model_field_map[attr.key] = attr.key
-            for column in attr.columns:
-                model_field_map[column.name] = attr.key
-                model_field_map[column.key] = attr.key
-
-        filtered_data = {
-            model_field_map[k]: v
-            for k, v in obj_in.items()
-            if k in model_field_map
-        }
-        db_obj = self.model(**filtered_data)
+        db_obj = self.model(**filter_model_fields(self.model, obj_in))
         db.add(db_obj)
         db.commit()
         db.refresh(db_obj)
@@ -129,3 +154,108 @@ class BaseRepository(Generic[ModelType]):
             field = asc(field)
 
         return db.query(self.model).order_by(field).offset(skip).limit(limit).all()
+
+
+class AsyncBaseRepository(Generic[ModelType]):
+    """Async counterpart of BaseRepository for AsyncSession callers."""
+
+    def __init__(self, model: Type[ModelType]):
+        self.model = model
+
+    async def get(self, db: AsyncSession, id: int) -> Optional[ModelType]:
+        """Get a single record by ID."""
+        result = await db.execute(
+            select(self.model).where(self.model.id == id)
+        )
+        return result.scalars().first()
+
+    async def get_multi(
+        self, db: AsyncSession, *, skip: int = 0, limit: int = 100
+    ) -> List[ModelType]:
+        """Get multiple records with pagination."""
+        result = await db.execute(
+            select(self.model).offset(skip).limit(limit)
+        )
+        return list(result.scalars().all())
+
+    async def get_all(
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: Optional[int] = 100,
+        filters: Optional[List[Any]] = None,
+        offset: Optional[int] = None,
+        order_by: Optional[List[Any]] = None,
+    ) -> List[ModelType]:
+        """Get records with optional filters and ordering."""
+        stmt = select(self.model)
+        for condition in filters or []:
+            stmt = stmt.where(condition)
+        for ordering in order_by or []:
+            stmt = stmt.order_by(ordering)
+        actual_offset = skip if offset is None else offset
+        stmt = stmt.offset(actual_offset)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        result = await db.execute(stmt)
+        return list(result.scalars().all())
+
+    async def create(
+        self, db: AsyncSession, *, obj_in: Dict[str, Any]
+    ) -> ModelType:
+        """Create a new record."""
+        db_obj = self.model(**filter_model_fields(self.model, obj_in))
+        db.add(db_obj)
+        await db.commit()
+        await db.refresh(db_obj)
+        return db_obj
+
+    async def update(
+        self, db: AsyncSession, *, db_obj: ModelType, obj_in: Dict[str, Any]
+    ) -> ModelType:
+        """Update an existing record."""
+        for field, value in obj_in.items():
+            if hasattr(db_obj, field):
+                setattr(db_obj, field, value)
+        db.add(db_obj)
+        await db.commit()
+        await db.refresh(db_obj)
+        return db_obj
+
+    async def delete(self, db: AsyncSession, *, id: int) -> bool:
+        """Delete a record by ID."""
+        obj = await self.get(db, id)
+        if obj:
+            await db.delete(obj)
+            await db.commit()
+            return True
+        return False
+
+    async def count(self, db: AsyncSession) -> int:
+        """Count total records."""
+        result = await db.execute(
+            select(func.count()).select_from(self.model)
+        )
+        return result.scalar_one()
+
+    async def exists(self, db: AsyncSession, id: int) -> bool:
+        """Check if a record exists by ID."""
+        result = await db.execute(
+            select(self.model.id).where(self.model.id == id).limit(1)
+        )
+        return result.first() is not None
+
+    async def filter(
+        self, db: AsyncSession, *, skip: int = 0, limit: int = 100, **filters
+    ) -> List[ModelType]:
+        """Filter records by given criteria."""
+        stmt = select(self.model)
+        for field, value in filters.items():
+            if hasattr(self.model, field):
+                if value is None:
+                    stmt = stmt.where(getattr(self.model, field).is_(None))
+                else:
+                    stmt = stmt.where(getattr(self.model, field) == value)
+        result = await db.execute(stmt.offset(skip).limit(limit))
+        return list(result.scalars().all())
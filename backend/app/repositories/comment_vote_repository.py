@@ -6,8 +6,11 @@ This repository handles all database operations for CommentVote entities.
 from typing import Optional, List
 from sqlalchemy.orm import Session
 
-from app.domain.models import CommentVote
+from app.domain.models import Comment, CommentVote
 from app.repositories.base import BaseRepository
+from app.repositories.vote_counts import (
+    VoteResult, cast_vote, reconcile_vote_counts, withdraw_vote
+)
 
 
 class CommentVoteRepository(BaseRepository[CommentVote]):
@@ -141,3 +144,60 @@ class CommentVoteRepository(BaseRepository[CommentVote]):
         db.commit()
         db.refresh(vote)
         return vote
+
+    def cast_vote(
+        self, db: Session, comment_id: int, user_id: int, vote_type: str
+    ) -> Optional[VoteResult]:
+        """
+        Add, switch or withdraw a user's vote on a comment.
+
+        Args:
+            db: Database session
+            comment_id: Comment ID
+            user_id: User ID
+            vote_type: Type of vote ("upvote" or "downvote")
+
+        Returns:
+            VoteResult with the comment's new counters, or None if the
+            comment does not exist
+        """
+        result = cast_vote(
+            db, self.model, Comment, comment_id, user_id, vote_type
+        )
+        if result is not None:
+            db.commit()
+        return result
+
+    def remove_vote(
+        self, db: Session, comment_id: int, user_id: int
+    ) -> Optional[VoteResult]:
+        """
+        Withdraw a user's vote on a comment.
+
+        Args:
+            db: Database session
+            comment_id: Comment ID
+            user_id: User ID
+
+        Returns:
+            VoteResult with the comment's new counters, or None if the
+            user had not voted
+        """
+        result = withdraw_vote(db, self.model, Comment, comment_id, user_id)
+        if result is not None:
+            db.commit()
+        return result
+
+    def reconcile_vote_counts(self, db: Session) -> int:
+        """
+        Recount comment vote counters that drifted from the vote rows.
+
+        Args:
+            db: Database session
+
+        Returns:
+            Number of repaired comments
+        """
+        repaired = reconcile_vote_counts(db, self.model, Comment)
+        db.commit()
+        return repaired
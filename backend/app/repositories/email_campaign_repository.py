@@ -0,0 +1,64 @@
+"""
+Email campaign repository: progress of resumable bulk email sends.
+"""
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.domain.models.shared import EmailCampaign
+from app.repositories.base import BaseRepository
+
+
+class EmailCampaignRepository(BaseRepository[EmailCampaign]):
+    """Repository for email campaign progress."""
+
+    def __init__(self):
+        super().__init__(EmailCampaign)
+
+    def get_by_key(self, db: Session, key: str) -> Optional[EmailCampaign]:
+        return db.query(self.model).filter(self.model.key == key).first()
+
+    def get_or_create(
+        self, db: Session, *, key: str, template_name: str
+    ) -> EmailCampaign:
+        """Campaign for ``key``, started if it does not exist yet."""
+        campaign = self.get_by_key(db, key)
+        if campaign is not None:
+            return campaign
+        try:
+            return self.create(db, obj_in={
+                "key": key,
+                "template_name": template_name,
+                "status": "running",
+                "last_recipient_id": 0,
+                "sent_count": 0,
+                "failed_count": 0,
+            })
+        except IntegrityError:
+            # Started concurrently by another process
+            db.rollback()
+            return self.get_by_key(db, key)
+
+    def record_progress(
+        self,
+        db: Session,
+        campaign: EmailCampaign,
+        *,
+        last_recipient_id: int,
+        sent: int,
+        failed: int,
+    ) -> EmailCampaign:
+        """Advance the resume point past a finished batch."""
+        campaign.last_recipient_id = last_recipient_id
+        campaign.sent_count += sent
+        campaign.failed_count += failed
+        db.commit()
+        return campaign
+
+    def complete(self, db: Session, campaign: EmailCampaign) -> EmailCampaign:
+        campaign.status = "completed"
+        campaign.completed_at = datetime.utcnow()
+        db.commit()
+        return campaign
@@ -1,11 +1,15 @@
 """
 Hackathon repository for database operations.
 """
-from typing import List
+from typing import Any, Dict, List, Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.repositories.base import BaseRepository
+from app.repositories.base import AsyncBaseRepository, BaseRepository
+from app.repositories.user_repository import invalidate_user_dashboard
 from app.domain.models.hackathon import Hackathon, HackathonRegistration
+from app.utils.pagination import Keyset, keyset_paginate
 
 
 class HackathonRepository(BaseRepository[Hackathon]):
@@ -15,13 +19,13 @@ class HackathonRepository(BaseRepository[Hackathon]):
         super().__init__(Hackathon)
     
     def get_active_hackathons(
-        self, db: Session, skip: int = 0, limit: int = 100
+        self, db: Session, skip: int = 0, limit: int = 100,
+        after: Optional[Keyset] = None
     ) -> List[Hackathon]:
-        """Get active hackathons."""
-        return db.query(self.model).filter(
-            self.model.is_active.is_(True)
-        ).order_by(
-            self.model.start_date.desc()
+        """Get active hackathons, latest start date first."""
+        query = db.query(self.model).filter(self.model.is_active.is_(True))
+        return keyset_paginate(
+            query, self.model, after, sort_attr="start_date", nulls_last=True
         ).offset(skip).limit(limit).all()
     
     def get_by_owner(
@@ -50,6 +54,23 @@ class HackathonRegistrationRepository(BaseRepository[HackathonRegistration]):
     
     def __init__(self):
         super().__init__(HackathonRegistration)
+
+    def create(self, db: Session, *, obj_in: Dict[str, Any]) -> HackathonRegistration:
+        """Register a user and refresh the user's cached dashboard."""
+        registration = super().create(db, obj_in=obj_in)
+        invalidate_user_dashboard(registration.user_id)
+        return registration
+
+    def delete(self, db: Session, *, id: int) -> bool:
+        """Remove a registration and refresh the user's cached dashboard."""
+        registration = self.get(db, id)
+        if registration is None:
+            return False
+        user_id = registration.user_id
+        db.delete(registration)
+        db.commit()
+        invalidate_user_dashboard(user_id)
+        return True
     
     def get_user_registrations(
         self, db: Session, user_id: int
@@ -102,4 +123,88 @@ class HackathonRegistrationRepository(BaseRepository[HackathonRegistration]):
             )
             db.commit()
         
-        return registration
\ No newline at end of file
+        return registration
+
+
+class AsyncHackathonRepository(AsyncBaseRepository[Hackathon]):
+    """Async repository for hackathons, used with AsyncSession."""
+
+    def __init__(self):
+        super().__init__(Hackathon)
+
+    async def get_active_hackathons(
+        self, db: AsyncSession, skip: int = 0, limit: int = 100,
+        after: Optional[Keyset] = None
+    ) -> List[Hackathon]:
+        """Get active hackathons, latest start date first."""
+        stmt = select(self.model).where(self.model.is_active.is_(True))
+        result = await db.execute(keyset_paginate(
+            stmt, self.model, after, sort_attr="start_date", nulls_last=True
+        ).offset(skip).limit(limit))
+        return list(result.scalars().all())
+
+    async def get_by_owner(
+        self, db: AsyncSession, owner_id: int, skip: int = 0, limit: int = 100
+    ) -> List[Hackathon]:
+        """Get hackathons by owner."""
+        result = await db.execute(
+            select(self.model).where(
+                self.model.owner_id == owner_id
+            ).order_by(
+                self.model.created_at.desc()
+            ).offset(skip).limit(limit)
+        )
+        return list(result.scalars().all())
+
+    async def search_by_name(
+        self, db: AsyncSession, name_query: str,
+        skip: int = 0, limit: int = 100
+    ) -> List[Hackathon]:
+        """Search hackathons by name."""
+        result = await db.execute(
+            select(self.model).where(
+                self.model.name.ilike(f"%{name_query}%")
+            ).order_by(
+                self.model.name
+            ).offset(skip).limit(limit)
+        )
+        return list(result.scalars().all())
+
+
+class AsyncHackathonRegistrationRepository(
+    AsyncBaseRepository[HackathonRegistration]
+):
+    """Async repository for hackathon registrations."""
+
+    def __init__(self):
+        super().__init__(HackathonRegistration)
+
+    async def get_user_registrations(
+        self, db: AsyncSession, user_id: int
+    ) -> List[HackathonRegistration]:
+        """Get all hackathon registrations for a user."""
+        result = await db.execute(
+            select(self.model).where(self.model.user_id == user_id)
+        )
+        return list(result.scalars().all())
+
+    async def get_hackathon_registrations(
+        self, db: AsyncSession, hackathon_id: int
+    ) -> List[HackathonRegistration]:
+        """Get all registrations for a hackathon."""
+        result = await db.execute(
+            select(self.model).where(self.model.hackathon_id == hackathon_id)
+        )
+        return list(result.scalars().all())
+
+    async def is_user_registered(
+        self, db: AsyncSession, user_id: int, hackathon_id: int
+    ) -> bool:
+        """Check if a user is registered for a hackathon."""
+        result = await db.execute(
+            select(self.model.id).where(
+                self.model.user_id == user_id,
+                self.model.hackathon_id == hackathon_id
+            ).limit(1)
+        )
+        return result.first() is not None
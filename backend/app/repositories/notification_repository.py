@@ -1,12 +1,17 @@
 """
 Notification repository for database operations.
 """
-from datetime import datetime, timezone
-from typing import Dict, List, Optional, Sequence
+from datetime import datetime, timedelta, timezone
+from typing import (
+    Any, Collection, Dict, List, Optional, Sequence, Set, Tuple
+)
 
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload, selectinload
 
-from app.repositories.base import BaseRepository
+from app.repositories.base import AsyncBaseRepository, BaseRepository
 from app.domain.models.notification import (
     NotificationDelivery,
     NotificationType,
@@ -14,6 +19,7 @@ from app.domain.models.notification import (
     UserNotification,
     UserNotificationPreference,
 )
+from app.utils.pagination import Keyset, keyset_paginate
 
 
 class NotificationRepository(BaseRepository[UserNotification]):
@@ -29,6 +35,7 @@ class NotificationRepository(BaseRepository[UserNotification]):
         skip: int = 0,
         limit: int = 100,
         unread_only: bool = False,
+        after: Optional[Keyset] = None,
     ) -> List[UserNotification]:
         query = db.query(self.model).options(
             joinedload(self.model.deliveries)
@@ -37,8 +44,8 @@ class NotificationRepository(BaseRepository[UserNotification]):
         if unread_only:
             query = query.filter(self.model.read_at.is_(None))
 
-        return query.order_by(
-            self.model.created_at.desc()
+        return keyset_paginate(
+            query, self.model, after
         ).offset(skip).limit(limit).all()
 
     def create_notification(
@@ -62,6 +69,23 @@ class NotificationRepository(BaseRepository[UserNotification]):
             },
         )
 
+    def insert_many(
+        self, db: Session, rows: Sequence[Dict[str, Any]]
+    ) -> Dict[int, int]:
+        """
+        Insert one notification per row, without committing.
+
+        Rows are sent as multi-row INSERT ... RETURNING statements; each
+        row needs a distinct user_id. Returns notification ids by user.
+        """
+        if not rows:
+            return {}
+        table = self.model.__table__
+        result = db.execute(
+            insert(table).returning(table.c.user_id, table.c.id), list(rows)
+        )
+        return {user_id: notification_id for user_id, notification_id in result}
+
     def mark_as_read(
         self, db: Session, notification_id: int, user_id: int
     ) -> bool:
@@ -94,6 +118,95 @@ class NotificationRepository(BaseRepository[UserNotification]):
         ).count()
 
 
+class AsyncNotificationRepository(AsyncBaseRepository[UserNotification]):
+    """Async repository for user notifications, used with AsyncSession."""
+
+    def __init__(self):
+        super().__init__(UserNotification)
+
+    async def get_user_notifications(
+        self,
+        db: AsyncSession,
+        user_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        unread_only: bool = False,
+        after: Optional[Keyset] = None,
+    ) -> List[UserNotification]:
+        stmt = select(self.model).options(
+            selectinload(self.model.deliveries)
+        ).where(self.model.user_id == user_id)
+
+        if unread_only:
+            stmt = stmt.where(self.model.read_at.is_(None))
+
+        result = await db.execute(
+            keyset_paginate(
+                stmt, self.model, after
+            ).offset(skip).limit(limit)
+        )
+        return list(result.scalars().all())
+
+    async def create_notification(
+        self,
+        db: AsyncSession,
+        *,
+        user_id: int,
+        notification_type: str,
+        title: str,
+        message: str,
+        data: Optional[Dict] = None,
+    ) -> UserNotification:
+        return await self.create(
+            db,
+            obj_in={
+                "user_id": user_id,
+                "notification_type": notification_type,
+                "title": title,
+                "message": message,
+                "data": data,
+            },
+        )
+
+    async def mark_as_read(
+        self, db: AsyncSession, notification_id: int, user_id: int
+    ) -> bool:
+        result = await db.execute(
+            select(self.model).where(
+                self.model.id == notification_id,
+                self.model.user_id == user_id,
+            )
+        )
+        notification = result.scalars().first()
+
+        if notification and not notification.read_at:
+            notification.read_at = datetime.utcnow()
+            await db.commit()
+            return True
+        return notification is not None
+
+    async def mark_all_as_read(self, db: AsyncSession, user_id: int) -> int:
+        result = await db.execute(
+            update(self.model).where(
+                self.model.user_id == user_id,
+                self.model.read_at.is_(None),
+            ).values(read_at=datetime.utcnow()).execution_options(
+                synchronize_session=False
+            )
+        )
+        await db.commit()
+        return result.rowcount
+
+    async def count_unread(self, db: AsyncSession, user_id: int) -> int:
+        result = await db.execute(
+            select(func.count(self.model.id)).where(
+                self.model.user_id == user_id,
+                self.model.read_at.is_(None),
+            )
+        )
+        return result.scalar_one()
+
+
 class NotificationDeliveryRepository(BaseRepository[NotificationDelivery]):
     """Repository for notification delivery records."""
 
@@ -105,12 +218,24 @@ class NotificationDeliveryRepository(BaseRepository[NotificationDelivery]):
         db: Session,
         notification_id: int,
         channels: Sequence[str],
+        *,
+        queued: Collection[str] = (),
+        payload: Optional[Dict[str, Any]] = None,
     ) -> List[NotificationDelivery]:
+        """
+        Insert one pending delivery per channel.
+
+        Channels in ``queued`` are due for the outbox worker right away and
+        keep ``payload`` for it; the others are sent by the caller.
+        """
+        now = datetime.utcnow()
         deliveries = [
             NotificationDelivery(
                 notification_id=notification_id,
                 channel=channel,
                 status="pending",
+                payload=payload if channel in queued else None,
+                next_attempt_at=now if channel in queued else None,
             )
             for channel in channels
         ]
@@ -120,6 +245,41 @@ class NotificationDeliveryRepository(BaseRepository[NotificationDelivery]):
             db.refresh(delivery)
         return deliveries
 
+    def insert_many(
+        self, db: Session, rows: Sequence[Dict[str, Any]]
+    ) -> Dict[Tuple[int, str], int]:
+        """
+        Insert deliveries as multi-row INSERT ... RETURNING, uncommitted.
+
+        Returns delivery ids by (notification id, channel).
+        """
+        if not rows:
+            return {}
+        # Core insert: the ORM bulk path splits rows by their NULL columns
+        table = self.model.__table__
+        result = db.execute(
+            insert(table).returning(
+                table.c.notification_id, table.c.channel, table.c.id
+            ),
+            list(rows),
+        )
+        return {
+            (notification_id, channel): delivery_id
+            for notification_id, channel, delivery_id in result
+        }
+
+    def get_many(
+        self, db: Session, delivery_ids: Collection[int]
+    ) -> List[NotificationDelivery]:
+        """Deliveries with their notification, in id order."""
+        if not delivery_ids:
+            return []
+        return db.query(self.model).options(
+            joinedload(self.model.notification)
+        ).filter(
+            self.model.id.in_(list(delivery_ids))
+        ).order_by(self.model.id.asc()).all()
+
     def get_by_notification(
         self, db: Session, notification_id: int
     ) -> List[NotificationDelivery]:
@@ -144,11 +304,13 @@ class NotificationDeliveryRepository(BaseRepository[NotificationDelivery]):
         error: Optional[str] = None,
         provider_message_id: Optional[str] = None,
         delivered_at: Optional[datetime] = None,
+        next_attempt_at: Optional[datetime] = None,
     ) -> NotificationDelivery:
         delivery.status = status
         delivery.error = error
         delivery.provider_message_id = provider_message_id
         delivery.delivered_at = delivered_at
+        delivery.next_attempt_at = next_attempt_at
         delivery.last_attempt_at = datetime.utcnow()
         delivery.attempt_count = (delivery.attempt_count or 0) + 1
         db.add(delivery)
@@ -156,6 +318,40 @@ class NotificationDeliveryRepository(BaseRepository[NotificationDelivery]):
         db.refresh(delivery)
         return delivery
 
+    def claim_due(
+        self,
+        db: Session,
+        *,
+        limit: int,
+        lease_seconds: int,
+    ) -> List[int]:
+        """
+        Claim up to ``limit`` queued deliveries that are due.
+
+        Rows are locked with ``FOR UPDATE SKIP LOCKED`` so concurrent
+        workers claim disjoint batches, then marked ``sending`` with
+        ``next_attempt_at`` pushed out by the lease: a worker that dies
+        mid-send leaves them to be claimed again once it expires.
+        """
+        now = datetime.utcnow()
+        ids = [
+            row.id for row in db.query(self.model.id).filter(
+                self.model.status.in_(("pending", "sending")),
+                self.model.next_attempt_at <= now,
+            ).order_by(
+                self.model.next_attempt_at.asc(), self.model.id.asc()
+            ).limit(limit).with_for_update(skip_locked=True).all()
+        ]
+        if ids:
+            db.execute(
+                update(self.model).where(self.model.id.in_(ids)).values(
+                    status="sending",
+                    next_attempt_at=now + timedelta(seconds=lease_seconds),
+                )
+            )
+        db.commit()
+        return ids
+
 
 class NotificationPreferenceRepository(
     BaseRepository[UserNotificationPreference]
@@ -200,6 +396,65 @@ class NotificationPreferenceRepository(
             },
         )
 
+    def get_or_create_masks(
+        self,
+        db: Session,
+        user_ids: Collection[int],
+        *,
+        default_types_mask: int = 0,
+        default_channels_mask: int = 0,
+    ) -> Dict[int, Tuple[int, int]]:
+        """
+        (types mask, channels mask) per user, in one query.
+
+        Users without settings get the defaults, inserted in one
+        multi-row statement.
+        """
+        user_ids = list(dict.fromkeys(user_ids))
+        if not user_ids:
+            return {}
+        masks = {
+            user_id: (int(types_mask or "0"), int(channels_mask or "0"))
+            for user_id, types_mask, channels_mask in db.execute(
+                select(
+                    self.model.user_id,
+                    self.model.types_mask,
+                    self.model.channels_mask,
+                ).where(self.model.user_id.in_(user_ids))
+            )
+        }
+        missing = [user_id for user_id in user_ids if user_id not in masks]
+        if not missing:
+            return masks
+
+        now = datetime.now(timezone.utc)
+        rows = [
+            {
+                "user_id": user_id,
+                "types_mask": str(default_types_mask),
+                "channels_mask": str(default_channels_mask),
+                "quiet_hours": {},
+                "updated_at": now,
+            }
+            for user_id in missing
+        ]
+        dialect_insert = {
+            "postgresql": postgresql.insert,
+            "sqlite": sqlite.insert,
+        }.get(db.get_bind().dialect.name)
+        if dialect_insert is not None:
+            # Settings created concurrently are kept
+            db.execute(
+                dialect_insert(self.model).values(rows)
+                .on_conflict_do_nothing(index_elements=["user_id"])
+            )
+        else:
+            db.execute(insert(self.model), rows)
+        db.commit()
+        for user_id in missing:
+            masks[user_id] = (default_types_mask, default_channels_mask)
+        return masks
+
     def update_settings_masks(
         self,
         db: Session,
@@ -232,6 +487,27 @@ class PushSubscriptionRepository(BaseRepository[PushSubscription]):
             self.model.user_id == user_id
         ).all()
 
+    def get_for_users(
+        self, db: Session, user_ids: Sequence[int]
+    ) -> List[PushSubscription]:
+        if not user_ids:
+            return []
+        return db.query(self.model).filter(
+            self.model.user_id.in_(list(user_ids))
+        ).order_by(self.model.user_id, self.model.id).all()
+
+    def get_subscribed_user_ids(
+        self, db: Session, user_ids: Collection[int]
+    ) -> Set[int]:
+        """Those of ``user_ids`` with at least one push subscription."""
+        if not user_ids:
+            return set()
+        return set(db.scalars(
+            select(self.model.user_id).where(
+                self.model.user_id.in_(list(user_ids))
+            ).distinct()
+        ))
+
     def get_by_endpoint(
         self, db: Session, endpoint: str
     ) -> Optional[PushSubscription]:
@@ -251,6 +527,16 @@ class PushSubscriptionRepository(BaseRepository[PushSubscription]):
         db.commit()
         return deleted
 
+    def delete_endpoints(self, db: Session, endpoints: Sequence[str]) -> int:
+        """Delete subscriptions of any user; endpoints are unique."""
+        if not endpoints:
+            return 0
+        deleted = db.query(self.model).filter(
+            self.model.endpoint.in_(list(endpoints)),
+        ).delete(synchronize_session=False)
+        db.commit()
+        return deleted
+
 
 class NotificationTypeRepository(BaseRepository[NotificationType]):
     """Repository for notification types."""
@@ -1,13 +1,157 @@
 """
 Project repository for database operations.
 """
-from typing import List
+import re
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import delete
+from sqlalchemy import (
+    Float, Integer, delete, func, literal_column, select, text, update
+)
 from app.domain.models.project import CommentVote
 
-from app.repositories.base import BaseRepository
-from app.domain.models.project import Project, Vote, Comment
+from app.repositories.base import (
+    AsyncBaseRepository, BaseRepository, filter_model_fields
+)
+from app.repositories.user_repository import invalidate_user_dashboard
+from app.repositories.vote_counts import (
+    VoteResult, cast_vote, reconcile_vote_counts, withdraw_vote
+)
+from app.domain.models.project import (
+    Project, ProjectTechnology, Technology, Vote, Comment,
+    normalize_technologies
+)
+from app.utils.pagination import Keyset, keyset_paginate
+from app.utils.project_engagement import (
+    RECENT_ACTIVITY_BONUS, calculate_engagement, engagement_level,
+    engagement_score, recency_bonus
+)
+
+# Cached per engine: which full-text backend the database provides.
+_search_backends: Dict[int, str] = {}
+
+
+def _detect_search_backend(db: Session) -> str:
+    """Return "postgresql", "sqlite" or "like" for the session's database."""
+    bind = db.get_bind()
+    engine = getattr(bind, "engine", bind)
+    backend = _search_backends.get(id(engine))
+    if backend is not None:
+        return backend
+
+    backend = "like"
+    if engine.dialect.name == "postgresql":
+        found = db.execute(text(
+            "SELECT 1 FROM information_schema.columns "
+            "WHERE table_name = 'projects' AND column_name = 'search_vector'"
+        )).first()
+        if found:
+            backend = "postgresql"
+    elif engine.dialect.name == "sqlite":
+        found = db.execute(text(
+            "SELECT 1 FROM sqlite_master "
+            "WHERE type = 'table' AND name = 'projects_fts'"
+        )).first()
+        if found:
+            backend = "sqlite"
+    _search_backends[id(engine)] = backend
+    return backend
+
+
+def _search_tokens(search_term: str) -> List[str]:
+    return re.findall(r"\w+", search_term.lower())
+
+
+def _search_statement(backend: str, search_term: str):
+    """
+    Build the project search query, ordered by relevance.
+
+    Every term is matched as a prefix so results update while the user
+    is still typing. Falls back to ILIKE when no full-text index exists
+    or the term has no searchable tokens.
+    """
+    options = (
+        joinedload(Project.owner),
+        joinedload(Project.hackathon),
+        joinedload(Project.team),
+    )
+    tokens = _search_tokens(search_term)
+
+    if backend == "postgresql" and tokens:
+        query = func.to_tsquery(
+            literal_column("'simple'::regconfig"),
+            " & ".join(f"{token}:*" for token in tokens)
+        )
+        vector = literal_column("projects.search_vector")
+        rank = func.ts_rank_cd(vector, query)
+        return select(Project).options(*options).where(
+            Project.is_public.is_(True),
+            vector.op("@@")(query)
+        ).order_by(rank.desc(), Project.created_at.desc())
+
+    if backend == "sqlite" and tokens:
+        match = " ".join(f'"{token}"*' for token in tokens)
+        # bm25 weights: title, description, technologies (lower is better)
+        ranked = text(
+            "SELECT rowid AS id, bm25(projects_fts, 10.0, 1.0, 5.0) AS score "
+            "FROM projects_fts WHERE projects_fts MATCH :match"
+        ).bindparams(match=match).columns(id=Integer, score=Float).subquery()
+        return select(Project).options(*options).join(
+            ranked, ranked.c.id == Project.id
+        ).where(
+            Project.is_public.is_(True)
+        ).order_by(ranked.c.score.asc(), Project.created_at.desc())
+
+    search_pattern = f"%{search_term}%"
+    return select(Project).options(*options).where(
+        Project.is_public.is_(True),
+        (
+            Project.title.ilike(search_pattern) |
+            Project.description.ilike(search_pattern) |
+            Project.technologies.ilike(search_pattern)
+        )
+    ).order_by(Project.created_at.desc())
+
+
+def _technology_filter(technologies: List[str], match_all: bool = True):
+    """
+    Restrict projects to those tagged with the given technologies.
+
+    Resolved through the project_technologies index: with ``match_all``
+    a project must carry every tag (AND), otherwise any of them (OR).
+    Returns None when no usable tag is given.
+    """
+    names = normalize_technologies(",".join(technologies))
+    if not names:
+        return None
+    tagged = select(ProjectTechnology.project_id).join(
+        Technology, Technology.id == ProjectTechnology.technology_id
+    ).where(Technology.name.in_(names))
+    if match_all and len(names) > 1:
+        tagged = tagged.group_by(ProjectTechnology.project_id).having(
+            func.count(ProjectTechnology.technology_id) == len(names)
+        )
+    return Project.id.in_(tagged)
+
+
+def _technology_facets_statement(
+    technologies: Optional[List[str]] = None, match_all: bool = True,
+    limit: int = 50
+):
+    """Count public projects per technology, most used first."""
+    project_count = func.count(ProjectTechnology.project_id)
+    stmt = select(Technology.name, project_count.label("count")).join(
+        ProjectTechnology, ProjectTechnology.technology_id == Technology.id
+    ).join(
+        Project, Project.id == ProjectTechnology.project_id
+    ).where(Project.is_public.is_(True))
+    selected = _technology_filter(technologies or [], match_all)
+    if selected is not None:
+        stmt = stmt.where(selected)
+    return stmt.group_by(Technology.name).order_by(
+        project_count.desc(), Technology.name
+    ).limit(limit)
 
 
 class ProjectRepository(BaseRepository[Project]):
@@ -17,82 +161,85 @@ class ProjectRepository(BaseRepository[Project]):
         super().__init__(Project)
 
     def get_public_projects(
-        self, db: Session, skip: int = 0, limit: int = 100
+        self, db: Session, skip: int = 0, limit: int = 100,
+        after: Optional[Keyset] = None
     ) -> List[Project]:
         """Get public projects with eager loading of relationships."""
-        return db.query(self.model).options(
+        query = db.query(self.model).options(
             joinedload(self.model.owner),
             joinedload(self.model.hackathon),
             joinedload(self.model.team)
         ).filter(
             self.model.is_public.is_(True)
-        ).order_by(
-            self.model.created_at.desc()
+        )
+        return keyset_paginate(
+            query, self.model, after
         ).offset(skip).limit(limit).all()
 
     def get_by_owner(
-        self, db: Session, owner_id: int, skip: int = 0, limit: int = 100
+        self, db: Session, owner_id: int, skip: int = 0, limit: int = 100,
+        after: Optional[Keyset] = None
     ) -> List[Project]:
         """Get projects by owner with eager loading."""
-        return db.query(self.model).options(
+        query = db.query(self.model).options(
             joinedload(self.model.owner),
             joinedload(self.model.hackathon),
             joinedload(self.model.team)
         ).filter(
             self.model.owner_id == owner_id
-        ).order_by(
-            self.model.created_at.desc()
+        )
+        return keyset_paginate(
+            query, self.model, after
         ).offset(skip).limit(limit).all()
 
     def get_by_hackathon(
-        self, db: Session, hackathon_id: int, skip: int = 0, limit: int = 100
+        self, db: Session, hackathon_id: int, skip: int = 0, limit: int = 100,
+        after: Optional[Keyset] = None
     ) -> List[Project]:
         """Get projects by hackathon with eager loading."""
-        return db.query(self.model).options(
+        query = db.query(self.model).options(
             joinedload(self.model.owner),
             joinedload(self.model.hackathon),
             joinedload(self.model.team)
         ).filter(
             self.model.hackathon_id == hackathon_id
-        ).order_by(
-            self.model.created_at.desc()
+        )
+        return keyset_paginate(
+            query, self.model, after
         ).offset(skip).limit(limit).all()
 
     def get_by_team(
-        self, db: Session, team_id: int, skip: int = 0, limit: int = 100
+        self, db: Session, team_id: int, skip: int = 0, limit: int = 100,
+        after: Optional[Keyset] = None
     ) -> List[Project]:
         """Get projects by team with eager loading."""
-        return db.query(self.model).options(
+        query = db.query(self.model).options(
             joinedload(self.model.owner),
             joinedload(self.model.hackathon),
             joinedload(self.model.team)
         ).filter(
             self.model.team_id == team_id
-        ).order_by(
-            self.model.created_at.desc()
+        )
+        return keyset_paginate(
+            query, self.model, after
         ).offset(skip).limit(limit).all()
 
     def get_by_technology(
-        self, db: Session, technology: str, skip: int = 0, limit: int = 100
+        self, db: Session, technology: str, skip: int = 0, limit: int = 100,
+        after: Optional[Keyset] = None
     ) -> List[Project]:
-        """Get projects containing a specific technology with eager loading."""
-        # Case-insensitive partial match in comma-separated technologies
-        return db.query(self.model).options(
-            joinedload(self.model.owner),
-            joinedload(self.model.hackathon),
-            joinedload(self.model.team)
-        ).filter(
-            self.model.is_public.is_(True),
-            self.model.technologies.ilike(f"%{technology}%")
-        ).order_by(
-            self.model.created_at.desc()
-        ).offset(skip).limit(limit).all()
+        """Get public projects tagged with a technology."""
+        return self.get_by_technologies(
+            db, technologies=[technology], skip=skip, limit=limit,
+            after=after
+        )
 
     def get_by_technologies(
         self, db: Session, technologies: List[str],
-        skip: int = 0, limit: int = 100
+        skip: int = 0, limit: int = 100, match_all: bool = True,
+        after: Optional[Keyset] = None
     ) -> List[Project]:
-        """Get projects containing ALL specified technologies (AND logic)."""
+        """Get public projects tagged with ALL (or ANY) technologies."""
         query = db.query(self.model).options(
             joinedload(self.model.owner),
             joinedload(self.model.hackathon),
@@ -100,33 +247,295 @@ class ProjectRepository(BaseRepository[Project]):
         ).filter(
             self.model.is_public.is_(True)
         )
-        
-        for tech in technologies:
-            query = query.filter(self.model.technologies.ilike(f"%{tech}%"))
-        
-        return query.order_by(
-            self.model.created_at.desc()
+        selected = _technology_filter(technologies, match_all)
+        if selected is not None:
+            query = query.filter(selected)
+
+        return keyset_paginate(
+            query, self.model, after
         ).offset(skip).limit(limit).all()
 
+    def get_technology_facets(
+        self, db: Session, technologies: Optional[List[str]] = None,
+        match_all: bool = True, limit: int = 50
+    ) -> List[Tuple[str, int]]:
+        """Count public projects per technology tag."""
+        return [
+            (name, count) for name, count in db.execute(
+                _technology_facets_statement(technologies, match_all, limit)
+            )
+        ]
+
     def search_projects(
         self, db: Session, search_term: str, skip: int = 0, limit: int = 100
     ) -> List[Project]:
         """Search projects by title, description, or technologies."""
-        search_pattern = f"%{search_term}%"
-        return db.query(self.model).options(
+        stmt = _search_statement(_detect_search_backend(db), search_term)
+        return list(
+            db.execute(stmt.offset(skip).limit(limit)).scalars().all()
+        )
+
+    def _engagement_values(self, bonus: int) -> Dict[str, Any]:
+        """SET clauses recomputing engagement from the row's counters."""
+        votes = (
+            func.coalesce(self.model.upvote_count, 0)
+            + func.coalesce(self.model.downvote_count, 0)
+        )
+        comments = func.coalesce(self.model.comment_count, 0)
+        views = func.coalesce(self.model.view_count, 0)
+        score = engagement_score(votes, comments, views, bonus)
+        return {
+            "engagement_score": score,
+            "engagement_level": engagement_level(
+                score, votes, comments, views
+            ),
+            # Activity is not an edit of the project itself.
+            "updated_at": self.model.updated_at,
+        }
+
+    def record_activity(self, db: Session, *project_ids: int) -> None:
+        """
+        Mark projects as active now (a vote, comment, view or edit).
+
+        Moves last_activity_at and recomputes the stored engagement in one
+        UPDATE, so call it after the counters of the same write have been
+        changed. Does not commit.
+        """
+        if not project_ids:
+            return
+        values = self._engagement_values(RECENT_ACTIVITY_BONUS)
+        values["last_activity_at"] = datetime.now(timezone.utc)
+        db.execute(
+            update(self.model).where(
+                self.model.id.in_(project_ids)
+            ).values(**values).execution_options(synchronize_session=False)
+        )
+
+    def refresh_engagement(self, db: Session, *project_ids: int) -> None:
+        """
+        Recompute stored engagement after counters changed without new
+        activity (views, or a vote or comment being removed).
+
+        Rows are updated in one statement per recency bonus. Does not
+        commit.
+        """
+        by_bonus: Dict[int, List[int]] = {}
+        for project_id, last_activity_at in db.query(
+            self.model.id, self.model.last_activity_at
+        ).filter(self.model.id.in_(project_ids)):
+            by_bonus.setdefault(
+                recency_bonus(last_activity_at), []
+            ).append(project_id)
+        for bonus, ids in by_bonus.items():
+            db.execute(
+                update(self.model).where(
+                    self.model.id.in_(ids)
+                ).values(
+                    **self._engagement_values(bonus)
+                ).execution_options(synchronize_session=False)
+            )
+
+    def adjust_comment_count(
+        self, db: Session, project_id: int, delta: int
+    ) -> None:
+        """Atomically add ``delta`` to a project's comment count."""
+        db.execute(
+            update(self.model).where(
+                self.model.id == project_id
+            ).values(
+                comment_count=func.coalesce(self.model.comment_count, 0)
+                + delta,
+                updated_at=self.model.updated_at,
+            ).execution_options(synchronize_session=False)
+        )
+
+    def rebuild_activity(self, db: Session, batch_size: int = 500) -> int:
+        """
+        Recompute comment counts, last activity and engagement of every
+        project from votes and comments.
+
+        Fills the columns for existing rows and lets scores decay once
+        their recency bonus has expired, so it is also meant to run
+        periodically. Commits per batch; returns the number of projects.
+        """
+        rebuilt = 0
+        last_id = 0
+        while True:
+            projects = db.query(self.model).filter(
+                self.model.id > last_id
+            ).order_by(self.model.id).limit(batch_size).all()
+            if not projects:
+                return rebuilt
+            ids = [project.id for project in projects]
+
+            last_votes = dict(db.query(
+                Vote.project_id, func.max(Vote.created_at)
+            ).filter(
+                Vote.project_id.in_(ids)
+            ).group_by(Vote.project_id).all())
+            comment_stats = {
+                row.project_id: row for row in db.query(
+                    Comment.project_id,
+                    func.count(Comment.id).label("total"),
+                    func.max(Comment.created_at).label("last_at"),
+                ).filter(
+                    Comment.project_id.in_(ids)
+                ).group_by(Comment.project_id).all()
+            }
+
+            rows = []
+            for project in projects:
+                comments = comment_stats.get(project.id)
+                total_comments = comments.total if comments else 0
+                last_activity_at = _latest(
+                    project.created_at,
+                    project.updated_at,
+                    project.last_activity_at,
+                    last_votes.get(project.id),
+                    comments.last_at if comments else None,
+                )
+                score, _, level = calculate_engagement(
+                    (project.upvote_count or 0)
+                    + (project.downvote_count or 0),
+                    total_comments,
+                    project.view_count or 0,
+                    last_activity_at,
+                )
+                rows.append({
+                    "id": project.id,
+                    "comment_count": total_comments,
+                    "last_activity_at": last_activity_at,
+                    "engagement_score": score,
+                    "engagement_level": level,
+                    "updated_at": project.updated_at,
+                })
+
+            db.execute(update(self.model), rows)
+            db.commit()
+            db.expunge_all()
+            rebuilt += len(rows)
+            last_id = ids[-1]
+
+
+def _latest(*moments: Optional[datetime]) -> Optional[datetime]:
+    """Most recent of the given timestamps, treating naive ones as UTC."""
+    def aware(moment: datetime) -> datetime:
+        if moment.tzinfo is None:
+            return moment.replace(tzinfo=timezone.utc)
+        return moment
+
+    present = [moment for moment in moments if moment is not None]
+    return max(present, key=aware) if present else None
+
+
+class AsyncProjectRepository(AsyncBaseRepository[Project]):
+    """Async repository for projects, used with AsyncSession."""
+
+    def __init__(self):
+        super().__init__(Project)
+
+    def _listing(self, *conditions, after: Optional[Keyset] = None):
+        return keyset_paginate(select(self.model).options(
             joinedload(self.model.owner),
             joinedload(self.model.hackathon),
             joinedload(self.model.team)
-        ).filter(
-            self.model.is_public.is_(True),
-            (
-                self.model.title.ilike(search_pattern) |
-                self.model.description.ilike(search_pattern) |
-                self.model.technologies.ilike(search_pattern)
-            )
-        ).order_by(
-            self.model.created_at.desc()
-        ).offset(skip).limit(limit).all()
+        ).where(*conditions), self.model, after)
+
+    async def _fetch(
+        self, db: AsyncSession, stmt, skip: int, limit: int
+    ) -> List[Project]:
+        result = await db.execute(stmt.offset(skip).limit(limit))
+        return list(result.scalars().all())
+
+    async def get_public_projects(
+        self, db: AsyncSession, skip: int = 0, limit: int = 100,
+        after: Optional[Keyset] = None
+    ) -> List[Project]:
+        """Get public projects with eager loading of relationships."""
+        return await self._fetch(
+            db,
+            self._listing(self.model.is_public.is_(True), after=after),
+            skip, limit
+        )
+
+    async def get_by_owner(
+        self, db: AsyncSession, owner_id: int, skip: int = 0, limit: int = 100,
+        after: Optional[Keyset] = None
+    ) -> List[Project]:
+        """Get projects by owner with eager loading."""
+        return await self._fetch(
+            db,
+            self._listing(self.model.owner_id == owner_id, after=after),
+            skip, limit
+        )
+
+    async def get_by_hackathon(
+        self, db: AsyncSession, hackathon_id: int,
+        skip: int = 0, limit: int = 100, after: Optional[Keyset] = None
+    ) -> List[Project]:
+        """Get projects by hackathon with eager loading."""
+        return await self._fetch(
+            db,
+            self._listing(
+                self.model.hackathon_id == hackathon_id, after=after
+            ),
+            skip, limit
+        )
+
+    async def get_by_team(
+        self, db: AsyncSession, team_id: int, skip: int = 0, limit: int = 100,
+        after: Optional[Keyset] = None
+    ) -> List[Project]:
+        """Get projects by team with eager loading."""
+        return await self._fetch(
+            db,
+            self._listing(self.model.team_id == team_id, after=after),
+            skip, limit
+        )
+
+    async def get_by_technology(
+        self, db: AsyncSession, technology: str,
+        skip: int = 0, limit: int = 100, after: Optional[Keyset] = None
+    ) -> List[Project]:
+        """Get public projects tagged with a technology."""
+        return await self.get_by_technologies(
+            db, technologies=[technology], skip=skip, limit=limit,
+            after=after
+        )
+
+    async def get_by_technologies(
+        self, db: AsyncSession, technologies: List[str],
+        skip: int = 0, limit: int = 100, match_all: bool = True,
+        after: Optional[Keyset] = None
+    ) -> List[Project]:
+        """Get public projects tagged with ALL (or ANY) technologies."""
+        conditions = [self.model.is_public.is_(True)]
+        selected = _technology_filter(technologies, match_all)
+        if selected is not None:
+            conditions.append(selected)
+        return await self._fetch(
+            db, self._listing(*conditions, after=after), skip, limit
+        )
+
+    async def get_technology_facets(
+        self, db: AsyncSession, technologies: Optional[List[str]] = None,
+        match_all: bool = True, limit: int = 50
+    ) -> List[Tuple[str, int]]:
+        """Count public projects per technology tag."""
+        result = await db.execute(
+            _technology_facets_statement(technologies, match_all, limit)
+        )
+        return [(name, count) for name, count in result]
+
+    async def search_projects(
+        self, db: AsyncSession, search_term: str,
+        skip: int = 0, limit: int = 100
+    ) -> List[Project]:
+        """Search projects by title, description, or technologies."""
+        backend = await db.run_sync(_detect_search_backend)
+        return await self._fetch(
+            db, _search_statement(backend, search_term), skip, limit
+        )
 
 
 class VoteRepository(BaseRepository[Vote]):
@@ -144,30 +553,53 @@ class VoteRepository(BaseRepository[Vote]):
             self.model.project_id == project_id
         ).first()
 
-    def update_vote_counts(
-        self, db: Session, project_id: int
-    ) -> None:
-        """Update vote counts for a project."""
-        from sqlalchemy import func
+    def cast_vote(
+        self, db: Session, project_id: int, user_id: int, vote_type: str,
+        toggle: bool = True
+    ) -> Optional[VoteResult]:
+        """
+        Add, switch or (with ``toggle``) withdraw a user's project vote.
 
-        # Count upvotes and downvotes
-        upvotes = db.query(func.count(self.model.id)).filter(
-            self.model.project_id == project_id,
-            self.model.vote_type == "upvote"
-        ).scalar()
+        Counters change by SQL deltas in the same transaction as the vote;
+        returns None when the project does not exist.
+        """
+        result = cast_vote(
+            db, self.model, Project, project_id, user_id, vote_type,
+            toggle=toggle,
+        )
+        if result is None:
+            return None
+        self._record_vote_activity(db, project_id, result.user_vote)
+        db.commit()
+        invalidate_user_dashboard(user_id)
+        return result
 
-        downvotes = db.query(func.count(self.model.id)).filter(
-            self.model.project_id == project_id,
-            self.model.vote_type == "downvote"
-        ).scalar()
-
-        # Update project
-        project = db.query(Project).filter(Project.id == project_id).first()
-        if project:
-            project.upvote_count = upvotes or 0
-            project.downvote_count = downvotes or 0
-            project.vote_score = (upvotes or 0) - (downvotes or 0)
-            db.commit()
+    def remove_vote(
+        self, db: Session, project_id: int, user_id: int
+    ) -> Optional[VoteResult]:
+        """Withdraw a user's project vote; None if there was none."""
+        result = withdraw_vote(db, self.model, Project, project_id, user_id)
+        if result is None:
+            return None
+        self._record_vote_activity(db, project_id, None)
+        db.commit()
+        invalidate_user_dashboard(user_id)
+        return result
+
+    def reconcile_vote_counts(self, db: Session) -> int:
+        """Repair drifted project vote counters; returns repaired rows."""
+        repaired = reconcile_vote_counts(db, self.model, Project)
+        db.commit()
+        return repaired
+
+    def _record_vote_activity(
+        self, db: Session, project_id: int, user_vote: Optional[str]
+    ) -> None:
+        # A withdrawn vote lowers the score without counting as activity.
+        if user_vote:
+            ProjectRepository().record_activity(db, project_id)
+        else:
+            ProjectRepository().refresh_engagement(db, project_id)
 
 
 class CommentRepository(BaseRepository[Comment]):
@@ -175,20 +607,52 @@ class CommentRepository(BaseRepository[Comment]):
 
     def __init__(self):
         super().__init__(Comment)
+        self.project_repo = ProjectRepository()
+
+    def create(self, db: Session, *, obj_in: Dict[str, Any]) -> Comment:
+        """Create a comment and record it as project activity."""
+        comment = self.model(**filter_model_fields(self.model, obj_in))
+        db.add(comment)
+        db.flush()
+        if comment.project_id:
+            self.project_repo.adjust_comment_count(db, comment.project_id, 1)
+            self.project_repo.record_activity(db, comment.project_id)
+        db.commit()
+        db.refresh(comment)
+        invalidate_user_dashboard(comment.user_id)
+        return comment
 
     def get_project_comments(
-        self, db: Session, project_id: int, skip: int = 0, limit: int = 100
+        self, db: Session, project_id: int, skip: int = 0, limit: int = 100,
+        after: Optional[Keyset] = None
     ) -> List[Comment]:
         """Get comments for a project."""
-        return db.query(self.model).options(
+        query = db.query(self.model).options(
             joinedload(self.model.user)
         ).filter(
             self.model.project_id == project_id,
             self.model.parent_id.is_(None)  # Top-level comments only
-        ).order_by(
-            self.model.created_at.desc()
+        )
+        return keyset_paginate(
+            query, self.model, after
         ).offset(skip).limit(limit).all()
 
+    def get_descendants(
+        self, db: Session, comment_ids: List[int]
+    ) -> List[Comment]:
+        """Get all nested replies below the given comments, level by level."""
+        descendants: List[Comment] = []
+        parent_ids = list(comment_ids)
+        while parent_ids:
+            replies = db.query(self.model).options(
+                joinedload(self.model.user)
+            ).filter(
+                self.model.parent_id.in_(parent_ids)
+            ).all()
+            descendants.extend(replies)
+            parent_ids = [reply.id for reply in replies]
+        return descendants
+
     def get_project_comments_flat(
         self, db: Session, project_id: int
     ) -> List[Comment]:
@@ -224,8 +688,17 @@ class CommentRepository(BaseRepository[Comment]):
             delete(CommentVote).where(CommentVote.comment_id.in_(comment_ids))
         )
 
+        project_id, user_id = comment.project_id, comment.user_id
         db.delete(comment)
+        if project_id:
+            db.flush()
+            self.project_repo.adjust_comment_count(
+                db, project_id, -len(comment_ids)
+            )
+            self.project_repo.refresh_engagement(db, project_id)
         db.commit()
+        # Deleted replies of other users leave their dashboards on expiry.
+        invalidate_user_dashboard(user_id)
         return True
 
     def _collect_descendant_ids(self, comment: Comment) -> List[int]:
@@ -5,6 +5,12 @@ from typing import Iterable, List, Sequence
 from sqlalchemy.orm import Session, joinedload
 
 from app.domain.models.rbac import Permission, Role, RolePermission, UserRole
+from app.utils.cache import cache_manager
+
+# Cache tag and Session.info memo key of access contexts
+# (see app.core.permissions)
+USER_ACCESS_TAG = "rbac:user:{user_id}"
+ACCESS_MEMO_KEY = "rbac_access"
 
 
 class RoleRepository:
@@ -72,4 +78,6 @@ class UserRoleRepository:
         for role in role_list:
             db.add(UserRole(user_id=user_id, role_id=role.id))
         db.commit()
+        db.info.get(ACCESS_MEMO_KEY, {}).pop(user_id, None)
+        cache_manager.invalidate_tags(USER_ACCESS_TAG.format(user_id=user_id))
         return self.get_user_roles(db, user_id)
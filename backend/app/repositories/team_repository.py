@@ -1,11 +1,13 @@
 """
 Team repository for database operations.
 """
-from typing import List, Optional
-from sqlalchemy.orm import Session, joinedload
+from typing import Any, Dict, List, Optional
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 from app.repositories.base import BaseRepository
+from app.repositories.user_repository import invalidate_user_dashboard
 from app.domain.models.team import Team, TeamMember, TeamInvitation, TeamReport
+from app.utils.pagination import Keyset, keyset_paginate
 
 
 class TeamRepository(BaseRepository[Team]):
@@ -15,13 +17,15 @@ class TeamRepository(BaseRepository[Team]):
         super().__init__(Team)
 
     def get_by_hackathon(
-        self, db: Session, hackathon_id: int, skip: int = 0, limit: int = 100
+        self, db: Session, hackathon_id: int, skip: int = 0, limit: int = 100,
+        after: Optional[Keyset] = None
     ) -> List[Team]:
         """Get teams by hackathon."""
-        return db.query(self.model).filter(
+        query = db.query(self.model).filter(
             self.model.hackathon_id == hackathon_id
-        ).order_by(
-            self.model.created_at.desc()
+        )
+        return keyset_paginate(
+            query, self.model, after
         ).offset(skip).limit(limit).all()
 
     def get_by_creator(
@@ -34,6 +38,19 @@ class TeamRepository(BaseRepository[Team]):
             self.model.created_at.desc()
         ).offset(skip).limit(limit).all()
 
+    def get_member_teams(
+        self, db: Session, user_id: int, hackathon_id: Optional[int] = None
+    ) -> List[Team]:
+        """Get the teams a user belongs to, with members and their users."""
+        query = db.query(self.model).join(
+            TeamMember, TeamMember.team_id == self.model.id
+        ).filter(TeamMember.user_id == user_id)
+        if hackathon_id is not None:
+            query = query.filter(self.model.hackathon_id == hackathon_id)
+        return query.options(
+            selectinload(self.model.members).selectinload(TeamMember.user)
+        ).order_by(self.model.id).all()
+
 
 class TeamMemberRepository(BaseRepository[TeamMember]):
     """Repository for team members."""
@@ -41,6 +58,23 @@ class TeamMemberRepository(BaseRepository[TeamMember]):
     def __init__(self):
         super().__init__(TeamMember)
 
+    def create(self, db: Session, *, obj_in: Dict[str, Any]) -> TeamMember:
+        """Add a member and refresh the user's cached dashboard."""
+        member = super().create(db, obj_in=obj_in)
+        invalidate_user_dashboard(member.user_id)
+        return member
+
+    def delete(self, db: Session, *, id: int) -> bool:
+        """Remove a member and refresh the user's cached dashboard."""
+        member = self.get(db, id)
+        if member is None:
+            return False
+        user_id = member.user_id
+        db.delete(member)
+        db.commit()
+        invalidate_user_dashboard(user_id)
+        return True
+
     def get_team_members(
         self, db: Session, team_id: int
     ) -> List[TeamMember]:
@@ -9,8 +9,23 @@ from app.domain.models.user import (
     User, RefreshToken, PasswordResetToken, EmailVerificationToken
 )
 from app.domain.schemas.user import UserCreate, UserUpdate
+from app.utils.cache import cache_manager
 from .base import BaseRepository
 
+# Version tag of a user's sessions; bumping it rejects the stateless
+# access tokens issued before (see app.core.auth).
+USER_SESSION_TAG = "auth:user:{user_id}"
+# Cached dashboard of a user's own activity (see DashboardService)
+USER_DASHBOARD_TAG = "user:{user_id}:dashboard"
+
+
+def invalidate_user_dashboard(*user_ids: Optional[int]) -> None:
+    """Drop the cached dashboards of the given users."""
+    cache_manager.invalidate_tags(*(
+        USER_DASHBOARD_TAG.format(user_id=user_id)
+        for user_id in user_ids if user_id
+    ))
+
 
 class UserRepository(BaseRepository[User]):
     """Repository for User model operations."""
@@ -155,6 +170,7 @@ class RefreshTokenRepository(BaseRepository[RefreshToken]):
         for token in tokens:
             db.delete(token)
         db.commit()
+        cache_manager.invalidate_tags(USER_SESSION_TAG.format(user_id=user_id))
         return count
 
     def get_valid_by_token_id(
@@ -0,0 +1,250 @@
+"""
+Vote counters maintained with atomic SQL deltas.
+
+Casting, switching or withdrawing a vote changes at most two counters on
+the voted row. Instead of recounting the votes table, the change is applied
+as ``count = count + delta`` in the same transaction as the vote row, so
+concurrent voters never overwrite each other's counts. Writes that bypass
+these helpers can make the counters drift; reconcile_vote_counts repairs
+them from the vote rows.
+"""
+from typing import Any, NamedTuple, Optional, Tuple
+
+from sqlalchemy import delete, func, or_, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+
+class VoteResult(NamedTuple):
+    """Outcome of a vote write and the target's counters afterwards."""
+    action: str  # "added", "changed", "removed" or "unchanged"
+    vote_type: str
+    vote: Optional[Any]
+    upvotes: int
+    downvotes: int
+
+    @property
+    def score(self) -> int:
+        return self.upvotes - self.downvotes
+
+    @property
+    def user_vote(self) -> Optional[str]:
+        """The caller's vote after this write, as reported to clients."""
+        return self.vote_type if self.action in ("added", "changed") else None
+
+    @property
+    def message(self) -> str:
+        return {
+            "added": f"Added {self.vote_type}",
+            "changed": f"Changed vote to {self.vote_type}",
+            "removed": f"Removed {self.vote_type}",
+            "unchanged": f"Already voted {self.vote_type}",
+        }[self.action]
+
+
+def _delta(vote_type: str, sign: int) -> Tuple[int, int]:
+    return (sign, 0) if vote_type == "upvote" else (0, sign)
+
+
+def _read_counts(db: Session, target_model, target_id: int):
+    return db.query(
+        target_model.upvote_count, target_model.downvote_count
+    ).filter(target_model.id == target_id).first()
+
+
+def apply_vote_deltas(
+    db: Session, target_model, target_id: int, upvotes: int, downvotes: int
+) -> Optional[Tuple[int, int]]:
+    """
+    Add deltas to a row's vote counters and return the new counts.
+
+    Returns None when the row does not exist. Does not commit.
+    """
+    new_upvotes = func.coalesce(target_model.upvote_count, 0) + upvotes
+    new_downvotes = func.coalesce(target_model.downvote_count, 0) + downvotes
+    values = {"upvote_count": new_upvotes, "downvote_count": new_downvotes}
+    columns = target_model.__table__.c
+    if "vote_score" in columns:
+        values["vote_score"] = new_upvotes - new_downvotes
+    if "updated_at" in columns:
+        # A vote is not an edit of the voted row.
+        values["updated_at"] = target_model.updated_at
+
+    row = db.execute(
+        update(target_model).where(
+            target_model.id == target_id
+        ).values(**values).returning(
+            target_model.upvote_count, target_model.downvote_count
+        ).execution_options(synchronize_session=False)
+    ).first()
+    return tuple(row) if row else None
+
+
+def cast_vote(
+    db: Session, vote_model, target_model, target_id: int, user_id: int,
+    vote_type: str, toggle: bool = True
+) -> Optional[VoteResult]:
+    """
+    Add, switch or (with ``toggle``) withdraw a user's vote.
+
+    The vote row and counter deltas are written in one transaction; a
+    concurrent request that already changed the same vote makes this one a
+    no-op instead of applying its delta twice. Returns None when the target
+    does not exist. Does not commit.
+    """
+    target_column = getattr(vote_model, _target_key(vote_model, target_model))
+    existing = db.query(vote_model).filter(
+        vote_model.user_id == user_id, target_column == target_id
+    ).first()
+
+    vote = existing
+    if existing is None:
+        try:
+            vote = _insert_vote(db, vote_model, {
+                "user_id": user_id,
+                target_column.key: target_id,
+                "vote_type": vote_type,
+            })
+        except IntegrityError:
+            # The target does not exist.
+            db.rollback()
+            return None
+        if vote is None:
+            # Another request created the vote first; report its state.
+            vote = db.query(vote_model).filter(
+                vote_model.user_id == user_id, target_column == target_id
+            ).first()
+            return _unchanged(db, target_model, target_id, vote, vote_type)
+        action, deltas = "added", _delta(vote_type, 1)
+    elif existing.vote_type == vote_type:
+        if not toggle:
+            return _unchanged(db, target_model, target_id, vote, vote_type)
+        removed = db.execute(
+            delete(vote_model).where(vote_model.id == existing.id)
+        ).rowcount
+        if not removed:
+            return _unchanged(db, target_model, target_id, None, vote_type)
+        action, deltas, vote = "removed", _delta(vote_type, -1), None
+    else:
+        previous = existing.vote_type
+        changed = db.execute(
+            update(vote_model).where(
+                vote_model.id == existing.id,
+                vote_model.vote_type == previous,
+            ).values(vote_type=vote_type)
+        ).rowcount
+        if not changed:
+            return _unchanged(db, target_model, target_id, vote, vote_type)
+        up, down = _delta(vote_type, 1)
+        old_up, old_down = _delta(previous, -1)
+        action, deltas = "changed", (up + old_up, down + old_down)
+
+    counts = apply_vote_deltas(db, target_model, target_id, *deltas)
+    if counts is None:
+        db.rollback()
+        return None
+    return VoteResult(action, vote_type, vote, *counts)
+
+
+def withdraw_vote(
+    db: Session, vote_model, target_model, target_id: int, user_id: int
+) -> Optional[VoteResult]:
+    """
+    Remove a user's vote and decrement its counter.
+
+    Returns None when there was no vote to remove. Does not commit.
+    """
+    target_column = getattr(vote_model, _target_key(vote_model, target_model))
+    vote_type = db.execute(
+        delete(vote_model).where(
+            vote_model.user_id == user_id, target_column == target_id
+        ).returning(vote_model.vote_type)
+    ).scalar()
+    if vote_type is None:
+        return None
+    counts = apply_vote_deltas(
+        db, target_model, target_id, *_delta(vote_type, -1)
+    )
+    return VoteResult("removed", vote_type, None, *(counts or (0, 0)))
+
+
+def reconcile_vote_counts(db: Session, vote_model, target_model) -> int:
+    """
+    Recount vote counters from the vote rows where they have drifted.
+
+    Returns the number of repaired rows. Does not commit.
+    """
+    target_column = getattr(vote_model, _target_key(vote_model, target_model))
+
+    def count(vote_type: str):
+        return select(func.count(vote_model.id)).where(
+            target_column == target_model.id,
+            vote_model.vote_type == vote_type,
+        ).scalar_subquery()
+
+    upvotes, downvotes = count("upvote"), count("downvote")
+    values = {"upvote_count": upvotes, "downvote_count": downvotes}
+    drifted = [
+        func.coalesce(target_model.upvote_count, -1) != upvotes,
+        func.coalesce(target_model.downvote_count, -1) != downvotes,
+    ]
+    columns = target_model.__table__.c
+    if "vote_score" in columns:
+        values["vote_score"] = upvotes - downvotes
+        drifted.append(
+            func.coalesce(target_model.vote_score, 0) != upvotes - downvotes
+        )
+    if "updated_at" in columns:
+        values["updated_at"] = target_model.updated_at
+
+    return db.execute(
+        update(target_model).where(or_(*drifted)).values(
+            **values
+        ).execution_options(synchronize_session=False)
+    ).rowcount
+
+
+def _target_key(vote_model, target_model) -> str:
+    """Name of the vote column referencing the target table."""
+    for column in vote_model.__table__.c:
+        for foreign_key in column.foreign_keys:
+            if foreign_key.column.table is target_model.__table__:
+                return column.key
+    raise ValueError(
+        f"{vote_model.__name__} does not reference {target_model.__name__}"
+    )
+
+
+def _insert_vote(db: Session, vote_model, values: dict):
+    """Insert a vote unless the user already has one; return it or None."""
+    dialect_insert = {
+        "postgresql": postgresql.insert,
+        "sqlite": sqlite.insert,
+    }.get(db.get_bind().dialect.name)
+    if dialect_insert is not None:
+        return db.scalars(
+            dialect_insert(vote_model).values(**values)
+            .on_conflict_do_nothing().returning(vote_model)
+        ).first()
+
+    vote = vote_model(**values)
+    try:
+        with db.begin_nested():
+            db.add(vote)
+    except IntegrityError:
+        return None
+    return vote
+
+
+def _unchanged(
+    db: Session, target_model, target_id: int, vote, vote_type: str
+) -> Optional[VoteResult]:
+    counts = _read_counts(db, target_model, target_id)
+    if counts is None:
+        return None
+    if vote is not None:
+        vote_type = vote.vote_type
+    return VoteResult(
+        "unchanged", vote_type, vote, counts[0] or 0, counts[1] or 0
+    )
@@ -50,7 +50,7 @@ class AuthService:
 
         # Create tokens for the newly registered user
         from app.core.auth import create_tokens
-        tokens = create_tokens(user.id, user.username)
+        tokens = create_tokens(user.id, user.username, db=db)
 
         return {
             "user": user,
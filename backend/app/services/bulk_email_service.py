@@ -0,0 +1,241 @@
+"""
+Streaming bulk email sends for newsletters and hackathon reminders.
+
+Recipients are read in batches from a server-side cursor instead of being
+loaded at once. Each language variant of the template is rendered once,
+with per-recipient variables left as markers that are filled in by plain
+string replacement. Batches go out over the pooled SMTP sessions of
+EmailService, several ``send_many`` calls at a time and optionally capped
+at BULK_EMAIL_RATE_LIMIT messages per second.
+
+Progress is stored per campaign key after every batch: a campaign that is
+interrupted resumes after its last finished batch, and a completed one is
+not sent again.
+"""
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Row, Select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.repositories.email_campaign_repository import (
+    EmailCampaignRepository,
+)
+from app.services.email_service import EmailService, OutgoingEmail
+from app.services.email_service import email_service as default_email_service
+from app.utils.template_engine import TemplateEngine
+from app.utils.template_engine import template_engine as default_engine
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BulkRecipient:
+    email: str
+    language: str = "en"
+    # Per-recipient template variables, e.g. user_name
+    variables: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class CampaignResult:
+    key: str
+    sent: int
+    failed: int
+    completed: bool
+
+
+class _RateLimiter:
+    """Space sends out to at most ``rate`` messages per second."""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate
+        self._next = 0.0
+
+    async def acquire(self, count: int) -> None:
+        now = asyncio.get_running_loop().time()
+        start = max(now, self._next)
+        self._next = start + count * self.interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+
+class _Variants:
+    """Renderings of one template, per language and personal variables."""
+
+    def __init__(
+        self,
+        engine: TemplateEngine,
+        template_name: str,
+        shared: Dict[str, Any],
+    ):
+        self.engine = engine
+        self.template_name = template_name
+        self.shared = shared
+        self._rendered: Dict[Tuple, Dict[str, str]] = {}
+
+    @staticmethod
+    def _marker(name: str) -> str:
+        return f"[[bulk:{name}]]"
+
+    def render(self, recipient: BulkRecipient) -> OutgoingEmail:
+        names = tuple(sorted(recipient.variables))
+        key = (recipient.language, names)
+        variant = self._rendered.get(key)
+        if variant is None:
+            variant = self.engine.render_email(
+                template_name=self.template_name,
+                language=recipient.language,
+                variables={
+                    **self.shared,
+                    **{name: self._marker(name) for name in names},
+                },
+            )
+            self._rendered[key] = variant
+
+        def fill(text: str) -> str:
+            for name in names:
+                value = recipient.variables[name]
+                text = text.replace(
+                    self._marker(name), "" if value is None else str(value)
+                )
+            return text
+
+        return OutgoingEmail(
+            to_email=recipient.email,
+            subject=fill(variant["subject"]),
+            body=fill(variant["text"]),
+            html_body=fill(variant["html"]),
+        )
+
+
+class BulkEmailService:
+    """Send one template to many recipients as a resumable campaign."""
+
+    def __init__(
+        self,
+        email_service: EmailService = default_email_service,
+        engine: TemplateEngine = default_engine,
+        *,
+        batch_size: int = settings.BULK_EMAIL_BATCH_SIZE,
+        chunk_size: int = settings.BULK_EMAIL_CHUNK_SIZE,
+        concurrency: Optional[int] = None,
+        rate_limit: Optional[float] = settings.BULK_EMAIL_RATE_LIMIT,
+    ):
+        self.email_service = email_service
+        self.engine = engine
+        self.batch_size = batch_size
+        self.chunk_size = chunk_size
+        # More concurrent sends than pooled SMTP sessions would only queue
+        self.concurrency = (
+            concurrency or email_service.pool.max_connections
+        )
+        self.rate_limit = rate_limit
+        self.campaign_repo = EmailCampaignRepository()
+
+    async def send_campaign(
+        self,
+        db: Session,
+        *,
+        key: str,
+        template_name: str,
+        recipients: Callable[[int], Select],
+        prepare: Callable[[Session, Sequence[Row]], List[BulkRecipient]],
+        variables: Optional[Dict[str, Any]] = None,
+        after_batch: Optional[Callable[[Session, Sequence[Row]], None]] = None,
+    ) -> CampaignResult:
+        """
+        Send ``template_name`` to everyone selected by ``recipients``.
+
+        ``recipients(after_id)`` returns a select whose first column is a
+        recipient id, ascending, limited to ids above ``after_id``.
+        ``prepare`` turns each batch of rows into the emails to send;
+        rows it drops are skipped but count as done. ``variables`` are
+        shared by all recipients. ``after_batch`` runs once a batch is
+        recorded as done, so work it does is not repeated on resume.
+        """
+        campaign = self.campaign_repo.get_or_create(
+            db, key=key, template_name=template_name
+        )
+        if campaign.status == "completed":
+            return self._result(campaign)
+        if campaign.last_recipient_id:
+            logger.info(
+                "Resuming campaign %s after recipient %s",
+                key, campaign.last_recipient_id,
+            )
+
+        variants = _Variants(self.engine, template_name, variables or {})
+        limiter = _RateLimiter(self.rate_limit) if self.rate_limit else None
+        statement = recipients(campaign.last_recipient_id)
+        with ThreadPoolExecutor(
+            max_workers=self.concurrency, thread_name_prefix="bulk-email"
+        ) as executor, db.get_bind().connect() as connection:
+            # Stream on a connection of its own: progress commits on the
+            # session must not close the cursor.
+            result = connection.execution_options(
+                stream_results=True, yield_per=self.batch_size
+            ).execute(statement)
+            for rows in result.partitions():
+                emails = [
+                    variants.render(recipient)
+                    for recipient in prepare(db, rows)
+                ]
+                sent = await self._send(emails, executor, limiter)
+                self.campaign_repo.record_progress(
+                    db,
+                    campaign,
+                    last_recipient_id=rows[-1][0],
+                    sent=sent,
+                    failed=len(emails) - sent,
+                )
+                if after_batch is not None:
+                    after_batch(db, rows)
+
+        self.campaign_repo.complete(db, campaign)
+        logger.info(
+            "Campaign %s completed: %s sent, %s failed",
+            key, campaign.sent_count, campaign.failed_count,
+        )
+        return self._result(campaign)
+
+    def run_campaign(self, db: Session, **kwargs: Any) -> CampaignResult:
+        """``send_campaign`` for synchronous callers such as cron jobs."""
+        return asyncio.run(self.send_campaign(db, **kwargs))
+
+    async def _send(
+        self,
+        emails: List[OutgoingEmail],
+        executor: ThreadPoolExecutor,
+        limiter: Optional[_RateLimiter],
+    ) -> int:
+        loop = asyncio.get_running_loop()
+
+        async def send_chunk(chunk: List[OutgoingEmail]) -> List[bool]:
+            if limiter is not None:
+                await limiter.acquire(len(chunk))
+            return await loop.run_in_executor(
+                executor, self.email_service.send_many, chunk
+            )
+
+        results = await asyncio.gather(*(
+            send_chunk(emails[start:start + self.chunk_size])
+            for start in range(0, len(emails), self.chunk_size)
+        ))
+        return sum(flag for flags in results for flag in flags)
+
+    @staticmethod
+    def _result(campaign) -> CampaignResult:
+        return CampaignResult(
+            key=campaign.key,
+            sent=campaign.sent_count,
+            failed=campaign.failed_count,
+            completed=campaign.status == "completed",
+        )
+
+
+bulk_email_service = BulkEmailService()
@@ -0,0 +1,167 @@
+"""
+Per-user dashboard aggregation for /api/me and public user profiles.
+
+Counts come from a single query of correlated counts; related lists are
+loaded with one query each, teams and hackathons batched by IN or join
+instead of one lookup per membership. Results are cached per user and
+invalidated through USER_DASHBOARD_TAG when the user votes, comments,
+joins a team or registers for a hackathon.
+"""
+from typing import Any, Dict
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, selectinload
+
+from app.domain import models, schemas
+from app.repositories.user_repository import USER_DASHBOARD_TAG
+from app.utils.cache import cached
+from app.utils.team_stats import attach_team_stats
+
+# Embedded projects and hackathons change with other users' activity too;
+# the TTL bounds how stale their counters can get.
+DASHBOARD_CACHE_TTL = 60
+
+
+def _count(model, column, user_id: int):
+    return select(func.count()).select_from(model).where(
+        column == user_id
+    ).scalar_subquery()
+
+
+class DashboardService:
+    """Aggregated activity of one user."""
+
+    @cached(
+        ttl=DASHBOARD_CACHE_TTL,
+        tags=(USER_DASHBOARD_TAG, "projects:list", "hackathons:list"),
+        key=("user_id",),
+    )
+    def get_counts(self, db: Session, user_id: int) -> Dict[str, int]:
+        """Number of the user's projects, teams, registrations and more."""
+        row = db.execute(select(
+            _count(models.Project, models.Project.owner_id, user_id)
+            .label("projects"),
+            _count(models.TeamMember, models.TeamMember.user_id, user_id)
+            .label("teams"),
+            _count(
+                models.HackathonRegistration,
+                models.HackathonRegistration.user_id, user_id,
+            ).label("registrations"),
+            _count(models.Hackathon, models.Hackathon.owner_id, user_id)
+            .label("hackathons_created"),
+            _count(models.Vote, models.Vote.user_id, user_id)
+            .label("votes"),
+            _count(models.Comment, models.Comment.user_id, user_id)
+            .label("comments"),
+        )).one()
+        return dict(row._mapping)
+
+    @cached(
+        ttl=DASHBOARD_CACHE_TTL,
+        tags=(USER_DASHBOARD_TAG, "projects:list"),
+        key=("user_id",),
+    )
+    def get_details(self, db: Session, user_id: int) -> Dict[str, Any]:
+        """Teams, projects, votes, comments and registrations for /me."""
+        team = selectinload(models.TeamMember.team)
+        memberships = db.query(models.TeamMember).options(
+            team.selectinload(models.Team.hackathon),
+            team.selectinload(models.Team.creator),
+        ).filter(models.TeamMember.user_id == user_id).all()
+        attach_team_stats(db, [
+            membership.team for membership in memberships if membership.team
+        ])
+        teams = []
+        for membership in memberships:
+            team_member = schemas.TeamMember.model_validate(membership)
+            if membership.team:
+                team_member.team = schemas.Team.model_validate(
+                    membership.team
+                )
+            teams.append(team_member)
+
+        def owned(model, column):
+            return db.query(model).filter(column == user_id).all()
+
+        return {
+            "teams": teams,
+            "projects": [
+                schemas.Project.model_validate(project)
+                for project in owned(models.Project, models.Project.owner_id)
+            ],
+            "votes": [
+                schemas.Vote.model_validate(vote)
+                for vote in owned(models.Vote, models.Vote.user_id)
+            ],
+            "comments": [
+                schemas.Comment.model_validate(comment)
+                for comment in owned(models.Comment, models.Comment.user_id)
+            ],
+            "hackathon_registrations": [
+                schemas.HackathonRegistration.model_validate(registration)
+                for registration in owned(
+                    models.HackathonRegistration,
+                    models.HackathonRegistration.user_id,
+                )
+            ],
+        }
+
+    @cached(
+        ttl=DASHBOARD_CACHE_TTL,
+        tags=(USER_DASHBOARD_TAG, "projects:list", "hackathons:list"),
+        key=("user_id", "project_limit"),
+    )
+    def get_profile(
+        self, db: Session, user_id: int, project_limit: int = 10
+    ) -> Dict[str, Any]:
+        """Recent projects, teams, hackathons and totals for a profile."""
+        projects = db.query(models.Project).filter(
+            models.Project.owner_id == user_id
+        ).order_by(
+            models.Project.created_at.desc(), models.Project.id.desc()
+        ).limit(project_limit).all()
+        teams = db.query(models.TeamMember, models.Team).join(
+            models.Team, models.Team.id == models.TeamMember.team_id
+        ).filter(models.TeamMember.user_id == user_id).all()
+        hackathons = db.query(
+            models.HackathonRegistration, models.Hackathon
+        ).join(
+            models.Hackathon,
+            models.Hackathon.id == models.HackathonRegistration.hackathon_id,
+        ).filter(models.HackathonRegistration.user_id == user_id).all()
+        counts = self.get_counts(db, user_id)
+
+        return {
+            "projects": [
+                {
+                    "id": project.id,
+                    "title": project.title,
+                    "description": project.description,
+                    "created_at": project.created_at
+                } for project in projects
+            ],
+            "teams": [
+                {
+                    "id": team.id,
+                    "name": team.name,
+                    "role": membership.role,
+                    "joined_at": membership.joined_at
+                } for membership, team in teams
+            ],
+            "hackathons": [
+                {
+                    "id": hackathon.id,
+                    "name": hackathon.name,
+                    "registered_at": registration.registered_at,
+                    "status": registration.status
+                } for registration, hackathon in hackathons
+            ],
+            "stats": {
+                "project_count": counts["projects"],
+                "team_count": len(teams),
+                "hackathon_count": len(hackathons)
+            }
+        }
+
+
+dashboard_service = DashboardService()
@@ -189,7 +189,7 @@ class EmailAuthService:
         self.user_repository.update_last_login(db, user.id)
 
         # Create tokens with remember_me parameter
-        tokens = create_tokens(user.id, user.username, remember_me)
+        tokens = create_tokens(user.id, user.username, remember_me, db=db)
 
         # Store refresh token with is_persistent flag
         self.refresh_token_repository.create_token(
@@ -269,7 +269,7 @@ class EmailAuthService:
 
         # Create tokens
         from app.core.auth import create_tokens
-        tokens = create_tokens(user.id, user.username)
+        tokens = create_tokens(user.id, user.username, db=db)
 
         # Store refresh token
         self.refresh_token_repository.create_token(
@@ -342,7 +342,7 @@ class EmailAuthService:
 
         # Create tokens
         from app.core.auth import create_tokens
-        tokens = create_tokens(user.id, user.username)
+        tokens = create_tokens(user.id, user.username, db=db)
 
         # Store refresh token
         self.refresh_token_repository.create_token(
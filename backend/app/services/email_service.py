@@ -5,18 +5,29 @@ Uses SMTP configuration from environment variables.
 
 import os
 import smtplib
+from dataclasses import dataclass
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from typing import Optional
+from typing import List, Optional, Sequence
 import logging
 
+from app.utils.smtp_pool import SMTPConnectionPool
 from app.utils.template_engine import template_engine
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class OutgoingEmail:
+    """One message for ``EmailService.send_many``."""
+    to_email: str
+    subject: str
+    body: str
+    html_body: Optional[str] = None
+
+
 class EmailService:
-    """Service for sending emails via SMTP"""
+    """Service for sending emails via SMTP over pooled connections"""
     
     def __init__(self):
         self.smtp_host = os.getenv("SMTP_HOST", "smtp.gmail.com")
@@ -27,6 +38,12 @@ class EmailService:
         self.smtp_from_email = os.getenv("SMTP_FROM_EMAIL", "")
         self.use_tls = os.getenv("SMTP_TLS", "true").lower() == "true"
         self.use_ssl = os.getenv("SMTP_SSL", "false").lower() == "true"
+        self.smtp_timeout = float(os.getenv("SMTP_TIMEOUT", "30"))
+        self.pool = SMTPConnectionPool(
+            self._open_connection,
+            max_connections=int(os.getenv("SMTP_POOL_SIZE", "4")),
+            max_idle=float(os.getenv("SMTP_POOL_MAX_IDLE", "60")),
+        )
         
         # Newsletter templates
         self.welcome_subject = os.getenv(
@@ -64,6 +81,51 @@ class EmailService:
         
         return msg
     
+    def _open_connection(self) -> smtplib.SMTP:
+        """Open a logged-in SMTP session for the pool"""
+        if self.use_ssl:
+            server = smtplib.SMTP_SSL(
+                self.smtp_host, self.smtp_port, timeout=self.smtp_timeout
+            )
+        else:
+            server = smtplib.SMTP(
+                self.smtp_host, self.smtp_port, timeout=self.smtp_timeout
+            )
+        try:
+            if self.use_tls and not self.use_ssl:
+                server.starttls()
+            server.login(self.smtp_user, self.smtp_password)
+        except Exception:
+            server.close()
+            raise
+        return server
+    
+    def _unconfigured_result(self, email: OutgoingEmail) -> bool:
+        """Outcome of a send while SMTP credentials are missing"""
+        environment = os.getenv("ENVIRONMENT", "development")
+        
+        if environment == "production":
+            logger.error(
+                "SMTP not configured in production! "
+                "Email would be sent to: %s",
+                email.to_email
+            )
+            logger.error("Subject: %s", email.subject)
+            return False  # Return failure in production
+        
+        logger.warning(
+            "SMTP not configured in development. "
+            "Email would be sent to: %s",
+            email.to_email
+        )
+        logger.warning("Subject: %s", email.subject)
+        if len(email.body) > 100:
+            body_preview = email.body[:100] + "..."
+        else:
+            body_preview = email.body
+        logger.warning("Body preview: %s", body_preview)
+        return True  # Return success in development only
+    
     def send_email(
         self,
         to_email: str,
@@ -72,57 +134,50 @@ class EmailService:
         html_body: Optional[str] = None
     ) -> bool:
         """Send an email via SMTP"""
+        return self.send_many([
+            OutgoingEmail(to_email, subject, body, html_body)
+        ])[0]
+    
+    def send_many(self, emails: Sequence[OutgoingEmail]) -> List[bool]:
+        """
+        Send several emails over one pooled SMTP session.
+        
+        Returns one success flag per email, in order. A refused recipient
+        fails only its own email; a dropped connection is reopened.
+        """
+        if not emails:
+            return []
         
         # Check if SMTP is configured
         if not self.smtp_user or not self.smtp_password:
-            environment = os.getenv("ENVIRONMENT", "development")
-            
-            if environment == "production":
-                logger.error(
-                    "SMTP not configured in production! "
-                    "Email would be sent to: %s",
-                    to_email
-                )
-                logger.error("Subject: %s", subject)
-                return False  # Return failure in production
-            else:
-                logger.warning(
-                    "SMTP not configured in development. "
-                    "Email would be sent to: %s",
-                    to_email
-                )
-                logger.warning("Subject: %s", subject)
-                if len(body) > 100:
-                    body_preview = body[:100] + "..."
-                else:
-                    body_preview = body
-                logger.warning("Body preview: %s", body_preview)
-                return True  # Return success in development only
+            return [self._unconfigured_result(email) for email in emails]
         
         try:
-            # Create message
-            msg = self._create_message(to_email, subject, body, html_body)
-            
-            # Connect to SMTP server
-            if self.use_ssl:
-                server = smtplib.SMTP_SSL(self.smtp_host, self.smtp_port)
-            else:
-                server = smtplib.SMTP(self.smtp_host, self.smtp_port)
-            
-            if self.use_tls and not self.use_ssl:
-                server.starttls()
-            
-            # Login and send
-            server.login(self.smtp_user, self.smtp_password)
-            server.send_message(msg)
-            server.quit()
-            
-            logger.info("Email sent successfully to: %s", to_email)
-            return True
-            
+            errors = self.pool.send_messages([
+                self._create_message(
+                    email.to_email, email.subject, email.body,
+                    email.html_body
+                )
+                for email in emails
+            ])
         except Exception as e:
-            logger.error("Failed to send email to %s: %s", to_email, str(e))
-            return False
+            logger.error("Failed to send %s emails: %s", len(emails), e)
+            return [False] * len(emails)
+        
+        results = []
+        for email, error in zip(emails, errors):
+            if error is None:
+                logger.info("Email sent successfully to: %s", email.to_email)
+            else:
+                logger.error(
+                    "Failed to send email to %s: %s", email.to_email, error
+                )
+            results.append(error is None)
+        return results
+    
+    def close(self) -> None:
+        """Close pooled SMTP connections"""
+        self.pool.close()
     
     def send_newsletter_welcome(
         self,
@@ -1,9 +1,18 @@
 """
 Firebase Cloud Messaging (FCM) provider for push notifications.
+
+All requests share one long-lived HTTP/2 httpx client (``h2`` is pinned in
+requirements.txt), so a send reuses open connections instead of paying
+a TCP and TLS handshake per device token. FCM v1 takes one token per
+request: tokens are sent concurrently, at most FCM_MAX_CONCURRENCY at a
+time, over that client.
 """
+import importlib.util
 import json
 import logging
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 import httpx
@@ -12,6 +21,15 @@ import google.auth.transport.requests
 
 logger = logging.getLogger(__name__)
 
+FCM_API_URL = os.environ.get("FCM_API_URL", "https://fcm.googleapis.com")
+FCM_MAX_CONCURRENCY = int(os.environ.get("FCM_MAX_CONCURRENCY", "32"))
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# FCM error codes meaning the token will never work again
+INVALID_TOKEN_ERRORS = (
+    "UNREGISTERED", "NOT_FOUND", "InvalidRegistration", "NotRegistered"
+)
+
 
 class FirebaseProvider:
     """Firebase Cloud Messaging provider for mobile push notifications."""
@@ -28,9 +46,60 @@ class FirebaseProvider:
         self.project_id = None
         self.access_token = None
         self.token_expiry = None
+        self.api_url = FCM_API_URL
+        self.max_concurrency = FCM_MAX_CONCURRENCY
+        self._client: Optional[httpx.Client] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._token_lock = threading.Lock()
 
         self._initialize_firebase(credentials_path)
 
+    @property
+    def client(self) -> httpx.Client:
+        """Shared HTTP client, created on first use."""
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    if not HTTP2_AVAILABLE:
+                        # h2 is in requirements.txt; only a broken
+                        # install gets here
+                        logger.warning(
+                            "h2 is not installed, sending FCM messages "
+                            "over HTTP/1.1"
+                        )
+                    self._client = httpx.Client(
+                        http2=HTTP2_AVAILABLE,
+                        timeout=30.0,
+                        limits=httpx.Limits(
+                            max_connections=self.max_concurrency,
+                            max_keepalive_connections=self.max_concurrency,
+                        ),
+                    )
+        return self._client
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Shared pool bounding concurrent FCM requests."""
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_concurrency,
+                        thread_name_prefix="fcm",
+                    )
+        return self._executor
+
+    def close(self):
+        """Close pooled connections and worker threads."""
+        with self._lock:
+            client, self._client = self._client, None
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        if client is not None:
+            client.close()
+
     def _initialize_firebase(self, credentials_path: Optional[str] = None):
         """Initialize Firebase credentials."""
         try:
@@ -128,13 +197,21 @@ class FirebaseProvider:
 
     def _ensure_valid_token(self):
         """Ensure we have a valid access token."""
-        if not self.access_token or not self.token_expiry:
-            self._refresh_access_token()
-            return
+        # One refresh for all concurrent senders
+        with self._token_lock:
+            if not self.access_token or not self.token_expiry:
+                self._refresh_access_token()
+                return
 
-        # Refresh if token expires in less than 5 minutes
-        if (self.token_expiry - datetime.utcnow()).total_seconds() < 300:
-            self._refresh_access_token()
+            # Refresh if token expires in less than 5 minutes
+            if (self.token_expiry - datetime.utcnow()).total_seconds() < 300:
+                self._refresh_access_token()
+
+    def _refresh_rejected_token(self, rejected: Optional[str]):
+        """Refresh after a 401, unless another sender already has."""
+        with self._token_lock:
+            if self.access_token == rejected:
+                self._refresh_access_token()
 
     def send_notification(
         self,
@@ -159,7 +236,8 @@ class FirebaseProvider:
             ttl: Time to live in seconds
 
         Returns:
-            Dict with success count, failure count, and results
+            Dict with success count, failure count, results, and the
+            invalid_tokens that should be forgotten
         """
         if not self.credentials or not self.project_id:
             logger.warning(
@@ -168,11 +246,17 @@ class FirebaseProvider:
             return {
                 "success_count": 0,
                 "failure_count": len(device_tokens),
-                "results": []
+                "results": [],
+                "invalid_tokens": [],
             }
 
         if not device_tokens:
-            return {"success_count": 0, "failure_count": 0, "results": []}
+            return {
+                "success_count": 0,
+                "failure_count": 0,
+                "results": [],
+                "invalid_tokens": [],
+            }
 
         self._ensure_valid_token()
 
@@ -217,133 +301,120 @@ class FirebaseProvider:
         if data:
             message["data"] = data
 
-        results = []
-        success_count = 0
-        failure_count = 0
-
-        # Send to each device token
-        for token in device_tokens:
+        def send(token: str) -> Dict[str, Any]:
             try:
-                # Add token to message
-                token_message = message.copy()
-                token_message["token"] = token
-
-                # Send request to FCM
-                response = self._send_fcm_request(token_message)
-
-                if response.get("success", False):
-                    success_count += 1
-                    results.append({
-                        "token": token,
-                        "success": True,
-                        "message_id": response.get("message_id"),
-                        "error": None
-                    })
-                    logger.debug(
-                        f"FCM notification sent successfully to token: "
-                        f"{token[:20]}..."
-                    )
-                else:
-                    failure_count += 1
-                    results.append({
-                        "token": token,
-                        "success": False,
-                        "message_id": None,
-                        "error": response.get("error")
-                    })
-                    logger.warning(
-                        f"FCM notification failed for token {token[:20]}...: "
-                        f"{response.get('error')}"
-                    )
-
-                    # Handle specific error cases
-                    error = response.get("error", "")
-                    if ("InvalidRegistration" in error or
-                            "NotRegistered" in error):
-                        logger.info(
-                            f"Device token is invalid or unregistered: "
-                            f"{token[:20]}..."
-                        )
-
+                response = self._send_fcm_request({**message, "token": token})
             except Exception as e:
-                failure_count += 1
-                results.append({
-                    "token": token,
-                    "success": False,
-                    "message_id": None,
-                    "error": str(e)
-                })
                 logger.error(
                     f"Exception sending FCM notification to {token[:20]}...: "
                     f"{e}"
                 )
+                response = {"success": False, "error": str(e)}
+            return {
+                "token": token,
+                "success": response.get("success", False),
+                "message_id": response.get("message_id"),
+                "error": response.get("error"),
+                "error_code": response.get("error_code"),
+            }
+
+        if len(device_tokens) == 1:
+            results = [send(device_tokens[0])]
+        else:
+            results = list(self.executor.map(send, device_tokens))
 
+        invalid_tokens = []
+        for result in results:
+            if result["success"]:
+                continue
+            token = result["token"]
+            logger.warning(
+                f"FCM notification failed for token {token[:20]}...: "
+                f"{result['error']}"
+            )
+            if self._is_invalid_token_error(result):
+                invalid_tokens.append(token)
+
+        success_count = sum(1 for result in results if result["success"])
+        failure_count = len(results) - success_count
         logger.info(
             f"FCM notification sent: {success_count} successful, "
             f"{failure_count} failed out of {len(device_tokens)} devices"
         )
+        if invalid_tokens:
+            logger.info(
+                f"{len(invalid_tokens)} device tokens are invalid or "
+                f"unregistered"
+            )
 
         return {
             "success_count": success_count,
             "failure_count": failure_count,
-            "results": results
+            "results": results,
+            "invalid_tokens": invalid_tokens,
         }
 
+    @staticmethod
+    def _is_invalid_token_error(result: Dict[str, Any]) -> bool:
+        error = f"{result.get('error_code') or ''} {result.get('error') or ''}"
+        return any(code in error for code in INVALID_TOKEN_ERRORS)
+
     def _send_fcm_request(self, message: Dict[str, Any]) -> Dict[str, Any]:
         """Send HTTP request to FCM API."""
         url = (
-            f"https://fcm.googleapis.com/v1/projects/{self.project_id}/"
-            f"messages:send"
+            f"{self.api_url}/v1/projects/{self.project_id}/messages:send"
         )
 
-        headers = {
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/json"
-        }
-
         payload = {"message": message}
 
         try:
-            with httpx.Client(timeout=30.0) as client:
-                response = client.post(url, headers=headers, json=payload)
-                response.raise_for_status()
-
-                response_data = response.json()
-
-                # Check for errors in response
-                if "error" in response_data:
-                    return {
-                        "success": False,
-                        "error": response_data["error"].get(
-                            "message", "Unknown error"
-                        )
-                    }
-
-                # Extract message ID from response
-                message_id = response_data.get("name", "").split("/")[-1]
-
+            access_token = self.access_token
+            response = self._post(url, payload, access_token)
+            if response.status_code == 401:
+                # Expired early or revoked: refresh once for all senders
+                self._refresh_rejected_token(access_token)
+                response = self._post(url, payload, self.access_token)
+            response.raise_for_status()
+
+            response_data = response.json()
+
+            # Check for errors in response
+            if "error" in response_data:
                 return {
-                    "success": True,
-                    "message_id": message_id
+                    "success": False,
+                    "error": response_data["error"].get(
+                        "message", "Unknown error"
+                    ),
+                    "error_code": self._error_code(response_data["error"]),
                 }
 
+            # Extract message ID from response
+            message_id = response_data.get("name", "").split("/")[-1]
+
+            return {
+                "success": True,
+                "message_id": message_id
+            }
+
         except httpx.HTTPError as e:
             error_msg = f"HTTP error: {e}"
-            if hasattr(e, 'response') and e.response:
+            error_code = None
+            response = getattr(e, "response", None)
+            if response is not None:
                 try:
-                    error_data = e.response.json()
-                    error_msg = error_data.get("error", {}).get(
-                        "message", str(e)
-                    )
+                    error_data = response.json().get("error", {})
+                    error_msg = error_data.get("message", str(e))
+                    error_code = self._error_code(error_data)
                 except Exception:
                     error_msg = (
-                        f"HTTP {e.response.status_code}: "
-                        f"{e.response.text}"
+                        f"HTTP {response.status_code}: "
+                        f"{response.text}"
                     )
 
             return {
                 "success": False,
-                "error": error_msg
+                "error": error_msg,
+                "error_code": error_code,
             }
 
         except Exception as e:
@@ -352,6 +423,22 @@ class FirebaseProvider:
                 "error": f"Unexpected error: {str(e)}"
             }
 
+    def _post(
+        self, url: str, payload: Dict[str, Any], access_token: Optional[str]
+    ) -> httpx.Response:
+        return self.client.post(url, json=payload, headers={
+            "Authorization": f"Bearer {access_token}",
+            "Content-Type": "application/json"
+        })
+
+    @staticmethod
+    def _error_code(error: Dict[str, Any]) -> Optional[str]:
+        """FCM error code (e.g. UNREGISTERED), else the gRPC status."""
+        for detail in error.get("details") or []:
+            if detail.get("errorCode"):
+                return detail["errorCode"]
+        return error.get("status")
+
     def send_to_topic(
         self,
         topic: str,
@@ -495,38 +582,37 @@ class FirebaseProvider:
         }
 
         try:
-            with httpx.Client(timeout=30.0) as client:
-                response = client.post(url, headers=headers, json=payload)
-                response.raise_for_status()
+            response = self.client.post(url, headers=headers, json=payload)
+            response.raise_for_status()
 
-                response_data = response.json()
+            response_data = response.json()
 
-                # Check for errors
-                if "error" in response_data:
-                    logger.error(
-                        f"FCM topic {operation} failed: "
-                        f"{response_data['error']}"
-                    )
-                    return False
-
-                # Check results
-                results = response_data.get("results", [])
-                success_count = sum(1 for r in results if "error" not in r)
-                error_count = len(results) - success_count
-
-                if error_count > 0:
-                    logger.warning(
-                        f"FCM topic {operation}: {success_count} successful, "
-                        f"{error_count} failed out of {len(device_tokens)} "
-                        f"devices"
-                    )
-                else:
-                    logger.info(
-                        f"FCM topic {operation} successful for all "
-                        f"{len(device_tokens)} devices"
-                    )
+            # Check for errors
+            if "error" in response_data:
+                logger.error(
+                    f"FCM topic {operation} failed: "
+                    f"{response_data['error']}"
+                )
+                return False
+
+            # Check results
+            results = response_data.get("results", [])
+            success_count = sum(1 for r in results if "error" not in r)
+            error_count = len(results) - success_count
+
+            if error_count > 0:
+                logger.warning(
+                    f"FCM topic {operation}: {success_count} successful, "
+                    f"{error_count} failed out of {len(device_tokens)} "
+                    f"devices"
+                )
+            else:
+                logger.info(
+                    f"FCM topic {operation} successful for all "
+                    f"{len(device_tokens)} devices"
+                )
 
-                return success_count > 0
+            return success_count > 0
 
         except Exception as e:
             logger.error(f"Exception during FCM topic {operation}: {e}")
@@ -221,7 +221,7 @@ class GitHubOAuthService:
             raise Exception("Account is deactivated")
 
         # Create tokens using the new JWT system with refresh tokens
-        tokens = create_tokens(db_user.id, db_user.username)
+        tokens = create_tokens(db_user.id, db_user.username, db=db)
 
         # Store refresh token in database
         self.refresh_token_repository.create_token(
@@ -189,7 +189,7 @@ class GoogleOAuthService:
             raise Exception("Account is deactivated")
 
         # Create JWT tokens
-        tokens = create_tokens(db_user.id, db_user.username)
+        tokens = create_tokens(db_user.id, db_user.username, db=db)
 
         # Store refresh token in database
         try:
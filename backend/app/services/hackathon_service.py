@@ -3,8 +3,10 @@ Hackathon service layer for business logic operations.
 """
 from typing import Optional, List
 from datetime import datetime
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from app.domain.models import HackathonRegistration, User
 from app.domain.schemas.hackathon import (
     HackathonCreate, HackathonUpdate, Hackathon as HackathonSchema,
     HackathonRegistration as RegistrationSchema
@@ -13,7 +15,15 @@ from app.repositories.hackathon_repository import (
     HackathonRepository, HackathonRegistrationRepository
 )
 from app.repositories.user_repository import UserRepository
-from app.services.notification_service import NotificationService
+from app.services.bulk_email_service import BulkRecipient, bulk_email_service
+from app.services.notification_eligibility_service import (
+    notification_eligibility_service
+)
+from app.services.notification_service import (
+    NotificationRecipient,
+    NotificationService,
+)
+from app.utils.cache import cache_manager, cached
 
 
 class HackathonService:
@@ -25,6 +35,7 @@ class HackathonService:
         self.user_repo = UserRepository()
         self.notification_service = NotificationService()
 
+    @cached(ttl=60, tags=("hackathons:list",))
     def get_hackathons(
         self, db: Session, skip: int = 0, limit: int = 100
     ) -> List[HackathonSchema]:
@@ -32,6 +43,7 @@ class HackathonService:
         hackathons = self.hackathon_repo.get_all(db, skip=skip, limit=limit)
         return [HackathonSchema.model_validate(h) for h in hackathons]
 
+    @cached(ttl=60, tags=("hackathon:{hackathon_id}",))
     def get_hackathon(
         self, db: Session, hackathon_id: int
     ) -> Optional[HackathonSchema]:
@@ -51,6 +63,7 @@ class HackathonService:
         hackathon_data["status"] = "upcoming"
 
         hackathon = self.hackathon_repo.create(db, obj_in=hackathon_data)
+        cache_manager.invalidate_tags("hackathons:list")
         return HackathonSchema.model_validate(hackathon)
 
     def update_hackathon(
@@ -63,8 +76,9 @@ class HackathonService:
 
         update_data = hackathon_update.model_dump(exclude_unset=True)
         updated_hackathon = self.hackathon_repo.update(
-            db, hackathon, update_data
+            db, db_obj=hackathon, obj_in=update_data
         )
+        self.invalidate_hackathon_cache(hackathon_id)
         return HackathonSchema.model_validate(updated_hackathon)
 
     def delete_hackathon(self, db: Session, hackathon_id: int) -> bool:
@@ -74,8 +88,50 @@ class HackathonService:
             return False
 
         self.hackathon_repo.delete(db, id=hackathon_id)
+        self.invalidate_hackathon_cache(hackathon_id)
         return True
 
+    def invalidate_hackathon_cache(self, hackathon_id: int) -> None:
+        """
+        Invalidate cached reads that depend on a hackathon.
+
+        Project listings embedding the hackathon carry its tag as well.
+        """
+        cache_manager.invalidate_tags(
+            f"hackathon:{hackathon_id}",
+            f"hackathon:{hackathon_id}:projects",
+            "hackathons:list",
+        )
+
+    @cached(ttl=60, tags=("hackathon:{hackathon_id}:projects",))
+    def get_hackathon_projects(
+        self, db: Session, hackathon_id: int
+    ) -> List[dict]:
+        """
+        Get a compact listing of the projects of a hackathon.
+
+        Timestamps are ISO strings (as rendered in the response) so the
+        cached listing is JSON and can be shared through Redis.
+        """
+        from app.domain.models.project import Project
+
+        projects = db.query(Project).filter(
+            Project.hackathon_id == hackathon_id
+        ).all()
+        return [
+            {
+                "id": project.id,
+                "title": project.title,
+                "description": project.description,
+                "team_id": project.team_id,
+                "created_at": (
+                    project.created_at.isoformat()
+                    if project.created_at else None
+                )
+            }
+            for project in projects
+        ]
+
     def register_for_hackathon(
         self, db: Session, hackathon_id: int, user_id: int
     ) -> Optional[RegistrationSchema]:
@@ -159,7 +215,9 @@ class HackathonService:
     def send_hackathon_start_reminders(self, db):
         """
         Send reminder emails for hackathons starting soon.
-        This should be called by a scheduled job (e.g., cron).
+        This should be called by a scheduled job (e.g., cron), outside a
+        running event loop. Re-running it resumes unfinished campaigns and
+        does not remind anyone twice.
         """
         import logging
         from datetime import datetime, timedelta
@@ -182,7 +240,7 @@ class HackathonService:
                     >= reminder_window_start,
                     self.hackathon_repo.model.start_date
                     <= reminder_window_end,
-                    self.hackathon_repo.model.status == "upcoming"
+                    self.hackathon_repo.model.is_active.is_(True)
                 )
             ]
         )
@@ -195,64 +253,9 @@ class HackathonService:
         error_count = 0
 
         for hackathon in hackathons:
-            # Get all registered users for this hackathon
-            registrations = self.registration_repo.get_all(
-                db,
-                filters=[
-                    self.registration_repo.model.hackathon_id == hackathon.id,
-                    self.registration_repo.model.status == "registered"
-                ]
-            )
-
-            for registration in registrations:
-                try:
-                    user = self.user_repo.get(db, registration.user_id)
-                    if not user or not user.email:
-                        continue
-
-                    # Get user's preferred language
-                    language = getattr(user, "language", None) or "en"
-                    if language == "auto":
-                        language = "en"
-
-                    # Format start time
-                    start_time = hackathon.start_date
-                    if start_time:
-                        time_str = start_time.strftime(
-                            "%B %d, %Y at %H:%M UTC"
-                        )
-                    else:
-                        time_str = "soon"
-
-                    variables = {
-                        "hackathon_name": hackathon.name,
-                        "user_name": user.name or user.username,
-                        "start_time": time_str,
-                        "hackathon_url": f"#TODO/hackathons/{hackathon.id}",
-                        "description": hackathon.description or "",
-                        "location": hackathon.location or "Online"
-                    }
-
-                    self.notification_service.send_multi_channel_notification(
-                        db=db,
-                        notification_type="hackathon_start_reminder",
-                        user_id=user.id,
-                        title=f"{hackathon.name} starts soon!",
-                        message=(
-                            f"Reminder: {hackathon.name} starts {time_str}"
-                        ),
-                        language=language,
-                        variables=variables
-                    )
-
-                    sent_count += 1
-
-                except Exception as e:
-                    logger.error(
-                        f"Failed to send start reminder for hackathon "
-                        f"{hackathon.id} to user {registration.user_id}: {e}"
-                    )
-                    error_count += 1
+            result, errors = self._send_start_reminder_campaign(db, hackathon)
+            sent_count += result.sent
+            error_count += result.failed + errors
 
         logger.info(
             f"Sent {sent_count} hackathon start reminders with "
@@ -260,6 +263,114 @@ class HackathonService:
         )
         return {"sent": sent_count, "errors": error_count}
 
+    def _send_start_reminder_campaign(self, db: Session, hackathon):
+        """
+        Remind the registered users of one hackathon.
+
+        Emails go out as one resumable bulk campaign per hackathon; other
+        channels the user allows are dispatched as notifications. Returns
+        the campaign result and the number of users that failed.
+        """
+        import logging
+
+        logger = logging.getLogger(__name__)
+        notification_type = "hackathon_start_reminder"
+        if hackathon.start_date:
+            time_str = hackathon.start_date.strftime("%B %d, %Y at %H:%M UTC")
+        else:
+            time_str = "soon"
+        variables = {
+            "hackathon_name": hackathon.name,
+            "start_time": time_str,
+            "days_until_start": 1,
+            "hackathon_url": f"#TODO/hackathons/{hackathon.id}",
+            "hackathon_dashboard_url": f"#TODO/hackathons/{hackathon.id}",
+            "description": hackathon.description or "",
+            "location": hackathon.location or "Online"
+        }
+        errors = 0
+
+        def recipients(after_id: int):
+            return select(
+                User.id, User.email, User.name, User.username, User.language
+            ).join(
+                HackathonRegistration, HackathonRegistration.user_id == User.id
+            ).where(
+                HackathonRegistration.hackathon_id == hackathon.id,
+                HackathonRegistration.status == "registered",
+                User.id > after_id,
+            ).order_by(User.id)
+
+        # Non-email reminders of the batch being sent; dispatched only
+        # once the campaign has recorded the batch, so a resumed
+        # campaign does not notify anyone twice.
+        pending = []
+
+        def prepare(db: Session, rows):
+            emails = []
+            others = []
+            allowed = (
+                notification_eligibility_service.get_allowed_channels_bulk(
+                    db, [row.id for row in rows], notification_type
+                )
+            )
+            for row in rows:
+                # Get user's preferred language
+                language = row.language or "en"
+                if language == "auto":
+                    language = "en"
+                personal = {"user_name": row.name or row.username}
+                channels = allowed.get(row.id, [])
+                if any(channel != "email" for channel in channels):
+                    others.append(NotificationRecipient(
+                        user_id=row.id, language=language, variables=personal
+                    ))
+                if "email" in channels and row.email:
+                    emails.append(BulkRecipient(
+                        email=row.email, language=language, variables=personal
+                    ))
+            pending[:] = [(others, allowed)]
+            return emails
+
+        def after_batch(db: Session, rows):
+            nonlocal errors
+            others, allowed = pending.pop()
+            if not others:
+                return
+            try:
+                self.notification_service.dispatch_bulk(
+                    db,
+                    notification_type,
+                    others,
+                    title=f"{hackathon.name} starts soon!",
+                    message=f"Reminder: {hackathon.name} starts {time_str}",
+                    variables=variables,
+                    allowed_channels={
+                        user_id: [
+                            channel for channel in channels
+                            if channel != "email"
+                        ]
+                        for user_id, channels in allowed.items()
+                    },
+                )
+            except Exception as e:
+                logger.error(
+                    f"Failed to send start reminders for hackathon "
+                    f"{hackathon.id} to {len(others)} users: {e}"
+                )
+                errors += len(others)
+
+        result = bulk_email_service.run_campaign(
+            db,
+            key=f"{notification_type}:{hackathon.id}",
+            template_name="hackathon/start_reminder",
+            recipients=recipients,
+            prepare=prepare,
+            variables=variables,
+            after_batch=after_batch,
+        )
+        return result, errors
+
     def unregister_from_hackathon(
         self, db: Session, hackathon_id: int, user_id: int
     ) -> bool:
@@ -309,6 +420,7 @@ class HackathonService:
         hackathon.status = status
         db.commit()
         db.refresh(hackathon)
+        self.invalidate_hackathon_cache(hackathon_id)
         return HackathonSchema.model_validate(hackathon)
 
 
@@ -4,7 +4,7 @@ In-app notification adapter.
 import logging
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from sqlalchemy.orm import Session
 
@@ -16,6 +16,7 @@ from app.repositories.notification_repository import (
     NotificationDeliveryRepository,
     NotificationRepository,
 )
+from app.utils.pagination import Keyset, next_keyset
 
 logger = logging.getLogger(__name__)
 
@@ -90,15 +91,43 @@ class InAppNotificationService:
         unread_only: bool = False,
         include_expired: bool = False,
     ) -> List[UserNotification]:
+        notifications, _ = self.get_user_notifications_page(
+            db,
+            user_id=user_id,
+            limit=limit,
+            offset=offset,
+            unread_only=unread_only,
+            include_expired=include_expired,
+        )
+        return notifications
+
+    def get_user_notifications_page(
+        self,
+        db: Session,
+        user_id: int,
+        limit: int = 50,
+        offset: int = 0,
+        unread_only: bool = False,
+        include_expired: bool = False,
+        after: Optional[Keyset] = None,
+    ) -> Tuple[List[UserNotification], Optional[Keyset]]:
+        """
+        Return one page of notifications and the keyset of the next page.
+
+        The keyset follows the last row read, so dropping expired
+        notifications never ends the listing early.
+        """
         notifications = self.notification_repo.get_user_notifications(
             db,
             user_id=user_id,
             skip=offset,
             limit=limit,
             unread_only=unread_only,
+            after=after,
         )
+        following = next_keyset(notifications, limit)
         if include_expired:
-            return notifications
+            return notifications, following
 
         result = []
         now = datetime.utcnow()
@@ -112,7 +141,7 @@ class InAppNotificationService:
             if expires_at and expires_at <= now:
                 continue
             result.append(notification)
-        return result
+        return result, following
 
     def get_unread_count(self, db: Session, user_id: int) -> int:
         return self.notification_repo.count_unread(db, user_id)
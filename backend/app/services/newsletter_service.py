@@ -1,11 +1,15 @@
 """
 Newsletter subscription service.
 """
-from typing import Optional, Dict
+from typing import Any, Optional, Dict
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.domain.models.shared import NewsletterSubscription
 from app.repositories.newsletter_repository import NewsletterRepository
+from app.services.bulk_email_service import (
+    BulkRecipient, CampaignResult, bulk_email_service
+)
 from app.services.email_orchestrator import EmailOrchestrator, EmailContext
 
 
@@ -144,6 +148,41 @@ class NewsletterService:
             db, skip=skip, limit=limit
         )
 
+    async def send_newsletter(
+        self,
+        db: Session,
+        campaign_key: str,
+        template_name: str,
+        variables: Optional[Dict[str, Any]] = None,
+    ) -> CampaignResult:
+        """
+        Send a newsletter issue to all active subscribers.
+
+        Sending the same ``campaign_key`` again resumes an interrupted send
+        and skips subscribers who already got the issue.
+        """
+        model = NewsletterSubscription
+
+        def recipients(after_id: int):
+            return select(model.id, model.email).where(
+                model.is_active.is_(True), model.id > after_id
+            ).order_by(model.id)
+
+        def prepare(db: Session, rows):
+            return [
+                BulkRecipient(email=row.email, variables={"email": row.email})
+                for row in rows
+            ]
+
+        return await bulk_email_service.send_campaign(
+            db,
+            key=f"newsletter:{campaign_key}",
+            template_name=template_name,
+            recipients=recipients,
+            prepare=prepare,
+            variables=variables,
+        )
+
 
 # Create a singleton instance
 newsletter_service = NewsletterService()
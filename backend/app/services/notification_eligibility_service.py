@@ -3,7 +3,7 @@ Centralized eligibility checks for notification dispatching.
 """
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Collection, Dict, List, Optional
 
 from sqlalchemy.orm import Session
 
@@ -45,5 +45,30 @@ class NotificationEligibilityService:
         requested = set(requested_channels)
         return [channel for channel in allowed if channel in requested]
 
+    def get_allowed_channels_bulk(
+        self,
+        db: Session,
+        user_ids: Collection[int],
+        notification_type: str,
+        requested_channels: Optional[List[str]] = None,
+    ) -> Dict[int, List[str]]:
+        """``get_allowed_channels`` for many users in two queries."""
+        push_user_ids = self.push_repository.get_subscribed_user_ids(
+            db, user_ids
+        )
+        allowed = notification_settings_service.get_allowed_channels_bulk(
+            db,
+            user_ids,
+            notification_type,
+            push_user_ids=push_user_ids,
+        )
+        if requested_channels is None:
+            return allowed
+        requested = set(requested_channels)
+        return {
+            user_id: [channel for channel in channels if channel in requested]
+            for user_id, channels in allowed.items()
+        }
+
 
 notification_eligibility_service = NotificationEligibilityService()
@@ -185,7 +185,7 @@ def _load_embedded_definitions() -> List[NotificationDefinition]:
     return definitions
 
 
-@cached(ttl=CACHE_TTL)
+@cached(ttl=CACHE_TTL, tags=("notification_types",))
 def get_all_definitions() -> List[NotificationDefinition]:
     """Get all notification definitions with caching."""
     db = next(get_db())
@@ -199,7 +199,7 @@ def get_all_definitions() -> List[NotificationDefinition]:
         db.close()
 
 
-@cached(ttl=CACHE_TTL)
+@cached(ttl=CACHE_TTL, tags=("notification_types",))
 def get_definition_map() -> Dict[str, NotificationDefinition]:
     """Get notification definition map with caching."""
     definitions = get_all_definitions()
@@ -240,7 +240,7 @@ def iter_definitions() -> Iterable[NotificationDefinition]:
 
 def refresh_cache() -> None:
     """Refresh the notification definitions cache."""
-    cache_manager.clear()
+    cache_manager.invalidate_tags("notification_types")
     # Trigger reload on next access
     try:
         get_all_definitions()
@@ -1,14 +1,24 @@
 """
 Canonical notification orchestration service.
+
+With ``NOTIFICATION_OUTBOX`` enabled, dispatching only stores the
+notification and its deliveries: in-app deliveries are completed inline,
+email and push deliveries stay pending for app.workers.notifications,
+which sends them through ``send_queued``. ``dispatch_bulk`` stores the
+notifications of many users in one transaction.
 """
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 from sqlalchemy.orm import Session
 
-from app.domain.models.notification import UserNotification
+from app.core.config import settings
+from app.domain.models.notification import (
+    NotificationDelivery,
+    UserNotification,
+)
 from app.repositories.notification_repository import (
     NotificationDeliveryRepository,
     NotificationRepository,
@@ -26,9 +36,13 @@ from app.services.notification_eligibility_service import (
 )
 from app.services.notification_registry import get_definition, is_known_type
 from app.services.push_notification_service import push_notification_service
+from app.utils.pagination import Keyset
 
 logger = logging.getLogger(__name__)
 
+# Channels delivered within the request even when the outbox is enabled
+INLINE_CHANNELS = ("in_app",)
+
 
 @dataclass
 class NotificationDispatchResult:
@@ -36,6 +50,21 @@ class NotificationDispatchResult:
     deliveries: Dict[str, DeliveryResult]
 
 
+@dataclass
+class NotificationRecipient:
+    user_id: int
+    language: str = "en"
+    # Per-user template variables, merged over the shared ones
+    variables: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class BulkDispatchResult:
+    # User id -> notification id, for users with at least one channel
+    notifications: Dict[int, int]
+    deliveries: Dict[int, Dict[str, DeliveryResult]]
+
+
 class NotificationService:
     """Service for sending notifications for important user actions."""
 
@@ -110,35 +139,31 @@ class NotificationService:
             message=message,
             data=data or {},
         )
+        queued = [
+            channel for channel in allowed_channels
+            if self._is_queued(channel)
+        ]
         deliveries = self.delivery_repo.create_deliveries(
-            db, notification.id, allowed_channels
+            db,
+            notification.id,
+            allowed_channels,
+            queued=queued,
+            payload={"language": language, "variables": variables or {}},
         )
 
         results: Dict[str, DeliveryResult] = {}
         delivery_map = {delivery.channel: delivery for delivery in deliveries}
         for channel in allowed_channels:
             delivery = delivery_map[channel]
-            try:
-                result = self._send_via_channel(
-                    db=db,
-                    channel=channel,
-                    notification=notification,
-                    delivery=delivery,
-                    language=language,
-                    variables=variables or {},
-                )
-            except Exception as exc:
-                logger.error(
-                    "Failed to send notification %s via %s: %s",
-                    notification.id,
-                    channel,
-                    exc,
-                )
-                result = DeliveryResult(
-                    success=False,
-                    status="failed",
-                    error=str(exc),
+            if channel in queued:
+                results[channel] = DeliveryResult(
+                    success=True, status="pending"
                 )
+                continue
+            result = self._attempt(
+                db, channel, notification, delivery,
+                language=language, variables=variables or {},
+            )
             self.delivery_repo.update_status(
                 db,
                 delivery,
@@ -154,6 +179,166 @@ class NotificationService:
             notification=hydrated, deliveries=results
         )
 
+    def dispatch_bulk(
+        self,
+        db: Session,
+        notification_type: str,
+        recipients: Sequence[NotificationRecipient],
+        *,
+        title: str,
+        message: str,
+        variables: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        requested_channels: Optional[List[str]] = None,
+        allowed_channels: Optional[Dict[int, List[str]]] = None,
+    ) -> BulkDispatchResult:
+        """
+        Dispatch one notification to many users.
+
+        All notifications and deliveries are inserted with multi-row
+        INSERT ... RETURNING and committed in one transaction; in-app
+        deliveries are stored as delivered. Channels the outbox does not
+        queue are sent afterwards. ``allowed_channels`` skips resolving
+        eligibility when the caller already has.
+        """
+        if not is_known_type(notification_type):
+            raise ValueError(f"Unknown notification type: {notification_type}")
+
+        recipients = list({
+            recipient.user_id: recipient for recipient in recipients
+        }.values())
+        if allowed_channels is None:
+            allowed_channels = (
+                notification_eligibility_service.get_allowed_channels_bulk(
+                    db,
+                    [recipient.user_id for recipient in recipients],
+                    notification_type,
+                    requested_channels=requested_channels,
+                )
+            )
+        elif requested_channels is not None:
+            allowed_channels = {
+                user_id: [
+                    channel for channel in channels
+                    if channel in requested_channels
+                ]
+                for user_id, channels in allowed_channels.items()
+            }
+        targets = [
+            (recipient, allowed_channels[recipient.user_id])
+            for recipient in recipients
+            if allowed_channels.get(recipient.user_id)
+        ]
+        if not targets:
+            return BulkDispatchResult(notifications={}, deliveries={})
+
+        now = datetime.utcnow()
+        try:
+            notification_ids = self.notification_repo.insert_many(db, [
+                {
+                    "user_id": recipient.user_id,
+                    "notification_type": notification_type,
+                    "title": title,
+                    "message": message,
+                    "data": data or {},
+                }
+                for recipient, _ in targets
+            ])
+            rows = []
+            for recipient, channels in targets:
+                payload = {
+                    "language": recipient.language,
+                    "variables": {**(variables or {}), **recipient.variables},
+                }
+                for channel in channels:
+                    rows.append(self._delivery_row(
+                        notification_ids[recipient.user_id],
+                        channel,
+                        payload,
+                        now,
+                    ))
+            delivery_ids = self.delivery_repo.insert_many(db, rows)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+
+        results: Dict[int, Dict[str, DeliveryResult]] = {}
+        unsent = []
+        for recipient, channels in targets:
+            notification_id = notification_ids[recipient.user_id]
+            user_results = results.setdefault(recipient.user_id, {})
+            for channel in channels:
+                if channel == "in_app":
+                    user_results[channel] = DeliveryResult(
+                        success=True, status="delivered"
+                    )
+                elif self._is_queued(channel):
+                    user_results[channel] = DeliveryResult(
+                        success=True, status="pending"
+                    )
+                else:
+                    unsent.append(delivery_ids[(notification_id, channel)])
+
+        by_notification = {
+            notification_ids[recipient.user_id]: recipient
+            for recipient, _ in targets
+        }
+        for delivery in self.delivery_repo.get_many(db, unsent):
+            recipient = by_notification[delivery.notification_id]
+            result = self._attempt(
+                db, delivery.channel, delivery.notification, delivery,
+                language=recipient.language,
+                variables={**(variables or {}), **recipient.variables},
+            )
+            self.delivery_repo.update_status(
+                db,
+                delivery,
+                status=result.status,
+                error=result.error,
+                provider_message_id=result.provider_message_id,
+                delivered_at=datetime.utcnow() if result.success else None,
+            )
+            results[recipient.user_id][delivery.channel] = result
+
+        return BulkDispatchResult(
+            notifications=notification_ids, deliveries=results
+        )
+
+    def _is_queued(self, channel: str) -> bool:
+        return (
+            settings.NOTIFICATION_OUTBOX and channel not in INLINE_CHANNELS
+        )
+
+    def _delivery_row(
+        self,
+        notification_id: int,
+        channel: str,
+        payload: Dict[str, Any],
+        now: datetime,
+    ) -> Dict[str, Any]:
+        row: Dict[str, Any] = {
+            "notification_id": notification_id,
+            "channel": channel,
+            "status": "pending",
+            "attempt_count": 0,
+            "payload": None,
+            "next_attempt_at": None,
+            "delivered_at": None,
+            "last_attempt_at": None,
+        }
+        if channel == "in_app":
+            # InAppNotificationService.deliver only marks it delivered
+            row.update(
+                status="delivered",
+                attempt_count=1,
+                delivered_at=now,
+                last_attempt_at=now,
+            )
+        elif self._is_queued(channel):
+            row.update(payload=payload, next_attempt_at=now)
+        return row
+
     def send_notification(
         self,
         db: Session,
@@ -329,6 +514,7 @@ class NotificationService:
         skip: int = 0,
         limit: int = 100,
         unread_only: bool = False,
+        after: Optional[Keyset] = None,
     ) -> List[UserNotification]:
         return self.notification_repo.get_user_notifications(
             db,
@@ -336,6 +522,7 @@ class NotificationService:
             skip=skip,
             limit=limit,
             unread_only=unread_only,
+            after=after,
         )
 
     def mark_notification_as_read(
@@ -348,6 +535,58 @@ class NotificationService:
     def mark_all_notifications_as_read(self, db: Session, user_id: int) -> int:
         return self.notification_repo.mark_all_as_read(db, user_id)
 
+    def send_queued(
+        self, db: Session, delivery: NotificationDelivery
+    ) -> DeliveryResult:
+        """Send a delivery stored by the outbox; the caller records it."""
+        notification = self.notification_repo.get(
+            db, delivery.notification_id
+        )
+        if notification is None:
+            return DeliveryResult(
+                success=False,
+                status="failed",
+                error="Notification not found",
+            )
+        payload = delivery.payload or {}
+        return self._attempt(
+            db, delivery.channel, notification, delivery,
+            language=payload.get("language") or "en",
+            variables=payload.get("variables") or {},
+        )
+
+    def _attempt(
+        self,
+        db: Session,
+        channel: str,
+        notification: UserNotification,
+        delivery: NotificationDelivery,
+        *,
+        language: str,
+        variables: Dict[str, Any],
+    ) -> DeliveryResult:
+        try:
+            return self._send_via_channel(
+                db=db,
+                channel=channel,
+                notification=notification,
+                delivery=delivery,
+                language=language,
+                variables=variables,
+            )
+        except Exception as exc:
+            logger.error(
+                "Failed to send notification %s via %s: %s",
+                notification.id,
+                channel,
+                exc,
+            )
+            return DeliveryResult(
+                success=False,
+                status="failed",
+                error=str(exc),
+            )
+
     def _send_via_channel(
         self,
         db: Session,
@@ -4,7 +4,7 @@ Central notification settings service backed by bitmasks.
 from __future__ import annotations
 
 from dataclasses import asdict
-from typing import Any, Dict, List
+from typing import Any, Collection, Dict, List, Optional
 
 from sqlalchemy.orm import Session
 
@@ -267,7 +267,52 @@ class NotificationSettingsService:
             default_types_mask=ALL_TYPE_FLAGS_MASK,
             default_channels_mask=ALL_CHANNEL_FLAGS_MASK,
         )
-        if not has_flag(preference.types_mask_int, TYPE_FLAGS[type_key]):
+        return self._allowed_channels(
+            type_key,
+            preference.types_mask_int,
+            preference.channels_mask_int,
+            push_runtime_enabled,
+        )
+
+    def get_allowed_channels_bulk(
+        self,
+        db: Session,
+        user_ids: Collection[int],
+        type_key: str,
+        *,
+        push_user_ids: Optional[Collection[int]] = None,
+    ) -> Dict[int, List[str]]:
+        """
+        Allowed channels per user, reading all settings in one query.
+
+        Push is only allowed for users in ``push_user_ids`` when given.
+        """
+        if not is_known_type(type_key):
+            return {user_id: [] for user_id in user_ids}
+        masks = self.preference_repository.get_or_create_masks(
+            db,
+            user_ids,
+            default_types_mask=ALL_TYPE_FLAGS_MASK,
+            default_channels_mask=ALL_CHANNEL_FLAGS_MASK,
+        )
+        return {
+            user_id: self._allowed_channels(
+                type_key,
+                types_mask,
+                channels_mask,
+                push_user_ids is None or user_id in push_user_ids,
+            )
+            for user_id, (types_mask, channels_mask) in masks.items()
+        }
+
+    def _allowed_channels(
+        self,
+        type_key: str,
+        types_mask: int,
+        channels_mask: int,
+        push_runtime_enabled: bool,
+    ) -> List[str]:
+        if not has_flag(types_mask, TYPE_FLAGS[type_key]):
             return []
         definition = get_definition(type_key)
         if not definition:
@@ -275,7 +320,7 @@ class NotificationSettingsService:
         allowed = [
             channel
             for channel in definition.default_channels
-            if has_flag(preference.channels_mask_int, CHANNEL_FLAGS[channel])
+            if has_flag(channels_mask, CHANNEL_FLAGS[channel])
         ]
         if not push_runtime_enabled:
             allowed = [channel for channel in allowed if channel != "push"]
@@ -6,7 +6,8 @@ from sqlalchemy.orm import Session
 
 from app.domain.schemas.project import (
     ProjectCreate, ProjectUpdate, Project as ProjectSchema,
-    Vote as VoteSchema, Comment as CommentSchema, CommentCreate
+    Vote as VoteSchema, Comment as CommentSchema, CommentCreate,
+    TechnologyFacet
 )
 from app.repositories.project_repository import (
     ProjectRepository, VoteRepository, CommentRepository
@@ -14,7 +15,26 @@ from app.repositories.project_repository import (
 from app.repositories.user_repository import UserRepository
 from app.services.notification_service import NotificationService
 from app.services.email_orchestrator import EmailOrchestrator, EmailContext
-from app.utils.cache import cached, invalidate_cache
+from app.utils.cache import cache_manager, cached, invalidate_cache
+from app.utils.pagination import Keyset
+
+
+def _embedded_hackathon_tags(projects) -> List[str]:
+    """Tag cached projects with the hackathons embedded in them."""
+    if projects is None:
+        return []
+    if not isinstance(projects, list):
+        projects = [projects]
+    return [
+        f"hackathon:{project.hackathon_id}"
+        for project in projects if project.hackathon_id
+    ]
+
+
+def _hackathon_projects_tags(project) -> List[str]:
+    if project is None or not project.hackathon_id:
+        return []
+    return [f"hackathon:{project.hackathon_id}:projects"]
 
 
 class ProjectService:
@@ -28,58 +48,104 @@ class ProjectService:
         self.notification_service = NotificationService()
         self.email_orchestrator = EmailOrchestrator()
 
-    @cached(ttl=60)  # Cache for 1 minute
+    @cached(
+        ttl=60,
+        stale_ttl=30,
+        tags=("projects:list", _embedded_hackathon_tags),
+        key=("skip", "limit", "user_id", "after"),
+    )
     def get_projects(
         self, db: Session, skip: int = 0, limit: int = 100,
-        user_id: Optional[int] = None
+        user_id: Optional[int] = None, after: Optional[Keyset] = None
     ) -> List[ProjectSchema]:
         """Get all public projects, optionally filtered by user."""
         if user_id is not None:
             projects = self.project_repo.get_by_owner(
-                db, owner_id=user_id, skip=skip, limit=limit
+                db, owner_id=user_id, skip=skip, limit=limit, after=after
             )
         else:
             projects = self.project_repo.get_public_projects(
-                db, skip=skip, limit=limit
+                db, skip=skip, limit=limit, after=after
             )
         return [ProjectSchema.model_validate(p) for p in projects]
 
-    @cached(ttl=60)  # Cache for 1 minute
+    @cached(
+        ttl=60,
+        stale_ttl=30,
+        tags=("projects:list", _embedded_hackathon_tags),
+        key=("technology", "skip", "limit", "after"),
+    )
     def get_projects_by_technology(
-        self, db: Session, technology: str, skip: int = 0, limit: int = 100
+        self, db: Session, technology: str, skip: int = 0, limit: int = 100,
+        after: Optional[Keyset] = None
     ) -> List[ProjectSchema]:
         """Get projects by technology."""
         projects = self.project_repo.get_by_technology(
-            db, technology=technology, skip=skip, limit=limit
+            db, technology=technology, skip=skip, limit=limit, after=after
         )
         return [ProjectSchema.model_validate(p) for p in projects]
 
-    @cached(ttl=60)  # Cache for 1 minute
+    @cached(
+        ttl=60,
+        stale_ttl=30,
+        tags=("projects:list", _embedded_hackathon_tags),
+        key=("technologies", "skip", "limit", "match_all", "after"),
+    )
     def get_projects_by_technologies(
         self, db: Session, technologies: List[str],
-        skip: int = 0, limit: int = 100
+        skip: int = 0, limit: int = 100, match_all: bool = True,
+        after: Optional[Keyset] = None
     ) -> List[ProjectSchema]:
-        """Get projects by multiple technologies."""
+        """Get projects tagged with all (or any) of the technologies."""
         projects = self.project_repo.get_by_technologies(
-            db, technologies=technologies, skip=skip, limit=limit
+            db, technologies=technologies, skip=skip, limit=limit,
+            match_all=match_all, after=after
         )
         return [ProjectSchema.model_validate(p) for p in projects]
 
-    @cached(ttl=30)  # Shorter TTL for individual projects
+    @cached(
+        ttl=60,
+        stale_ttl=30,
+        tags=("projects:list",),
+        key=("technologies", "match_all", "limit"),
+    )
+    def get_technology_facets(
+        self, db: Session, technologies: Optional[List[str]] = None,
+        match_all: bool = True, limit: int = 50
+    ) -> List[TechnologyFacet]:
+        """Count public projects per technology, within a tag selection."""
+        facets = self.project_repo.get_technology_facets(
+            db, technologies=technologies, match_all=match_all, limit=limit
+        )
+        return [
+            TechnologyFacet(name=name, count=count) for name, count in facets
+        ]
+
+    # Shorter TTL for individual projects
+    @cached(
+        ttl=30,
+        tags=("project:{project_id}", _embedded_hackathon_tags),
+        key=("project_id",),
+    )
     def get_project(
         self, db: Session, project_id: int
     ) -> Optional[ProjectSchema]:
-        """Get a project by ID and increment view count."""
+        """
+        Get a project by ID.
+
+        Views are counted by POST /projects/{id}/view, not by reads.
+        """
         project = self.project_repo.get(db, project_id)
         if project:
-            # Business logic: increment view count
-            project.view_count = (project.view_count or 0) + 1
-            db.commit()
-            db.refresh(project)
             return ProjectSchema.model_validate(project)
         return None
 
-    @cached(ttl=60)  # Cache for 1 minute
+    @cached(
+        ttl=60,
+        stale_ttl=30,
+        tags=("projects:list", _embedded_hackathon_tags),
+        key=("search_term", "skip", "limit"),
+    )
     def search_projects(
         self, db: Session, search_term: str, skip: int = 0, limit: int = 100
     ) -> List[ProjectSchema]:
@@ -89,7 +155,7 @@ class ProjectService:
         )
         return [ProjectSchema.model_validate(p) for p in projects]
 
-    @invalidate_cache()
+    @invalidate_cache(tags=("projects:list", _hackathon_projects_tags))
     def create_project(
         self, db: Session, project_create: ProjectCreate, creator_id: int
     ) -> ProjectSchema:
@@ -119,7 +185,6 @@ class ProjectService:
 
         return ProjectSchema.model_validate(project)
 
-    @invalidate_cache()
     def update_project(
         self, db: Session, project_id: int, project_update: ProjectUpdate,
         user_id: int, locale: str = "en"
@@ -136,12 +201,18 @@ class ProjectService:
             from app.i18n.helpers import raise_forbidden
             raise_forbidden(locale, "update", entity="project")
 
+        previous_hackathon_id = project.hackathon_id
         update_data = project_update.model_dump(exclude_unset=True)
         updated_project = self.project_repo.update(
             db, db_obj=project, obj_in=update_data)
+        self.project_repo.record_activity(db, project_id)
+        db.commit()
+        db.refresh(updated_project)
+        self.invalidate_project_cache(
+            project_id, previous_hackathon_id, updated_project.hackathon_id
+        )
         return ProjectSchema.model_validate(updated_project)
 
-    @invalidate_cache()
     def delete_project(
         self, db: Session, project_id: int, user_id: int, locale: str = "en"
     ) -> bool:
@@ -157,9 +228,24 @@ class ProjectService:
             from app.i18n.helpers import raise_forbidden
             raise_forbidden(locale, "delete", entity="project")
 
+        hackathon_id = project.hackathon_id
         self.project_repo.delete(db, id=project_id)
+        self.invalidate_project_cache(project_id, hackathon_id)
         return True
 
+    def invalidate_project_cache(
+        self, project_id: int, *hackathon_ids: Optional[int]
+    ) -> None:
+        """Invalidate cached reads that depend on a project."""
+        cache_manager.invalidate_tags(
+            f"project:{project_id}",
+            "projects:list",
+            *(
+                f"hackathon:{hackathon_id}:projects"
+                for hackathon_id in hackathon_ids if hackathon_id
+            ),
+        )
+
     def get_project_votes(
         self, db: Session, project_id: int
     ) -> List[VoteSchema]:
@@ -182,53 +268,17 @@ class ProjectService:
         if vote_type not in ["upvote", "downvote"]:
             raise ValueError("Vote type must be 'upvote' or 'downvote'")
 
-        # Business logic: check if user already voted
-        existing_vote = self.vote_repo.get_by_user_and_project(
-            db, user_id, project_id
+        # Setting the same vote again keeps it instead of toggling it off
+        result = self.vote_repo.cast_vote(
+            db, project_id, user_id, vote_type, toggle=False
         )
-        if existing_vote:
-            # Update existing vote
-            existing_vote.vote_type = vote_type
-            db.commit()
-            db.refresh(existing_vote)
-            return VoteSchema.model_validate(existing_vote)
-
-        # Create new vote
-        vote_data = {
-            "project_id": project_id,
-            "user_id": user_id,
-            "vote_type": vote_type
-        }
-        vote = self.vote_repo.create(db, obj_in=vote_data)
-
-        # Update project vote count
-        project = self.project_repo.get(db, project_id)
-        if project:
-            if vote_type == "upvote":
-                project.up_votes = (project.up_votes or 0) + 1
-            else:
-                project.down_votes = (project.down_votes or 0) + 1
-            db.commit()
-
-        return VoteSchema.model_validate(vote)
+        if result is None or result.vote is None:
+            return None
+        return VoteSchema.model_validate(result.vote)
 
     def remove_vote(self, db: Session, project_id: int, user_id: int) -> bool:
         """Remove a user's vote from a project."""
-        vote = self.vote_repo.get_by_user_and_project(db, user_id, project_id)
-        if not vote:
-            return False
-
-        # Update project vote count
-        project = self.project_repo.get(db, project_id)
-        if project:
-            if vote.vote_type == "upvote":
-                project.up_votes = max(0, (project.up_votes or 0) - 1)
-            else:
-                project.down_votes = max(0, (project.down_votes or 0) - 1)
-            db.commit()
-
-        self.vote_repo.delete(db, id=vote.id)
-        return True
+        return self.vote_repo.remove_vote(db, project_id, user_id) is not None
 
     def get_project_comments(
         self, db: Session, project_id: int
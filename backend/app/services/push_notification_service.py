@@ -5,9 +5,12 @@ import base64
 import json
 import logging
 import os
+import threading
+import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
 import httpx
@@ -17,6 +20,7 @@ from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric import ec
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.domain.models.notification import (
     NotificationDelivery, PushSubscription
 )
@@ -30,6 +34,18 @@ except Exception:  # pragma: no cover - optional dependency
 
 logger = logging.getLogger(__name__)
 
+# VAPID JWTs may be valid for at most 24 hours; cached headers are signed
+# again once less than the margin is left.
+VAPID_TOKEN_LIFETIME = 12 * 60 * 60
+VAPID_REFRESH_MARGIN = 60 * 60
+
+
+@dataclass
+class _FanOutResult:
+    # Subscription id -> provider message id, for every delivered send
+    delivered: Dict[int, Optional[str]] = field(default_factory=dict)
+    dead_endpoints: List[str] = field(default_factory=list)
+
 
 class PushNotificationService:
     """Service for managing and sending push notifications."""
@@ -42,6 +58,10 @@ class PushNotificationService:
         self.vapid_private_key = vapid_private_key
         self.vapid_public_key = vapid_public_key
         self.subscription_repo = PushSubscriptionRepository()
+        # Signed VAPID headers per audience: (header, expires at)
+        self._vapid_headers: Dict[str, Tuple[str, int]] = {}
+        self._vapid_signing_key: Optional[ec.EllipticCurvePrivateKey] = None
+        self._vapid_lock = threading.Lock()
         if not self.vapid_private_key or not self.vapid_public_key:
             self._load_vapid_keys_from_env()
 
@@ -96,69 +116,15 @@ class PushNotificationService:
                 error="No push subscriptions found",
             )
 
-        fcm_tokens = self._extract_fcm_tokens(subscriptions)
-        web_push_subscriptions = [
-            subscription
-            for subscription in subscriptions
-            if not self._is_fcm_token(subscription.endpoint)
-        ]
-
-        success_count = 0
-        failed_endpoints: List[str] = []
-        first_provider_id: Optional[str] = None
-
-        if fcm_tokens:
-            try:
-                if firebase_provider is None:
-                    failed_endpoints.extend(fcm_tokens)
-                else:
-                    fcm_result = firebase_provider.send_notification(
-                        device_tokens=fcm_tokens,
-                        title=title,
-                        body=body,
-                        data=data,
-                        ttl=ttl,
-                    )
-                    success_count += fcm_result.get("success_count", 0)
-                    for result in fcm_result.get("results", []):
-                        if result.get("success", False):
-                            first_provider_id = (
-                                first_provider_id or result.get("message_id")
-                            )
-                        else:
-                            failed_endpoints.append(result.get("token"))
-            except Exception as exc:
-                logger.error("Failed to send FCM notifications: %s", exc)
-                failed_endpoints.extend(fcm_tokens)
+        max_workers = min(8, len(subscriptions))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            outcome = self._fan_out(
+                executor, subscriptions, title, body, data, ttl
+            )
 
-        if web_push_subscriptions:
-            payload = self._create_notification_payload(title, body, data)
-            max_workers = min(8, len(web_push_subscriptions))
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                future_map = {
-                    executor.submit(
-                        self._send_to_subscription, subscription, payload, ttl
-                    ): subscription
-                    for subscription in web_push_subscriptions
-                }
-                for future in as_completed(future_map):
-                    subscription = future_map[future]
-                    try:
-                        if future.result():
-                            success_count += 1
-                        else:
-                            failed_endpoints.append(subscription.endpoint)
-                    except Exception as exc:
-                        logger.error(
-                            "Failed to send to subscription %s: %s",
-                            subscription.endpoint,
-                            exc,
-                        )
-                        failed_endpoints.append(subscription.endpoint)
-
-        if failed_endpoints:
+        if outcome.dead_endpoints:
             removed = self.subscription_repo.delete_by_endpoints(
-                db, user_id, failed_endpoints
+                db, user_id, outcome.dead_endpoints
             )
             if removed:
                 logger.info(
@@ -167,11 +133,15 @@ class PushNotificationService:
                     user_id,
                 )
 
-        if success_count > 0:
+        if outcome.delivered:
+            message_ids = [
+                message_id for message_id in outcome.delivered.values()
+                if message_id
+            ]
             return DeliveryResult(
                 success=True,
                 status="delivered",
-                provider_message_id=first_provider_id,
+                provider_message_id=message_ids[0] if message_ids else None,
             )
         return DeliveryResult(
             success=False,
@@ -179,6 +149,80 @@ class PushNotificationService:
             error="Failed to send push notification to any device",
         )
 
+    def _fan_out(
+        self,
+        executor: ThreadPoolExecutor,
+        subscriptions: List[PushSubscription],
+        title: str,
+        body: str,
+        data: Optional[Dict[str, Any]],
+        ttl: int,
+    ) -> _FanOutResult:
+        """Send to all subscriptions, FCM and WebPush on one executor."""
+        fcm_subscriptions: Dict[str, List[PushSubscription]] = {}
+        web_push_subscriptions = []
+        for subscription in subscriptions:
+            token = self._fcm_token(subscription.endpoint)
+            if token:
+                fcm_subscriptions.setdefault(token, []).append(subscription)
+            elif not self._is_fcm_token(subscription.endpoint):
+                web_push_subscriptions.append(subscription)
+
+        # None stands for the one FCM call covering every token
+        future_map = {}
+        if fcm_subscriptions and firebase_provider is not None:
+            future_map[executor.submit(
+                firebase_provider.send_notification,
+                device_tokens=list(fcm_subscriptions),
+                title=title,
+                body=body,
+                data=data,
+                ttl=ttl,
+            )] = None
+        if web_push_subscriptions:
+            payload = self._create_notification_payload(title, body, data)
+            for subscription in web_push_subscriptions:
+                future_map[executor.submit(
+                    self._send_to_subscription, subscription, payload, ttl
+                )] = subscription
+
+        outcome = _FanOutResult()
+        for future in as_completed(future_map):
+            subscription = future_map[future]
+            if subscription is None:
+                try:
+                    fcm_result = future.result()
+                except Exception as exc:
+                    logger.error("Failed to send FCM notifications: %s", exc)
+                    continue
+                # Transient failures keep their subscription
+                invalid = set(fcm_result.get("invalid_tokens", []))
+                for result in fcm_result.get("results", []):
+                    matching = fcm_subscriptions.get(result.get("token"), [])
+                    for fcm_subscription in matching:
+                        if result.get("success", False):
+                            outcome.delivered[fcm_subscription.id] = (
+                                result.get("message_id")
+                            )
+                        elif result.get("token") in invalid:
+                            outcome.dead_endpoints.append(
+                                fcm_subscription.endpoint
+                            )
+                continue
+            try:
+                if future.result():
+                    outcome.delivered[subscription.id] = None
+                else:
+                    outcome.dead_endpoints.append(subscription.endpoint)
+            except Exception as exc:
+                logger.error(
+                    "Failed to send to subscription %s: %s",
+                    subscription.endpoint,
+                    exc,
+                )
+                outcome.dead_endpoints.append(subscription.endpoint)
+        return outcome
+
     def _is_fcm_token(self, endpoint: str) -> bool:
         fcm_patterns = [
             "https://fcm.googleapis.com/fcm/send/",
@@ -190,20 +234,22 @@ class PushNotificationService:
             return True
         return any(pattern in endpoint for pattern in fcm_patterns)
 
+    def _fcm_token(self, endpoint: str) -> Optional[str]:
+        if not self._is_fcm_token(endpoint):
+            return None
+        if "http" in endpoint:
+            token = endpoint.rsplit("/", 1)[-1]
+            return token if token and len(token) > 50 else None
+        return endpoint
+
     def _extract_fcm_tokens(
         self, subscriptions: List[PushSubscription]
     ) -> List[str]:
         fcm_tokens = []
         for subscription in subscriptions:
-            endpoint = subscription.endpoint
-            if not self._is_fcm_token(endpoint):
-                continue
-            if "http" in endpoint:
-                token = endpoint.rsplit("/", 1)[-1]
-                if token and len(token) > 50:
-                    fcm_tokens.append(token)
-            else:
-                fcm_tokens.append(endpoint)
+            token = self._fcm_token(subscription.endpoint)
+            if token:
+                fcm_tokens.append(token)
         return fcm_tokens
 
     def _create_notification_payload(
@@ -265,28 +311,56 @@ class PushNotificationService:
             return False
 
     def _generate_vapid_auth_header(self, endpoint: str) -> Optional[str]:
+        """
+        VAPID Authorization header for the push service of ``endpoint``.
+
+        Headers are signed once per audience and reused until shortly
+        before the JWT expires.
+        """
         try:
             if not self.vapid_private_key or not self.vapid_public_key:
                 return None
-            private_key_bytes = base64.urlsafe_b64decode(
-                self.vapid_private_key + "=="
-            )
-            token = jwt.encode(
-                {
-                    "aud": self._get_audience_from_endpoint(endpoint),
-                    "exp": datetime.utcnow() + timedelta(hours=12),
-                    "sub": "mailto:admin@hackathonhub.oklabflensburg.de",
-                },
-                private_key_bytes,
-                algorithm="ES256",
-                headers={"typ": "JWT"},
-            )
-            crypto_key = f"p256ecdsa={self.vapid_public_key}"
-            return f"vapid t={token}, k={crypto_key}"
+            audience = self._get_audience_from_endpoint(endpoint)
+            now = time.time()
+            with self._vapid_lock:
+                cached = self._vapid_headers.get(audience)
+                if cached and cached[1] - now > VAPID_REFRESH_MARGIN:
+                    return cached[0]
+                if self._vapid_signing_key is None:
+                    self._vapid_signing_key = self._load_vapid_signing_key()
+                expires_at = int(now + VAPID_TOKEN_LIFETIME)
+                token = jwt.encode(
+                    {
+                        "aud": audience,
+                        "exp": expires_at,
+                        "sub": "mailto:admin@hackathonhub.oklabflensburg.de",
+                    },
+                    self._vapid_signing_key,
+                    algorithm="ES256",
+                    headers={"typ": "JWT"},
+                )
+                crypto_key = f"p256ecdsa={self.vapid_public_key}"
+                header = f"vapid t={token}, k={crypto_key}"
+                self._vapid_headers[audience] = (header, expires_at)
+                return header
         except Exception as exc:
             logger.error("Failed to generate VAPID auth header: %s", exc)
             return None
 
+    def _load_vapid_signing_key(self) -> ec.EllipticCurvePrivateKey:
+        """Private key from PEM, or base64url PKCS8 DER or raw scalar."""
+        key = self.vapid_private_key.strip()
+        if key.startswith("-----BEGIN"):
+            return serialization.load_pem_private_key(
+                key.encode(), password=None
+            )
+        raw = base64.urlsafe_b64decode(key + "=" * (-len(key) % 4))
+        if len(raw) == 32:
+            return ec.derive_private_key(
+                int.from_bytes(raw, "big"), ec.SECP256R1()
+            )
+        return serialization.load_der_private_key(raw, password=None)
+
     def _get_audience_from_endpoint(self, endpoint: str) -> str:
         try:
             parsed = urlparse(endpoint)
@@ -302,21 +376,66 @@ class PushNotificationService:
         title: str,
         body: str,
         data: Optional[Dict[str, Any]] = None,
+        ttl: int = 86400,
     ) -> Dict[str, int]:
+        """
+        Send one notification to many users.
+
+        Subscriptions are loaded per batch of PUSH_BULK_BATCH_SIZE users in
+        one query, every FCM and WebPush send of the batch shares one
+        executor, and dead endpoints of the batch are removed with a
+        single DELETE.
+        """
+        user_ids = list(dict.fromkeys(user_ids))
         results = {"total": len(user_ids), "success": 0, "failed": 0}
-        for user_id in user_ids:
-            try:
-                if self.send_push_notification(
-                    db, user_id, notification_type, title, body, data
-                ):
-                    results["success"] += 1
-                else:
-                    results["failed"] += 1
-            except Exception as exc:
-                logger.error("Bulk push send failed: %s", exc)
-                results["failed"] += 1
+        batch_size = settings.PUSH_BULK_BATCH_SIZE
+        with ThreadPoolExecutor(
+            max_workers=settings.PUSH_MAX_CONCURRENCY,
+            thread_name_prefix="push",
+        ) as executor:
+            for start in range(0, len(user_ids), batch_size):
+                batch = user_ids[start:start + batch_size]
+                try:
+                    delivered = self._send_bulk_batch(
+                        db, executor, batch, title, body, data, ttl
+                    )
+                except Exception as exc:
+                    logger.error("Bulk push send failed: %s", exc)
+                    db.rollback()
+                    delivered = 0
+                results["success"] += delivered
+                results["failed"] += len(batch) - delivered
         return results
 
+    def _send_bulk_batch(
+        self,
+        db: Session,
+        executor: ThreadPoolExecutor,
+        user_ids: List[int],
+        title: str,
+        body: str,
+        data: Optional[Dict[str, Any]],
+        ttl: int,
+    ) -> int:
+        subscriptions = self.subscription_repo.get_for_users(db, user_ids)
+        if not subscriptions:
+            return 0
+        outcome = self._fan_out(
+            executor, subscriptions, title, body, data, ttl
+        )
+        # Count before the DELETE commit expires the loaded rows
+        delivered_users = {
+            subscription.user_id for subscription in subscriptions
+            if subscription.id in outcome.delivered
+        }
+        if outcome.dead_endpoints:
+            removed = self.subscription_repo.delete_endpoints(
+                db, outcome.dead_endpoints
+            )
+            if removed:
+                logger.info("Removed %s failed push subscriptions", removed)
+        return len(delivered_users)
+
     def generate_vapid_keys(self) -> Dict[str, str]:
         private_key = ec.generate_private_key(
             ec.SECP256R1(), default_backend()
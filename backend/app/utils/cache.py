@@ -1,10 +1,23 @@
 """
 Cache utilities for improving API performance.
 """
+import asyncio
 import hashlib
+import importlib
+import inspect
 import json
-from typing import Any, Callable, Optional
-from functools import wraps
+import logging
+import pickle
+import sys
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any, Callable, Dict, Iterable, Optional, Set, Tuple, Union
+)
+from functools import lru_cache, wraps
 
 try:
     from redis import Redis
@@ -13,71 +26,290 @@ except ImportError:
     REDIS_AVAILABLE = False
     Redis = None
 
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
 from app.core.config import settings
 
+logger = logging.getLogger(__name__)
+
+# Redis keys holding the current version of each invalidation tag
+TAG_VERSION_PREFIX = "cache:tag:"
+# Redis keys used as cross-worker single-flight locks
+LOCK_PREFIX = "cache:lock:"
+# Marks a Pydantic model in a JSON-encoded Redis entry
+MODEL_MARKER = "__model__"
+
+# Deletes a lock only if it still holds our token (it may have expired
+# and been taken over by another worker meanwhile).
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+def _estimate_size(value: Any) -> int:
+    """Approximate the in-memory footprint of a cached value in bytes."""
+    try:
+        return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return sys.getsizeof(value)
+
+
+def _encode(value: Any) -> Any:
+    """Make a cached value JSON-serializable, keeping model classes."""
+    if isinstance(value, BaseModel):
+        model = type(value)
+        return {
+            MODEL_MARKER: f"{model.__module__}:{model.__qualname__}",
+            "data": value.model_dump(mode="json"),
+        }
+    if isinstance(value, dict):
+        return {k: _encode(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_encode(v) for v in value]
+    return value
+
+
+def _decode(value: Any) -> Any:
+    """Inverse of ``_encode``: re-validate encoded models."""
+    if isinstance(value, dict):
+        if set(value) == {MODEL_MARKER, "data"}:
+            return _model_class(value[MODEL_MARKER]).model_validate(
+                value["data"]
+            )
+        return {k: _decode(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_decode(v) for v in value]
+    return value
+
+
+@lru_cache(maxsize=None)
+def _model_class(path: str) -> type:
+    module_name, _, qualname = path.partition(":")
+    target: Any = importlib.import_module(module_name)
+    for name in qualname.split("."):
+        target = getattr(target, name)
+    if not (isinstance(target, type) and issubclass(target, BaseModel)):
+        raise TypeError(f"{path} is not a Pydantic model")
+    return target
+
+
+class LocalCache:
+    """
+    Thread-safe, size-bounded LRU cache with per-entry expiry.
+
+    Entries are evicted least-recently-used first once ``max_entries`` or
+    the optional ``max_bytes`` budget is exceeded. Expired entries are
+    dropped on access and whenever eviction runs.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: Optional[int] = None,
+        default_ttl: int = 300,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        # key -> (value, expires_at, size)
+        self._entries: "OrderedDict[str, Tuple[Any, float, int]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return a live entry and mark it recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            value, expires_at, _ = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """Store a value for ``ttl`` seconds, evicting as needed."""
+        ttl = self.default_ttl if ttl is None else ttl
+        size = _estimate_size(value) if self.max_bytes else 0
+        if self.max_bytes and size > self.max_bytes:
+            # Larger than the whole budget; caching it would flush everything.
+            self.delete(key)
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, time.monotonic() + ttl, size)
+            self._bytes += size
+            self._evict()
+
+    def delete(self, key: str) -> None:
+        """Remove a key if present."""
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self) -> None:
+        """Drop all entries (statistics are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: str) -> None:
+        _, _, size = self._entries.pop(key)
+        self._bytes -= size
+
+    def _over_budget(self) -> bool:
+        if len(self._entries) > self.max_entries:
+            return True
+        return bool(self.max_bytes) and self._bytes > self.max_bytes
+
+    def _evict(self) -> None:
+        if not self._over_budget():
+            return
+        now = time.monotonic()
+        for key in [
+            k for k, (_, expires_at, _) in self._entries.items()
+            if expires_at <= now
+        ]:
+            self._remove(key)
+            self.expirations += 1
+        while self._over_budget():
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": self.hits / lookups if lookups else 0,
+        }
+
 
 class CacheManager:
-    """Simple cache manager for API responses."""
+    """
+    Two-tier cache manager for API responses.
+
+    A bounded in-process LocalCache is always present. When Redis is
+    configured it is the shared tier and the local cache acts as an L1
+    with a short TTL (``CACHE_LOCAL_TTL``) in front of it; otherwise the
+    local cache is the only tier.
+    """
 
     def __init__(self):
-        self._cache = {}
-        self.use_redis = REDIS_AVAILABLE and settings.REDIS_URL
+        self.local = LocalCache(
+            max_entries=settings.CACHE_LOCAL_MAX_ENTRIES,
+            max_bytes=settings.CACHE_LOCAL_MAX_BYTES,
+        )
+        self.use_redis = bool(REDIS_AVAILABLE and settings.REDIS_URL)
         if self.use_redis:
             self.redis_client = Redis.from_url(
                 settings.REDIS_URL, decode_responses=True
             )
         else:
             self.redis_client = None
+        self._tag_versions: Dict[str, int] = {}
+        self._tag_lock = threading.Lock()
+        # Keys whose last value could not be stored in Redis
+        self.local_only: Set[str] = set()
 
-    def _make_key(self, func_name: str, *args, **kwargs) -> str:
-        """Create a cache key from function name and arguments."""
-        key_parts = [func_name]
+    def _local_ttl(self, ttl: int) -> int:
+        if self.use_redis and self.redis_client:
+            return min(ttl, settings.CACHE_LOCAL_TTL)
+        return ttl
 
-        # Add args
-        for arg in args:
-            if isinstance(arg, (str, int, float, bool, type(None))):
-                key_parts.append(str(arg))
-            else:
-                key_parts.append(
-                    hashlib.md5(str(arg).encode()).hexdigest()[:8]
-                )
+    def _make_key(self, func_name: str, params: Dict[str, Any]) -> str:
+        """
+        Create a deterministic cache key from function name and parameters.
 
-        # Add kwargs
-        for k, v in sorted(kwargs.items()):
+        Primitive values are kept readable; anything else (lists, dicts)
+        is serialized canonically and hashed so equal arguments always
+        produce the same key across requests and workers.
+        """
+        key_parts = [func_name]
+
+        for k, v in sorted(params.items()):
             if isinstance(v, (str, int, float, bool, type(None))):
                 key_parts.append(f"{k}:{v}")
             else:
+                serialized = json.dumps(v, sort_keys=True, default=str)
                 key_parts.append(
-                    f"{k}:{hashlib.md5(str(v).encode()).hexdigest()[:8]}"
+                    f"{k}:{hashlib.md5(serialized.encode()).hexdigest()[:8]}"
                 )
 
         return "::".join(key_parts)
 
     def get(self, key: str) -> Optional[Any]:
         """Get value from cache."""
+        value = self.local.get(key)
+        if value is not None:
+            return value
+
         if self.use_redis and self.redis_client:
             try:
                 cached = self.redis_client.get(key)
                 if cached:
-                    return json.loads(cached)
+                    value = _decode(json.loads(cached))
+                    ttl = self.redis_client.ttl(key)
+                    if ttl and ttl > 0:
+                        self.local.set(key, value, self._local_ttl(ttl))
+                    return value
             except Exception:
-                # Fall back to memory cache
                 pass
 
-        return self._cache.get(key)
+        return None
 
     def set(self, key: str, value: Any, ttl: int = 300) -> None:
-        """Set value in cache with TTL (seconds)."""
+        """
+        Set value in cache with TTL (seconds).
+
+        Pydantic models are stored in Redis as JSON and re-validated on
+        read. Values that cannot be shared stay in the local tier, and
+        the key is remembered in ``local_only`` so this worker does not
+        wait on other workers for it.
+        """
         if self.use_redis and self.redis_client:
             try:
-                self.redis_client.setex(key, ttl, json.dumps(value))
+                self.redis_client.setex(
+                    key, ttl, json.dumps(_encode(value))
+                )
             except Exception:
-                # Fall back to memory cache
-                self._cache[key] = value
-                # Simple TTL simulation for memory cache
-                # In production, use proper TTL implementation
-        else:
-            self._cache[key] = value
+                # Not JSON-serializable or Redis down: keep it local only
+                if len(self.local_only) >= self.local.max_entries:
+                    self.local_only.clear()
+                self.local_only.add(key)
+                self.local.set(key, value, ttl)
+                return
+            self.local_only.discard(key)
+        self.local.set(key, value, self._local_ttl(ttl))
 
     def delete(self, key: str) -> None:
         """Delete value from cache."""
@@ -87,7 +319,7 @@ class CacheManager:
             except Exception:
                 pass
 
-        self._cache.pop(key, None)
+        self.local.delete(key)
 
     def clear(self) -> None:
         """Clear all cache."""
@@ -97,66 +329,471 @@ class CacheManager:
             except Exception:
                 pass
 
-        self._cache.clear()
+        self.local.clear()
+
+    def get_tag_versions(self, tags: Iterable[str]) -> Dict[str, int]:
+        """
+        Return the current version of each tag.
+
+        Versions live in Redis when available so every worker sees the
+        same namespace; the process-local map is used otherwise.
+        """
+        tags = list(dict.fromkeys(tags))
+        if not tags:
+            return {}
+        if self.use_redis and self.redis_client:
+            try:
+                values = self.redis_client.mget(
+                    [f"{TAG_VERSION_PREFIX}{tag}" for tag in tags]
+                )
+                return {
+                    tag: int(value or 0) for tag, value in zip(tags, values)
+                }
+            except Exception:
+                pass
+        with self._tag_lock:
+            return {tag: self._tag_versions.get(tag, 0) for tag in tags}
+
+    def tags_current(self, versions: Dict[str, int]) -> bool:
+        """Check that none of the tags changed since ``versions``."""
+        return self.get_tag_versions(versions) == versions
+
+    def invalidate_tags(self, *tags: str) -> None:
+        """
+        Invalidate every entry depending on any of ``tags``.
+
+        Bumping a tag's version moves it to a new namespace: entries
+        recorded under the old version are treated as misses and age
+        out through their TTL instead of being deleted eagerly.
+        """
+        tags = [tag for tag in dict.fromkeys(tags) if tag]
+        if not tags:
+            return
+        with self._tag_lock:
+            for tag in tags:
+                self._tag_versions[tag] = self._tag_versions.get(tag, 0) + 1
+        if self.use_redis and self.redis_client:
+            try:
+                pipeline = self.redis_client.pipeline()
+                for tag in tags:
+                    pipeline.incr(f"{TAG_VERSION_PREFIX}{tag}")
+                pipeline.execute()
+            except Exception:
+                pass
+
+    def acquire_lock(self, name: str, timeout: float) -> Optional[str]:
+        """
+        Try to take a cross-worker lock without blocking.
+
+        Returns a release token, or None if another worker holds the lock.
+        Without Redis every caller gets a token; in-process coordination
+        is left to SingleFlight.
+        """
+        token = uuid.uuid4().hex
+        if self.use_redis and self.redis_client:
+            try:
+                acquired = self.redis_client.set(
+                    f"{LOCK_PREFIX}{name}", token,
+                    nx=True, px=int(timeout * 1000)
+                )
+                return token if acquired else None
+            except Exception:
+                pass
+        return token
+
+    def release_lock(self, name: str, token: str) -> None:
+        """Release a lock taken with acquire_lock."""
+        if self.use_redis and self.redis_client:
+            try:
+                self.redis_client.eval(
+                    _RELEASE_LOCK_SCRIPT, 1, f"{LOCK_PREFIX}{name}", token
+                )
+            except Exception:
+                pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics for the local tier."""
+        return {"redis": self.use_redis, "local": self.local.get_stats()}
+
+
+# Returned by lookups (and unfinished flights) when no value is available
+BUSY = object()
+
+
+class _Flight:
+    """A computation in progress that other callers can wait on."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = BUSY
+        self.error: Optional[BaseException] = None
+
+
+def _in_event_loop() -> bool:
+    """Whether the calling thread is running an asyncio event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent computations of the same cache key.
+
+    Within a worker, the first thread to miss a key becomes the leader
+    and the others wait for its result. Across workers the leader also
+    takes a Redis lock; workers that lose the race poll the cache for the
+    winner's result for at most ``max_wait`` seconds before running the
+    query themselves. The wait is skipped for keys whose values this
+    worker could not store in Redis, and whenever the caller runs on an
+    event loop thread (a sync service called from an ``async def``
+    route), where blocking would stall every other request of the worker.
+
+    Refreshes of stale entries run on a small background pool so the
+    request that notices the expiry is not the one paying for the query.
+    """
+
+    def __init__(
+        self,
+        manager: CacheManager,
+        lock_timeout: float = 10.0,
+        poll_interval: float = 0.02,
+        max_wait: float = settings.CACHE_SINGLE_FLIGHT_WAIT,
+        refresh_workers: int = settings.CACHE_REFRESH_WORKERS,
+    ):
+        self.manager = manager
+        self.lock_timeout = lock_timeout
+        self.poll_interval = poll_interval
+        self.max_wait = max_wait
+        self.refresh_workers = refresh_workers
+        self._lock = threading.Lock()
+        self._flights: Dict[str, _Flight] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def do(
+        self,
+        key: str,
+        compute: Callable[[], Any],
+        lookup: Callable[[], Any],
+    ) -> Any:
+        """
+        Return ``compute()``, running it at most once per key at a time.
+
+        ``lookup`` returns a usable cached value or BUSY; it is polled
+        briefly while another worker holds the key's lock.
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+
+        if not leader:
+            if _in_event_loop():
+                return compute()
+            if flight.done.wait(self.lock_timeout):
+                if flight.error is not None:
+                    raise flight.error
+                if flight.result is not BUSY:
+                    return flight.result
+            # Leader is stuck or gave up; do not make every waiter hang.
+            return compute()
+
+        try:
+            flight.result = self._run_locked(key, compute, lookup)
+            return flight.result
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            self._finish(key, flight)
+
+    def refresh(self, key: str, compute: Callable[[], Any]) -> bool:
+        """
+        Run ``compute()`` in the background unless it already runs.
+
+        Returns False when another refresh of ``key`` is in progress in
+        this worker. Across workers only the holder of the key's lock
+        computes; the others skip the refresh.
+        """
+        with self._lock:
+            if key in self._flights:
+                return False
+            flight = self._flights[key] = _Flight()
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.refresh_workers,
+                    thread_name_prefix="cache-refresh",
+                )
+            executor = self._executor
+        try:
+            executor.submit(self._refresh, key, flight, compute)
+        except RuntimeError:
+            # Executor shut down (interpreter exit): keep serving stale
+            self._finish(key, flight)
+            return False
+        return True
+
+    def _refresh(
+        self, key: str, flight: _Flight, compute: Callable[[], Any]
+    ) -> None:
+        try:
+            token = self.manager.acquire_lock(key, self.lock_timeout)
+            if token is None:
+                return
+            try:
+                flight.result = compute()
+            finally:
+                self.manager.release_lock(key, token)
+        except Exception:
+            # Waiters compute for themselves; the stale entry stays usable
+            logger.exception("Background refresh of %s failed", key)
+        finally:
+            self._finish(key, flight)
+
+    def _finish(self, key: str, flight: _Flight) -> None:
+        with self._lock:
+            self._flights.pop(key, None)
+        flight.done.set()
+
+    def _run_locked(
+        self,
+        key: str,
+        compute: Callable[[], Any],
+        lookup: Callable[[], Any],
+    ) -> Any:
+        token = self.manager.acquire_lock(key, self.lock_timeout)
+        if token is not None:
+            try:
+                return compute()
+            finally:
+                self.manager.release_lock(key, token)
+
+        if key in self.manager.local_only or _in_event_loop():
+            # The winner cannot share its result either, or waiting
+            # would block the event loop
+            return compute()
+        deadline = time.monotonic() + self.max_wait
+        while time.monotonic() < deadline:
+            time.sleep(self.poll_interval)
+            value = lookup()
+            if value is not BUSY:
+                return value
+        return compute()
 
 
 # Global cache instance
 cache_manager = CacheManager()
+single_flight = SingleFlight(cache_manager)
+
 
+TagSpec = Union[str, Callable[[Any], Iterable[str]]]
 
-def cached(ttl: int = 300):
+
+def _format_tags(
+    specs: Iterable[TagSpec], arguments: Dict[str, Any]
+) -> list:
+    """Render string tag templates against the call's bound arguments."""
+    return [
+        spec.format(**arguments)
+        for spec in specs if isinstance(spec, str)
+    ]
+
+
+def _result_tags(specs: Iterable[TagSpec], result: Any) -> list:
+    """Collect tags derived from a function's result."""
+    tags = []
+    for spec in specs:
+        if callable(spec):
+            tags.extend(spec(result) or ())
+    return tags
+
+
+def _bind_arguments(
+    signature: inspect.Signature, args: tuple, kwargs: Dict[str, Any]
+) -> Dict[str, Any]:
+    bound = signature.bind_partial(*args, **kwargs)
+    bound.apply_defaults()
+    return dict(bound.arguments)
+
+
+# Arguments that never influence a cached result: the receiver, the
+# per-request database session and the response locale.
+NON_KEY_PARAMETERS = frozenset({"self", "cls", "db", "locale", "skip_cache"})
+
+
+def _is_session(value: Any) -> bool:
+    return isinstance(value, (Session, AsyncSession))
+
+
+def _with_own_session(
+    signature: inspect.Signature, args: tuple, kwargs: Dict[str, Any]
+) -> Tuple[tuple, Dict[str, Any], Optional[Session]]:
+    """
+    Replace the request's session in a call with a new one.
+
+    Background refreshes outlive the request, whose session is closed
+    (and not thread-safe) by the time they run.
+    """
+    from app.core.database import SessionLocal
+
+    bound = signature.bind(*args, **kwargs)
+    session = None
+    for name, value in bound.arguments.items():
+        if isinstance(value, Session):
+            session = session or SessionLocal()
+            bound.arguments[name] = session
+    return bound.args, bound.kwargs, session
+
+
+def _key_params(
+    arguments: Dict[str, Any], key: Optional[Iterable[str]]
+) -> Dict[str, Any]:
+    """Select the arguments that identify a cached result."""
+    if key is not None:
+        return {name: arguments.get(name) for name in key}
+    return {
+        name: value for name, value in arguments.items()
+        if name not in NON_KEY_PARAMETERS and not _is_session(value)
+    }
+
+
+def cached(
+    ttl: int = 300,
+    tags: Iterable[TagSpec] = (),
+    key: Optional[Iterable[str]] = None,
+    stale_ttl: int = 0,
+):
     """
     Decorator to cache function results.
 
+    Concurrent misses for the same key are coalesced: one caller runs
+    the function and the others (threads or, with Redis, other workers)
+    reuse its result.
+
     Args:
         ttl: Time to live in seconds (default: 5 minutes)
+        tags: Entities the result depends on. Strings are formatted with
+            the call arguments (e.g. ``"project:{project_id}"``);
+            callables receive the result and return extra tags, such as
+            the hackathons embedded in a project list. An entry is
+            discarded once any of its tags is invalidated.
+        key: Names of the parameters that make up the cache key. Defaults
+            to every parameter except ``self``, sessions and ``locale``.
+        stale_ttl: Seconds an expired entry may still be served while it
+            is recomputed in the background (stale-while-revalidate),
+            with a session of its own. Invalidated entries are never
+            served stale.
     """
+    tags = tuple(tags)
+    key_names = tuple(key) if key is not None else None
+
     def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+        if key_names is not None:
+            unknown = set(key_names) - set(signature.parameters)
+            if unknown:
+                raise ValueError(
+                    f"{func.__qualname__} has no parameters {sorted(unknown)}"
+                )
+
         @wraps(func)
         def wrapper(*args, **kwargs):
             # Skip cache for certain operations
             if kwargs.get('skip_cache', False):
                 return func(*args, **kwargs)
 
-            # Create cache key
+            arguments = _bind_arguments(signature, args, kwargs)
             key = cache_manager._make_key(
-                f"{func.__module__}.{func.__name__}",
-                *args,
-                **{k: v for k, v in kwargs.items() if k != 'skip_cache'}
+                f"{func.__module__}.{func.__qualname__}",
+                _key_params(arguments, key_names)
             )
 
+            def compute(call_args=args, call_kwargs=kwargs):
+                # Snapshot versions before computing so a write that lands
+                # meanwhile leaves this entry already stale.
+                versions = cache_manager.get_tag_versions(
+                    _format_tags(tags, arguments)
+                )
+                result = func(*call_args, **call_kwargs)
+                if result is None:
+                    return result
+                extra = [
+                    t for t in _result_tags(tags, result) if t not in versions
+                ]
+                versions.update(cache_manager.get_tag_versions(extra))
+                cache_manager.set(key, {
+                    "value": result,
+                    "tags": versions,
+                    "fresh_until": time.time() + ttl,
+                }, ttl + stale_ttl)
+                return result
+
+            def refresh():
+                call_args, call_kwargs, session = _with_own_session(
+                    signature, args, kwargs
+                )
+                try:
+                    return compute(call_args, call_kwargs)
+                finally:
+                    if session is not None:
+                        session.close()
+
+            def lookup():
+                entry = cache_manager.get(key)
+                if (
+                    entry is not None
+                    and entry["fresh_until"] > time.time()
+                    and cache_manager.tags_current(entry["tags"])
+                ):
+                    return entry["value"]
+                return BUSY
+
             # Try to get from cache
-            cached_result = cache_manager.get(key)
-            if cached_result is not None:
-                return cached_result
+            entry = cache_manager.get(key)
+            if entry is not None and cache_manager.tags_current(entry["tags"]):
+                if entry["fresh_until"] > time.time():
+                    return entry["value"]
+                # Expired but inside the stale window: refresh in the
+                # background and keep serving the old value meanwhile.
+                single_flight.refresh(key, refresh)
+                return entry["value"]
 
-            # Execute function and cache result
-            result = func(*args, **kwargs)
-            cache_manager.set(key, result, ttl)
-            return result
+            return single_flight.do(key, compute, lookup)
 
         return wrapper
     return decorator
 
 
-def invalidate_cache(pattern: str = None):
+def invalidate_cache(tags: Optional[Iterable[TagSpec]] = None):
     """
     Decorator to invalidate cache after function execution.
 
     Args:
-        pattern: Pattern to match cache keys (if None, invalidates all)
+        tags: Tags to invalidate, formatted with the call arguments or
+            derived from the result like in ``cached``. If None, the
+            whole cache is cleared.
     """
+    specs = tuple(tags) if tags is not None else None
+
     def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+
         @wraps(func)
         def wrapper(*args, **kwargs):
             result = func(*args, **kwargs)
 
-            if pattern:
-                # In production, use Redis SCAN for pattern matching
-                # For simplicity, we'll clear all cache for now
+            if specs is None:
                 cache_manager.clear()
             else:
-                cache_manager.clear()
+                cache_manager.invalidate_tags(
+                    *_format_tags(
+                        specs, _bind_arguments(signature, args, kwargs)
+                    ),
+                    *_result_tags(specs, result),
+                )
 
             return result
 
@@ -0,0 +1,98 @@
+"""
+Keyset (cursor) pagination helpers.
+
+Listings are ordered newest first by a sort column and the primary key.
+A cursor is the opaque encoding of the last row's (sort value, id); the
+next page continues strictly after it, so fetching a page costs the same
+at any depth, unlike OFFSET.
+"""
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, NamedTuple, Optional, Sequence
+
+from sqlalchemy import func, or_, select, tuple_
+from sqlalchemy.orm import aliased
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class Keyset(NamedTuple):
+    """Position of a row in a (sort value, id) ordering."""
+    value: Any
+    id: int
+
+
+def encode_cursor(value: Any, id: int) -> str:
+    """Encode a keyset position as an opaque URL-safe string."""
+    if isinstance(value, datetime):
+        value = {"t": value.isoformat()}
+    raw = json.dumps([value, id], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Keyset:
+    """Decode a cursor produced by encode_cursor; raise ValueError if bad."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        value, id = json.loads(raw)
+        if isinstance(value, dict):
+            value = datetime.fromisoformat(value["t"])
+    except (binascii.Error, UnicodeDecodeError, KeyError, TypeError,
+            ValueError) as exc:
+        raise ValueError("Invalid pagination cursor") from exc
+    if not isinstance(id, int) or isinstance(id, bool):
+        raise ValueError("Invalid pagination cursor")
+    return Keyset(value, id)
+
+
+def keyset_paginate(query, model, after: Optional[Keyset] = None,
+                    sort_attr: str = "created_at", nulls_last: bool = False):
+    """
+    Order a Query/Select newest first and continue after a keyset.
+
+    The caller applies the limit. ``nulls_last`` keeps rows without a
+    sort value at the end of the listing.
+    """
+    sort_column = getattr(model, sort_attr)
+    order = sort_column.desc()
+    if nulls_last:
+        order = order.nulls_last()
+    query = query.order_by(order, model.id.desc())
+    if after is None:
+        return query
+
+    if after.value is None:
+        return query.where(sort_column.is_(None), model.id < after.id)
+
+    # Compare against the stored value of the cursor row while it exists:
+    # SQLite keeps timestamps as text that may be formatted differently
+    # from the bound parameter.
+    anchor = aliased(model)
+    anchor_value = func.coalesce(
+        select(getattr(anchor, sort_attr)).where(
+            anchor.id == after.id
+        ).scalar_subquery(),
+        after.value,
+    )
+    condition = tuple_(sort_column, model.id) < tuple_(anchor_value, after.id)
+    if nulls_last:
+        condition = or_(condition, sort_column.is_(None))
+    return query.where(condition)
+
+
+def next_keyset(items: Sequence[Any], limit: Optional[int],
+                sort_attr: str = "created_at") -> Optional[Keyset]:
+    """Keyset of the last item when the page is full, else None."""
+    if not items or not limit or len(items) < limit:
+        return None
+    last = items[-1]
+    return Keyset(getattr(last, sort_attr), last.id)
+
+
+def next_cursor(items: Sequence[Any], limit: Optional[int],
+                sort_attr: str = "created_at") -> Optional[str]:
+    """Cursor for the page after ``items``, or None on the last page."""
+    keyset = next_keyset(items, limit, sort_attr)
+    return encode_cursor(*keyset) if keyset else None
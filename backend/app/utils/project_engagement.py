@@ -0,0 +1,93 @@
+"""
+Project engagement score, rate and level.
+
+The formulas work on plain numbers (for Python-side computation) and on
+SQL column expressions (so the stored columns can be refreshed from the
+row's own counters in a single UPDATE).
+"""
+from datetime import datetime, timezone
+from typing import Optional, Tuple
+
+from sqlalchemy import case, or_
+
+RECENT_ACTIVITY_BONUS = 10
+
+
+def _cap(value, limit):
+    if isinstance(value, (int, float)):
+        return min(value, limit)
+    return case((value > limit, limit), else_=value)
+
+
+def recency_bonus(
+    last_activity_at: Optional[datetime], now: Optional[datetime] = None
+) -> int:
+    """Bonus points for activity within the last week or month."""
+    if last_activity_at is None:
+        return 0
+    now = now or datetime.now(timezone.utc)
+    if last_activity_at.tzinfo is None:
+        last_activity_at = last_activity_at.replace(tzinfo=timezone.utc)
+    age_days = max(0, (now - last_activity_at).days)
+    if age_days <= 7:
+        return RECENT_ACTIVITY_BONUS
+    if age_days <= 30:
+        return 5
+    return 0
+
+
+def engagement_score(total_votes, total_comments, view_count, recency):
+    """Score from 0 to 100."""
+    return _cap(
+        _cap(total_votes * 12, 40)
+        + _cap(total_comments * 15, 35)
+        + _cap(view_count * 2, 15)
+        + recency,
+        100,
+    )
+
+
+def engagement_rate(
+    total_votes: int, total_comments: int, view_count: int
+) -> float:
+    """Interactions per view, as a percentage."""
+    interactions = total_votes + total_comments
+    return round(min(100.0, (interactions / max(view_count, 1)) * 100), 1)
+
+
+def engagement_level(score, total_votes, total_comments, view_count):
+    """"high", "medium" or "low" from the score and interaction rate."""
+    interactions = (total_votes + total_comments) * 100
+    if isinstance(score, int):
+        views = max(view_count, 1)
+        if score >= 70 or interactions >= 15 * views:
+            return "high"
+        if score >= 35 or interactions >= 5 * views:
+            return "medium"
+        return "low"
+
+    views = case((view_count > 1, view_count), else_=1)
+    return case(
+        (or_(score >= 70, interactions >= 15 * views), "high"),
+        (or_(score >= 35, interactions >= 5 * views), "medium"),
+        else_="low",
+    )
+
+
+def calculate_engagement(
+    total_votes: int,
+    total_comments: int,
+    view_count: int,
+    last_activity_at: Optional[datetime],
+    now: Optional[datetime] = None,
+) -> Tuple[int, float, str]:
+    """Return (score, rate, level) for one project."""
+    score = engagement_score(
+        total_votes, total_comments, view_count,
+        recency_bonus(last_activity_at, now),
+    )
+    return (
+        score,
+        engagement_rate(total_votes, total_comments, view_count),
+        engagement_level(score, total_votes, total_comments, view_count),
+    )
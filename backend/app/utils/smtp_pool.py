@@ -0,0 +1,189 @@
+"""
+Pooled, persistent SMTP connections.
+
+Opening an SMTP session costs a TCP connect, the greeting, EHLO, STARTTLS
+and AUTH: several round-trips before the first message. The pool keeps
+logged-in sessions open between sends, checks those idle for a while with
+NOOP before reuse, drops sessions idle past the server's likely timeout,
+and caps how many sessions are open at once.
+"""
+import logging
+import smtplib
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from email.message import Message
+from typing import Callable, Deque, Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def is_connection_error(exc: BaseException) -> bool:
+    """
+    Whether the session is unusable after ``exc``.
+
+    Refused recipients or senders and rejected data concern one message
+    only. SMTPException derives from OSError, so socket errors are told
+    apart from SMTP replies explicitly.
+    """
+    if isinstance(exc, (
+        smtplib.SMTPServerDisconnected, smtplib.SMTPHeloError
+    )):
+        return True
+    if isinstance(exc, smtplib.SMTPResponseException):
+        # 421: the server is closing the transmission channel
+        return exc.smtp_code == 421
+    return isinstance(exc, OSError) and not isinstance(
+        exc, smtplib.SMTPException
+    )
+
+
+class SMTPPoolTimeout(Exception):
+    """No SMTP connection became free in time."""
+
+
+class SMTPConnectionPool:
+    """
+    Thread-safe pool of logged-in SMTP sessions.
+
+    ``connect`` opens a ready-to-send session (connected, STARTTLS, logged
+    in). At most ``max_connections`` sessions exist at any time; callers
+    beyond that wait up to ``acquire_timeout`` seconds for a free one.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], smtplib.SMTP],
+        *,
+        max_connections: int = 4,
+        max_idle: float = 60.0,
+        noop_after: float = 5.0,
+        acquire_timeout: Optional[float] = 30.0,
+    ):
+        self._connect = connect
+        self.max_connections = max_connections
+        self.max_idle = max_idle
+        self.noop_after = noop_after
+        self.acquire_timeout = acquire_timeout
+        self._slots = threading.BoundedSemaphore(max_connections)
+        self._idle: Deque[Tuple[smtplib.SMTP, float]] = deque()
+        self._lock = threading.Lock()
+        self.opened = 0
+
+    @contextmanager
+    def connection(self) -> Iterator[smtplib.SMTP]:
+        """
+        Borrow a session; it is returned to the pool afterwards.
+
+        A session whose use raised is closed instead.
+        """
+        if not self._slots.acquire(timeout=self.acquire_timeout):
+            raise SMTPPoolTimeout(
+                f"No free SMTP connection within {self.acquire_timeout}s"
+            )
+        server = None
+        try:
+            server = self._checkout()
+            yield server
+        except BaseException:
+            # Dropped, or left mid-command: either way not reusable.
+            self._discard(server)
+            server = None
+            raise
+        finally:
+            if server is not None:
+                with self._lock:
+                    self._idle.append((server, time.monotonic()))
+            self._slots.release()
+
+    def send_messages(
+        self, messages: Sequence[Message]
+    ) -> List[Optional[Exception]]:
+        """
+        Send ``messages`` over one session, in order.
+
+        Returns one entry per message: ``None`` when it was accepted,
+        otherwise the error. If the session drops, the interrupted message
+        is retried once on a new one; if that fails too, the remaining
+        messages fail with the same error.
+        """
+        results: List[Optional[Exception]] = []
+        pending = deque(messages)
+        retried = False
+        while pending:
+            try:
+                with self.connection() as server:
+                    while pending:
+                        try:
+                            server.send_message(pending[0])
+                            results.append(None)
+                        except smtplib.SMTPException as exc:
+                            if is_connection_error(exc):
+                                raise
+                            results.append(exc)
+                        pending.popleft()
+                        retried = False
+            except (OSError, SMTPPoolTimeout) as exc:
+                if not (
+                    isinstance(exc, SMTPPoolTimeout)
+                    or is_connection_error(exc)
+                ):
+                    raise
+                if retried or isinstance(exc, SMTPPoolTimeout):
+                    logger.warning(
+                        "Giving up on %s SMTP messages: %s", len(pending), exc
+                    )
+                    results.extend(exc for _ in pending)
+                    break
+                retried = True
+        return results
+
+    def close(self) -> None:
+        """Quit all idle sessions."""
+        with self._lock:
+            idle, self._idle = list(self._idle), deque()
+        for server, _ in idle:
+            self._quit(server)
+
+    def _checkout(self) -> smtplib.SMTP:
+        now = time.monotonic()
+        while True:
+            with self._lock:
+                if not self._idle:
+                    break
+                server, last_used = self._idle.pop()
+            idle_for = now - last_used
+            if idle_for > self.max_idle:
+                self._quit(server)
+                continue
+            if idle_for > self.noop_after and not self._healthy(server):
+                self._discard(server)
+                continue
+            return server
+        server = self._connect()
+        with self._lock:
+            self.opened += 1
+        return server
+
+    @staticmethod
+    def _healthy(server: smtplib.SMTP) -> bool:
+        try:
+            return server.noop()[0] == 250
+        except OSError:
+            return False
+
+    @staticmethod
+    def _quit(server: smtplib.SMTP) -> None:
+        try:
+            server.quit()
+        except OSError:
+            server.close()
+
+    @staticmethod
+    def _discard(server: Optional[smtplib.SMTP]) -> None:
+        if server is not None:
+            try:
+                server.close()
+            except OSError:
+                pass
@@ -0,0 +1,113 @@
+"""
+Aggregated team statistics (member counts, project activity, engagement)
+shared by the team and user routers.
+"""
+from datetime import datetime, timezone
+from typing import List
+
+from sqlalchemy import case, func
+from sqlalchemy.orm import Session
+
+from app.domain.models.project import Project
+from app.domain.models.team import TeamMember
+
+
+def team_engagement(
+    member_count: int,
+    project_count: int,
+    view_count: int,
+    last_activity_at: datetime | None,
+) -> tuple[int, str]:
+    """Calculate a stable team engagement score and level."""
+    score = min(member_count * 12, 30) + min(project_count * 18, 30)
+    score += min(view_count * 2, 25)
+
+    if last_activity_at:
+        now = datetime.now(timezone.utc)
+        activity_time = last_activity_at
+        if activity_time.tzinfo is None:
+            activity_time = activity_time.replace(tzinfo=timezone.utc)
+        age_days = max(0, (now - activity_time).days)
+        if age_days <= 7:
+            score += 15
+        elif age_days <= 30:
+            score += 8
+
+    score = min(score, 100)
+
+    if score >= 70:
+        return score, "high"
+    if score >= 35:
+        return score, "medium"
+    return score, "low"
+
+
+def attach_team_stats(db: Session, teams: List) -> None:
+    """
+    Populate aggregated team statistics used across team responses.
+
+    Member counts and project statistics are loaded with one grouped
+    query each, however many teams are passed.
+    """
+    team_ids = [team.id for team in teams]
+    if not team_ids:
+        return
+
+    member_rows = db.query(
+        TeamMember.team_id,
+        func.count(TeamMember.id).label("member_count"),
+    ).filter(
+        TeamMember.team_id.in_(team_ids)
+    ).group_by(TeamMember.team_id).all()
+    member_map = {row.team_id: row.member_count for row in member_rows}
+
+    project_rows = db.query(
+        Project.team_id.label("team_id"),
+        func.count(Project.id).label("project_count"),
+        func.sum(
+            case((Project.status == "active", 1), else_=0)
+        ).label("active_project_count"),
+        func.sum(
+            case((Project.status == "completed", 1), else_=0)
+        ).label("completed_project_count"),
+        func.sum(Project.comment_count).label("total_comments"),
+        func.sum(Project.upvote_count + Project.downvote_count).label("total_votes"),
+        func.max(func.coalesce(Project.updated_at, Project.created_at)).label("last_activity_at"),
+    ).filter(
+        Project.team_id.in_(team_ids)
+    ).group_by(Project.team_id).all()
+
+    project_map = {
+        row.team_id: {
+            "project_count": row.project_count or 0,
+            "active_project_count": row.active_project_count or 0,
+            "completed_project_count": row.completed_project_count or 0,
+            "total_comments": row.total_comments or 0,
+            "total_votes": row.total_votes or 0,
+            "last_activity_at": row.last_activity_at,
+        }
+        for row in project_rows
+    }
+
+    for team in teams:
+        project_stats = project_map.get(team.id, {})
+        member_count = member_map.get(team.id, 0)
+        project_count = project_stats.get("project_count", 0)
+        last_activity_at = project_stats.get("last_activity_at") or team.created_at
+        view_count = team.view_count or 0
+        engagement_score, engagement_level = team_engagement(
+            member_count=member_count,
+            project_count=project_count,
+            view_count=view_count,
+            last_activity_at=last_activity_at,
+        )
+
+        team._member_count = member_count
+        team.project_count = project_count
+        team.active_project_count = project_stats.get("active_project_count", 0)
+        team.completed_project_count = project_stats.get("completed_project_count", 0)
+        team.total_comments = project_stats.get("total_comments", 0)
+        team.total_votes = project_stats.get("total_votes", 0)
+        team.last_activity_at = last_activity_at
+        team.engagement_score = engagement_score
+        team.engagement_level = engagement_level
@@ -0,0 +1,190 @@
+"""
+Buffered page-view counters.
+
+Views are counted in memory, or in Redis hashes (HINCRBY) when Redis is
+configured so that every worker shares one buffer, and written to the
+database periodically as a single batched
+``view_count = view_count + n`` UPDATE per table. Recording a view costs
+no database write and takes no row lock; stored counts catch up after the
+next flush.
+"""
+import logging
+import threading
+import uuid
+from collections import Counter
+from typing import Callable, Dict, Optional
+
+from sqlalchemy import bindparam, func, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.domain.models import Hackathon, Project, Team
+from app.repositories.project_repository import ProjectRepository
+from app.utils.cache import cache_manager
+
+logger = logging.getLogger(__name__)
+
+# Redis hashes of pending views per kind, field = object id
+VIEW_KEY_PREFIX = "views:"
+
+
+class ViewCounter:
+    """
+    Buffer view increments and flush them in batched UPDATEs.
+
+    ``start`` runs the periodic flush on a background thread; ``flush``
+    can also be called directly (e.g. from tests or a shutdown hook).
+    """
+
+    MODELS = {"project": Project, "hackathon": Hackathon, "team": Team}
+
+    def __init__(self, redis_client=None, flush_interval: float = 5.0):
+        self.redis_client = redis_client
+        self.flush_interval = flush_interval
+        self._pending = self._empty()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _empty(self) -> Dict[str, Counter]:
+        return {kind: Counter() for kind in self.MODELS}
+
+    def record(self, kind: str, object_id: int, count: int = 1) -> None:
+        """Count ``count`` views of an object."""
+        if kind not in self.MODELS:
+            raise ValueError(f"Unknown view counter kind: {kind}")
+        if self.redis_client is not None:
+            try:
+                self.redis_client.hincrby(
+                    f"{VIEW_KEY_PREFIX}{kind}", object_id, count
+                )
+                return
+            except Exception:
+                logger.warning(
+                    "Redis unavailable, buffering views locally",
+                    exc_info=True,
+                )
+        with self._lock:
+            self._pending[kind][object_id] += count
+
+    def pending(self, kind: str, object_id: int) -> int:
+        """Views of an object recorded but not yet flushed."""
+        count = 0
+        if self.redis_client is not None:
+            try:
+                count += int(self.redis_client.hget(
+                    f"{VIEW_KEY_PREFIX}{kind}", object_id
+                ) or 0)
+            except Exception:
+                pass
+        with self._lock:
+            return count + self._pending[kind].get(object_id, 0)
+
+    def flush(self, db: Session) -> int:
+        """
+        Write buffered views to the database.
+
+        Returns the number of updated rows. On failure the drained counts
+        are put back into the local buffer and the error is re-raised.
+        """
+        drained = self._drain()
+        flushed = 0
+        try:
+            for kind, counts in drained.items():
+                if counts:
+                    self._apply(db, self.MODELS[kind], counts)
+                    flushed += len(counts)
+            db.commit()
+        except Exception:
+            db.rollback()
+            with self._lock:
+                for kind, counts in drained.items():
+                    self._pending[kind].update(counts)
+            raise
+        return flushed
+
+    def _drain(self) -> Dict[str, Counter]:
+        with self._lock:
+            drained, self._pending = self._pending, self._empty()
+        if self.redis_client is None:
+            return drained
+
+        for kind in self.MODELS:
+            key = f"{VIEW_KEY_PREFIX}{kind}"
+            claimed = f"{key}:flushing:{uuid.uuid4().hex}"
+            try:
+                if not self.redis_client.exists(key):
+                    continue
+                # RENAME is atomic: views recorded from now on start a new
+                # hash, and no other worker can claim the same counts.
+                self.redis_client.rename(key, claimed)
+                values = self.redis_client.hgetall(claimed)
+                self.redis_client.delete(claimed)
+            except Exception:
+                logger.warning(
+                    "Could not drain %s views from Redis", kind, exc_info=True
+                )
+                continue
+            for object_id, count in values.items():
+                drained[kind][int(object_id)] += int(count)
+        return drained
+
+    def _apply(self, db: Session, model, counts: Counter) -> None:
+        table = model.__table__
+        values = {
+            "view_count": func.coalesce(table.c.view_count, 0)
+            + bindparam("views"),
+        }
+        if "updated_at" in table.c:
+            # A view is not an edit of the viewed row.
+            values["updated_at"] = table.c.updated_at
+        db.execute(
+            update(table).where(
+                table.c.id == bindparam("object_id")
+            ).values(**values),
+            [
+                {"object_id": object_id, "views": views}
+                for object_id, views in counts.items()
+            ],
+        )
+        if model is Project:
+            ProjectRepository().refresh_engagement(db, *counts)
+
+    def start(self, session_factory: Callable[[], Session]) -> None:
+        """Flush every ``flush_interval`` seconds on a background thread."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, args=(session_factory,),
+            name="view-counter-flush", daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self, session_factory: Callable[[], Session]) -> None:
+        """Stop the background thread and flush what is still buffered."""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+        self._flush_with(session_factory)
+
+    def _run(self, session_factory: Callable[[], Session]) -> None:
+        while not self._stop.wait(self.flush_interval):
+            self._flush_with(session_factory)
+
+    def _flush_with(self, session_factory: Callable[[], Session]) -> None:
+        db = session_factory()
+        try:
+            self.flush(db)
+        except Exception:
+            logger.exception("Failed to flush view counts")
+        finally:
+            db.close()
+
+
+view_counter = ViewCounter(
+    redis_client=cache_manager.redis_client if cache_manager.use_redis
+    else None,
+    flush_interval=settings.VIEW_COUNT_FLUSH_INTERVAL,
+)
@@ -0,0 +1,189 @@
+"""
+Send queued email and push notifications.
+
+Requests only store pending deliveries (NOTIFICATION_OUTBOX); this worker
+claims due ones with ``SELECT ... FOR UPDATE SKIP LOCKED``, sends them
+concurrently and reschedules failures with exponential backoff until
+NOTIFICATION_MAX_ATTEMPTS is reached. Several workers can run side by
+side.
+
+Usage:
+    python -m app.workers.notifications [--once]
+"""
+import argparse
+import logging
+import random
+import signal
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Callable
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.repositories.notification_repository import (
+    NotificationDeliveryRepository,
+)
+from app.services.notification_service import notification_service
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationWorker:
+    """Claim, send and reschedule queued notification deliveries."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        *,
+        batch_size: int = settings.NOTIFICATION_WORKER_BATCH_SIZE,
+        concurrency: int = settings.NOTIFICATION_WORKER_CONCURRENCY,
+        poll_interval: float = settings.NOTIFICATION_WORKER_POLL_INTERVAL,
+        lease_seconds: int = settings.NOTIFICATION_WORKER_LEASE_SECONDS,
+        max_attempts: int = settings.NOTIFICATION_MAX_ATTEMPTS,
+        retry_base: float = settings.NOTIFICATION_RETRY_BASE_SECONDS,
+        retry_max: float = settings.NOTIFICATION_RETRY_MAX_SECONDS,
+    ):
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.retry_base = retry_base
+        self.retry_max = retry_max
+        self.delivery_repo = NotificationDeliveryRepository()
+        self._stop = threading.Event()
+
+    def backoff(self, attempt: int) -> timedelta:
+        """Delay before retry number ``attempt``, with jitter."""
+        delay = min(self.retry_max, self.retry_base * 2 ** (attempt - 1))
+        return timedelta(seconds=delay * random.uniform(0.75, 1.0))
+
+    def run_once(self) -> int:
+        """Send one batch of due deliveries; returns how many were claimed."""
+        db = self.session_factory()
+        try:
+            ids = self.delivery_repo.claim_due(
+                db, limit=self.batch_size, lease_seconds=self.lease_seconds
+            )
+        finally:
+            db.close()
+        if not ids:
+            return 0
+        if self.concurrency <= 1 or len(ids) == 1:
+            for delivery_id in ids:
+                self._process(delivery_id)
+        else:
+            max_workers = min(self.concurrency, len(ids))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                list(executor.map(self._process, ids))
+        return len(ids)
+
+    def run(self) -> None:
+        """Poll for due deliveries until ``stop`` is called."""
+        while not self._stop.is_set():
+            try:
+                claimed = self.run_once()
+            except Exception:
+                logger.exception("Failed to process notification outbox")
+                claimed = 0
+            # A full batch suggests more is due: claim again right away.
+            if claimed < self.batch_size:
+                self._stop.wait(self.poll_interval)
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def _process(self, delivery_id: int) -> None:
+        # Sessions are not thread-safe: each send gets its own.
+        db = self.session_factory()
+        try:
+            delivery = self.delivery_repo.get(db, delivery_id)
+            if delivery is None or delivery.status != "sending":
+                return
+            result = notification_service.send_queued(db, delivery)
+            attempt = (delivery.attempt_count or 0) + 1
+            if result.success:
+                self.delivery_repo.update_status(
+                    db,
+                    delivery,
+                    status=result.status,
+                    provider_message_id=result.provider_message_id,
+                    delivered_at=datetime.utcnow(),
+                )
+            elif attempt >= self.max_attempts:
+                logger.warning(
+                    "Giving up on notification delivery %s after %s "
+                    "attempts: %s", delivery_id, attempt, result.error,
+                )
+                self.delivery_repo.update_status(
+                    db, delivery, status="failed", error=result.error
+                )
+            else:
+                self.delivery_repo.update_status(
+                    db,
+                    delivery,
+                    status="pending",
+                    error=result.error,
+                    next_attempt_at=datetime.utcnow()
+                    + self.backoff(attempt),
+                )
+        except Exception:
+            # Left as claimed: retried once the lease expires.
+            db.rollback()
+            logger.exception(
+                "Failed to record notification delivery %s", delivery_id
+            )
+        finally:
+            db.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--once", action="store_true",
+        help="send one batch of due deliveries and exit",
+    )
+    parser.add_argument(
+        "--batch-size", type=int,
+        default=settings.NOTIFICATION_WORKER_BATCH_SIZE,
+    )
+    parser.add_argument(
+        "--concurrency", type=int,
+        default=settings.NOTIFICATION_WORKER_CONCURRENCY,
+    )
+    parser.add_argument(
+        "--poll-interval", type=float,
+        default=settings.NOTIFICATION_WORKER_POLL_INTERVAL,
+    )
+    args = parser.parse_args()
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+
+    worker = NotificationWorker(
+        batch_size=args.batch_size,
+        concurrency=args.concurrency,
+        poll_interval=args.poll_interval,
+    )
+    if args.once:
+        print(f"Processed {worker.run_once()} notification deliveries")
+        return 0
+
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda *_: worker.stop())
+    logger.info(
+        "Notification worker started (batch %s, concurrency %s)",
+        worker.batch_size, worker.concurrency,
+    )
+    worker.run()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
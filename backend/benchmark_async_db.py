@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Benchmark: sync Session vs AsyncSession inside `async def` routes.
+
+Runs two otherwise identical list endpoints in-process against a seeded
+SQLite database and fires concurrent requests at each. Every query is
+slowed down by ``--query-delay`` seconds (a SQL function that sleeps) to
+model a slow Postgres query. The sync variant runs that query on the event
+loop thread, so requests queue behind each other; the async variant awaits
+it and keeps serving.
+
+Usage:
+    python benchmark_async_db.py --requests 200 --concurrency 20
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+import httpx
+from fastapi import Depends, FastAPI
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import (
+    AsyncSession, async_sessionmaker, create_async_engine
+)
+from sqlalchemy.orm import Session, sessionmaker
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+
+from app.domain.models import Base, Project  # noqa: E402
+from app.repositories.project_repository import (  # noqa: E402
+    AsyncProjectRepository, ProjectRepository
+)
+
+
+def _install_slow_function(engine, delay: float) -> None:
+    @event.listens_for(engine, "connect")
+    def _register(dbapi_connection, _record):
+        dbapi_connection.create_function(
+            "slow", 1, lambda value: time.sleep(delay) or value
+        )
+
+
+def build_app(db_path: str, delay: float, pool_size: int) -> FastAPI:
+    """Create an app exposing a sync-session and an async-session route."""
+    # Size the sync pool to the concurrency so checkout waits do not skew
+    # the comparison (a blocked loop cannot release sync sessions).
+    sync_engine = create_engine(
+        f"sqlite:///{db_path}", pool_size=pool_size
+    )
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+    _install_slow_function(sync_engine, delay)
+    _install_slow_function(async_engine.sync_engine, delay)
+
+    SyncSession = sessionmaker(bind=sync_engine)
+    AsyncSessionLocal = async_sessionmaker(
+        async_engine, class_=AsyncSession, expire_on_commit=False
+    )
+    sync_repo = ProjectRepository()
+    async_repo = AsyncProjectRepository()
+
+    def get_sync_db():
+        db = SyncSession()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    async def get_async_db():
+        async with AsyncSessionLocal() as db:
+            yield db
+
+    app = FastAPI()
+
+    @app.get("/sync")
+    async def list_sync(db: Session = Depends(get_sync_db)):
+        db.execute(Project.__table__.select().with_only_columns(
+            Project.id
+        ).where(Project.id == _slow_literal()).limit(1)).all()
+        return len(sync_repo.get_public_projects(db, limit=20))
+
+    @app.get("/async")
+    async def list_async(db: AsyncSession = Depends(get_async_db)):
+        await db.execute(Project.__table__.select().with_only_columns(
+            Project.id
+        ).where(Project.id == _slow_literal()).limit(1))
+        return len(await async_repo.get_public_projects(db, limit=20))
+
+    return app
+
+
+def _slow_literal():
+    from sqlalchemy import func
+    return func.slow(1)
+
+
+def seed(db_path: str, count: int) -> None:
+    engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as db:
+        db.add_all([
+            Project(title=f"Project {i}", description="bench", is_public=True)
+            for i in range(count)
+        ])
+        db.commit()
+    engine.dispose()
+
+
+async def run_load(
+    app: FastAPI, path: str, total: int, concurrency: int
+) -> List[float]:
+    latencies: List[float] = []
+    semaphore = asyncio.Semaphore(concurrency)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+        async def one():
+            async with semaphore:
+                start = time.perf_counter()
+                response = await client.get(path)
+                response.raise_for_status()
+                latencies.append((time.perf_counter() - start) * 1000)
+
+        await asyncio.gather(*(one() for _ in range(total)))
+    return latencies
+
+
+def summarize(latencies: List[float]) -> Dict[str, float]:
+    ordered = sorted(latencies)
+
+    def pct(p: float) -> float:
+        return ordered[min(len(ordered) - 1, int(len(ordered) * p))]
+
+    return {
+        "p50_ms": statistics.median(ordered),
+        "p95_ms": pct(0.95),
+        "p99_ms": pct(0.99),
+        "max_ms": ordered[-1],
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--projects", type=int, default=500)
+    parser.add_argument("--query-delay", type=float, default=0.01)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "bench.db")
+        seed(db_path, args.projects)
+        app = build_app(db_path, args.query_delay, args.concurrency)
+
+        print("=" * 60)
+        print(
+            f"{args.requests} requests, concurrency {args.concurrency}, "
+            f"query delay {args.query_delay * 1000:.0f} ms"
+        )
+        print("=" * 60)
+        for label, path in (("sync Session", "/sync"),
+                            ("AsyncSession", "/async")):
+            started = time.perf_counter()
+            latencies = asyncio.run(
+                run_load(app, path, args.requests, args.concurrency)
+            )
+            elapsed = time.perf_counter() - started
+            stats = summarize(latencies)
+            print(
+                f"{label:<14} p50 {stats['p50_ms']:8.1f} ms  "
+                f"p95 {stats['p95_ms']:8.1f} ms  "
+                f"p99 {stats['p99_ms']:8.1f} ms  "
+                f"throughput {args.requests / elapsed:7.1f} req/s"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Benchmark: sequential per-token FCM requests vs the shared client.
+
+Starts a local mock of the FCM v1 ``messages:send`` endpoint that answers
+after ``--latency`` milliseconds; tokens starting with "dead" are answered
+with UNREGISTERED. The same notification is then sent to ``--tokens``
+device tokens twice: the previous way, one token after another with a new
+httpx.Client per request, and through FirebaseProvider, which fans out
+over one pooled client. Reports wall time, TCP connections opened and the
+invalid tokens found. The mock speaks plain HTTP/1.1, so the TLS handshake
+each fresh client would pay against the real FCM is not even counted.
+
+Usage:
+    python benchmark_fcm_send.py --tokens 500 --latency 20
+"""
+import argparse
+import json
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+
+from app.services.firebase_provider import FirebaseProvider
+
+
+class MockFCMHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        message = json.loads(self.rfile.read(length))["message"]
+        time.sleep(self.server.latency)
+        if message["token"].startswith("dead"):
+            status, body = 404, {"error": {
+                "code": 404, "status": "NOT_FOUND",
+                "message": "Requested entity was not found.",
+                "details": [{
+                    "@type": "type.googleapis.com/"
+                             "google.firebase.fcm.v1.FcmError",
+                    "errorCode": "UNREGISTERED",
+                }],
+            }}
+        else:
+            status = 200
+            body = {"name": f"projects/bench/messages/{message['token']}"}
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+class MockFCMServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, latency: float):
+        super().__init__(("127.0.0.1", 0), MockFCMHandler)
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.connections = 0
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address
+        return f"http://{host}:{port}"
+
+
+class BenchmarkProvider(FirebaseProvider):
+    """FirebaseProvider with a fixed access token instead of credentials."""
+
+    def _initialize_firebase(self, credentials_path=None):
+        self.credentials = object()
+        self.project_id = "bench"
+        self.access_token = "benchmark-token"
+        self.token_expiry = datetime.utcnow() + timedelta(hours=1)
+
+    def _refresh_access_token(self):
+        pass
+
+
+def send_sequentially(api_url: str, tokens) -> int:
+    """The previous loop: one request and one new client per token."""
+    url = f"{api_url}/v1/projects/bench/messages:send"
+    headers = {"Authorization": "Bearer benchmark-token"}
+    sent = 0
+    for token in tokens:
+        with httpx.Client(timeout=30.0) as client:
+            response = client.post(url, headers=headers, json={
+                "message": {"token": token, "notification": {
+                    "title": "Benchmark", "body": "Hello",
+                }},
+            })
+            sent += response.status_code == 200
+    return sent
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tokens", type=int, default=500)
+    parser.add_argument("--latency", type=float, default=20.0,
+                        help="mock FCM response time in milliseconds")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--invalid", type=float, default=0.1,
+                        help="share of unregistered tokens")
+    args = parser.parse_args()
+
+    dead = int(args.tokens * args.invalid)
+    tokens = [f"dead-{i:0>60}" for i in range(dead)] + [
+        f"live-{i:0>60}" for i in range(args.tokens - dead)
+    ]
+    server = MockFCMServer(args.latency / 1000)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    print(f"{args.tokens} tokens, {args.latency:.0f} ms FCM latency")
+    try:
+        started = time.perf_counter()
+        sent = send_sequentially(server.url, tokens)
+        elapsed = time.perf_counter() - started
+        print(
+            f"  sequential, client per token: {elapsed:7.2f}s  "
+            f"{sent} sent  {server.connections} connections"
+        )
+
+        server.connections = 0
+        provider = BenchmarkProvider()
+        provider.api_url = server.url
+        provider.max_concurrency = args.concurrency
+        try:
+            started = time.perf_counter()
+            result = provider.send_notification(
+                tokens, title="Benchmark", body="Hello"
+            )
+            elapsed = time.perf_counter() - started
+        finally:
+            provider.close()
+        print(
+            f"  shared client, {args.concurrency:>3} in flight:  "
+            f"{elapsed:7.2f}s  {result['success_count']} sent  "
+            f"{server.connections} connections  "
+            f"{len(result['invalid_tokens'])} invalid tokens"
+        )
+    finally:
+        server.shutdown()
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Benchmark: ILIKE scan vs full-text index for project search.
+
+Seeds a SQLite database with ``--projects`` rows (FTS5 index and sync
+triggers are created with the schema) and times ``search_projects`` for a
+set of search-box terms, once forcing the ILIKE fallback and once through
+the FTS5 index.
+
+Usage:
+    python benchmark_project_search.py --projects 100000 --repeat 20
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import Session
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+
+from app.domain.models import Base, Project, User  # noqa: E402
+from app.repositories import project_repository  # noqa: E402
+
+WORDS = (
+    "weather flood bike parking energy solar transit map sensor budget "
+    "school library waste water noise tree air traffic civic open data "
+    "dashboard alert tracker community garden health shelter bus ferry"
+).split()
+TECHNOLOGIES = (
+    "python", "fastapi", "vue", "react", "postgres", "rust", "go", "flutter"
+)
+TERMS = ("weather", "flo", "solar map", "fastapi", "community garden", "xyz")
+
+
+def _filler_vocabulary(rng: random.Random, size: int = 20_000) -> List[str]:
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    return [
+        "".join(rng.choices(letters, k=rng.randint(4, 9)))
+        for _ in range(size)
+    ]
+
+
+def seed(engine, count: int) -> None:
+    rng = random.Random(42)
+    filler = _filler_vocabulary(rng)
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as db:
+        owner = User(
+            email="bench@example.com", username="bench", password_hash="x"
+        )
+        db.add(owner)
+        db.commit()
+        batch = []
+        for i in range(count):
+            batch.append({
+                "title": " ".join(rng.sample(WORDS, 2)).title() + f" {i}",
+                # Mostly filler words so theme terms are selective.
+                "description": " ".join(
+                    rng.choices(filler, k=40) + rng.sample(WORDS, 2)
+                ),
+                "technologies": ",".join(rng.sample(TECHNOLOGIES, 3)),
+                "owner_id": owner.id,
+                "is_public": True,
+            })
+            if len(batch) == 5000:
+                db.execute(insert(Project), batch)
+                batch = []
+        if batch:
+            db.execute(insert(Project), batch)
+        db.commit()
+
+
+def time_search(engine, backend: str, term: str, repeat: int) -> List[float]:
+    repo = project_repository.ProjectRepository()
+    latencies = []
+    with Session(engine) as db:
+        project_repository._search_backends[id(engine)] = backend
+        for _ in range(repeat):
+            start = time.perf_counter()
+            repo.search_projects(db, term, limit=20)
+            latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def summarize(latencies: List[float]) -> Dict[str, float]:
+    ordered = sorted(latencies)
+    return {
+        "p50_ms": statistics.median(ordered),
+        "p95_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--projects", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        started = time.perf_counter()
+        seed(engine, args.projects)
+        print(
+            f"seeded {args.projects} projects in "
+            f"{time.perf_counter() - started:.1f} s"
+        )
+        print("=" * 60)
+        print(f"{'term':<18}{'ILIKE p50':>12}{'FTS5 p50':>12}{'speedup':>10}")
+        print("=" * 60)
+        for term in TERMS:
+            like = summarize(time_search(engine, "like", term, args.repeat))
+            fts = summarize(time_search(engine, "sqlite", term, args.repeat))
+            print(
+                f"{term:<18}{like['p50_ms']:10.1f}ms{fts['p50_ms']:10.1f}ms"
+                f"{like['p50_ms'] / max(fts['p50_ms'], 1e-6):9.1f}x"
+            )
+        engine.dispose()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
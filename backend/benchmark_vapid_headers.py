@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: VAPID header per send vs cached per audience.
+
+Generates a VAPID key pair and builds the Authorization header for
+``--sends`` web push endpoints spread over the usual push services (FCM,
+Mozilla autopush, Apple, Windows). The uncached variant decodes the
+private key and signs a new JWT for every send, the previous behaviour;
+the cached variant is PushNotificationService, which loads the key once
+and signs once per audience until the token is close to expiry. Reports
+CPU time per send.
+
+Usage:
+    python benchmark_vapid_headers.py --sends 5000
+"""
+import argparse
+import base64
+import sys
+import time
+
+import jwt
+from cryptography.hazmat.primitives import serialization
+
+from app.services.push_notification_service import PushNotificationService
+
+PUSH_SERVICES = [
+    "https://fcm.googleapis.com/fcm/send/",
+    "https://updates.push.services.mozilla.com/wpush/v2/",
+    "https://web.push.apple.com/",
+    "https://wns2-par02p.notify.windows.com/w/?token=",
+]
+
+
+def uncached_header(service: PushNotificationService, endpoint: str) -> str:
+    """The previous work per send: decode the key, sign a new JWT."""
+    key = service.vapid_private_key
+    signing_key = serialization.load_der_private_key(
+        base64.urlsafe_b64decode(key + "=" * (-len(key) % 4)), password=None
+    )
+    token = jwt.encode(
+        {
+            "aud": service._get_audience_from_endpoint(endpoint),
+            "exp": int(time.time()) + 12 * 60 * 60,
+            "sub": "mailto:admin@hackathonhub.oklabflensburg.de",
+        },
+        signing_key,
+        algorithm="ES256",
+        headers={"typ": "JWT"},
+    )
+    return f"vapid t={token}, k=p256ecdsa={service.vapid_public_key}"
+
+
+def measure(build, endpoints) -> float:
+    started = time.process_time()
+    for endpoint in endpoints:
+        build(endpoint)
+    return time.process_time() - started
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sends", type=int, default=5000)
+    args = parser.parse_args()
+
+    keys = PushNotificationService("unused", "unused").generate_vapid_keys()
+    service = PushNotificationService(
+        keys["private_key"], keys["public_key"]
+    )
+    endpoints = [
+        f"{PUSH_SERVICES[i % len(PUSH_SERVICES)]}subscription-{i}"
+        for i in range(args.sends)
+    ]
+
+    print(f"{args.sends} sends to {len(PUSH_SERVICES)} push services")
+    for label, build in (
+        ("signed per send", lambda e: uncached_header(service, e)),
+        ("cached per audience", service._generate_vapid_auth_header),
+    ):
+        elapsed = measure(build, endpoints)
+        print(
+            f"  {label:<20} {elapsed:7.3f}s CPU  "
+            f"{elapsed / args.sends * 1e6:8.1f} us/send"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Load test: per-request view-count writes vs buffered view counting.
+
+Fires concurrent page views at two otherwise identical endpoints against a
+seeded SQLite database. The direct variant loads the row, increments
+view_count and commits on every view (the previous behaviour); the buffered
+variant records the view in a ViewCounter that is flushed every
+``--flush-interval`` seconds. Reports database write statements and commits
+per view, which is the write amplification the buffer removes, and the
+views actually stored: the direct read-modify-write also loses increments
+under concurrency.
+
+Usage:
+    python benchmark_view_counts.py --requests 2000 --concurrency 20
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+from typing import Dict
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import create_engine, event, func, select
+from sqlalchemy.orm import Session, sessionmaker
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+
+from app.domain.models import Base, Project  # noqa: E402
+from app.utils.view_counter import ViewCounter  # noqa: E402
+
+
+class WriteStats:
+    """Counts UPDATE statements and commits issued on an engine."""
+
+    def __init__(self, engine):
+        self.updates = 0
+        self.commits = 0
+        event.listen(engine, "before_cursor_execute", self._statement)
+        event.listen(engine, "commit", self._commit)
+
+    def _statement(self, conn, cursor, statement, *args):
+        if statement.lstrip().upper().startswith("UPDATE"):
+            self.updates += 1
+
+    def _commit(self, conn):
+        self.commits += 1
+
+    def reset(self) -> None:
+        self.updates = self.commits = 0
+
+
+def build_app(SessionFactory, counter: ViewCounter) -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/direct/{project_id}")
+    def direct(project_id: int):
+        with SessionFactory() as db:
+            project = db.get(Project, project_id)
+            project.view_count = (project.view_count or 0) + 1
+            db.commit()
+            db.refresh(project)
+            return project.view_count
+
+    @app.post("/buffered/{project_id}")
+    def buffered(project_id: int):
+        counter.record("project", project_id)
+        return counter.pending("project", project_id)
+
+    return app
+
+
+def seed(engine, count: int) -> None:
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as db:
+        db.add_all([
+            Project(title=f"Project {i}", is_public=True)
+            for i in range(count)
+        ])
+        db.commit()
+
+
+async def run_load(app: FastAPI, prefix: str, project_ids, total: int,
+                   concurrency: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+        async def one(project_id: int):
+            async with semaphore:
+                response = await client.post(f"{prefix}/{project_id}")
+                response.raise_for_status()
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one(pid) for pid in project_ids[:total]))
+        return time.perf_counter() - started
+
+
+def total_views(SessionFactory) -> int:
+    with SessionFactory() as db:
+        return db.execute(
+            select(func.coalesce(func.sum(Project.view_count), 0))
+        ).scalar()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--projects", type=int, default=50)
+    parser.add_argument("--flush-interval", type=float, default=0.5)
+    args = parser.parse_args()
+
+    # Views are skewed towards a few popular projects, as during judging.
+    rng = random.Random(42)
+    project_ids = [
+        min(int(rng.paretovariate(1.2)), args.projects)
+        for _ in range(args.requests)
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        seed(engine, args.projects)
+        SessionFactory = sessionmaker(bind=engine)
+        stats = WriteStats(engine)
+        counter = ViewCounter(flush_interval=args.flush_interval)
+        app = build_app(SessionFactory, counter)
+
+        results: Dict[str, Dict[str, float]] = {}
+        for label, prefix in (("direct", "/direct"),
+                              ("buffered", "/buffered")):
+            before = total_views(SessionFactory)
+            stats.reset()
+            if label == "buffered":
+                counter.start(SessionFactory)
+            elapsed = asyncio.run(run_load(
+                app, prefix, project_ids, args.requests, args.concurrency
+            ))
+            if label == "buffered":
+                counter.stop(SessionFactory)
+            results[label] = {
+                "elapsed": elapsed,
+                "updates": stats.updates,
+                "commits": stats.commits,
+                "stored": total_views(SessionFactory) - before,
+            }
+
+    print("=" * 72)
+    print(
+        f"{args.requests} views over {args.projects} projects, "
+        f"concurrency {args.concurrency}, "
+        f"flush every {args.flush_interval:g} s"
+    )
+    print("=" * 72)
+    print(f"{'variant':<10} {'req/s':>9} {'UPDATEs':>9} {'commits':>9} "
+          f"{'writes/view':>12} {'stored':>8}")
+    for label, result in results.items():
+        print(
+            f"{label:<10} {args.requests / result['elapsed']:9.1f} "
+            f"{result['updates']:9d} {result['commits']:9d} "
+            f"{result['updates'] / args.requests:12.3f} "
+            f"{result['stored']:8d}"
+        )
+    if results["buffered"]["stored"] != args.requests:
+        print("ERROR: buffered views were lost", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,51 @@
+"""add email campaigns table for resumable bulk email sends
+
+Revision ID: add_email_campaigns
+Revises: add_notification_outbox_columns
+Create Date: 2026-10-17 17:00:00.000000
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+
+revision = "add_email_campaigns"
+down_revision = "add_notification_outbox_columns"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    if "email_campaigns" in inspector.get_table_names():
+        return
+    op.create_table(
+        "email_campaigns",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("key", sa.String(length=200), nullable=False),
+        sa.Column("template_name", sa.String(length=200), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("last_recipient_id", sa.Integer(), nullable=False),
+        sa.Column("sent_count", sa.Integer(), nullable=False),
+        sa.Column("failed_count", sa.Integer(), nullable=False),
+        sa.Column(
+            "started_at", sa.DateTime(timezone=True),
+            server_default=sa.text("now()"), nullable=True
+        ),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("key"),
+    )
+    op.create_index(
+        op.f("ix_email_campaigns_id"), "email_campaigns", ["id"],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    if "email_campaigns" not in inspector.get_table_names():
+        return
+    op.drop_index(op.f("ix_email_campaigns_id"), table_name="email_campaigns")
+    op.drop_table("email_campaigns")
@@ -0,0 +1,73 @@
+"""add composite indexes for keyset pagination
+
+Revision ID: add_keyset_pagination_indexes
+Revises: add_project_technologies
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+
+revision = "add_keyset_pagination_indexes"
+down_revision = "add_project_technologies"
+branch_labels = None
+depends_on = None
+
+
+KEYSET_INDEXES = [
+    ("ix_projects_public_created_id", "projects",
+     ["is_public", "created_at", "id"]),
+    ("ix_projects_owner_created_id", "projects",
+     ["owner_id", "created_at", "id"]),
+    ("ix_projects_hackathon_created_id", "projects",
+     ["hackathon_id", "created_at", "id"]),
+    ("ix_projects_team_created_id", "projects",
+     ["team_id", "created_at", "id"]),
+    ("ix_hackathons_active_start_id", "hackathons",
+     ["is_active", "start_date", "id"]),
+    ("ix_teams_created_id", "teams", ["created_at", "id"]),
+    ("ix_teams_hackathon_created_id", "teams",
+     ["hackathon_id", "created_at", "id"]),
+    ("ix_comments_project_parent_created_id", "comments",
+     ["project_id", "parent_comment_id", "created_at", "id"]),
+    ("ix_comments_parent_comment_id", "comments", ["parent_comment_id"]),
+    ("ix_user_notifications_user_created_id", "user_notifications",
+     ["user_id", "created_at", "id"]),
+]
+
+# Prefixes of the keyset indexes above (add_project_performance_indexes)
+SUPERSEDED_INDEXES = [
+    ("idx_projects_is_public_created_at", "projects",
+     ["is_public", "created_at"]),
+    ("idx_projects_owner_id_created_at", "projects",
+     ["owner_id", "created_at"]),
+    ("idx_projects_hackathon_id_created_at", "projects",
+     ["hackathon_id", "created_at"]),
+    ("idx_projects_team_id_created_at", "projects",
+     ["team_id", "created_at"]),
+]
+
+
+def _index_names(inspector, table):
+    return {index["name"] for index in inspector.get_indexes(table)}
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    for name, table, columns in KEYSET_INDEXES:
+        if name not in _index_names(inspector, table):
+            op.create_index(name, table, columns, unique=False)
+    for name, table, _ in SUPERSEDED_INDEXES:
+        if name in _index_names(inspector, table):
+            op.drop_index(name, table_name=table)
+
+
+def downgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    for name, table, columns in SUPERSEDED_INDEXES:
+        if name not in _index_names(inspector, table):
+            op.create_index(name, table, columns, unique=False)
+    for name, table, _ in KEYSET_INDEXES:
+        if name in _index_names(inspector, table):
+            op.drop_index(name, table_name=table)
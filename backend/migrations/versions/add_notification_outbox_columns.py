@@ -0,0 +1,52 @@
+"""add outbox columns to notification deliveries
+
+Revision ID: add_notification_outbox_columns
+Revises: add_project_activity_columns
+Create Date: 2026-10-17 16:00:00.000000
+
+Pending email and push deliveries are claimed by app.workers.notifications
+by (status, next_attempt_at).
+"""
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+
+revision = "add_notification_outbox_columns"
+down_revision = "add_project_activity_columns"
+branch_labels = None
+depends_on = None
+
+
+TABLE = "notification_deliveries"
+INDEX = "ix_notification_deliveries_status_next_attempt"
+COLUMNS = [
+    sa.Column(
+        "payload",
+        sa.JSON().with_variant(postgresql.JSONB(), "postgresql"),
+        nullable=True,
+    ),
+    sa.Column("next_attempt_at", sa.DateTime(timezone=True), nullable=True),
+]
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    existing = {column["name"] for column in inspector.get_columns(TABLE)}
+    for column in COLUMNS:
+        if column.name not in existing:
+            op.add_column(TABLE, column)
+    indexes = {index["name"] for index in inspector.get_indexes(TABLE)}
+    if INDEX not in indexes:
+        op.create_index(INDEX, TABLE, ["status", "next_attempt_at"])
+
+
+def downgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    indexes = {index["name"] for index in inspector.get_indexes(TABLE)}
+    if INDEX in indexes:
+        op.drop_index(INDEX, table_name=TABLE)
+    existing = {column["name"] for column in inspector.get_columns(TABLE)}
+    for column in reversed(COLUMNS):
+        if column.name in existing:
+            op.drop_column(TABLE, column.name)
@@ -0,0 +1,47 @@
+"""add stored activity and engagement columns to projects
+
+Revision ID: add_project_activity_columns
+Revises: add_keyset_pagination_indexes
+Create Date: 2026-10-17 14:00:00.000000
+
+Existing rows are filled by rebuild_project_activity.py.
+"""
+import sqlalchemy as sa
+from alembic import op
+
+
+revision = "add_project_activity_columns"
+down_revision = "add_keyset_pagination_indexes"
+branch_labels = None
+depends_on = None
+
+
+COLUMNS = [
+    sa.Column(
+        "last_activity_at", sa.DateTime(timezone=True), nullable=True
+    ),
+    sa.Column(
+        "engagement_score", sa.Integer(), nullable=False,
+        server_default="0"
+    ),
+    sa.Column(
+        "engagement_level", sa.String(length=10), nullable=False,
+        server_default="low"
+    ),
+]
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    existing = {column["name"] for column in inspector.get_columns("projects")}
+    for column in COLUMNS:
+        if column.name not in existing:
+            op.add_column("projects", column)
+
+
+def downgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    existing = {column["name"] for column in inspector.get_columns("projects")}
+    for column in reversed(COLUMNS):
+        if column.name in existing:
+            op.drop_column("projects", column.name)
@@ -0,0 +1,101 @@
+"""add full-text search index for projects
+
+Revision ID: add_project_fulltext_search
+Revises: add_user_platform_prefs
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from alembic import op
+
+
+revision = "add_project_fulltext_search"
+down_revision = "add_user_platform_prefs"
+branch_labels = None
+depends_on = None
+
+
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('simple', coalesce({row}title, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce({row}technologies, '')), 'B') "
+    "|| setweight(to_tsvector('simple', coalesce({row}description, '')), 'C')"
+)
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        # Maintained by a trigger rather than a generated column, so
+        # counter updates on projects do not recompute the vector.
+        op.execute(
+            "ALTER TABLE projects ADD COLUMN IF NOT EXISTS search_vector "
+            "tsvector"
+        )
+        op.execute(
+            "CREATE OR REPLACE FUNCTION projects_search_vector_update() "
+            "RETURNS trigger LANGUAGE plpgsql AS $$ BEGIN "
+            f"NEW.search_vector := {SEARCH_VECTOR_SQL.format(row='NEW.')}; "
+            "RETURN NEW; END $$"
+        )
+        op.execute(
+            "CREATE TRIGGER projects_search_vector_trg "
+            "BEFORE INSERT OR UPDATE OF title, description, technologies "
+            "ON projects FOR EACH ROW "
+            "EXECUTE FUNCTION projects_search_vector_update()"
+        )
+        op.execute(
+            "UPDATE projects SET search_vector = "
+            f"{SEARCH_VECTOR_SQL.format(row='')}"
+        )
+        op.execute(
+            "CREATE INDEX IF NOT EXISTS ix_projects_search_vector "
+            "ON projects USING GIN (search_vector)"
+        )
+    elif dialect == "sqlite":
+        op.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS projects_fts USING fts5("
+            "title, description, technologies, "
+            "content='projects', content_rowid='id')"
+        )
+        op.execute(
+            "CREATE TRIGGER IF NOT EXISTS projects_fts_ai "
+            "AFTER INSERT ON projects BEGIN "
+            "INSERT INTO projects_fts(rowid, title, description, technologies) "
+            "VALUES (new.id, new.title, new.description, new.technologies); "
+            "END"
+        )
+        op.execute(
+            "CREATE TRIGGER IF NOT EXISTS projects_fts_ad "
+            "AFTER DELETE ON projects BEGIN "
+            "INSERT INTO projects_fts"
+            "(projects_fts, rowid, title, description, technologies) "
+            "VALUES ('delete', old.id, old.title, old.description, "
+            "old.technologies); END"
+        )
+        op.execute(
+            "CREATE TRIGGER IF NOT EXISTS projects_fts_au "
+            "AFTER UPDATE OF title, description, technologies ON projects "
+            "BEGIN "
+            "INSERT INTO projects_fts"
+            "(projects_fts, rowid, title, description, technologies) "
+            "VALUES ('delete', old.id, old.title, old.description, "
+            "old.technologies); "
+            "INSERT INTO projects_fts(rowid, title, description, technologies) "
+            "VALUES (new.id, new.title, new.description, new.technologies); "
+            "END"
+        )
+        op.execute("INSERT INTO projects_fts(projects_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        op.execute("DROP INDEX IF EXISTS ix_projects_search_vector")
+        op.execute(
+            "DROP TRIGGER IF EXISTS projects_search_vector_trg ON projects"
+        )
+        op.execute("DROP FUNCTION IF EXISTS projects_search_vector_update()")
+        op.execute("ALTER TABLE projects DROP COLUMN IF EXISTS search_vector")
+    elif dialect == "sqlite":
+        for trigger in ("projects_fts_ai", "projects_fts_ad", "projects_fts_au"):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS projects_fts")
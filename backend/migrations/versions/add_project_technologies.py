@@ -0,0 +1,118 @@
+"""add normalized project technology tags
+
+Revision ID: add_project_technologies
+Revises: add_project_fulltext_search
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+
+revision = "add_project_technologies"
+down_revision = "add_project_fulltext_search"
+branch_labels = None
+depends_on = None
+
+
+def _normalize(value):
+    # Frozen copy of app.domain.models.project.normalize_technologies
+    tags = []
+    for tag in (value or "").split(","):
+        tag = " ".join(tag.split()).lower()[:100]
+        if tag and tag not in tags:
+            tags.append(tag)
+    return tags
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if not inspector.has_table("technologies"):
+        op.create_table(
+            "technologies",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("name", sa.String(length=100), nullable=False),
+            sa.UniqueConstraint("name"),
+        )
+        op.create_index(
+            op.f("ix_technologies_id"), "technologies", ["id"], unique=False
+        )
+    if not inspector.has_table("project_technologies"):
+        op.create_table(
+            "project_technologies",
+            sa.Column(
+                "project_id", sa.Integer(),
+                sa.ForeignKey("projects.id", ondelete="CASCADE"),
+                primary_key=True,
+            ),
+            sa.Column(
+                "technology_id", sa.Integer(),
+                sa.ForeignKey("technologies.id", ondelete="CASCADE"),
+                primary_key=True,
+            ),
+        )
+        op.create_index(
+            "ix_project_technologies_technology_project",
+            "project_technologies",
+            ["technology_id", "project_id"],
+            unique=False,
+        )
+
+    # Backfill the tag dictionary and index from the existing strings.
+    projects = sa.table(
+        "projects", sa.column("id", sa.Integer),
+        sa.column("technologies", sa.String),
+    )
+    technologies = sa.table(
+        "technologies", sa.column("id", sa.Integer),
+        sa.column("name", sa.String),
+    )
+    project_technologies = sa.table(
+        "project_technologies", sa.column("project_id", sa.Integer),
+        sa.column("technology_id", sa.Integer),
+    )
+
+    tagged = {
+        project_id: _normalize(value)
+        for project_id, value in bind.execute(
+            sa.select(projects.c.id, projects.c.technologies).where(
+                projects.c.technologies.isnot(None)
+            )
+        )
+    }
+    names = sorted({name for tags in tagged.values() for name in tags})
+    known = dict(bind.execute(
+        sa.select(technologies.c.name, technologies.c.id)
+    ).all())
+    missing = [name for name in names if name not in known]
+    if missing:
+        bind.execute(
+            technologies.insert(), [{"name": name} for name in missing]
+        )
+        known = dict(bind.execute(
+            sa.select(technologies.c.name, technologies.c.id)
+        ).all())
+
+    bind.execute(project_technologies.delete())
+    rows = [
+        {"project_id": project_id, "technology_id": known[name]}
+        for project_id, tags in tagged.items() for name in tags
+    ]
+    if rows:
+        bind.execute(project_technologies.insert(), rows)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if inspector.has_table("project_technologies"):
+        op.drop_index(
+            "ix_project_technologies_technology_project",
+            table_name="project_technologies",
+        )
+        op.drop_table("project_technologies")
+    if inspector.has_table("technologies"):
+        op.drop_index(op.f("ix_technologies_id"), table_name="technologies")
+        op.drop_table("technologies")
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Rebuild stored project activity and engagement columns.
+
+Recomputes comment_count, last_activity_at, engagement_score and
+engagement_level from votes and comments. Run it once after the migration
+`add_project_activity_columns` has been applied, and then periodically
+(e.g. daily): writes keep the columns current, but the recency bonus in the
+score only decays when the row is recomputed.
+
+Usage:
+    python rebuild_project_activity.py --batch-size 500
+"""
+import argparse
+import sys
+
+from app.core.database import SessionLocal
+from app.repositories.project_repository import ProjectRepository
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        rebuilt = ProjectRepository().rebuild_activity(
+            db, batch_size=args.batch_size
+        )
+    finally:
+        db.close()
+    print(f"Rebuilt activity for {rebuilt} projects")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Repair drifted project and comment vote counters.
+
+Votes update the counters with atomic SQL deltas; this recounts them from
+the vote rows and fixes any row that no longer matches (e.g. after manual
+edits or writes that bypassed the repositories). Run it periodically, e.g.
+hourly during judging and daily otherwise.
+
+Usage:
+    python reconcile_vote_counts.py
+"""
+import argparse
+import sys
+
+from app.core.database import SessionLocal
+from app.repositories.comment_vote_repository import CommentVoteRepository
+from app.repositories.project_repository import VoteRepository
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        projects = VoteRepository().reconcile_vote_counts(db)
+        comments = CommentVoteRepository().reconcile_vote_counts(db)
+    finally:
+        db.close()
+    print(f"Repaired vote counts of {projects} projects, {comments} comments")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,122 @@
+import os
+import unittest
+
+os.environ.setdefault("DEBUG", "false")
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+
+from sqlalchemy.ext.asyncio import (  # noqa: E402
+    AsyncSession, async_sessionmaker, create_async_engine
+)
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+from app.core.database import to_async_database_url  # noqa: E402
+from app.domain.models import Base, User  # noqa: E402
+from app.repositories.hackathon_repository import (  # noqa: E402
+    AsyncHackathonRepository,
+)
+from app.repositories.notification_repository import (  # noqa: E402
+    AsyncNotificationRepository,
+)
+from app.repositories.project_repository import (  # noqa: E402
+    AsyncProjectRepository,
+)
+
+
+class AsyncDatabaseUrlTests(unittest.TestCase):
+    def test_sqlite_and_postgres_urls_map_to_async_drivers(self):
+        self.assertEqual(
+            to_async_database_url("sqlite:///./hackathon.db"),
+            "sqlite+aiosqlite:///./hackathon.db",
+        )
+        self.assertEqual(
+            to_async_database_url(
+                "postgresql://u:p@localhost:5432/db?sslmode=require"
+            ),
+            "postgresql+asyncpg://u:p@localhost:5432/db?ssl=require",
+        )
+
+
+class AsyncRepositoryTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.engine = create_async_engine(
+            "sqlite+aiosqlite:///:memory:", poolclass=StaticPool
+        )
+        async with self.engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        self.session_factory = async_sessionmaker(
+            self.engine, class_=AsyncSession, expire_on_commit=False
+        )
+        async with self.session_factory() as db:
+            user = User(
+                email="async@example.com",
+                username="asyncuser",
+                password_hash="secret",
+            )
+            db.add(user)
+            await db.commit()
+            self.user_id = user.id
+
+    async def asyncTearDown(self):
+        await self.engine.dispose()
+
+    async def test_project_listing_and_search(self):
+        repo = AsyncProjectRepository()
+        async with self.session_factory() as db:
+            await repo.create(db, obj_in={
+                "title": "Async Tracker",
+                "technologies": "python,fastapi",
+                "owner_id": self.user_id,
+                "is_public": True,
+            })
+            await repo.create(db, obj_in={
+                "title": "Private",
+                "owner_id": self.user_id,
+                "is_public": False,
+            })
+
+            public = await repo.get_public_projects(db)
+            self.assertEqual([p.title for p in public], ["Async Tracker"])
+            # Eager-loaded relationships are usable without lazy IO.
+            self.assertEqual(public[0].owner.username, "asyncuser")
+
+            found = await repo.search_projects(db, search_term="fastapi")
+            self.assertEqual(len(found), 1)
+            self.assertEqual(len(await repo.get_by_owner(db, self.user_id)), 2)
+            self.assertEqual(await repo.count(db), 2)
+
+    async def test_hackathon_and_notification_repositories(self):
+        hackathons = AsyncHackathonRepository()
+        notifications = AsyncNotificationRepository()
+        async with self.session_factory() as db:
+            await hackathons.create(db, obj_in={
+                "name": "Async Hack",
+                "owner_id": self.user_id,
+                "is_active": True,
+            })
+            active = await hackathons.get_active_hackathons(db)
+            self.assertEqual([h.name for h in active], ["Async Hack"])
+
+            await notifications.create_notification(
+                db,
+                user_id=self.user_id,
+                notification_type="system_announcement",
+                title="Hi",
+                message="There",
+            )
+            self.assertEqual(
+                await notifications.count_unread(db, self.user_id), 1
+            )
+            items = await notifications.get_user_notifications(
+                db, self.user_id
+            )
+            self.assertEqual(items[0].deliveries, [])
+            self.assertEqual(
+                await notifications.mark_all_as_read(db, self.user_id), 1
+            )
+            self.assertEqual(
+                await notifications.count_unread(db, self.user_id), 0
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
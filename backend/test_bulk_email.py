@@ -0,0 +1,237 @@
+import asyncio
+import os
+import threading
+import time
+import unittest
+from datetime import datetime, timedelta
+from unittest import mock
+
+os.environ.setdefault("DEBUG", "false")
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+
+from sqlalchemy import select  # noqa: E402
+
+from app.core.database import SessionLocal, engine  # noqa: E402
+from app.domain.models import (  # noqa: E402
+    Base, EmailCampaign, Hackathon, HackathonRegistration,
+    NewsletterSubscription, PushSubscription, User, UserNotification
+)
+from app.services.bulk_email_service import (  # noqa: E402
+    BulkEmailService, BulkRecipient, _RateLimiter
+)
+from app.services.email_service import EmailService  # noqa: E402
+from app.services.hackathon_service import HackathonService  # noqa: E402
+from app.services.newsletter_service import NewsletterService  # noqa: E402
+from app.services.notification_preference_service import (  # noqa: E402
+    notification_preference_service,
+)
+from app.utils.template_engine import template_engine  # noqa: E402
+
+
+class RecordingEmailService(EmailService):
+    """EmailService that records instead of talking to SMTP."""
+
+    def __init__(self):
+        super().__init__()
+        self.sent = []
+        self.lock = threading.Lock()
+
+    def send_many(self, emails):
+        with self.lock:
+            self.sent.extend(emails)
+        return [True] * len(emails)
+
+
+class BulkEmailTests(unittest.TestCase):
+    def setUp(self):
+        Base.metadata.drop_all(bind=engine)
+        Base.metadata.create_all(bind=engine)
+        self.db = SessionLocal()
+        self.mailer = RecordingEmailService()
+        self.bulk = BulkEmailService(
+            self.mailer, batch_size=10, chunk_size=4, concurrency=3
+        )
+        for name in ("newsletter_service", "hackathon_service"):
+            patcher = mock.patch(
+                f"app.services.{name}.bulk_email_service", self.bulk
+            )
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.db.close()
+
+    def _subscribe(self, count):
+        self.db.add_all([
+            NewsletterSubscription(email=f"reader{i}@example.com")
+            for i in range(count)
+        ] + [
+            NewsletterSubscription(email="gone@example.com", is_active=False)
+        ])
+        self.db.commit()
+
+    def _send_newsletter(self):
+        return asyncio.run(NewsletterService().send_newsletter(
+            self.db, "2026-10", "newsletter_welcome",
+            variables={"unsubscribe_url": "https://example.com/u"},
+        ))
+
+    def test_newsletter_renders_once_and_reaches_active_subscribers(self):
+        self._subscribe(25)
+
+        with mock.patch.object(
+            template_engine, "render_email", wraps=template_engine.render_email
+        ) as render:
+            result = self._send_newsletter()
+
+        self.assertEqual((result.sent, result.failed), (25, 0))
+        self.assertTrue(result.completed)
+        self.assertEqual(render.call_count, 1)
+        recipients = sorted(email.to_email for email in self.mailer.sent)
+        self.assertEqual(
+            recipients,
+            sorted(f"reader{i}@example.com" for i in range(25)),
+        )
+        self.assertNotIn("[[bulk:", self.mailer.sent[0].html_body)
+
+    def test_completed_campaign_is_not_sent_again(self):
+        self._subscribe(5)
+        self._send_newsletter()
+
+        result = self._send_newsletter()
+
+        self.assertEqual(result.sent, 5)
+        self.assertEqual(len(self.mailer.sent), 5)
+
+    def test_interrupted_campaign_resumes_after_last_batch(self):
+        self._subscribe(25)
+        model = NewsletterSubscription
+        batches = []
+
+        def recipients(after_id):
+            return select(model.id, model.email).where(
+                model.is_active.is_(True), model.id > after_id
+            ).order_by(model.id)
+
+        def failing_prepare(db, rows):
+            batches.append(len(rows))
+            if len(batches) == 2:
+                raise RuntimeError("worker stopped")
+            return [BulkRecipient(email=row.email) for row in rows]
+
+        campaign = {
+            "key": "newsletter:resume",
+            "template_name": "newsletter_welcome",
+            "recipients": recipients,
+        }
+        with self.assertRaises(RuntimeError):
+            self.bulk.run_campaign(
+                self.db, prepare=failing_prepare, **campaign
+            )
+        self.assertEqual(len(self.mailer.sent), 10)
+
+        result = self.bulk.run_campaign(
+            self.db,
+            prepare=lambda db, rows: [
+                BulkRecipient(email=row.email) for row in rows
+            ],
+            **campaign,
+        )
+
+        self.assertEqual(result.sent, 25)
+        self.assertEqual(len(self.mailer.sent), 25)
+        self.assertEqual(len({e.to_email for e in self.mailer.sent}), 25)
+
+    def _register_for_reminders(self, count):
+        notification_preference_service.initialize_notification_types(self.db)
+        users = [
+            User(email=f"hacker{i}@example.com", username=f"hacker{i}",
+                 name=f"Hacker {i}", password_hash="secret",
+                 language="de" if i % 2 else "en")
+            for i in range(count)
+        ]
+        self.db.add_all(users)
+        self.db.commit()
+        hackathon = Hackathon(
+            name="Reminder Jam", description="Soon",
+            start_date=datetime.utcnow() + timedelta(hours=24),
+            end_date=datetime.utcnow() + timedelta(hours=48),
+            location="Flensburg", owner_id=users[0].id,
+        )
+        self.db.add(hackathon)
+        self.db.commit()
+        self.db.add_all([
+            HackathonRegistration(user_id=user.id, hackathon_id=hackathon.id)
+            for user in users
+        ])
+        self.db.commit()
+        return hackathon
+
+    def test_start_reminders_go_out_as_one_campaign_per_hackathon(self):
+        hackathon = self._register_for_reminders(5)
+
+        result = HackathonService().send_hackathon_start_reminders(self.db)
+        again = HackathonService().send_hackathon_start_reminders(self.db)
+
+        self.assertEqual(result, {"sent": 5, "errors": 0})
+        self.assertEqual(again, {"sent": 5, "errors": 0})
+        self.assertEqual(len(self.mailer.sent), 5)
+        bodies = {email.to_email: email.body for email in self.mailer.sent}
+        self.assertIn("Hacker 1", bodies["hacker1@example.com"])
+        self.assertIn("Reminder Jam", bodies["hacker1@example.com"])
+        campaign = self.db.query(EmailCampaign).one()
+        self.assertEqual(
+            campaign.key, f"hackathon_start_reminder:{hackathon.id}"
+        )
+
+    def test_resumed_reminders_do_not_notify_twice(self):
+        self._register_for_reminders(25)
+        # Push is only offered to users with a subscription
+        self.db.add_all([
+            PushSubscription(
+                user_id=user_id, endpoint=f"https://push.example.com/{user_id}",
+                p256dh="key", auth="auth",
+            )
+            for (user_id,) in self.db.query(User.id)
+        ])
+        self.db.commit()
+        repo = self.bulk.campaign_repo
+        record_progress = repo.record_progress
+        calls = []
+
+        def stop_on_second_batch(*args, **kwargs):
+            calls.append(1)
+            if len(calls) == 2:
+                raise RuntimeError("worker stopped")
+            return record_progress(*args, **kwargs)
+
+        with mock.patch.object(
+            repo, "record_progress", side_effect=stop_on_second_batch
+        ), self.assertRaises(RuntimeError):
+            HackathonService().send_hackathon_start_reminders(self.db)
+        self.assertEqual(self.db.query(UserNotification).count(), 10)
+
+        HackathonService().send_hackathon_start_reminders(self.db)
+
+        user_ids = [
+            user_id for (user_id,) in
+            self.db.query(UserNotification.user_id)
+        ]
+        self.assertEqual(len(user_ids), 25)
+        self.assertEqual(len(set(user_ids)), 25)
+
+    def test_rate_limiter_spaces_out_sends(self):
+        async def send_three_chunks():
+            limiter = _RateLimiter(200)
+            for _ in range(3):
+                await limiter.acquire(10)
+
+        started = time.monotonic()
+        asyncio.run(send_three_chunks())
+
+        # The first chunk goes at once, the next two wait 50 ms each.
+        self.assertGreaterEqual(time.monotonic() - started, 0.09)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,439 @@
+import asyncio
+import os
+import threading
+import time
+import unittest
+from unittest import mock
+
+os.environ.setdefault("DEBUG", "false")
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.core.database import SessionLocal, engine  # noqa: E402
+from app.domain.models import Base, Hackathon, Project, User  # noqa: E402
+from app.domain.schemas.project import (  # noqa: E402
+    Project as ProjectSchema,
+)
+from app.main import app  # noqa: E402
+from app.services.hackathon_service import hackathon_service  # noqa: E402
+from app.services.project_service import project_service  # noqa: E402
+from app.utils.cache import (  # noqa: E402
+    BUSY, CacheManager, LocalCache, SingleFlight, cache_manager, cached,
+    invalidate_cache,
+)
+
+
+class LocalCacheTests(unittest.TestCase):
+    def test_entries_expire_after_ttl(self):
+        cache = LocalCache(max_entries=10)
+        with mock.patch("app.utils.cache.time.monotonic", return_value=100.0):
+            cache.set("projects", [1, 2], ttl=5)
+            self.assertEqual(cache.get("projects"), [1, 2])
+        with mock.patch("app.utils.cache.time.monotonic", return_value=106.0):
+            self.assertIsNone(cache.get("projects"))
+        stats = cache.get_stats()
+        self.assertEqual(stats["expirations"], 1)
+        self.assertEqual(stats["entries"], 0)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = LocalCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), 3)
+        self.assertEqual(cache.get_stats()["evictions"], 1)
+
+    def test_memory_budget_bounds_total_size(self):
+        cache = LocalCache(max_entries=100, max_bytes=2000)
+        for i in range(50):
+            cache.set(f"page:{i}", "x" * 200)
+
+        stats = cache.get_stats()
+        self.assertLessEqual(stats["bytes"], 2000)
+        self.assertGreater(stats["evictions"], 0)
+        self.assertEqual(cache.get("page:49"), "x" * 200)
+
+    def test_hit_and_miss_counters(self):
+        cache = LocalCache()
+        cache.set("k", "v")
+        cache.get("k")
+        cache.get("missing")
+        stats = cache.get_stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+
+
+class CacheManagerTests(unittest.TestCase):
+    def test_local_tier_is_used_without_redis(self):
+        manager = CacheManager()
+        manager.use_redis = False
+        manager.redis_client = None
+
+        manager.set("key", {"value": 1}, ttl=60)
+        self.assertEqual(manager.get("key"), {"value": 1})
+        manager.delete("key")
+        self.assertIsNone(manager.get("key"))
+
+    def test_local_tier_fronts_redis(self):
+        redis = mock.Mock()
+        redis.get.return_value = '{"value": 2}'
+        redis.ttl.return_value = 120
+        manager = CacheManager()
+        manager.use_redis = True
+        manager.redis_client = redis
+
+        self.assertEqual(manager.get("key"), {"value": 2})
+        self.assertEqual(manager.get("key"), {"value": 2})
+        redis.get.assert_called_once_with("key")
+
+
+class TagInvalidationTests(unittest.TestCase):
+    def setUp(self):
+        cache_manager.clear()
+        self.calls = []
+
+        @cached(ttl=60, tags=("project:{project_id}",))
+        def load_project(project_id):
+            self.calls.append(project_id)
+            return {"id": project_id}
+
+        @cached(ttl=60, tags=(
+            "projects:list",
+            lambda items: [f"hackathon:{i['hackathon_id']}" for i in items],
+        ))
+        def list_projects():
+            self.calls.append("list")
+            return [{"id": 1, "hackathon_id": 7}]
+
+        self.load_project = load_project
+        self.list_projects = list_projects
+
+    def test_invalidating_a_tag_only_drops_dependent_entries(self):
+        self.load_project(1)
+        self.load_project(2)
+        cache_manager.invalidate_tags("project:1")
+        self.load_project(1)
+        self.load_project(2)
+
+        self.assertEqual(self.calls, [1, 2, 1])
+
+    def test_result_derived_tags_are_tracked(self):
+        self.list_projects()
+        self.list_projects()
+        cache_manager.invalidate_tags("hackathon:7")
+        self.list_projects()
+
+        self.assertEqual(self.calls, ["list", "list"])
+
+    def test_invalidate_cache_decorator_formats_tags(self):
+        @invalidate_cache(tags=("project:{project_id}",))
+        def update_project(project_id):
+            return project_id
+
+        self.load_project(3)
+        update_project(3)
+        self.load_project(3)
+        self.assertEqual(self.calls, [3, 3])
+
+    def test_redis_holds_shared_tag_versions(self):
+        redis = mock.Mock()
+        redis.mget.return_value = ["4", None]
+        manager = CacheManager()
+        manager.use_redis = True
+        manager.redis_client = redis
+
+        self.assertEqual(
+            manager.get_tag_versions(["projects:list", "project:1"]),
+            {"projects:list": 4, "project:1": 0},
+        )
+        manager.invalidate_tags("projects:list")
+        redis.pipeline.return_value.incr.assert_called_once_with(
+            "cache:tag:projects:list"
+        )
+
+
+class CacheKeyTests(unittest.TestCase):
+    def test_session_and_receiver_are_not_part_of_the_key(self):
+        class Service:
+            calls = 0
+
+            @cached(ttl=60)
+            def listing(self, db, skip=0, limit=100, locale="en"):
+                Service.calls += 1
+                return [skip, limit]
+
+        cache_manager.clear()
+        first_db, second_db = SessionLocal(), SessionLocal()
+        try:
+            Service().listing(first_db, skip=0, limit=10)
+            Service().listing(second_db, 0, 10, locale="de")
+        finally:
+            first_db.close()
+            second_db.close()
+        self.assertEqual(Service.calls, 1)
+
+    def test_declared_key_parameters_must_exist(self):
+        with self.assertRaises(ValueError):
+            @cached(key=("missing",))
+            def listing(db, skip=0):
+                return []
+
+
+class SingleFlightTests(unittest.TestCase):
+    def setUp(self):
+        cache_manager.clear()
+
+    def test_concurrent_misses_compute_once(self):
+        calls = []
+        started = threading.Event()
+
+        @cached(ttl=60)
+        def search(term):
+            calls.append(term)
+            started.set()
+            time.sleep(0.2)
+            return [term]
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(search("ai")))
+            for _ in range(5)
+        ]
+        threads[0].start()
+        started.wait(1)
+        for thread in threads[1:]:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(calls, ["ai"])
+        self.assertEqual(results, [["ai"]] * 5)
+
+    def test_expired_entry_is_served_while_refreshed_in_background(self):
+        versions = iter(range(1, 10))
+        release = threading.Event()
+        sessions = []
+
+        @cached(ttl=10, stale_ttl=30)
+        def listing(db):
+            sessions.append(db)
+            if len(sessions) > 1:
+                release.wait(1)
+            return next(versions)
+
+        request_db = SessionLocal()
+        self.addCleanup(request_db.close)
+        flight = SingleFlight(cache_manager)
+        with mock.patch("app.utils.cache.time.time", return_value=1000.0), \
+                mock.patch("app.utils.cache.single_flight", flight):
+            self.assertEqual(listing(request_db), 1)
+        with mock.patch("app.utils.cache.time.time", return_value=1015.0), \
+                mock.patch("app.utils.cache.single_flight", flight):
+            # Neither caller waits for the refresh, which runs once.
+            self.assertEqual(listing(request_db), 1)
+            self.assertEqual(listing(request_db), 1)
+            release.set()
+            flight._executor.shutdown(wait=True)
+            self.assertEqual(listing(request_db), 2)
+
+        self.assertEqual(len(sessions), 2)
+        self.assertIsNot(sessions[1], request_db)
+
+    def test_event_loop_thread_does_not_wait_for_other_workers(self):
+        manager = mock.Mock()
+        manager.acquire_lock.return_value = None
+        manager.local_only = set()
+        flight = SingleFlight(manager, max_wait=5)
+
+        async def handler():
+            return flight.do("key", lambda: "computed", lambda: BUSY)
+
+        started = time.monotonic()
+        result = asyncio.run(handler())
+
+        self.assertEqual(result, "computed")
+        self.assertLess(time.monotonic() - started, 1)
+
+    def test_worker_that_loses_the_redis_lock_reuses_the_winner_result(self):
+        manager = mock.Mock()
+        manager.acquire_lock.return_value = None
+        manager.local_only = set()
+        flight = SingleFlight(manager, poll_interval=0.01, max_wait=1)
+        lookups = iter([BUSY, ["from other worker"]])
+        compute = mock.Mock()
+
+        result = flight.do("key", compute, lambda: next(lookups))
+
+        self.assertEqual(result, ["from other worker"])
+        compute.assert_not_called()
+
+
+class FakeRedis:
+    """In-memory stand-in for the Redis commands CacheManager uses."""
+
+    def __init__(self):
+        self.store = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def setex(self, key, ttl, value):
+        self.store[key] = value
+
+    def ttl(self, key):
+        return 60 if key in self.store else -2
+
+    def set(self, key, value, nx=False, px=None):
+        if nx and key in self.store:
+            return None
+        self.store[key] = value
+        return True
+
+    def eval(self, script, numkeys, key, token):
+        if self.store.get(key) == token:
+            del self.store[key]
+            return 1
+        return 0
+
+    def mget(self, keys):
+        return [self.store.get(key) for key in keys]
+
+    def delete(self, key):
+        self.store.pop(key, None)
+
+    def flushdb(self):
+        self.store.clear()
+
+
+class RedisTierTests(unittest.TestCase):
+    """Two CacheManagers on one Redis stand in for two workers."""
+
+    def setUp(self):
+        Base.metadata.drop_all(bind=engine)
+        Base.metadata.create_all(bind=engine)
+        self.db = SessionLocal()
+        owner = User(
+            email="redis@example.com", username="redisuser",
+            password_hash="secret",
+        )
+        self.db.add(owner)
+        self.db.commit()
+        self.db.add(Project(title="Shared", owner_id=owner.id, is_public=True))
+        self.db.commit()
+        self.redis = FakeRedis()
+
+    def tearDown(self):
+        self.db.close()
+
+    def _worker(self):
+        manager = CacheManager()
+        manager.use_redis = True
+        manager.redis_client = self.redis
+        return manager, SingleFlight(manager, poll_interval=0.01)
+
+    def _list_projects(self, worker):
+        manager, flight = worker
+        repo = project_service.project_repo
+        with mock.patch("app.utils.cache.cache_manager", manager), \
+                mock.patch("app.utils.cache.single_flight", flight), \
+                mock.patch.object(
+                    repo, "get_public_projects",
+                    wraps=repo.get_public_projects,
+                ) as listing:
+            projects = project_service.get_projects(self.db, limit=10)
+        return projects, listing.call_count
+
+    def test_project_schemas_are_shared_through_redis(self):
+        first, first_queries = self._list_projects(self._worker())
+        second, second_queries = self._list_projects(self._worker())
+
+        self.assertEqual((first_queries, second_queries), (1, 0))
+        self.assertIsInstance(second[0], ProjectSchema)
+        self.assertEqual(second, first)
+
+    def test_worker_that_loses_the_lock_gets_the_winner_models(self):
+        first, _ = self._list_projects(self._worker())
+        saved = dict(self.redis.store)
+        self.redis.store.clear()
+        (key,) = saved
+        self.redis.set(f"cache:lock:{key}", "winner")
+        threading.Timer(0.05, self.redis.store.update, [saved]).start()
+
+        second, queries = self._list_projects(self._worker())
+
+        self.assertEqual(queries, 0)
+        self.assertEqual(second, first)
+
+    def test_hackathon_project_listing_is_shared_through_redis(self):
+        hackathon = Hackathon(name="Shared hackathon")
+        self.db.add(hackathon)
+        self.db.commit()
+        self.db.query(Project).update({"hackathon_id": hackathon.id})
+        self.db.commit()
+
+        results = []
+        for manager, flight in (self._worker(), self._worker()):
+            with mock.patch("app.utils.cache.cache_manager", manager), \
+                    mock.patch("app.utils.cache.single_flight", flight):
+                results.append(hackathon_service.get_hackathon_projects(
+                    self.db, hackathon_id=hackathon.id
+                ))
+
+        self.assertEqual(manager.local_only, set())
+        self.assertEqual(results[1], results[0])
+        self.assertEqual(results[0][0]["title"], "Shared")
+
+    def test_unshareable_value_is_computed_without_waiting(self):
+        manager, flight = self._worker()
+        flight.max_wait = 5
+        manager.set("key", {"value": object()}, ttl=60)
+        manager.acquire_lock("key", timeout=10)
+
+        started = time.monotonic()
+        result = flight.do("key", lambda: "computed", lambda: BUSY)
+
+        self.assertEqual(result, "computed")
+        self.assertLess(time.monotonic() - started, 1)
+
+
+class ProjectListCacheTests(unittest.TestCase):
+    def setUp(self):
+        Base.metadata.drop_all(bind=engine)
+        Base.metadata.create_all(bind=engine)
+        cache_manager.clear()
+        self.db = SessionLocal()
+        owner = User(
+            email="cache@example.com",
+            username="cacheuser",
+            password_hash="secret",
+        )
+        self.db.add(owner)
+        self.db.commit()
+        self.db.add(Project(title="Cached", owner_id=owner.id, is_public=True))
+        self.db.commit()
+        self.client = TestClient(app)
+
+    def tearDown(self):
+        self.client.close()
+        self.db.close()
+        cache_manager.clear()
+
+    def test_repeated_project_listing_hits_the_cache(self):
+        repo = project_service.project_repo
+        with mock.patch.object(
+            repo, "get_public_projects", wraps=repo.get_public_projects
+        ) as listing:
+            first = self.client.get("/api/projects?limit=10")
+            second = self.client.get("/api/projects?limit=10")
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(first.json(), second.json())
+        self.assertEqual(listing.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
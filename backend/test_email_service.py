@@ -0,0 +1,157 @@
+import os
+import socketserver
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+os.environ.setdefault("DEBUG", "false")
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+
+from app.services.email_service import EmailService, OutgoingEmail  # noqa: E402
+
+
+class FakeSMTPHandler(socketserver.StreamRequestHandler):
+    """Just enough SMTP for smtplib: EHLO, AUTH, MAIL, RCPT, DATA, NOOP."""
+
+    def reply(self, line):
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self):
+        server = self.server
+        with server.lock:
+            server.connections += 1
+            server.open += 1
+            server.max_open = max(server.max_open, server.open)
+        try:
+            self.reply("220 localhost ESMTP")
+            self._session()
+        finally:
+            with server.lock:
+                server.open -= 1
+
+    def _session(self):
+        for raw in self.rfile:
+            command = raw.decode().strip()
+            verb = command.split(" ", 1)[0].upper()
+            if verb == "EHLO":
+                self.reply("250-localhost")
+                self.reply("250 AUTH PLAIN LOGIN")
+            elif verb == "AUTH":
+                self.reply("235 Authenticated")
+            elif verb == "RCPT" and "refused" in command:
+                self.reply("550 No such user")
+            elif verb in ("MAIL", "RCPT", "RSET"):
+                self.reply("250 OK")
+            elif verb == "NOOP":
+                if self.server.drop_on_noop:
+                    return
+                self.reply("250 OK")
+            elif verb == "DATA":
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                for line in self.rfile:
+                    if line == b".\r\n":
+                        break
+                with self.server.lock:
+                    self.server.messages += 1
+                self.reply("250 Queued")
+                if self.server.drop_after_data:
+                    return
+            elif verb == "QUIT":
+                self.reply("221 Bye")
+                return
+            else:
+                self.reply("502 Not implemented")
+
+
+class FakeSMTPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), FakeSMTPHandler)
+        self.lock = threading.Lock()
+        self.connections = self.open = self.max_open = self.messages = 0
+        self.drop_on_noop = self.drop_after_data = False
+
+
+class EmailServicePoolTests(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeSMTPServer()
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.service = EmailService()
+        self.service.smtp_host, self.service.smtp_port = (
+            self.server.server_address
+        )
+        self.service.smtp_user = "mailer"
+        self.service.smtp_password = "secret"
+        self.service.use_tls = self.service.use_ssl = False
+
+    def tearDown(self):
+        self.service.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _emails(self, count, prefix="user"):
+        return [
+            OutgoingEmail(f"{prefix}{i}@example.com", "Hello", "Body")
+            for i in range(count)
+        ]
+
+    def test_send_many_reuses_one_session(self):
+        results = self.service.send_many(self._emails(20))
+        self.assertTrue(self.service.send_email("late@example.com", "Hi", "B"))
+
+        self.assertEqual(results, [True] * 20)
+        self.assertEqual(self.server.messages, 21)
+        self.assertEqual(self.server.connections, 1)
+
+    def test_refused_recipient_fails_only_its_message(self):
+        emails = self._emails(2)
+        emails.insert(1, OutgoingEmail("refused@example.com", "Hi", "B"))
+
+        self.assertEqual(self.service.send_many(emails), [True, False, True])
+        self.assertEqual(self.server.messages, 2)
+        self.assertEqual(self.server.connections, 1)
+
+    def test_dropped_session_is_reopened(self):
+        self.server.drop_after_data = True
+
+        self.assertEqual(self.service.send_many(self._emails(3)), [True] * 3)
+        self.assertEqual(self.server.messages, 3)
+        self.assertEqual(self.server.connections, 3)
+
+    def test_idle_session_is_checked_with_noop(self):
+        self.service.pool.noop_after = 0
+        self.assertTrue(self.service.send_email("a@example.com", "Hi", "B"))
+        self.server.drop_on_noop = True
+
+        self.assertTrue(self.service.send_email("b@example.com", "Hi", "B"))
+        self.assertEqual(self.server.messages, 2)
+        self.assertEqual(self.server.connections, 2)
+
+    def test_concurrent_senders_share_a_capped_pool(self):
+        self.service.pool = type(self.service.pool)(
+            self.service._open_connection, max_connections=2
+        )
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(
+                lambda email: self.service.send_many([email]),
+                self._emails(40),
+            ))
+
+        self.assertEqual(results, [[True]] * 40)
+        self.assertEqual(self.server.messages, 40)
+        self.assertLessEqual(self.server.max_open, 2)
+        self.assertLessEqual(self.server.connections, 2)
+
+    def test_unreachable_server_fails_every_message(self):
+        self.service.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+        self.assertEqual(self.service.send_many(self._emails(3)), [False] * 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,237 @@
+import os
+import unittest
+from datetime import datetime, timedelta
+from unittest import mock
+
+os.environ.setdefault("DEBUG", "false")
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+
+from sqlalchemy import event  # noqa: E402
+
+from app.core.database import SessionLocal, engine  # noqa: E402
+from app.domain.models import Base, User  # noqa: E402
+from app.repositories.notification_repository import (  # noqa: E402
+    NotificationDeliveryRepository,
+)
+from app.services.email_orchestrator import SendResult  # noqa: E402
+from app.services.notification_preference_service import (  # noqa: E402
+    notification_preference_service,
+)
+from app.services.notification_service import (  # noqa: E402
+    NotificationRecipient,
+    notification_service,
+)
+from app.workers.notifications import NotificationWorker  # noqa: E402
+
+
+@mock.patch("app.services.notification_service.settings.NOTIFICATION_OUTBOX", True)
+class NotificationOutboxTests(unittest.TestCase):
+    def setUp(self):
+        Base.metadata.drop_all(bind=engine)
+        Base.metadata.create_all(bind=engine)
+        self.db = SessionLocal()
+        user = User(
+            email="outbox@example.com", username="outbox",
+            password_hash="secret",
+        )
+        self.db.add(user)
+        self.db.commit()
+        self.user_id = user.id
+        notification_preference_service.initialize_notification_types(self.db)
+        self.repo = NotificationDeliveryRepository()
+        # SQLite in memory shares one connection: send sequentially.
+        self.worker = NotificationWorker(
+            concurrency=1, max_attempts=2, retry_base=60
+        )
+        send = mock.patch.object(
+            notification_service.email_orchestrator, "send_template",
+            return_value=SendResult(success=True, message_id="smtp-1"),
+        )
+        self.send_template = send.start()
+        self.addCleanup(send.stop)
+
+    def tearDown(self):
+        self.db.close()
+
+    def _dispatch(self):
+        return notification_service.dispatch_notification(
+            self.db,
+            notification_type="team_invitation",
+            user_id=self.user_id,
+            title="Invite",
+            message="Join the team",
+            language="de",
+            variables={"team_name": "Outbox"},
+            requested_channels=["email", "in_app"],
+        )
+
+    def _email(self, notification_id):
+        self.db.expire_all()
+        return self.repo.get_for_channel(self.db, notification_id, "email")
+
+    def test_dispatch_queues_email_without_sending(self):
+        dispatch = self._dispatch()
+
+        self.send_template.assert_not_called()
+        self.assertEqual(dispatch.deliveries["email"].status, "pending")
+        email = self._email(dispatch.notification.id)
+        self.assertEqual(email.status, "pending")
+        self.assertEqual(email.attempt_count, 0)
+        self.assertEqual(email.payload, {
+            "language": "de", "variables": {"team_name": "Outbox"},
+        })
+        in_app = self.repo.get_for_channel(
+            self.db, dispatch.notification.id, "in_app"
+        )
+        self.assertEqual(in_app.status, "delivered")
+        self.assertIsNone(in_app.next_attempt_at)
+
+    def test_worker_sends_queued_delivery_once(self):
+        notification_id = self._dispatch().notification.id
+
+        self.assertEqual(self.worker.run_once(), 1)
+        self.assertEqual(self.worker.run_once(), 0)
+
+        self.send_template.assert_called_once()
+        context = self.send_template.call_args.kwargs["context"]
+        self.assertEqual(context.language, "de")
+        email = self._email(notification_id)
+        self.assertEqual(email.status, "delivered")
+        self.assertEqual(email.provider_message_id, "smtp-1")
+        self.assertEqual(email.attempt_count, 1)
+
+    def test_failures_back_off_then_give_up(self):
+        notification_id = self._dispatch().notification.id
+        self.send_template.return_value = SendResult(
+            success=False, error="SMTP unavailable"
+        )
+
+        self.worker.run_once()
+        email = self._email(notification_id)
+        self.assertEqual(email.status, "pending")
+        self.assertEqual(email.error, "SMTP unavailable")
+        self.assertGreater(
+            email.next_attempt_at, datetime.utcnow() + timedelta(seconds=30)
+        )
+        # Not due yet
+        self.assertEqual(self.worker.run_once(), 0)
+
+        email.next_attempt_at = datetime.utcnow()
+        self.db.commit()
+        self.worker.run_once()
+        email = self._email(notification_id)
+        self.assertEqual(email.status, "failed")
+        self.assertEqual(email.attempt_count, 2)
+        self.assertEqual(self.send_template.call_count, 2)
+
+    def test_claimed_deliveries_are_not_claimed_again_until_lease_expires(self):
+        notification_id = self._dispatch().notification.id
+
+        claimed = self.repo.claim_due(self.db, limit=10, lease_seconds=300)
+        self.assertEqual(len(claimed), 1)
+        self.assertEqual(
+            self.repo.claim_due(self.db, limit=10, lease_seconds=300), []
+        )
+
+        email = self._email(notification_id)
+        self.assertEqual(email.status, "sending")
+        email.next_attempt_at = datetime.utcnow() - timedelta(seconds=1)
+        self.db.commit()
+        self.assertEqual(
+            self.repo.claim_due(self.db, limit=10, lease_seconds=300),
+            claimed,
+        )
+
+    def _bulk_users(self, count):
+        users = [
+            User(email=f"bulk{i}@example.com", username=f"bulk{i}",
+                 password_hash="secret")
+            for i in range(count)
+        ]
+        self.db.add_all(users)
+        self.db.commit()
+        return [self.user_id] + [user.id for user in users]
+
+    def _dispatch_bulk(self, user_ids):
+        return notification_service.dispatch_bulk(
+            self.db,
+            "team_invitation",
+            [
+                NotificationRecipient(
+                    user_id=user_id, language="de",
+                    variables={"user_name": f"User {user_id}"},
+                )
+                for user_id in user_ids
+            ],
+            title="Invite",
+            message="Join the team",
+            variables={"team_name": "Outbox"},
+            requested_channels=["email", "in_app"],
+        )
+
+    def test_bulk_dispatch_inserts_everything_in_one_transaction(self):
+        user_ids = self._bulk_users(4)
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement.lower())
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            result = self._dispatch_bulk(user_ids)
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        inserts = [s for s in statements if s.startswith("insert")]
+        self.assertEqual(len(inserts), 3)
+        self.assertIn("user_notification_preferences", inserts[0])
+        self.assertIn("returning", inserts[1])
+        self.assertIn("returning", inserts[2])
+        self.send_template.assert_not_called()
+        self.assertEqual(sorted(result.notifications), sorted(user_ids))
+        user_id = user_ids[2]
+        self.assertEqual(result.deliveries[user_id]["email"].status, "pending")
+        self.assertEqual(
+            result.deliveries[user_id]["in_app"].status, "delivered"
+        )
+        notification_id = result.notifications[user_id]
+        email = self._email(notification_id)
+        self.assertEqual(email.payload, {
+            "language": "de",
+            "variables": {
+                "team_name": "Outbox", "user_name": f"User {user_id}",
+            },
+        })
+        in_app = self.repo.get_for_channel(
+            self.db, notification_id, "in_app"
+        )
+        self.assertEqual(in_app.status, "delivered")
+        self.assertEqual(in_app.attempt_count, 1)
+        self.assertEqual(len(notification_service.get_user_notifications(
+            self.db, user_id
+        )), 1)
+
+        self.assertEqual(self.worker.run_once(), 5)
+        self.assertEqual(self.send_template.call_count, 5)
+
+    def test_bulk_dispatch_sends_afterwards_without_outbox(self):
+        user_ids = self._bulk_users(2)
+
+        with mock.patch(
+            "app.services.notification_service.settings.NOTIFICATION_OUTBOX",
+            False,
+        ):
+            result = self._dispatch_bulk(user_ids)
+
+        self.assertEqual(self.send_template.call_count, 3)
+        for user_id in user_ids:
+            self.assertEqual(
+                result.deliveries[user_id]["email"].status, "delivered"
+            )
+            email = self._email(result.notifications[user_id])
+            self.assertEqual(email.provider_message_id, "smtp-1")
+            self.assertIsNone(email.next_attempt_at)
+
+
+if __name__ == "__main__":
+    unittest.main()
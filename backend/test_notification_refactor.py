@@ -4,13 +4,20 @@ import unittest
 os.environ.setdefault("DEBUG", "false")
 os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
 
+from sqlalchemy import event  # noqa: E402
+
 from app.core.database import SessionLocal, engine  # noqa: E402
-from app.domain.models import Base, User  # noqa: E402
+from app.domain.models import (  # noqa: E402
+    Base, PushSubscription, User, UserNotificationPreference
+)
 from app.repositories.notification_repository import (  # noqa: E402
     NotificationDeliveryRepository,
     NotificationPreferenceRepository,
 )
 from app.services.in_app_notification_service import InAppNotificationService  # noqa: E402
+from app.services.notification_eligibility_service import (  # noqa: E402
+    notification_eligibility_service,
+)
 from app.services.notification_preference_service import (  # noqa: E402
     notification_preference_service,
 )
@@ -75,6 +82,52 @@ class NotificationRefactorTests(unittest.TestCase):
         self.assertNotIn("push", channels)
         self.assertIn("in_app", channels)
 
+    def test_bulk_channels_match_single_user_resolution(self):
+        others = [
+            User(email=f"bulk{i}@example.com", username=f"bulk{i}",
+                 password_hash="secret")
+            for i in range(3)
+        ]
+        self.db.add_all(others)
+        self.db.commit()
+        user_ids = [self.user.id] + [user.id for user in others]
+        self.db.add(PushSubscription(
+            user_id=others[0].id, endpoint="https://push.example.com/a",
+            p256dh="key", auth="auth",
+        ))
+        self.db.commit()
+        notification_settings_service.update_settings(
+            self.db, others[1].id, {"channels": {"email": False}}
+        )
+
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement.lower())
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            bulk = notification_eligibility_service.get_allowed_channels_bulk(
+                self.db, user_ids, "hackathon_start_reminder"
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        self.assertEqual(len(statements), 3)
+        self.assertTrue(statements[-1].startswith("insert"))
+        self.assertEqual(
+            self.db.query(UserNotificationPreference).count(), 4
+        )
+        self.assertEqual(bulk, {
+            user_id: notification_eligibility_service.get_allowed_channels(
+                self.db, user_id, "hackathon_start_reminder"
+            )
+            for user_id in user_ids
+        })
+        self.assertIn("push", bulk[others[0].id])
+        self.assertNotIn("push", bulk[self.user.id])
+        self.assertNotIn("email", bulk[others[1].id])
+
     def test_global_enabled_requires_all_type_flags(self):
         settings = notification_settings_service.get_settings(self.db, self.user.id)
         self.assertTrue(settings["global_enabled"])
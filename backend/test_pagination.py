@@ -0,0 +1,218 @@
+import os
+import unittest
+from datetime import datetime, timedelta, timezone
+
+os.environ.setdefault("DEBUG", "false")
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.core.auth import create_tokens  # noqa: E402
+from app.core.database import SessionLocal, engine  # noqa: E402
+from app.domain.models import (  # noqa: E402
+    Base, Comment, Hackathon, Project, User, UserNotification
+)
+from app.main import app  # noqa: E402
+from app.repositories.hackathon_repository import (  # noqa: E402
+    HackathonRepository,
+)
+from app.utils.cache import cache_manager  # noqa: E402
+from app.utils.pagination import (  # noqa: E402
+    NEXT_CURSOR_HEADER, Keyset, decode_cursor, encode_cursor
+)
+
+
+class CursorEncodingTests(unittest.TestCase):
+    def test_round_trip(self):
+        created = datetime(2026, 3, 1, 12, 30, tzinfo=timezone.utc)
+        self.assertEqual(
+            decode_cursor(encode_cursor(created, 42)), Keyset(created, 42)
+        )
+        self.assertEqual(decode_cursor(encode_cursor(None, 7)), (None, 7))
+
+    def test_garbage_is_rejected(self):
+        for cursor in ("", "not-a-cursor", encode_cursor("x", "1")):
+            with self.assertRaises(ValueError):
+                decode_cursor(cursor)
+
+
+class PaginationTestCase(unittest.TestCase):
+    def setUp(self):
+        Base.metadata.drop_all(bind=engine)
+        Base.metadata.create_all(bind=engine)
+        cache_manager.clear()
+        self.db = SessionLocal()
+        self.user = User(
+            email="pages@example.com",
+            username="pager",
+            password_hash="secret",
+        )
+        self.db.add(self.user)
+        self.db.commit()
+        self.client = TestClient(app)
+
+    def tearDown(self):
+        self.client.close()
+        self.db.close()
+        cache_manager.clear()
+
+    def _walk(self, path, limit, key=None, **params):
+        """Follow cursors until the last page; return all ids in order."""
+        ids, cursor, pages = [], None, 0
+        while True:
+            query = dict(params, limit=limit)
+            if cursor:
+                query["cursor"] = cursor
+            response = self.client.get(path, params=query, **self._auth())
+            self.assertEqual(response.status_code, 200)
+            body = response.json()
+            items = body[key] if key else body
+            ids.extend(item["id"] for item in items)
+            pages += 1
+            cursor = (
+                body.get("next_cursor") if key
+                else response.headers.get(NEXT_CURSOR_HEADER)
+            )
+            if not cursor:
+                return ids, pages
+
+    def _auth(self):
+        token = create_tokens(self.user.id, self.user.username)[
+            "access_token"
+        ]
+        return {"headers": {"Authorization": f"Bearer {token}"}}
+
+
+class KeysetPaginationApiTests(PaginationTestCase):
+    def test_projects_with_identical_timestamps_page_without_gaps(self):
+        # All rows share one created_at second: only the id breaks ties.
+        self.db.add_all([
+            Project(title=f"P{i}", owner_id=self.user.id, is_public=True)
+            for i in range(7)
+        ])
+        self.db.commit()
+        expected = [
+            p.id for p in self.db.query(Project).order_by(
+                Project.created_at.desc(), Project.id.desc()
+            )
+        ]
+
+        ids, pages = self._walk("/api/projects", limit=3)
+
+        self.assertEqual(ids, expected)
+        self.assertEqual(pages, 3)
+
+    def test_invalid_cursor_is_a_bad_request(self):
+        response = self.client.get("/api/projects?cursor=%%%")
+        self.assertEqual(response.status_code, 400)
+
+    def _hackathon(self, name, start_date):
+        return Hackathon(
+            name=name, description="d", location="Flensburg",
+            start_date=start_date, end_date=start_date, is_active=True,
+        )
+
+    def test_hackathons_page_by_start_date(self):
+        start = datetime(2026, 5, 1, tzinfo=timezone.utc)
+        self.db.add_all([
+            self._hackathon("Early", start),
+            self._hackathon("Late", start + timedelta(days=9)),
+            self._hackathon("Same", start),
+        ])
+        self.db.commit()
+        by_name = {h.name: h.id for h in self.db.query(Hackathon)}
+
+        ids, _ = self._walk("/api/hackathons", limit=1)
+
+        self.assertEqual(
+            ids, [by_name["Late"], by_name["Same"], by_name["Early"]]
+        )
+
+    def test_undated_hackathons_come_last(self):
+        start = datetime(2026, 5, 1, tzinfo=timezone.utc)
+        self.db.add_all([
+            Hackathon(name="Undated", is_active=True),
+            self._hackathon("Dated", start),
+            Hackathon(name="Undated too", is_active=True),
+        ])
+        self.db.commit()
+        repo = HackathonRepository()
+
+        names, after = [], None
+        while True:
+            page = repo.get_active_hackathons(self.db, limit=1, after=after)
+            if not page:
+                break
+            names.append(page[0].name)
+            after = Keyset(page[0].start_date, page[0].id)
+
+        self.assertEqual(names, ["Dated", "Undated too", "Undated"])
+
+    def test_comment_pages_carry_their_replies(self):
+        project = Project(title="Talk", owner_id=self.user.id)
+        self.db.add(project)
+        self.db.commit()
+        roots = [
+            Comment(content=f"root {i}", user_id=self.user.id,
+                    project_id=project.id)
+            for i in range(3)
+        ]
+        self.db.add_all(roots)
+        self.db.commit()
+        reply = Comment(content="reply", user_id=self.user.id,
+                        project_id=project.id, parent_id=roots[0].id)
+        self.db.add(reply)
+        self.db.commit()
+        self.db.add(Comment(content="nested", user_id=self.user.id,
+                            project_id=project.id, parent_id=reply.id))
+        self.db.commit()
+
+        first = self.client.get(
+            f"/api/projects/{project.id}/comments?limit=2"
+        ).json()
+        second = self.client.get(
+            f"/api/projects/{project.id}/comments",
+            params={"limit": 2, "cursor": first["next_cursor"]},
+        ).json()
+
+        self.assertEqual(
+            [c["content"] for c in first["comments"]], ["root 2", "root 1"]
+        )
+        self.assertEqual(
+            [c["content"] for c in second["comments"]], ["root 0"]
+        )
+        self.assertIsNone(second["next_cursor"])
+        replies = second["comments"][0]["replies"]
+        self.assertEqual(replies[0]["content"], "reply")
+        self.assertEqual(replies[0]["replies"][0]["content"], "nested")
+
+
+class NotificationPaginationTests(PaginationTestCase):
+    def test_notification_feed_pages(self):
+        self.db.add_all([
+            UserNotification(
+                user_id=self.user.id,
+                notification_type="system_announcement",
+                title=f"N{i}",
+                message="m",
+            )
+            for i in range(5)
+        ])
+        self.db.commit()
+        expected = [
+            n.id for n in self.db.query(UserNotification).order_by(
+                UserNotification.id.desc()
+            )
+        ]
+
+        feed, _ = self._walk("/api/notifications", limit=2)
+        in_app, _ = self._walk(
+            "/api/notifications/in-app/list", limit=2, key="notifications"
+        )
+
+        self.assertEqual(feed, expected)
+        self.assertEqual(in_app, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
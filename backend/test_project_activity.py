@@ -0,0 +1,140 @@
+import os
+import unittest
+from datetime import datetime, timedelta, timezone
+
+os.environ.setdefault("DEBUG", "false")
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+
+from app.core.database import SessionLocal, engine  # noqa: E402
+from app.core.auth import create_tokens  # noqa: E402
+from app.domain.models import Base, Comment, Project, User, Vote  # noqa: E402
+from app.main import app  # noqa: E402
+from app.repositories.project_repository import (  # noqa: E402
+    CommentRepository, ProjectRepository
+)
+from app.utils.cache import cache_manager  # noqa: E402
+from app.utils.project_engagement import calculate_engagement  # noqa: E402
+
+
+class ProjectActivityTests(unittest.TestCase):
+    def setUp(self):
+        Base.metadata.drop_all(bind=engine)
+        Base.metadata.create_all(bind=engine)
+        cache_manager.clear()
+        self.db = SessionLocal()
+        self.user = User(
+            email="activity@example.com",
+            username="activity",
+            password_hash="secret",
+        )
+        self.db.add(self.user)
+        self.db.commit()
+        self.project = Project(
+            title="Active", owner_id=self.user.id, is_public=True
+        )
+        self.db.add(self.project)
+        self.db.commit()
+        self.project_id = self.project.id
+        self.client = TestClient(app)
+        token = create_tokens(self.user.id, self.user.username)
+        self.headers = {"Authorization": f"Bearer {token['access_token']}"}
+
+    def tearDown(self):
+        self.client.close()
+        self.db.close()
+        cache_manager.clear()
+
+    def _reload(self):
+        self.db.expire_all()
+        return self.db.get(Project, self.project_id)
+
+    def test_comments_update_count_and_activity(self):
+        comments = CommentRepository()
+        root = comments.create(self.db, obj_in={
+            "content": "Nice", "project_id": self.project_id,
+            "user_id": self.user.id,
+        })
+        comments.create(self.db, obj_in={
+            "content": "Thanks", "project_id": self.project_id,
+            "user_id": self.user.id, "parent_id": root.id,
+        })
+
+        project = self._reload()
+        self.assertEqual(project.comment_count, 2)
+        self.assertIsNotNone(project.last_activity_at)
+        self.assertEqual(project.engagement_score, 30 + 10)
+
+        comments.delete(self.db, id=root.id)
+        project = self._reload()
+        self.assertEqual(project.comment_count, 0)
+        self.assertEqual(project.engagement_score, 10)
+
+    def test_vote_updates_stored_engagement(self):
+        response = self.client.post(
+            f"/api/projects/{self.project_id}/vote",
+            json={"vote_type": "upvote"},
+            headers=self.headers,
+        )
+        self.assertEqual(response.status_code, 200)
+
+        project = self._reload()
+        self.assertEqual(project.upvote_count, 1)
+        self.assertEqual(project.engagement_score, 12 + 10)
+        # One interaction without views is a high interaction rate.
+        self.assertEqual(project.engagement_level, "high")
+
+    def test_listing_reads_stored_columns_without_aggregates(self):
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement.lower())
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            response = self.client.get("/api/projects")
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()[0]["title"], "Active")
+        self.assertFalse(any("group by" in s for s in statements))
+
+    def test_rebuild_fills_existing_rows(self):
+        voted_at = datetime.now(timezone.utc) - timedelta(days=20)
+        self.db.add(Vote(
+            user_id=self.user.id, project_id=self.project_id,
+            vote_type="upvote", created_at=voted_at,
+        ))
+        self.db.add(Comment(
+            content="Old", user_id=self.user.id,
+            project_id=self.project_id, created_at=voted_at,
+        ))
+        self.db.commit()
+        self.db.query(Project).update({
+            Project.created_at: voted_at - timedelta(days=40),
+            Project.updated_at: None,
+            Project.upvote_count: 1,
+        })
+        self.db.commit()
+
+        rebuilt = ProjectRepository().rebuild_activity(self.db, batch_size=1)
+
+        project = self._reload()
+        self.assertEqual(rebuilt, 1)
+        self.assertEqual(project.comment_count, 1)
+        self.assertEqual(
+            project.last_activity_at.replace(tzinfo=timezone.utc), voted_at
+        )
+        score, _, level = calculate_engagement(1, 1, 0, voted_at)
+        self.assertEqual(
+            (project.engagement_score, project.engagement_level),
+            (score, level),
+        )
+        self.assertEqual(score, 12 + 15 + 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
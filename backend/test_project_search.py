@@ -0,0 +1,107 @@
+import os
+import unittest
+
+os.environ.setdefault("DEBUG", "false")
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+
+from sqlalchemy import update  # noqa: E402
+
+from app.core.database import SessionLocal, engine  # noqa: E402
+from app.domain.models import Base, Project, User  # noqa: E402
+from app.repositories.project_repository import (  # noqa: E402
+    ProjectRepository, _detect_search_backend,
+)
+
+
+class ProjectSearchTests(unittest.TestCase):
+    def setUp(self):
+        Base.metadata.drop_all(bind=engine)
+        Base.metadata.create_all(bind=engine)
+        self.db = SessionLocal()
+        self.repo = ProjectRepository()
+        owner = User(
+            email="search@example.com",
+            username="searcher",
+            password_hash="secret",
+        )
+        self.db.add(owner)
+        self.db.commit()
+        self.owner_id = owner.id
+
+    def tearDown(self):
+        self.db.close()
+
+    def _project(self, title, description="", technologies="", public=True):
+        project = Project(
+            title=title,
+            description=description,
+            technologies=technologies,
+            owner_id=self.owner_id,
+            is_public=public,
+        )
+        self.db.add(project)
+        self.db.commit()
+        return project
+
+    def _titles(self, term):
+        return [p.title for p in self.repo.search_projects(self.db, term)]
+
+    def test_sqlite_uses_fts5_index(self):
+        self.assertEqual(_detect_search_backend(self.db), "sqlite")
+
+    def test_results_are_ordered_by_relevance(self):
+        self._project("Weather station", description="Reads sensors")
+        self._project("Mapping", description="Shows the weather on a map")
+        self._project("Budget", technologies="python,weather")
+
+        self.assertEqual(
+            self._titles("weather"), ["Weather station", "Budget", "Mapping"]
+        )
+
+    def test_terms_match_as_prefixes_and_all_must_match(self):
+        self._project("Flood alerts", technologies="fastapi,postgres")
+        self._project("Flood map", technologies="vue")
+
+        self.assertEqual(self._titles("flo fast"), ["Flood alerts"])
+        self.assertEqual(self._titles("FLOOD"), ["Flood map", "Flood alerts"])
+
+    def test_index_follows_updates_and_deletes(self):
+        project = self._project("Bike counter")
+        project.title = "Parking sensor"
+        self.db.commit()
+
+        self.assertEqual(self._titles("bike"), [])
+        self.assertEqual(self._titles("parking"), ["Parking sensor"])
+
+        self.db.delete(project)
+        self.db.commit()
+        self.assertEqual(self._titles("parking"), [])
+
+    def test_counter_updates_leave_the_index_alone(self):
+        project = self._project("Bike counter")
+        sqlite = self.db.connection().connection.driver_connection
+        changes = sqlite.total_changes
+
+        self.db.execute(
+            update(Project).where(Project.id == project.id)
+            .values(view_count=Project.view_count + 1)
+        )
+
+        # Only the projects row; the FTS update trigger did not fire
+        self.assertEqual(sqlite.total_changes - changes, 1)
+        self.assertEqual(self._titles("bike"), ["Bike counter"])
+
+    def test_private_projects_are_excluded(self):
+        self._project("Secret tracker", public=False)
+        self._project("Open tracker")
+
+        self.assertEqual(self._titles("tracker"), ["Open tracker"])
+
+    def test_terms_without_tokens_fall_back_to_substring_match(self):
+        self._project("C++ toolkit")
+
+        self.assertEqual(self._titles("++"), ["C++ toolkit"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+import os
+import unittest
+
+os.environ.setdefault("DEBUG", "false")
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.core.database import SessionLocal, engine  # noqa: E402
+from app.domain.models import (  # noqa: E402
+    Base, Project, ProjectTechnology, Technology, User
+)
+from app.domain.models.project import normalize_technologies  # noqa: E402
+from app.main import app  # noqa: E402
+from app.repositories.project_repository import ProjectRepository  # noqa: E402
+from app.utils.cache import cache_manager  # noqa: E402
+
+
+class ProjectTechnologyTests(unittest.TestCase):
+    def setUp(self):
+        Base.metadata.drop_all(bind=engine)
+        Base.metadata.create_all(bind=engine)
+        cache_manager.clear()
+        self.db = SessionLocal()
+        self.repo = ProjectRepository()
+        owner = User(
+            email="tags@example.com",
+            username="tagger",
+            password_hash="secret",
+        )
+        self.db.add(owner)
+        self.db.commit()
+        self.owner_id = owner.id
+
+    def tearDown(self):
+        self.db.close()
+        cache_manager.clear()
+
+    def _project(self, title, technologies, public=True):
+        project = Project(
+            title=title,
+            technologies=technologies,
+            owner_id=self.owner_id,
+            is_public=public,
+        )
+        self.db.add(project)
+        self.db.commit()
+        return project
+
+    def _titles(self, projects):
+        return sorted(p.title for p in projects)
+
+    def test_technologies_are_normalized(self):
+        self.assertEqual(
+            normalize_technologies(" Python,fastapi , PYTHON,,Vue  JS"),
+            ["python", "fastapi", "vue js"],
+        )
+
+    def test_tags_match_exactly(self):
+        self._project("Backend", "Java, Spring")
+        self._project("Frontend", "JavaScript,Vue")
+
+        self.assertEqual(
+            self._titles(self.repo.get_by_technology(self.db, "java")),
+            ["Backend"],
+        )
+
+    def test_and_or_filtering(self):
+        self._project("Both", "python,fastapi")
+        self._project("Python only", "python,django")
+        self._project("Other", "rust")
+        self._project("Hidden", "python,fastapi", public=False)
+
+        self.assertEqual(
+            self._titles(self.repo.get_by_technologies(
+                self.db, ["Python", "FastAPI"]
+            )),
+            ["Both"],
+        )
+        self.assertEqual(
+            self._titles(self.repo.get_by_technologies(
+                self.db, ["fastapi", "rust"], match_all=False
+            )),
+            ["Both", "Other"],
+        )
+
+    def test_index_follows_updates_and_deletes(self):
+        project = self._project("Tracker", "python")
+        project.technologies = "go"
+        self.db.commit()
+
+        self.assertEqual(self.repo.get_by_technology(self.db, "python"), [])
+        self.assertEqual(
+            self._titles(self.repo.get_by_technology(self.db, "go")),
+            ["Tracker"],
+        )
+
+        self.db.delete(project)
+        self.db.commit()
+        self.assertEqual(self.db.query(ProjectTechnology).count(), 0)
+        # The dictionary keeps tags for reuse.
+        self.assertEqual(self.db.query(Technology).count(), 2)
+
+    def test_facet_counts_endpoint(self):
+        self._project("A", "python,fastapi")
+        self._project("B", "python,vue")
+        self._project("C", "rust")
+        self._project("Hidden", "python", public=False)
+
+        with TestClient(app) as client:
+            facets = client.get("/api/projects/technologies").json()
+            drill_down = client.get(
+                "/api/projects/technologies?technologies=fastapi"
+            ).json()
+            listing = client.get(
+                "/api/projects?technologies=fastapi,rust&match=any"
+            )
+
+        self.assertEqual(facets, [
+            {"name": "python", "count": 2},
+            {"name": "fastapi", "count": 1},
+            {"name": "rust", "count": 1},
+            {"name": "vue", "count": 1},
+        ])
+        self.assertEqual(drill_down, [
+            {"name": "fastapi", "count": 1},
+            {"name": "python", "count": 1},
+        ])
+        self.assertEqual(listing.status_code, 200)
+        self.assertEqual(
+            sorted(p["title"] for p in listing.json()), ["A", "C"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
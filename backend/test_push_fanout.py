@@ -0,0 +1,216 @@
+import base64
+import os
+import threading
+import unittest
+from unittest import mock
+
+os.environ.setdefault("DEBUG", "false")
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+
+import jwt  # noqa: E402
+from cryptography.hazmat.primitives.asymmetric import ec  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+
+from app.core.database import SessionLocal, engine  # noqa: E402
+from app.domain.models import Base, PushSubscription, User  # noqa: E402
+from app.services.push_notification_service import (  # noqa: E402
+    PushNotificationService,
+)
+
+FCM_TOKEN = "f" * 120
+DEAD_FCM_TOKEN = "d" * 120
+
+
+class FakeFirebaseProvider:
+    def __init__(self):
+        self.calls = []
+
+    def send_notification(self, device_tokens, **kwargs):
+        self.calls.append(list(device_tokens))
+        results = [
+            {"token": token, "success": token == FCM_TOKEN,
+             "message_id": "fcm-1" if token == FCM_TOKEN else None}
+            for token in device_tokens
+        ]
+        return {
+            "success_count": sum(r["success"] for r in results),
+            "failure_count": sum(not r["success"] for r in results),
+            "results": results,
+            "invalid_tokens": [DEAD_FCM_TOKEN],
+        }
+
+
+class RecordingPushService(PushNotificationService):
+    """WebPush sends fail for endpoints containing "gone"."""
+
+    def __init__(self):
+        super().__init__(vapid_private_key="x", vapid_public_key="y")
+        self.sent = []
+        self.lock = threading.Lock()
+
+    def _send_to_subscription(self, subscription, payload, ttl):
+        with self.lock:
+            self.sent.append(subscription.endpoint)
+        return "gone" not in subscription.endpoint
+
+
+class PushFanOutTests(unittest.TestCase):
+    def setUp(self):
+        Base.metadata.drop_all(bind=engine)
+        Base.metadata.create_all(bind=engine)
+        self.db = SessionLocal()
+        users = [
+            User(email=f"push{i}@example.com", username=f"push{i}",
+                 password_hash="secret")
+            for i in range(4)
+        ]
+        self.db.add_all(users)
+        self.db.commit()
+        self.user_ids = [user.id for user in users]
+        endpoints = {
+            users[0].id: ["https://push.example.com/a", FCM_TOKEN],
+            users[1].id: ["https://push.example.com/gone-b"],
+            users[2].id: ["https://push.example.com/c", DEAD_FCM_TOKEN],
+        }
+        self.db.add_all([
+            PushSubscription(user_id=user_id, endpoint=endpoint,
+                             p256dh="key", auth="auth")
+            for user_id, user_endpoints in endpoints.items()
+            for endpoint in user_endpoints
+        ])
+        self.db.commit()
+        self.firebase = FakeFirebaseProvider()
+        patcher = mock.patch(
+            "app.services.push_notification_service.firebase_provider",
+            self.firebase,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.service = RecordingPushService()
+
+    def tearDown(self):
+        self.db.close()
+
+    def _send_bulk(self):
+        return self.service.send_bulk_push_notifications(
+            self.db, self.user_ids, "hackathon_reminder", "Soon", "Tomorrow"
+        )
+
+    def test_bulk_send_reaches_every_endpoint(self):
+        results = self._send_bulk()
+
+        self.assertEqual(results, {"total": 4, "success": 2, "failed": 2})
+        self.assertEqual(sorted(self.service.sent), [
+            "https://push.example.com/a",
+            "https://push.example.com/c",
+            "https://push.example.com/gone-b",
+        ])
+        # All FCM tokens of the batch go out in one provider call
+        self.assertEqual(len(self.firebase.calls), 1)
+        self.assertEqual(
+            sorted(self.firebase.calls[0]), [DEAD_FCM_TOKEN, FCM_TOKEN]
+        )
+
+    def test_bulk_send_loads_and_prunes_in_one_query_each(self):
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement.lower())
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            self._send_bulk()
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        touching = [s for s in statements if "push_subscriptions" in s]
+        self.assertEqual(len(touching), 2)
+        self.assertTrue(touching[0].startswith("select"))
+        self.assertTrue(touching[1].startswith("delete"))
+        remaining = sorted(
+            endpoint for (endpoint,) in
+            self.db.query(PushSubscription.endpoint)
+        )
+        self.assertEqual(remaining, sorted([
+            "https://push.example.com/a",
+            "https://push.example.com/c",
+            FCM_TOKEN,
+        ]))
+
+    def test_single_user_delivery_keeps_fcm_message_id(self):
+        result = self.service.deliver(
+            self.db, user_id=self.user_ids[0],
+            notification_type="hackathon_reminder",
+            title="Soon", body="Tomorrow",
+        )
+
+        self.assertEqual(result.status, "delivered")
+        self.assertEqual(result.provider_message_id, "fcm-1")
+
+
+class VapidHeaderTests(unittest.TestCase):
+    def setUp(self):
+        keys = PushNotificationService("x", "y").generate_vapid_keys()
+        self.service = PushNotificationService(
+            keys["private_key"], keys["public_key"]
+        )
+
+    def _claims(self, header):
+        token = header.split("t=", 1)[1].split(",", 1)[0]
+        public_key = self.service._load_vapid_signing_key().public_key()
+        return jwt.decode(
+            token, public_key, algorithms=["ES256"],
+            audience="https://fcm.googleapis.com",
+        )
+
+    def test_header_is_signed_once_per_audience(self):
+        with mock.patch.object(
+            jwt, "encode", wraps=jwt.encode
+        ) as encode:
+            first = self.service._generate_vapid_auth_header(
+                "https://fcm.googleapis.com/fcm/send/a"
+            )
+            second = self.service._generate_vapid_auth_header(
+                "https://fcm.googleapis.com/fcm/send/b"
+            )
+            other = self.service._generate_vapid_auth_header(
+                "https://updates.push.services.mozilla.com/wpush/v2/c"
+            )
+
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, other)
+        self.assertEqual(encode.call_count, 2)
+        self.assertEqual(
+            self._claims(first)["aud"], "https://fcm.googleapis.com"
+        )
+
+    def test_header_is_signed_again_close_to_expiry(self):
+        endpoint = "https://fcm.googleapis.com/fcm/send/a"
+        first = self.service._generate_vapid_auth_header(endpoint)
+        expires_at = self._claims(first)["exp"]
+
+        with mock.patch(
+            "app.services.push_notification_service.time.time",
+            return_value=expires_at - 60,
+        ):
+            renewed = self.service._generate_vapid_auth_header(endpoint)
+
+        self.assertNotEqual(renewed, first)
+        self.assertGreater(self._claims(renewed)["exp"], expires_at)
+
+    def test_raw_private_key_is_accepted(self):
+        scalar = ec.generate_private_key(
+            ec.SECP256R1()
+        ).private_numbers().private_value.to_bytes(32, "big")
+        self.service.vapid_private_key = (
+            base64.urlsafe_b64encode(scalar).decode().rstrip("=")
+        )
+
+        key = self.service._load_vapid_signing_key()
+
+        self.assertEqual(key.private_numbers().private_value,
+                         int.from_bytes(scalar, "big"))
+
+
+if __name__ == "__main__":
+    unittest.main()
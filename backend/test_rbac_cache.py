@@ -0,0 +1,280 @@
+import os
+import unittest
+from datetime import datetime, timedelta, timezone
+
+os.environ.setdefault("DEBUG", "false")
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+
+from app.core.auth import create_tokens  # noqa: E402
+from app.core.database import SessionLocal, engine  # noqa: E402
+from fastapi import HTTPException  # noqa: E402
+
+from app.core.permissions import (  # noqa: E402
+    ALL_PERMISSIONS_MASK, PERMISSION_BITS, PERMISSION_CODES,
+    RBAC_QUERIES_HEADER, ROLE_PERMISSION_MAP, ROLE_PERMISSION_MASKS,
+    AccessContext, can_delete_project, can_manage_project,
+    can_manage_project_reports, can_review_report, can_review_team_report,
+    get_user_access_context, require_any_permission, resolve_ownership,
+    start_rbac_query_stats, user_has_permission,
+)
+from app.domain.models import (  # noqa: E402
+    Base, Hackathon, Permission, Project, Report, Role, RolePermission, Team,
+    TeamMember, TeamReport, User, UserRole
+)
+from app.main import app  # noqa: E402
+from app.repositories.rbac_repository import UserRoleRepository  # noqa: E402
+from app.utils.cache import cache_manager  # noqa: E402
+
+
+class RBACCacheTests(unittest.TestCase):
+    def setUp(self):
+        Base.metadata.drop_all(bind=engine)
+        Base.metadata.create_all(bind=engine)
+        cache_manager.clear()
+        self.db = SessionLocal()
+        self.user = User(
+            email="rbac@example.com", username="rbac", password_hash="secret"
+        )
+        self.owner = User(
+            email="owner@example.com", username="owner",
+            password_hash="secret",
+        )
+        self.admin_role = Role(name="admin", description="admin")
+        delete_any = Permission(
+            code=PERMISSION_CODES["projects_delete_any"],
+            resource="projects", action="delete_any",
+        )
+        self.db.add_all([self.user, self.owner, self.admin_role, delete_any])
+        self.db.commit()
+        self.db.add(RolePermission(
+            role_id=self.admin_role.id, permission_id=delete_any.id
+        ))
+        self.db.commit()
+        self.project = Project(title="Owned", owner_id=self.owner.id)
+        self.db.add(self.project)
+        self.db.commit()
+
+    def tearDown(self):
+        self.db.close()
+        cache_manager.clear()
+
+    def test_checks_within_a_request_share_one_query(self):
+        stats = start_rbac_query_stats()
+        for _ in range(4):
+            user_has_permission(
+                self.db, self.user, PERMISSION_CODES["projects_update_any"]
+            )
+        can_delete_project(self.db, self.user, self.project)
+        self.assertEqual(stats.queries, 1)
+
+    def test_access_is_shared_across_requests(self):
+        stats = start_rbac_query_stats()
+        get_user_access_context(self.db, self.user)
+        other = SessionLocal()
+        try:
+            access = get_user_access_context(other, self.user)
+        finally:
+            other.close()
+        self.assertEqual(stats.queries, 1)
+        self.assertEqual(access.roles, ["user"])
+
+    def test_setting_roles_invalidates_cached_access(self):
+        code = PERMISSION_CODES["projects_delete_any"]
+        self.assertFalse(user_has_permission(self.db, self.user, code))
+
+        UserRoleRepository().set_user_roles(
+            self.db, self.user.id, [self.admin_role]
+        )
+
+        other = SessionLocal()
+        try:
+            self.assertTrue(user_has_permission(other, self.user, code))
+            self.assertTrue(user_has_permission(self.db, self.user, code))
+        finally:
+            other.close()
+
+    def test_direct_role_edits_are_visible_after_invalidation_only(self):
+        code = PERMISSION_CODES["projects_delete_any"]
+        self.assertFalse(user_has_permission(self.db, self.user, code))
+        self.db.add(UserRole(user_id=self.user.id, role_id=self.admin_role.id))
+        self.db.commit()
+
+        other = SessionLocal()
+        try:
+            self.assertFalse(user_has_permission(other, self.user, code))
+        finally:
+            other.close()
+
+    def test_response_reports_rbac_queries(self):
+        token = create_tokens(self.user.id, self.user.username)
+        with TestClient(app) as client:
+            response = client.delete(
+                f"/api/projects/{self.project.id}",
+                headers={
+                    "Authorization": f"Bearer {token['access_token']}"
+                },
+            )
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(response.headers[RBAC_QUERIES_HEADER], "1")
+
+
+class PermissionBitsetTests(unittest.TestCase):
+    def test_each_catalogued_permission_has_its_own_bit(self):
+        bits = list(PERMISSION_BITS.values())
+        self.assertEqual(len(bits), len(set(PERMISSION_CODES.values())))
+        self.assertEqual(len(set(bits)), len(bits))
+        self.assertEqual(ALL_PERMISSIONS_MASK, (1 << len(bits)) - 1)
+
+    def test_role_masks_match_role_permission_map(self):
+        for role, codes in ROLE_PERMISSION_MAP.items():
+            access = AccessContext(roles=[role], permissions=sorted(codes))
+            self.assertEqual(access.permission_mask, ROLE_PERMISSION_MASKS[role])
+            for code in PERMISSION_CODES.values():
+                self.assertEqual(access.allows(code), code in codes)
+
+    def test_superuser_and_uncatalogued_codes(self):
+        superuser = AccessContext(roles=["superuser"], permissions=[])
+        self.assertEqual(superuser.permission_mask, ALL_PERMISSIONS_MASK)
+        self.assertTrue(superuser.allows("custom:thing"))
+
+        custom = AccessContext(roles=["user"], permissions=["custom:thing"])
+        self.assertEqual(custom.permission_mask, 0)
+        self.assertTrue(custom.allows("custom:thing"))
+        self.assertFalse(custom.allows(PERMISSION_CODES["rbac_view"]))
+
+    def test_require_any_permission_checks_the_mask(self):
+        dependency = require_any_permission([
+            PERMISSION_CODES["reports_view"], PERMISSION_CODES["rbac_view"]
+        ])
+        db = SessionLocal()
+        try:
+            user = User(id=1, username="mod")
+            db.info["rbac_access"] = {1: AccessContext(
+                roles=["moderator"],
+                permissions=[PERMISSION_CODES["rbac_view"]],
+            )}
+            self.assertIs(dependency(db=db, current_user=user), user)
+            db.info["rbac_access"][1] = AccessContext(
+                roles=["user"], permissions=sorted(ROLE_PERMISSION_MAP["user"])
+            )
+            with self.assertRaises(HTTPException):
+                dependency(db=db, current_user=user)
+        finally:
+            db.close()
+
+
+class OwnershipResolverTests(unittest.TestCase):
+    def setUp(self):
+        Base.metadata.drop_all(bind=engine)
+        Base.metadata.create_all(bind=engine)
+        cache_manager.clear()
+        self.db = SessionLocal()
+        self.organizer, self.owner, self.lead, self.stranger = [
+            User(email=f"{name}@example.com", username=name,
+                 password_hash="secret")
+            for name in ("organizer", "owner", "lead", "stranger")
+        ]
+        self.db.add_all([self.organizer, self.owner, self.lead, self.stranger])
+        self.db.commit()
+        hackathon = Hackathon(
+            name="Hack", description="Ownership",
+            start_date=datetime.now(timezone.utc),
+            end_date=datetime.now(timezone.utc) + timedelta(days=1),
+            location="Flensburg", owner_id=self.organizer.id,
+        )
+        self.db.add(hackathon)
+        self.db.commit()
+        self.team = Team(
+            name="Team", hackathon_id=hackathon.id, created_by=self.owner.id
+        )
+        self.db.add(self.team)
+        self.db.commit()
+        self.project = Project(
+            title="Owned", owner_id=self.owner.id, team_id=self.team.id,
+            hackathon_id=hackathon.id,
+        )
+        self.team_report = TeamReport(
+            team_id=self.team.id, reporter_id=self.stranger.id, reason="spam"
+        )
+        self.db.add_all([
+            self.project, self.team_report,
+            TeamMember(team_id=self.team.id, user_id=self.lead.id,
+                       role="admin"),
+        ])
+        self.db.commit()
+        self.team_as_report = Report(
+            reporter_id=self.stranger.id, resource_type="team",
+            resource_id=self.team.id, reason="spam",
+        )
+        for user in (self.organizer, self.owner, self.lead, self.stranger):
+            get_user_access_context(self.db, user)
+        self.db.refresh(self.project)
+        self.db.refresh(self.team_report)
+        self.statements = []
+        event.listen(engine, "before_cursor_execute", self._record)
+
+    def tearDown(self):
+        event.remove(engine, "before_cursor_execute", self._record)
+        self.db.close()
+        cache_manager.clear()
+
+    def _record(self, conn, cursor, statement, *args):
+        self.statements.append(statement)
+
+    def test_project_chain_is_loaded_in_one_query(self):
+        ownership = resolve_ownership(
+            self.db, self.lead, project_id=self.project.id
+        )
+
+        self.assertEqual(len(self.statements), 1)
+        self.assertEqual(ownership.owner_id, self.owner.id)
+        self.assertEqual(ownership.team_role, "admin")
+        self.assertEqual(ownership.hackathon_owner_id, self.organizer.id)
+        self.assertTrue(ownership.leads_team)
+        self.assertFalse(ownership.owns_hackathon)
+
+    def test_project_checks_take_one_query(self):
+        self.assertTrue(can_manage_project(self.db, self.lead, self.project))
+        self.assertTrue(can_delete_project(self.db, self.lead, self.project))
+        self.assertTrue(can_manage_project_reports(
+            self.db, self.organizer, self.project.id
+        ))
+        self.assertFalse(can_manage_project(
+            self.db, self.stranger, self.project
+        ))
+
+        self.assertEqual(len(self.statements), 3)
+
+    def test_team_report_checks_take_one_query(self):
+        self.assertTrue(can_review_team_report(
+            self.db, self.organizer, self.team_report
+        ))
+        self.assertEqual(len(self.statements), 1)
+        self.assertTrue(can_review_report(
+            self.db, self.lead, self.team_as_report
+        ))
+        # The lead's context for the team is reused.
+        self.assertFalse(can_review_team_report(
+            self.db, self.lead, self.team_report
+        ))
+        self.assertEqual(len(self.statements), 2)
+
+    def test_writes_forget_resolved_ownership(self):
+        self.assertFalse(can_manage_project(
+            self.db, self.stranger, self.project
+        ))
+        self.db.add(TeamMember(
+            team_id=self.team.id, user_id=self.stranger.id, role="owner"
+        ))
+        self.db.commit()
+
+        self.assertTrue(can_manage_project(
+            self.db, self.stranger, self.project
+        ))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -23,12 +23,14 @@ from app.domain.models import (  # noqa: E402
     UserRole,
 )
 from app.main import app  # noqa: E402
+from app.utils.cache import cache_manager  # noqa: E402
 
 
 class RbacTeamReportTests(unittest.TestCase):
     def setUp(self):
         Base.metadata.drop_all(bind=engine)
         Base.metadata.create_all(bind=engine)
+        cache_manager.clear()
         self.db = SessionLocal()
 
         self.owner = User(
@@ -0,0 +1,225 @@
+import os
+import unittest
+from unittest import mock
+
+os.environ.setdefault("DEBUG", "false")
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+
+from app.core.auth import create_tokens, revoke_access_tokens  # noqa: E402
+from app.core.database import SessionLocal, engine  # noqa: E402
+from app.core.permissions import (  # noqa: E402
+    PERMISSION_CODES, RBAC_QUERIES_HEADER
+)
+from app.domain.models import (  # noqa: E402
+    Base, Permission, Project, Role, RolePermission, User
+)
+from app.main import app  # noqa: E402
+from app.repositories.rbac_repository import UserRoleRepository  # noqa: E402
+from app.repositories.user_repository import (  # noqa: E402
+    RefreshTokenRepository
+)
+from app.utils.cache import CacheManager, cache_manager  # noqa: E402
+
+
+class FakeRedis:
+    """In-memory stand-in for the Redis commands CacheManager uses."""
+
+    def __init__(self):
+        self.store = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def setex(self, key, ttl, value):
+        self.store[key] = value
+
+    def ttl(self, key):
+        return 60 if key in self.store else -2
+
+    def set(self, key, value, nx=False, px=None):
+        if nx and key in self.store:
+            return None
+        self.store[key] = value
+        return True
+
+    def eval(self, script, numkeys, key, token):
+        if self.store.get(key) == token:
+            del self.store[key]
+            return 1
+        return 0
+
+    def mget(self, keys):
+        return [self.store.get(key) for key in keys]
+
+    def incr(self, key):
+        self.store[key] = str(int(self.store.get(key) or 0) + 1)
+        return int(self.store[key])
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+    def delete(self, key):
+        self.store.pop(key, None)
+
+    def flushdb(self):
+        self.store.clear()
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def incr(self, key):
+        self.commands.append(key)
+
+    def execute(self):
+        return [self.redis.incr(key) for key in self.commands]
+
+
+@mock.patch("app.core.auth.STATELESS_ACCESS_TOKENS", True)
+class StatelessAccessTokenTests(unittest.TestCase):
+    def setUp(self):
+        Base.metadata.drop_all(bind=engine)
+        Base.metadata.create_all(bind=engine)
+        self.redis = FakeRedis()
+        for name, value in (("use_redis", True), ("redis_client", self.redis)):
+            patcher = mock.patch.object(cache_manager, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        cache_manager.clear()
+        self.db = SessionLocal()
+        user = User(
+            email="stateless@example.com", username="stateless",
+            password_hash="secret",
+        )
+        owner = User(
+            email="owner@example.com", username="owner",
+            password_hash="secret",
+        )
+        self.admin_role = Role(name="admin", description="admin")
+        delete_any = Permission(
+            code=PERMISSION_CODES["projects_delete_any"],
+            resource="projects", action="delete_any",
+        )
+        self.db.add_all([user, owner, self.admin_role, delete_any])
+        self.db.commit()
+        self.db.add(RolePermission(
+            role_id=self.admin_role.id, permission_id=delete_any.id
+        ))
+        project = Project(title="Owned", owner_id=owner.id)
+        self.db.add(project)
+        self.db.commit()
+        self.user_id, self.project_id = user.id, project.id
+        self.client = TestClient(app)
+        self.statements = []
+        event.listen(engine, "before_cursor_execute", self._record)
+
+    def tearDown(self):
+        event.remove(engine, "before_cursor_execute", self._record)
+        self.client.close()
+        self.db.close()
+        cache_manager.clear()
+
+    def _record(self, conn, cursor, statement, *args):
+        self.statements.append(statement)
+
+    def _user_queries(self):
+        return [
+            statement for statement in self.statements
+            if "FROM users" in statement or "user_roles" in statement
+        ]
+
+    def _headers(self):
+        token = create_tokens(self.user_id, "stateless", db=self.db)
+        return {"Authorization": f"Bearer {token['access_token']}"}
+
+    def test_permission_check_does_not_load_the_user(self):
+        headers = self._headers()
+        self.statements.clear()
+
+        response = self.client.delete(
+            f"/api/projects/{self.project_id}", headers=headers
+        )
+
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(response.headers[RBAC_QUERIES_HEADER], "0")
+        self.assertEqual(self._user_queries(), [])
+
+    def test_other_user_fields_are_loaded_on_demand(self):
+        response = self.client.get("/api/users/me", headers=self._headers())
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["email"], "stateless@example.com")
+        self.assertEqual(response.json()["roles"], ["user"])
+
+    def test_role_change_is_visible_to_issued_tokens(self):
+        headers = self._headers()
+        UserRoleRepository().set_user_roles(
+            self.db, self.user_id, [self.admin_role]
+        )
+
+        response = self.client.delete(
+            f"/api/projects/{self.project_id}", headers=headers
+        )
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_logout_revokes_issued_tokens(self):
+        headers = self._headers()
+        revoke_access_tokens(self.user_id)
+
+        response = self.client.get("/api/users/me", headers=headers)
+
+        self.assertEqual(response.status_code, 401)
+        fresh = self.client.get("/api/users/me", headers=self._headers())
+        self.assertEqual(fresh.status_code, 200)
+
+    def test_revoking_refresh_tokens_revokes_access_tokens(self):
+        headers = self._headers()
+        RefreshTokenRepository().revoke_all_for_user(self.db, self.user_id)
+
+        response = self.client.get("/api/users/me", headers=headers)
+
+        self.assertEqual(response.status_code, 401)
+
+    def test_revocation_reaches_other_workers(self):
+        headers = self._headers()
+        revoke_access_tokens(self.user_id)
+        other_worker = CacheManager()
+        other_worker.use_redis = True
+        other_worker.redis_client = self.redis
+
+        with mock.patch("app.core.auth.cache_manager", other_worker):
+            response = self.client.get("/api/users/me", headers=headers)
+
+        self.assertEqual(response.status_code, 401)
+
+    def test_without_redis_tokens_are_checked_against_the_database(self):
+        with mock.patch.object(cache_manager, "use_redis", False):
+            headers = self._headers()
+            self.db.query(User).filter(User.id == self.user_id).update(
+                {"is_active": False}
+            )
+            self.db.commit()
+
+            response = self.client.get("/api/users/me", headers=headers)
+
+        self.assertEqual(response.status_code, 401)
+        self.assertTrue(any("FROM users" in s for s in self.statements))
+
+    def test_tokens_without_claims_use_the_database(self):
+        with mock.patch("app.core.auth.STATELESS_ACCESS_TOKENS", False):
+            headers = self._headers()
+
+        response = self.client.get("/api/users/me", headers=headers)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["username"], "stateless")
+
+
+if __name__ == "__main__":
+    unittest.main()
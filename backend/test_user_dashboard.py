@@ -0,0 +1,158 @@
+import os
+import unittest
+from datetime import datetime, timedelta, timezone
+
+os.environ.setdefault("DEBUG", "false")
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+
+from app.core.auth import create_tokens  # noqa: E402
+from app.core.database import SessionLocal, engine  # noqa: E402
+from app.domain.models import (  # noqa: E402
+    Base, Hackathon, HackathonRegistration, Project, Team, TeamMember, User
+)
+from app.main import app  # noqa: E402
+from app.repositories.hackathon_repository import (  # noqa: E402
+    HackathonRegistrationRepository
+)
+from app.repositories.project_repository import (  # noqa: E402
+    CommentRepository, VoteRepository
+)
+from app.repositories.team_repository import TeamMemberRepository  # noqa: E402
+from app.utils.cache import cache_manager  # noqa: E402
+
+
+class UserDashboardTests(unittest.TestCase):
+    def setUp(self):
+        Base.metadata.drop_all(bind=engine)
+        Base.metadata.create_all(bind=engine)
+        cache_manager.clear()
+        self.db = SessionLocal()
+        user = User(
+            email="dash@example.com", username="dash", password_hash="secret"
+        )
+        self.db.add(user)
+        self.db.commit()
+        hackathons = [
+            Hackathon(
+                name=f"Hack {i}", description="Dashboard",
+                start_date=datetime.now(timezone.utc),
+                end_date=datetime.now(timezone.utc) + timedelta(days=1),
+                location="Flensburg", owner_id=user.id,
+            )
+            for i in range(4)
+        ]
+        self.db.add_all(hackathons)
+        self.db.commit()
+        teams = [
+            Team(name=f"Team {i}", hackathon_id=hackathon.id,
+                 created_by=user.id)
+            for i, hackathon in enumerate(hackathons)
+        ]
+        self.db.add_all(teams)
+        self.db.add_all([
+            Project(title=f"Project {i}", owner_id=user.id)
+            for i in range(12)
+        ])
+        self.db.commit()
+        self.db.add_all([
+            TeamMember(team_id=team.id, user_id=user.id, role="owner")
+            for team in teams[:3]
+        ] + [
+            HackathonRegistration(user_id=user.id, hackathon_id=hackathon.id)
+            for hackathon in hackathons[:3]
+        ])
+        self.db.commit()
+        self.user_id = user.id
+        self.project_id = self.db.query(Project.id).first()[0]
+        self.spare_team_id, self.spare_hackathon_id = (
+            teams[3].id, hackathons[3].id
+        )
+        token = create_tokens(user.id, user.username)["access_token"]
+        self.headers = {"Authorization": f"Bearer {token}"}
+        self.client = TestClient(app)
+        self.statements = []
+        event.listen(engine, "before_cursor_execute", self._record)
+
+    def tearDown(self):
+        event.remove(engine, "before_cursor_execute", self._record)
+        self.client.close()
+        self.db.close()
+        cache_manager.clear()
+
+    def _record(self, conn, cursor, statement, *args):
+        self.statements.append(statement)
+
+    def _me(self):
+        response = self.client.get("/api/me", headers=self.headers)
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_me_is_loaded_in_batches_and_cached(self):
+        me = self._me()
+        first = len(self.statements)
+        self.statements.clear()
+        self._me()
+
+        self.assertEqual(len(me["teams"]), 3)
+        self.assertEqual(me["teams"][0]["team"]["name"], "Team 0")
+        self.assertEqual(len(me["projects"]), 12)
+        self.assertEqual(len(me["hackathon_registrations"]), 3)
+        # Auth, RBAC and user row; memberships with their teams, creators
+        # and hackathons (IN), two grouped team stats; projects, votes,
+        # comments and registrations. None of it grows with the teams.
+        self.assertLessEqual(first, 13)
+        # Cached: only the user is looked up again.
+        self.assertLessEqual(len(self.statements), 2)
+
+    def test_votes_comments_and_joins_invalidate_the_dashboard(self):
+        self.assertEqual(self._me()["votes"], [])
+
+        VoteRepository().cast_vote(
+            self.db, self.project_id, self.user_id, "upvote"
+        )
+        CommentRepository().create(self.db, obj_in={
+            "project_id": self.project_id, "user_id": self.user_id,
+            "content": "Nice",
+        })
+        TeamMemberRepository().create(self.db, obj_in={
+            "team_id": self.spare_team_id, "user_id": self.user_id,
+        })
+        registration = HackathonRegistrationRepository().register_user(
+            self.db, self.user_id, self.spare_hackathon_id
+        )
+
+        me = self._me()
+        self.assertEqual(len(me["votes"]), 1)
+        self.assertEqual(len(me["comments"]), 1)
+        self.assertEqual(len(me["teams"]), 4)
+        self.assertEqual(len(me["hackathon_registrations"]), 4)
+
+        HackathonRegistrationRepository().delete(self.db, id=registration.id)
+        self.assertEqual(len(self._me()["hackathon_registrations"]), 3)
+
+    def test_profile_counts_come_from_one_query(self):
+        response = self.client.get(f"/api/users/{self.user_id}/profile")
+
+        self.assertEqual(response.status_code, 200)
+        profile = response.json()
+        self.assertEqual(len(profile["projects"]), 10)
+        self.assertEqual(profile["stats"], {
+            "project_count": 12, "team_count": 3, "hackathon_count": 3,
+        })
+        self.assertEqual(profile["hackathons"][0]["name"], "Hack 0")
+        # User, projects, teams, hackathons and one aggregate of counts
+        self.assertLessEqual(len(self.statements), 5)
+
+    def test_stats_use_the_aggregate_counts(self):
+        response = self.client.get("/api/users/me/stats", headers=self.headers)
+
+        self.assertEqual(response.json(), {
+            "hackathonsCreated": 4, "projectsSubmitted": 12, "totalVotes": 0,
+        })
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+import os
+import unittest
+from datetime import datetime, timedelta, timezone
+
+os.environ.setdefault("DEBUG", "false")
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+
+from app.core.auth import create_tokens  # noqa: E402
+from app.core.database import SessionLocal, engine  # noqa: E402
+from app.domain.models import (  # noqa: E402
+    Base, Hackathon, Project, Team, TeamMember, User
+)
+from app.main import app  # noqa: E402
+from app.utils.cache import cache_manager  # noqa: E402
+
+
+class UserTeamsTests(unittest.TestCase):
+    def setUp(self):
+        Base.metadata.drop_all(bind=engine)
+        Base.metadata.create_all(bind=engine)
+        cache_manager.clear()
+        self.db = SessionLocal()
+        users = [
+            User(email=f"member{i}@example.com", username=f"member{i}",
+                 name=f"Member {i}", password_hash="secret")
+            for i in range(5)
+        ]
+        self.db.add_all(users)
+        self.db.commit()
+        hackathon = Hackathon(
+            name="Hack", description="Teams",
+            start_date=datetime.now(timezone.utc),
+            end_date=datetime.now(timezone.utc) + timedelta(days=1),
+            location="Flensburg", owner_id=users[0].id,
+        )
+        self.db.add(hackathon)
+        self.db.commit()
+        teams = [
+            Team(name=f"Team {i}", hackathon_id=hackathon.id,
+                 created_by=users[0].id)
+            for i in range(10)
+        ]
+        self.db.add_all(teams)
+        self.db.commit()
+        self.db.add_all([
+            TeamMember(team_id=team.id, user_id=user.id,
+                       role="owner" if user is users[0] else "member")
+            for team in teams for user in users
+        ])
+        self.db.add(Project(
+            title="Built", owner_id=users[0].id, team_id=teams[0].id
+        ))
+        self.db.commit()
+        self.user_id, self.hackathon_id = users[0].id, hackathon.id
+        token = create_tokens(self.user_id, "member0")["access_token"]
+        self.headers = {"Authorization": f"Bearer {token}"}
+        self.client = TestClient(app)
+        self.statements = []
+        event.listen(engine, "before_cursor_execute", self._record)
+
+    def tearDown(self):
+        event.remove(engine, "before_cursor_execute", self._record)
+        self.client.close()
+        self.db.close()
+        cache_manager.clear()
+
+    def _record(self, conn, cursor, statement, *args):
+        self.statements.append(statement)
+
+    def _team_queries(self):
+        return [
+            statement for statement in self.statements
+            if "teams" in statement or "team_members" in statement
+        ]
+
+    def test_user_teams_load_in_constant_queries(self):
+        response = self.client.get(
+            f"/api/users/{self.user_id}/teams", headers=self.headers
+        )
+
+        self.assertEqual(response.status_code, 200)
+        teams = response.json()
+        self.assertEqual(len(teams), 10)
+        self.assertEqual({team["member_count"] for team in teams}, {5})
+        self.assertEqual(
+            sorted(member["name"] for member in teams[0]["members"]),
+            [f"Member {i}" for i in range(5)],
+        )
+        # Teams, members, member users; no aggregates
+        self.assertLessEqual(len(self._team_queries()), 3)
+        self.assertFalse(any(
+            "count(" in statement.lower() for statement in self.statements
+        ))
+
+    def test_hackathon_teams_load_in_constant_queries(self):
+        response = self.client.get(
+            f"/api/users/me/teams/{self.hackathon_id}", headers=self.headers
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()), 10)
+        self.assertLessEqual(len(self._team_queries()), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
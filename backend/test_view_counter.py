@@ -0,0 +1,138 @@
+import os
+import unittest
+from datetime import datetime, timezone
+from unittest import mock
+
+os.environ.setdefault("DEBUG", "false")
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+
+from app.core.database import SessionLocal, engine  # noqa: E402
+from app.domain.models import (  # noqa: E402
+    Base, Hackathon, Project, Team, User
+)
+from app.main import app  # noqa: E402
+from app.utils.cache import cache_manager  # noqa: E402
+from app.utils.view_counter import ViewCounter, view_counter  # noqa: E402
+
+
+class ViewCounterTests(unittest.TestCase):
+    def setUp(self):
+        Base.metadata.drop_all(bind=engine)
+        Base.metadata.create_all(bind=engine)
+        cache_manager.clear()
+        self.db = SessionLocal()
+        view_counter.flush(self.db)
+        user = User(
+            email="views@example.com", username="viewer",
+            password_hash="secret",
+        )
+        self.db.add(user)
+        self.db.commit()
+        hackathon = Hackathon(
+            name="Viewed", owner_id=user.id, description="Views",
+            location="Online",
+            start_date=datetime(2026, 1, 1, tzinfo=timezone.utc),
+            end_date=datetime(2026, 1, 2, tzinfo=timezone.utc),
+        )
+        self.db.add(hackathon)
+        self.db.commit()
+        project = Project(title="Viewed", owner_id=user.id, is_public=True)
+        team = Team(
+            name="Viewers", hackathon_id=hackathon.id, created_by=user.id
+        )
+        self.db.add_all([project, team])
+        self.db.commit()
+        self.ids = {
+            "project": project.id, "hackathon": hackathon.id, "team": team.id
+        }
+        self.client = TestClient(app)
+
+    def tearDown(self):
+        self.client.close()
+        self.db.close()
+        cache_manager.clear()
+
+    def _stored(self, model, kind):
+        self.db.expire_all()
+        return self.db.get(model, self.ids[kind]).view_count or 0
+
+    def test_views_are_buffered_until_flush(self):
+        path = f"/api/projects/{self.ids['project']}/view"
+        counts = [self.client.post(path).json()["view_count"] for _ in range(3)]
+        self.assertEqual(counts, [1, 2, 3])
+        self.assertEqual(self._stored(Project, "project"), 0)
+
+        self.assertEqual(view_counter.flush(self.db), 1)
+        project = self.db.get(Project, self.ids["project"])
+        self.assertEqual(project.view_count, 3)
+        self.assertEqual(project.engagement_score, 6)
+        self.assertEqual(self.client.post(path).json()["view_count"], 4)
+
+    def test_reading_a_project_does_not_count_a_view(self):
+        response = self.client.get(f"/api/projects/{self.ids['project']}")
+        self.assertEqual(response.status_code, 200)
+        view_counter.flush(self.db)
+        self.assertEqual(self._stored(Project, "project"), 0)
+
+    def test_missing_project_is_not_counted(self):
+        response = self.client.post("/api/projects/999/view")
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(view_counter.pending("project", 999), 0)
+
+    def test_flush_batches_one_update_per_table(self):
+        for _ in range(5):
+            self.client.get(f"/api/hackathons/{self.ids['hackathon']}")
+            self.client.get(f"/api/teams/{self.ids['team']}")
+        self.assertEqual(self._stored(Team, "team"), 0)
+
+        updates = []
+
+        def record(conn, cursor, statement, parameters, context, many):
+            if statement.startswith("UPDATE"):
+                updates.append(statement)
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            self.assertEqual(view_counter.flush(self.db), 2)
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        self.assertEqual(len(updates), 2)
+        self.assertEqual(self._stored(Hackathon, "hackathon"), 5)
+        self.assertEqual(self._stored(Team, "team"), 5)
+
+    def test_failed_flush_keeps_counts(self):
+        counter = ViewCounter()
+        counter.record("team", self.ids["team"], 2)
+        with mock.patch.object(
+            counter, "_apply", side_effect=RuntimeError("db down")
+        ):
+            with self.assertRaises(RuntimeError):
+                counter.flush(self.db)
+        self.assertEqual(counter.pending("team", self.ids["team"]), 2)
+        counter.flush(self.db)
+        self.assertEqual(self._stored(Team, "team"), 2)
+
+    def test_redis_buffer_is_claimed_atomically(self):
+        redis = mock.Mock()
+        redis.exists.side_effect = lambda key: key == "views:team"
+        redis.hgetall.return_value = {str(self.ids["team"]): "7"}
+        counter = ViewCounter(redis_client=redis)
+
+        counter.record("team", self.ids["team"])
+        redis.hincrby.assert_called_once_with(
+            "views:team", self.ids["team"], 1
+        )
+        counter.flush(self.db)
+
+        claimed = redis.rename.call_args.args[1]
+        self.assertTrue(claimed.startswith("views:team:flushing:"))
+        redis.delete.assert_called_once_with(claimed)
+        self.assertEqual(self._stored(Team, "team"), 7)
+
+
+if __name__ == "__main__":
+    unittest.main()
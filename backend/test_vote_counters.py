@@ -0,0 +1,171 @@
+import os
+import unittest
+
+os.environ.setdefault("DEBUG", "false")
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+
+from app.core.auth import create_tokens  # noqa: E402
+from app.core.database import SessionLocal, engine  # noqa: E402
+from app.domain.models import (  # noqa: E402
+    Base, Comment, CommentVote, Project, User, Vote
+)
+from app.main import app  # noqa: E402
+from app.repositories.comment_vote_repository import (  # noqa: E402
+    CommentVoteRepository,
+)
+from app.repositories.project_repository import VoteRepository  # noqa: E402
+from app.utils.cache import cache_manager  # noqa: E402
+
+
+class VoteCounterTests(unittest.TestCase):
+    def setUp(self):
+        Base.metadata.drop_all(bind=engine)
+        Base.metadata.create_all(bind=engine)
+        cache_manager.clear()
+        self.db = SessionLocal()
+        self.users = [
+            User(email=f"voter{i}@example.com", username=f"voter{i}",
+                 password_hash="secret")
+            for i in range(2)
+        ]
+        self.db.add_all(self.users)
+        self.db.commit()
+        project = Project(
+            title="Voted", owner_id=self.users[0].id, is_public=True
+        )
+        self.db.add(project)
+        self.db.commit()
+        comment = Comment(
+            content="Hi", user_id=self.users[0].id, project_id=project.id
+        )
+        self.db.add(comment)
+        self.db.commit()
+        self.project_id = project.id
+        self.comment_id = comment.id
+        self.client = TestClient(app)
+
+    def tearDown(self):
+        self.client.close()
+        self.db.close()
+        cache_manager.clear()
+
+    def _headers(self, user):
+        token = create_tokens(user.id, user.username)["access_token"]
+        return {"Authorization": f"Bearer {token}"}
+
+    def _vote(self, path, user, vote_type):
+        response = self.client.post(
+            path, json={"vote_type": vote_type}, headers=self._headers(user)
+        )
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_project_vote_toggle_applies_deltas(self):
+        path = f"/api/projects/{self.project_id}/vote"
+        first, second = self.users
+
+        self._vote(path, first, "upvote")
+        stats = self._vote(path, second, "downvote")["project_stats"]
+        self.assertEqual((stats["upvotes"], stats["downvotes"]), (1, 1))
+
+        body = self._vote(path, second, "upvote")
+        self.assertEqual(body["message"], "Changed vote to upvote")
+        self.assertEqual(body["project_stats"]["total_score"], 2)
+
+        body = self._vote(path, first, "upvote")
+        self.assertEqual(body["message"], "Removed upvote")
+        self.assertIsNone(body["project_stats"]["user_vote"])
+
+        response = self.client.delete(path, headers=self._headers(second))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["project_stats"]["upvotes"], 0)
+        self.assertEqual(
+            self.client.delete(path, headers=self._headers(second))
+            .status_code,
+            404,
+        )
+
+        self.db.expire_all()
+        project = self.db.get(Project, self.project_id)
+        self.assertEqual(
+            (project.upvote_count, project.downvote_count,
+             project.vote_score),
+            (0, 0, 0),
+        )
+
+    def test_vote_does_not_recount_votes(self):
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement.lower())
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            self._vote(
+                f"/api/projects/{self.project_id}/vote", self.users[0],
+                "upvote",
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        self.assertFalse(any("count(" in s for s in statements))
+        self.assertTrue(any(
+            s.startswith("update projects") and "returning" in s
+            for s in statements
+        ))
+
+    def test_vote_on_missing_project_is_not_found(self):
+        response = self.client.post(
+            "/api/projects/999/vote", json={"vote_type": "upvote"},
+            headers=self._headers(self.users[0]),
+        )
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(self.db.query(Vote).count(), 0)
+
+    def test_comment_votes_use_deltas(self):
+        path = f"/api/comments/{self.comment_id}/vote"
+        self._vote(path, self.users[0], "upvote")
+        stats = self._vote(path, self.users[1], "downvote")["comment_stats"]
+        self.assertEqual((stats["upvotes"], stats["downvotes"]), (1, 1))
+
+        response = self.client.delete(
+            path, headers=self._headers(self.users[1])
+        )
+        self.assertEqual(response.json()["comment_stats"]["downvotes"], 0)
+
+    def test_reconciliation_repairs_drift(self):
+        self.db.add(Vote(
+            user_id=self.users[0].id, project_id=self.project_id,
+            vote_type="upvote",
+        ))
+        self.db.add(CommentVote(
+            user_id=self.users[0].id, comment_id=self.comment_id,
+            vote_type="downvote",
+        ))
+        self.db.query(Project).update({Project.downvote_count: 3})
+        self.db.commit()
+
+        self.assertEqual(VoteRepository().reconcile_vote_counts(self.db), 1)
+        self.assertEqual(
+            CommentVoteRepository().reconcile_vote_counts(self.db), 1
+        )
+        self.assertEqual(VoteRepository().reconcile_vote_counts(self.db), 0)
+
+        self.db.expire_all()
+        project = self.db.get(Project, self.project_id)
+        comment = self.db.get(Comment, self.comment_id)
+        self.assertEqual(
+            (project.upvote_count, project.downvote_count,
+             project.vote_score),
+            (1, 0, 1),
+        )
+        self.assertEqual(
+            (comment.upvote_count, comment.downvote_count), (0, 1)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()